@@ -19,6 +19,7 @@
   ****************************************************************************
 """
 import calendar
+import threading
 import time
 import socket
 
@@ -26,6 +27,7 @@ import json
 from actuators.impl.actuator import Actuator
 from framework.base.debug import Debug
 from framework.utils.service_logging import logger
+from framework.utils.conf_utils import Conf, SSPL_CONF, NODEHWACTUATOR
 from framework.base.sspl_constants import AlertTypes, SensorTypes, SeverityTypes
 from framework.utils.ipmi_client import IpmiFactory
 
@@ -41,6 +43,8 @@ class NodeHWactuator(Actuator, Debug):
         "fan" : "Fan",
         "psu" : "Power Supply"
     }
+    FRU_CACHE_TTL = "fru_cache_ttl"
+    DEFAULT_FRU_CACHE_TTL = 5
 
     @staticmethod
     def name():
@@ -52,9 +56,14 @@ class NodeHWactuator(Actuator, Debug):
         self.host_id = socket.getfqdn()
         self.sensor_id_map = None
         self._executor = executor
-        self.fru_specific_info = {}
         self._resource_id = ""
         self._sensor_type = ""
+        self._fru_cache_ttl = float(Conf.get(SSPL_CONF,
+            f"{NODEHWACTUATOR}>{self.FRU_CACHE_TTL}", self.DEFAULT_FRU_CACHE_TTL))
+        # Sensor id to the time its properties were read, common and
+        # specific properties
+        self._sensor_props = {}
+        self._sensor_props_lock = threading.Lock()
 
     def initialize(self):
         """Performs basic Node HW actuator initialization"""
@@ -63,19 +72,41 @@ class NodeHWactuator(Actuator, Debug):
             sensor_id_map={})
         self.ipmi_client = IpmiFactory().get_implementor('ipmitool')
 
+    def _get_sensors_props(self, sensor_ids):
+        """Returns the (common, specific) properties of the sensors, read
+           with a single ipmitool call for the sensors not read in the
+           last fru_cache_ttl secs"""
+        now = time.time()
+        props = {}
+        missing = []
+        with self._sensor_props_lock:
+            for sensor_id in sensor_ids:
+                cached = self._sensor_props.get(sensor_id)
+                if cached is not None and now - cached[0] < self._fru_cache_ttl:
+                    props[sensor_id] = cached[1:]
+                else:
+                    missing.append(sensor_id)
+        if missing:
+            read = self._executor.get_sensors_props(missing)
+            with self._sensor_props_lock:
+                for sensor_id, (common, specific) in read.items():
+                    # Errors are not cached
+                    if common is not False:
+                        self._sensor_props[sensor_id] = (now, common, specific)
+            props.update(read)
+        return props
+
     def _get_fru_instances(self, fru, fru_instance):
         """Get the fru information based on fru_type and instance"""
         response = None
         try:
             if self.sensor_id_map:
                 fru_dict = self.sensor_id_map[fru.lower()]
-                for sensor_id in fru_dict.values():
-                    if sensor_id == '':
-                        continue
-                    sensor_common_info, sensor_specific_info = self._executor.get_sensor_props(sensor_id)
-                    self.fru_specific_info[sensor_id] = sensor_specific_info
-                if self.fru_specific_info is not None:
-                    resource_info = self._parse_fru_info(fru)
+                sensor_ids = [sensor_id for sensor_id in fru_dict.values()
+                              if sensor_id != '']
+                fru_specific_info = {sensor_id: specific for sensor_id, (_, specific)
+                                     in self._get_sensors_props(sensor_ids).items()}
+                resource_info = self._parse_fru_info(fru, fru_specific_info)
                 if fru_instance == "*":
                     response = self._create_node_fru_json_message(resource_info, fru_instance)
                 else:
@@ -96,12 +127,12 @@ class NodeHWactuator(Actuator, Debug):
             return
         return response
 
-    def _parse_fru_info(self, fru):
+    def _parse_fru_info(self, fru, fru_specific_info):
         """Parses fan information"""
         specific_info = None
         specifics = []
 
-        for sensor_id, fru_info in self.fru_specific_info.items():
+        for sensor_id, fru_info in fru_specific_info.items():
             specific_info = dict()
             for fru_key,fru_value in fru_info.items():
                 specific_info[fru_key] = fru_value
@@ -121,7 +152,6 @@ class NodeHWactuator(Actuator, Debug):
                         each['States Asserted'] = ' '.join(
                             x.strip() for x in each['States Asserted'].split())
 
-        self.fru_specific_info = {}
         return specifics
 
     def perform_request(self, json_msg):
@@ -150,8 +180,9 @@ class NodeHWactuator(Actuator, Debug):
         if fru_instance.isdigit() and isinstance(int(fru_instance), int):
             fru_dict = self.sensor_id_map.get(fru.lower())
             sensor_id = fru_dict[int(fru_instance)]
-            common, specific = self._executor.get_sensor_props(sensor_id)
-            response = self._create_node_fru_json_message(specific, sensor_id)
+            common, specific = self._get_sensors_props([sensor_id])[sensor_id]
+            # Cached properties are shared with the next requests
+            response = self._create_node_fru_json_message(dict(specific), sensor_id)
             response['instance_id'] = fru_instance
             response['info']['resource_id'] = sensor_id
 
@@ -20,8 +20,116 @@
                     another.
  ****************************************************************************
 """
+import queue
+import time
+from collections import deque
+
+from framework.base.scheduler_core import SchedulerCore
 from framework.utils.service_logging import logger
 
+class MsgPriority(object):
+    """Lanes of an InternalQueue, lower values are read first"""
+    # Alerts, actuator responses and other messages
+    NORMAL = 0
+    # Periodic telemetry such as resent node_data
+    LOW = 1
+
+class InternalQueue(queue.Queue):
+    """queue.Queue with priority lanes and depth, rate and age metrics.
+
+    Messages are read from the highest priority non empty lane, in FIFO
+    order within a lane.
+    """
+
+    LANES = 2
+
+    def __init__(self, name=None, maxsize=0):
+        self.name = name
+        super(InternalQueue, self).__init__(maxsize)
+
+    def _init(self, maxsize):
+        self._lanes = [deque() for _ in range(self.LANES)]
+        self._enqueued = 0
+        self._dequeued = 0
+        self._age_total = 0.0
+        self._max_age = 0.0
+        self._stats_time = time.time()
+        self._stats_enqueued = 0
+        self._stats_dequeued = 0
+
+    def _qsize(self):
+        return sum(len(lane) for lane in self._lanes)
+
+    def _put(self, item):
+        priority, item = item
+        self._lanes[priority].append((time.time(), item))
+        self._enqueued += 1
+
+    def _get(self):
+        for lane in self._lanes:
+            if lane:
+                enqueue_time, item = lane.popleft()
+                age = time.time() - enqueue_time
+                self._age_total += age
+                self._max_age = max(self._max_age, age)
+                self._dequeued += 1
+                return item
+
+    @property
+    def queue(self):
+        """Pending messages in read order, caller must hold the mutex"""
+        return [item for lane in self._lanes for _, item in lane]
+
+    def put(self, item, block=True, timeout=None, priority=MsgPriority.NORMAL):
+        super(InternalQueue, self).put((priority, item), block, timeout)
+        # Wake the module waiting on this queue, including for writers
+        # putting directly to the queue
+        if self.name is not None:
+            SchedulerCore.get_instance().notify_queue(self.name)
+
+    def get_many(self, max_n, timeout=None):
+        """Blocks up to timeout secs, None for ever, for a message and
+           returns up to max_n messages, empty list on timeout"""
+        with self.not_empty:
+            if timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+            else:
+                deadline = time.time() + timeout
+                while not self._qsize():
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return []
+                    self.not_empty.wait(remaining)
+            items = []
+            while self._qsize() and len(items) < max_n:
+                items.append(self._get())
+            self.not_full.notify(len(items))
+            return items
+
+    def get_stats(self):
+        """Returns depth, rates and message age since the last call"""
+        with self.mutex:
+            now = time.time()
+            elapsed = max(now - self._stats_time, 1e-6)
+            dequeued = self._dequeued - self._stats_dequeued
+            stats = {
+                "depth": self._qsize(),
+                "depth_per_lane": [len(lane) for lane in self._lanes],
+                "enqueue_rate": round((self._enqueued - self._stats_enqueued) / elapsed, 3),
+                "dequeue_rate": round(dequeued / elapsed, 3),
+                "avg_age": round(self._age_total / dequeued, 6) if dequeued else 0,
+                "max_age": round(self._max_age, 6),
+                "oldest_age": round(max([now - lane[0][0] for lane in self._lanes
+                                         if lane] or [0]), 6)
+            }
+            self._stats_time = now
+            self._stats_enqueued = self._enqueued
+            self._stats_dequeued = self._dequeued
+            self._age_total = 0.0
+            self._max_age = 0.0
+            return stats
+
 class InternalMsgQ(object):
     """Base Class for internal message queue communications between modules"""
 
@@ -37,11 +145,15 @@ class InternalMsgQ(object):
         q = self._msgQlist[self.name()]
         return q.empty()
 
-    def _read_my_msgQ(self):
-        """Blocks on reading from this module's queue placed by another thread"""
+    def _read_my_msgQ(self, timeout=None):
+        """Blocks on reading from this module's queue placed by another thread,
+           up to timeout secs if given"""
         try:
             q = self._msgQlist[self.name()]
-            jsonMsg, event = q.get()
+            try:
+                jsonMsg, event = q.get(timeout=timeout)
+            except queue.Empty:
+                return None, None
 
             if jsonMsg is None:
                 return None, None
@@ -64,12 +176,11 @@ class InternalMsgQ(object):
         try:
             q = self._msgQlist[self.name()]
 
-            # See if queue is empty otherwise don't bother
-            if q.empty():
-                return None, None
-
             # Don't block waiting for messages
-            jsonMsg, event = q.get_nowait()
+            try:
+                jsonMsg, event = q.get_nowait()
+            except queue.Empty:
+                return None, None
 
             if jsonMsg is None:
                 return None, None
@@ -85,13 +196,82 @@ class InternalMsgQ(object):
         except Exception as e:
             logger.exception("_read_my_msgQ_noWait: %r" % e)
 
-    def _write_internal_msgQ(self, toModule, jsonMsg, event=None):
+    def _read_my_msgQ_batch(self, max_msgs, timeout, linger=0):
+        """Blocks up to timeout secs for a message on this module's queue and
+           then collects up to max_msgs messages arriving within linger secs.
+           Returns a list of (jsonMsg, event) tuples, empty on timeout"""
+        batch = []
+        q = self._msgQlist[self.name()]
+        if isinstance(q, InternalQueue):
+            msgs = q.get_many(max_msgs, timeout)
+            deadline = time.time() + linger
+            while msgs and len(msgs) < max_msgs and time.time() < deadline:
+                more = q.get_many(max_msgs - len(msgs), deadline - time.time())
+                if not more:
+                    break
+                msgs.extend(more)
+        else:
+            msgs = []
+            deadline = None
+            while len(msgs) < max_msgs:
+                try:
+                    if deadline is None:
+                        msgs.append(q.get(timeout=timeout))
+                        deadline = time.time() + linger
+                    else:
+                        remaining = deadline - time.time()
+                        if remaining > 0:
+                            msgs.append(q.get(timeout=remaining))
+                        else:
+                            msgs.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+        for jsonMsg, event in msgs:
+            try:
+                if jsonMsg is None:
+                    continue
+
+                # Check for debugging being activated in the message header
+                global_debug_off, jsonMsg = self._check_debug(jsonMsg)
+                if global_debug_off is True:
+                    self._debug_off_globally()
+
+                if jsonMsg is not None:
+                    batch.append((jsonMsg, event))
+            except Exception as e:
+                logger.exception("_read_my_msgQ_batch: %r" % e)
+
+        self._log_debug("_read_my_msgQ_batch: %s, Msgs:%d" % (self.name(), len(batch)))
+        return batch
+
+    def _write_internal_msgQ(self, toModule, jsonMsg, event=None,
+                             priority=MsgPriority.NORMAL):
         """writes a json message to an internal message queue"""
         self._log_debug("_write_internal_msgQ: From %s, To %s, Msg:%s" %
                        (self.name(), toModule, jsonMsg))
 
         q = self._msgQlist[toModule]
-        q.put((jsonMsg, event))
+        if isinstance(q, InternalQueue):
+            q.put((jsonMsg, event), priority=priority)
+        else:
+            q.put((jsonMsg, event))
+            SchedulerCore.get_instance().notify_queue(toModule)
+
+    def _schedule_read_my_msgQ(self, delay=1):
+        """Schedules run() for the next message on this module's queue.
+           Falls back to running again after delay secs with the legacy
+           scheduler"""
+        if hasattr(self._scheduler, "enter_on_queue"):
+            self._scheduler.enter_on_queue(self.name(),
+                self._msgQlist[self.name()], self._priority, self.run)
+        else:
+            self._scheduler.enter(delay, self._priority, self.run, ())
+
+    def _get_msgQ_stats(self):
+        """Returns the metrics of all the internal queues by module name"""
+        return {name: q.get_stats() for name, q in self._msgQlist.items()
+                if isinstance(q, InternalQueue)}
 
     def _get_msgQ_copy(self, module_name):
         """Returns a copy of a modules message queue"""
@@ -26,6 +26,8 @@ import threading
 import time
 from sched import scheduler
 from .debug import Debug
+from .scheduler_core import CoreScheduler, SchedulerCore
+from framework.utils.conf_utils import Conf, SSPL_CONF, SSPL_LL_SETTING
 from framework.utils.service_logging import logger
 
 class DependencyState(object):
@@ -65,13 +67,53 @@ class ScheduledModuleThread(ModuleThread, Debug):
     SUSPENDED = 2
     HALTED = 3
 
+    # Set by the modules whose run() polls and returns, their events
+    # run on the workers of the scheduler core and they hold no thread
+    RUN_ON_CORE_WORKERS = False
+
     def __init__(self, module_name, priority):
         super(ScheduledModuleThread, self).__init__()
 
-        self._scheduler   = scheduler(time.time, time.sleep)
+        self._scheduler   = self._create_scheduler(module_name)
         self._module_name = module_name
         self._priority    = priority
         self._running     = False
+        self._failure_handler = None
+
+    @classmethod
+    def _create_scheduler(cls, module_name):
+        """Returns the scheduler backed by the shared scheduler core or
+           the legacy per module sched.scheduler"""
+        use_core = Conf.get(SSPL_CONF, f"{SSPL_LL_SETTING}>scheduler_core", True)
+        if str(use_core).lower() in ("false", "no", "0"):
+            return scheduler(time.time, time.sleep)
+        workers = Conf.get(SSPL_CONF,
+            f"{SSPL_LL_SETTING}>scheduler_core_workers",
+            SchedulerCore.DEFAULT_WORKERS)
+        try:
+            workers = int(workers)
+        except (TypeError, ValueError):
+            logger.warn(f"Invalid scheduler_core_workers {workers}, using "
+                        f"{SchedulerCore.DEFAULT_WORKERS}")
+            workers = SchedulerCore.DEFAULT_WORKERS
+        return CoreScheduler(module_name,
+                             core=SchedulerCore.get_instance(workers),
+                             pooled=cls.RUN_ON_CORE_WORKERS)
+
+    def runs_on_core_workers(self):
+        """Returns True if start() returns and the module has no thread"""
+        return getattr(self._scheduler, "pooled", False)
+
+    def set_failure_handler(self, handler):
+        """Sets the function called with the exception of a failed run
+           of a module running on the core workers"""
+        self._failure_handler = handler
+
+    def _on_failure(self, err):
+        if self._failure_handler is None:
+            logger.error(f"{self.name()}, {err}")
+            return
+        self._failure_handler(err)
 
     def initialize(self, conf_reader):
         """Initialize the monitoring thread"""
@@ -84,6 +126,9 @@ class ScheduledModuleThread(ModuleThread, Debug):
     def start(self):
         """Run the scheduler"""
         self._running = True
+        if self.runs_on_core_workers():
+            self._scheduler.start(self._on_failure)
+            return
         self._scheduler.run()
 
     def start_thread(self, conf_reader, msgQlist, product):
@@ -0,0 +1,312 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Process wide scheduler core. One timer heap serviced by
+                    a single thread and a small worker pool replace the
+                    sched loops of the individual modules.
+ ****************************************************************************
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.utils.service_logging import logger
+
+
+Event = namedtuple('Event', 'time, priority, sequence, action, argument, kwargs')
+
+
+class Job(object):
+    """Handle of a job registered with the SchedulerCore"""
+
+    def __init__(self, due, priority, callback, interval=None):
+        self.due = due
+        self.priority = priority
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+
+
+class SchedulerCore(object):
+    """Timer heap and worker pool shared by all the modules.
+
+    Timed jobs are kept in one heap serviced by a single timer thread which
+    sleeps until the earliest deadline. Periodic jobs and queue readiness
+    callbacks registered with the core run on the worker pool.
+    """
+
+    DEFAULT_WORKERS = 8
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, workers=DEFAULT_WORKERS):
+        """Returns the core, workers is only used by the first call"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(workers)
+            return cls._instance
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._workers = workers
+        self._executor = None
+        # Queue name to list of readiness callbacks
+        self._queue_watchers = {}
+        self._watchers_lock = threading.Lock()
+        self.wakeups = 0
+        self.jobs_run = 0
+        self._timer = threading.Thread(target=self._run_timer,
+                                       name="SchedulerCore", daemon=True)
+        self._timer.start()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers,
+                                                thread_name_prefix="SchedulerCore")
+        return self._executor
+
+    def add_timer(self, due, priority, callback, interval=None):
+        """Calls callback on the timer thread at time due.
+
+        The callback must not block, use schedule() for real work.
+        """
+        job = Job(due, priority, callback, interval)
+        with self._cond:
+            heapq.heappush(self._heap, (due, priority, next(self._sequence), job))
+            # Wake the timer only if the new job is the earliest one
+            if self._heap[0][3] is job:
+                self._cond.notify()
+        return job
+
+    def cancel(self, job):
+        """Cancels a job, it is dropped from the heap when it is due"""
+        job.cancelled = True
+
+    def schedule(self, delay, action, argument=(), kwargs=None, priority=1):
+        """Runs action once on the worker pool after delay secs"""
+        kwargs = kwargs or {}
+        return self.add_timer(time.time() + delay, priority,
+            lambda: self._submit(action, argument, kwargs))
+
+    def schedule_periodic(self, interval, action, argument=(), kwargs=None,
+                          priority=1):
+        """Runs action on the worker pool every interval secs"""
+        kwargs = kwargs or {}
+        return self.add_timer(time.time() + interval, priority,
+            lambda: self._submit(action, argument, kwargs), interval)
+
+    def submit(self, action, argument=(), kwargs=None):
+        """Runs action on the worker pool right away"""
+        self._get_executor().submit(self._call, action, argument, kwargs or {})
+
+    def _submit(self, action, argument, kwargs):
+        self.submit(action, argument, kwargs)
+
+    def _call(self, action, argument, kwargs):
+        try:
+            action(*argument, **kwargs)
+        except Exception as err:
+            logger.exception(f"SchedulerCore, job {action} failed: {err}")
+
+    def watch_queue(self, queue_name, callback):
+        """Calls callback on the worker pool for every write to the queue"""
+        with self._watchers_lock:
+            self._queue_watchers.setdefault(queue_name, []).append(callback)
+
+    def unwatch_queue(self, queue_name, callback):
+        with self._watchers_lock:
+            watchers = self._queue_watchers.get(queue_name, [])
+            if callback in watchers:
+                watchers.remove(callback)
+
+    def notify_queue(self, queue_name):
+        """Called by the writers of internal queues"""
+        with self._watchers_lock:
+            watchers = list(self._queue_watchers.get(queue_name, ()))
+        for callback in watchers:
+            callback()
+
+    def _run_timer(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.time():
+                    timeout = self._heap[0][0] - time.time() if self._heap else None
+                    self._cond.wait(timeout)
+                    self.wakeups += 1
+                _, _, _, job = heapq.heappop(self._heap)
+                if job.cancelled:
+                    continue
+                if job.interval is not None:
+                    job.due += job.interval
+                    heapq.heappush(self._heap, (job.due, job.priority,
+                                                next(self._sequence), job))
+            self.jobs_run += 1
+            try:
+                job.callback()
+            except Exception as err:
+                logger.exception(f"SchedulerCore, timer callback failed: {err}")
+
+    def stats(self):
+        """Returns the timer wakeups and jobs run since start"""
+        return {"wakeups": self.wakeups, "jobs_run": self.jobs_run,
+                "pending": len(self._heap)}
+
+
+class CoreScheduler(object):
+    """Drop-in replacement of sched.scheduler on top of SchedulerCore.
+
+    Events are timed by the shared core and executed on the thread calling
+    run(), so modules keep their thread affinity and exceptions raised by
+    run() still reach the module recovery in execute_thread. Between events
+    the module thread waits on a condition and does not wake up.
+
+    A pooled scheduler has no thread calling run(). Once start() is called
+    its events run on the core workers, one at a time and in time order.
+    """
+
+    def __init__(self, name, core=None, pooled=False):
+        self._name = name
+        self._core = core or SchedulerCore.get_instance()
+        self.pooled = pooled
+        self._started = False
+        self._dispatching = False
+        self._on_error = None
+        self._cond = threading.Condition()
+        # Events waiting for their time or queue, sequence to
+        # (event, cancel function)
+        self._pending = {}
+        # Events due, to be run by run()
+        self._ready = []
+        self._sequence = itertools.count()
+
+    def enterabs(self, time, priority, action, argument=(), kwargs=None):
+        event = Event(time, priority, next(self._sequence), action,
+                      argument, kwargs or {})
+        with self._cond:
+            job = self._core.add_timer(time, priority,
+                                       lambda: self._make_ready(event))
+            self._pending[event.sequence] = (event,
+                                             lambda: self._core.cancel(job))
+        return event
+
+    def enter(self, delay, priority, action, argument=(), kwargs=None):
+        return self.enterabs(time.time() + delay, priority, action,
+                             argument, kwargs)
+
+    def enter_on_queue(self, queue_name, queue, priority, action, argument=(),
+                       kwargs=None):
+        """Schedules action for when the internal queue has messages"""
+        event = Event(0, priority, next(self._sequence), action,
+                      argument, kwargs or {})
+
+        def _on_write():
+            self._core.unwatch_queue(queue_name, _on_write)
+            self._make_ready(event)
+
+        with self._cond:
+            self._pending[event.sequence] = (event,
+                lambda: self._core.unwatch_queue(queue_name, _on_write))
+        self._core.watch_queue(queue_name, _on_write)
+        # Messages written before the watch was set
+        if not queue.empty():
+            _on_write()
+        return event
+
+    def _make_ready(self, event):
+        with self._cond:
+            if self._pending.pop(event.sequence, None) is None:
+                # Cancelled or already made ready
+                return
+            heapq.heappush(self._ready, event)
+            self._cond.notify()
+        if self.pooled:
+            self._dispatch()
+
+    def cancel(self, event):
+        with self._cond:
+            if event.sequence in self._pending:
+                _, cancel = self._pending.pop(event.sequence)
+                cancel()
+            elif event in self._ready:
+                self._ready.remove(event)
+                heapq.heapify(self._ready)
+            else:
+                raise ValueError(event)
+
+    def empty(self):
+        with self._cond:
+            return not self._pending and not self._ready
+
+    @property
+    def queue(self):
+        with self._cond:
+            return sorted([event for event, _ in self._pending.values()] +
+                          self._ready)
+
+    def run(self, blocking=True):
+        """Runs the events as they become due, returns once none is left"""
+        while True:
+            with self._cond:
+                while not self._ready:
+                    if not self._pending or not blocking:
+                        return
+                    self._cond.wait()
+                event = heapq.heappop(self._ready)
+            event.action(*event.argument, **event.kwargs)
+
+    def start(self, on_error):
+        """Runs the events of a pooled scheduler on the core workers.
+
+        An exception raised by an event stops the scheduler and is passed
+        to on_error, the events left are run again by the next start().
+        """
+        with self._cond:
+            self._on_error = on_error
+            self._started = True
+        self._dispatch()
+
+    def _dispatch(self):
+        with self._cond:
+            if not self._started or self._dispatching or not self._ready:
+                return
+            self._dispatching = True
+        self._core.submit(self._run_ready)
+
+    def _run_ready(self):
+        """Runs the due events on a core worker until none is left"""
+        while True:
+            with self._cond:
+                if not self._started or not self._ready:
+                    self._dispatching = False
+                    return
+                event = heapq.heappop(self._ready)
+            try:
+                event.action(*event.argument, **event.kwargs)
+            except Exception as err:
+                with self._cond:
+                    self._started = False
+                    self._dispatching = False
+                self._on_error(err)
+                return
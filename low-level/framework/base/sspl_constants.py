@@ -46,6 +46,10 @@ NODE_ID = "SN01"
 SITE_ID = "DC01"
 RACK_ID = "RC01"
 SSPL_STORE_TYPE = 'file'
+# Defaults of DATASTORE>file_store_cached and file_store_fsync_batch
+FILE_STORE_CACHED = True
+# Writes synced together by the file store, 0 to never sync
+FILE_STORE_FSYNC_BATCH = 0
 SYSLOG_HOST = 'localhost'
 SYSLOG_PORT = 514
 SYSINFO = "SYSTEM_INFORMATION"
@@ -59,6 +63,8 @@ SUPPORT_CONTACT_NUMBER = "18007324283"
 ENCL_TRIGGER_LOG_MAX_RETRY = 10
 ENCL_DOWNLOAD_LOG_MAX_RETRY = 60
 ENCL_DOWNLOAD_LOG_WAIT_BEFORE_RETRY = 15
+ENCL_DOWNLOAD_LOG_RESUME_MAX_RETRY = 5
+ENCL_DOWNLOAD_LOG_CHUNK_SIZE = 1024 * 1024
 PRODUCT_BASE_DIR = "/opt/seagate/%s/" % (PRODUCT_FAMILY)
 SSPL_BASE_DIR = "%s/sspl" % (PRODUCT_BASE_DIR)
 SSPL_CLI_DIR = "%s/low-level/cli" % (SSPL_BASE_DIR)
@@ -85,6 +91,7 @@ SERVICE_IFACE = "org.freedesktop.systemd1.Service"
 MANAGER_IFACE = 'org.freedesktop.systemd1.Manager'
 SYSTEMD_BUS = "org.freedesktop.systemd1"
 CORTX_RELEASE_FACTORY_INFO = "/etc/yum.repos.d/RELEASE_FACTORY.INFO"
+RPMDB_PATH = "/var/lib/rpm/Packages"
 DEFAULT_RECOMMENDATION = 'Please Contact Seagate Support.'
 HEALTH_SVC_NAME = 'health'
 SAS_RESOURCE_ID = "SASHBA-"
@@ -33,6 +33,7 @@ from framework.utils.conf_utils import SSPL_CONF, Conf
 from framework.utils.service_logging import logger
 from framework.utils.store_queue import StoreQueue
 from framework.utils.iem import Iem
+from framework.messaging.producer_pool import ProducerPool
 from . import producer_initialized
 
 
@@ -55,6 +56,11 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
     METHOD = 'method'
     # 300 seconds for 5 mins
     MSG_TIMEOUT = 300
+    # Number of accumulated messages replayed per batch
+    MIN_PAGE_SIZE = 16
+    MAX_PAGE_SIZE = 1024
+    # Secs a batch send may take before the page size is reduced
+    SEND_LATENCY_TARGET = 1
 
     @staticmethod
     def name():
@@ -76,17 +82,15 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
             msgQlist)
 
         self.store_queue = StoreQueue()
+        self._page_size = self.MIN_PAGE_SIZE
         self._read_config()
         producer_initialized.wait()
         self.create_MsgProducer_obj()
 
     def create_MsgProducer_obj(self):
-        self._producer = None
-        try:
-            self._producer = MessageProducer(producer_id=self._producer_id,
-                message_type=self._message_type, method=self._method)
-        except Exception as err:
-            logger.error('Instance creation for MessageProducer class failed due to %s' % err)
+        # Shares the producer of EgressProcessor
+        self._producer = ProducerPool.get_producer(self._producer_id,
+            self._message_type, self._method)
 
     def read_data(self):
         """This method is part of interface. Currently it is not
@@ -119,37 +123,10 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
             # error out in case of failure (EOS-17626)
             if not self.store_queue.is_empty():
                 logger.debug("Found accumulated messages, trying to send again")
+                # Keep replaying pages while the bus accepts them
                 while not self.store_queue.is_empty():
-                    message = self.store_queue.get()
-                    if isinstance(message, bytes):
-                        message = message.decode()
-                    dict_msg = json.loads(message)
-                    if dict_msg.get("iem"):
-                        try:
-                            Iem.raise_iem_event(
-                                module=dict_msg["iem"]["module"],
-                                event_code=dict_msg["iem"]["event_code"],
-                                severity=dict_msg["iem"]["severity"],
-                                description=dict_msg["iem"]["description"])
-                            logger.info("Accumulated IEM sent. %s" % dict_msg)
-                            self.store_queue.delete()
-                        except (EventMessageError, Exception) as e:
-                            logger.error(f"Failed to send IEM. ERROR: {e}")
-                    else:
-                        if "actuator_response_type" in dict_msg["message"]:
-                            event_time = dict_msg["message"] \
-                                ["actuator_response_type"]["info"]["event_time"]
-                            time_diff = int(time.time()) - int(event_time)
-                            if time_diff > self.MSG_TIMEOUT:
-                                continue
-                        if "sensor_response_type" in dict_msg["message"]:
-                            logger.info(f"Publishing Accumulated Alert: {message}")
-                        if isinstance(self._producer, MessageProducer):
-                            self._producer.send([message])
-                            logger.info(f"Published Accumulated Message {message}")
-                            self.store_queue.delete()
-                        else:
-                            self.create_MsgProducer_obj()
+                    if not self._replay_page():
+                        break
         except MessageBusError as e:
             logger.error("EgressAccumulatedMsgsProcessor, run, %r" % e)
         except Exception as e:
@@ -158,6 +135,120 @@ class EgressAccumulatedMsgsProcessor(ScheduledModuleThread, InternalMsgQ):
             logger.debug("Consul accumulated processing ended")
             self._scheduler.enter(30, self._priority, self.run, ())
 
+    def _is_expired(self, dict_msg):
+        """Actuator responses older than MSG_TIMEOUT are not replayed.
+           Messages without a valid event_time are not expired.
+        """
+        message = dict_msg.get("message")
+        response = message.get("actuator_response_type") \
+            if isinstance(message, dict) else None
+        if not isinstance(response, dict):
+            return False
+        info = response.get("info")
+        event_time = info.get("event_time") if isinstance(info, dict) else None
+        try:
+            time_diff = int(time.time()) - int(event_time)
+        except (TypeError, ValueError):
+            logger.warn(f"EgressAccumulatedMsgsProcessor, invalid event_time "
+                        f"{event_time} in accumulated actuator response")
+            return False
+        return time_diff > self.MSG_TIMEOUT
+
+    def _send_pending(self, pending):
+        """Send accumulated messages in one call, returns True on success"""
+        if not pending:
+            return True
+        if not isinstance(self._producer, MessageProducer):
+            self.create_MsgProducer_obj()
+            return False
+        start = time.time()
+        try:
+            self._producer.send(pending)
+        except MessageBusError as e:
+            logger.error(f"EgressAccumulatedMsgsProcessor, failed to send "
+                         f"{len(pending)} accumulated messages, {e}")
+            return False
+        # Grow the page while the bus keeps up, shrink it when it slows down
+        if time.time() - start > self.SEND_LATENCY_TARGET:
+            self._page_size = max(self._page_size // 2, self.MIN_PAGE_SIZE)
+        else:
+            self._page_size = min(self._page_size * 2, self.MAX_PAGE_SIZE)
+        logger.info(f"Published {len(pending)} Accumulated Messages")
+        return True
+
+    def _replay_page(self):
+        """Replay one page of accumulated messages.
+
+        Expired and invalid messages are dropped, the others are sent in
+        one batch and the handled part of the page is acknowledged with
+        one store operation. Returns False when replay has to stop.
+        """
+        first, page = self.store_queue.get_batch(self._page_size)
+        if not page:
+            return False
+
+        # Number of messages from the head of the page already handled
+        done = 0
+        pending = []
+        expired = 0
+        success = True
+        for index, message in enumerate(page):
+            if isinstance(message, bytes):
+                message = message.decode()
+            try:
+                dict_msg = json.loads(message)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Dropping invalid accumulated message, {e}")
+                continue
+            if not isinstance(dict_msg, dict):
+                logger.error(f"Dropping invalid accumulated message {message}")
+                continue
+
+            if dict_msg.get("iem"):
+                iem = dict_msg["iem"]
+                if not isinstance(iem, dict) or not all(key in iem for key in
+                        ("module", "event_code", "severity", "description")):
+                    logger.error(f"Dropping invalid accumulated IEM {message}")
+                    continue
+                # IEMs go through a different channel, send what is
+                # pending first to keep the order
+                if not self._send_pending(pending):
+                    success = False
+                    break
+                pending = []
+                done = index
+                try:
+                    Iem.raise_iem_event(
+                        module=iem["module"],
+                        event_code=iem["event_code"],
+                        severity=iem["severity"],
+                        description=iem["description"])
+                    logger.info("Accumulated IEM sent. %s" % dict_msg)
+                except (EventMessageError, Exception) as e:
+                    logger.error(f"Failed to send IEM. ERROR: {e}")
+                    success = False
+                    break
+                done = index + 1
+            elif self._is_expired(dict_msg):
+                expired += 1
+            else:
+                if "sensor_response_type" in (dict_msg.get("message") or {}):
+                    logger.debug(f"Publishing Accumulated Alert: {message}")
+                pending.append(message)
+        else:
+            if self._send_pending(pending):
+                done = len(page)
+            else:
+                success = False
+
+        if not success:
+            self._page_size = max(self._page_size // 2, self.MIN_PAGE_SIZE)
+        if expired:
+            logger.info(f"Dropped {expired} expired accumulated messages")
+        if done:
+            self.store_queue.ack(first + done)
+        return success
+
     def _read_config(self):
         """Read config for messaging bus."""
         try:
@@ -24,13 +24,13 @@ import json
 import time
 
 from cortx.utils.message_bus import MessageProducer
-from cortx.utils.message_bus.error import MessageBusError
 
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import ScheduledModuleThread
 from framework.utils.conf_utils import SSPL_CONF, Conf
 from framework.utils.service_logging import logger
 from framework.utils.store_queue import StoreQueue
+from framework.messaging.producer_pool import ProducerPool
 from . import producer_initialized
 
 try:
@@ -57,6 +57,12 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
     PRODUCER_ID = 'producer_id'
     MESSAGE_TYPE = 'message_type'
     METHOD = 'method'
+    BATCH_SIZE = 'batch_size'
+    BATCH_TIMEOUT_MS = 'batch_timeout_ms'
+
+    # Secs to block on an empty queue and interval to log throughput
+    IDLE_WAIT = 1
+    STATS_INTERVAL = 300
 
     @staticmethod
     def name():
@@ -81,35 +87,40 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
         self._request_shutdown = False
 
         self._read_config()
+        self._read_batch_config()
         self.create_MsgProducer_obj()
+
+        # Throughput counters
+        self._sent_msgs = 0
+        self._sent_batches = 0
+        self._stats_start = time.time()
         producer_initialized.set()
 
     def create_MsgProducer_obj(self):
-        self._producer = None
-        try:
-            self._producer = MessageProducer(producer_id=self._producer_id,
-                message_type=self._message_type, method=self._method)
-        except Exception as err:
-            logger.error('Instance creation for MessageProducer class failed due to %s' % err)
+        self._producer = ProducerPool.get_producer(self._producer_id,
+            self._message_type, self._method)
 
     def run(self):
-        """Run the module periodically on its own thread. """
+        """Run the module on its own thread, draining the queue in batches."""
         self._log_debug("Start accepting requests")
 
         # self._set_debug(True)
         # self._set_debug_persist(True)
 
-        try:
-            # Loop thru all messages in queue until and transmit
-            while not self._is_my_msgQ_empty():
-                self._jsonMsg, self._event = self._read_my_msgQ()
-
-                if self._jsonMsg is not None:
-                    self._transmit_msg_on_exchange()
-
-        except Exception:
-            # Log it and restart the whole process when a failure occurs
-            logger.error("EgressProcessor restarting")
+        # Drain continuously, a batch is sent once it has batch_size
+        # messages or batch_timeout has elapsed since its first message
+        while self._running and self._request_shutdown is False:
+            try:
+                batch = self._read_my_msgQ_batch(self._batch_size,
+                    self.IDLE_WAIT, self._batch_timeout)
+                if batch:
+                    self._transmit_batch(batch)
+                self._log_throughput()
+
+            except Exception as ex:
+                # Log it and keep draining the queue
+                logger.error(f"EgressProcessor, run, error while processing "
+                             f"batch: {ex}")
 
         self._log_debug("Finished processing successfully")
 
@@ -117,9 +128,19 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
         #  placing a 'shutdown' msg into our queue which allows us to
         #  finish processing any other queued up messages.
         if self._request_shutdown is True:
+            self._drain_msgQ()
             self.shutdown()
-        else:
-            self._scheduler.enter(1, self._priority, self.run, ())
+
+    def _drain_msgQ(self):
+        """Sends the messages queued behind the shutdown message"""
+        try:
+            q = self._msgQlist[self.name()]
+            batch = self._read_my_msgQ_batch(max(q.qsize(), 1), 0)
+            if batch:
+                self._transmit_batch(batch)
+        except Exception as ex:
+            logger.error(f"EgressProcessor, _drain_msgQ, error while "
+                         f"sending queued messages: {ex}")
 
     def _read_config(self):
         """Read the messaging bus configs."""
@@ -146,12 +167,24 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
         except Exception as ex:
             logger.error("EgressProcessor, _read_config: %r" % ex)
 
-    def _add_signature(self):
+    def _read_batch_config(self):
+        """Read the batching configs."""
+        try:
+            self._batch_size = max(int(Conf.get(SSPL_CONF,
+                f"{self.PROCESSOR}>{self.BATCH_SIZE}", 100)), 1)
+            self._batch_timeout = int(Conf.get(SSPL_CONF,
+                f"{self.PROCESSOR}>{self.BATCH_TIMEOUT_MS}", 100)) / 1000.0
+        except Exception as ex:
+            logger.error("EgressProcessor, _read_batch_config: %r" % ex)
+            self._batch_size = 100
+            self._batch_timeout = 0.1
+
+    def _add_signature(self, jsonMsg):
         """Adds the authentication signature to the message"""
-        self._log_debug("_add_signature, jsonMsg: %s" % self._jsonMsg)
-        self._jsonMsg["username"] = self._signature_user
-        self._jsonMsg["expires"] = int(self._signature_expires)
-        self._jsonMsg["time"] = str(int(time.time()))
+        self._log_debug("_add_signature, jsonMsg: %s" % jsonMsg)
+        jsonMsg["username"] = self._signature_user
+        jsonMsg["expires"] = int(self._signature_expires)
+        jsonMsg["time"] = str(int(time.time()))
 
         if use_security_lib:
             authn_token_len = len(self._signature_token) + 1
@@ -164,93 +197,128 @@ class EgressProcessor(ScheduledModuleThread, InternalMsgQ):
                 self._signature_token, session_length, token)
 
             # Generate the signature
-            msg_len = len(self._jsonMsg) + 1
+            msg_len = len(jsonMsg) + 1
             sig = ctypes.create_string_buffer(SSPL_SEC.sspl_get_sig_length())
-            SSPL_SEC.sspl_sign_message(msg_len, str(self._jsonMsg),
+            SSPL_SEC.sspl_sign_message(msg_len, str(jsonMsg),
                                        self._signature_user,
                                        token, sig)
 
-            self._jsonMsg["signature"] = str(sig.raw, encoding='utf-8')
+            jsonMsg["signature"] = str(sig.raw, encoding='utf-8')
         else:
-            self._jsonMsg["signature"] = "SecurityLibNotInstalled"
-
-    def _transmit_msg_on_exchange(self):
-        """Transmit json message onto messaging bus."""
-        self._log_debug(
-            "_transmit_msg_on_exchange, jsonMsg: %s" % self._jsonMsg)
+            jsonMsg["signature"] = "SecurityLibNotInstalled"
 
-        try:
-            # Check for shut down message from sspl_ll_d and set a flag to shutdown
-            #  once our message queue is empty
-            if self._jsonMsg.get("message").get(
-                    "actuator_response_type") is not None and \
-                    self._jsonMsg.get("message").get(
-                        "actuator_response_type").get(
-                        "thread_controller") is not None and \
-                    self._jsonMsg.get("message").get(
-                        "actuator_response_type").get("thread_controller").get(
-                        "thread_response") == \
-                    "SSPL-LL is shutting down":
-                logger.info(
-                    "EgressProcessor, _transmit_msg_on_exchange, received"
-                    "global shutdown message from sspl_ll_d")
-                self._request_shutdown = True
-
-            # Publish json message to the correct channel
-            # NOTE: We need to route ThreadController messages to ACK channel.
-            # We can't modify schema as it will affect other modules too. As a
-            # temporary solution we have added a extra check to see if actuator_response_type
-            # is "thread_controller".
-            # TODO: Find a proper way to solve this issue. Avoid changing
-            # core egress processor code
-            if self._jsonMsg.get("message").get(
-                    "actuator_response_type") is not None and \
-                    (self._jsonMsg.get("message").get(
-                        "actuator_response_type").get("ack") is not None or
-                     self._jsonMsg.get("message").get(
-                         "actuator_response_type").get(
-                         "thread_controller") is not None):
-                self._add_signature()
-                if isinstance(self._producer, MessageProducer):
-                    self._producer.send([json.dumps(self._jsonMsg)])
+    @staticmethod
+    def _get_actuator_response_type(jsonMsg):
+        """Returns the actuator_response_type section of the message if any"""
+        message = jsonMsg.get("message")
+        if message is None:
+            return None
+        return message.get("actuator_response_type")
+
+    def _transmit_batch(self, batch):
+        """Transmit a batch of (jsonMsg, event) onto messaging bus."""
+        responses = []
+        alerts = []
+        for jsonMsg, _ in batch:
+            try:
+                response_type = self._get_actuator_response_type(jsonMsg)
+                # Check for shut down message from sspl_ll_d and set a flag to shutdown
+                #  once our message queue is empty
+                if response_type is not None and \
+                        response_type.get("thread_controller") is not None and \
+                        response_type.get("thread_controller").get(
+                            "thread_response") == "SSPL-LL is shutting down":
+                    logger.info(
+                        "EgressProcessor, _transmit_batch, received"
+                        "global shutdown message from sspl_ll_d")
+                    self._request_shutdown = True
+
+                # Signed on a copy, the queued message may be cached and
+                # sent again by its sender
+                jsonMsg = dict(jsonMsg)
+                self._add_signature(jsonMsg)
+                # NOTE: We need to route ThreadController messages to ACK channel.
+                # We can't modify schema as it will affect other modules too. As a
+                # temporary solution we have added a extra check to see if actuator_response_type
+                # is "thread_controller".
+                # TODO: Find a proper way to solve this issue. Avoid changing
+                # core egress processor code
+                if response_type is not None and \
+                        (response_type.get("ack") is not None or
+                         response_type.get("thread_controller") is not None):
+                    responses.append(json.dumps(jsonMsg))
                 else:
-                    self.create_MsgProducer_obj()
-                logger.debug(
-                    "_transmit_msg_on_exchange, Successfully Sent: %s" % self._jsonMsg)
+                    alerts.append(json.dumps(jsonMsg))
+            except Exception as ex:
+                logger.error(
+                    f'EgressProcessor, _transmit_batch, problem while preparing the message:{ex}, dropping message: {jsonMsg}')
+
+        if responses:
+            failed = self._send_batch(responses)
+            for jsonMsg in failed:
+                logger.error(f"EgressProcessor, _transmit_batch, failed to send response {jsonMsg}")
+
+        if alerts:
+            if self.store_queue.is_empty():
+                failed = self._send_batch(alerts)
+                if not failed:
+                    for jsonMsg in alerts:
+                        logger.info(f"Published Alert: {jsonMsg}")
             else:
-                self._add_signature()
-                jsonMsg = json.dumps(self._jsonMsg)
-                try:
-                    if self.store_queue.is_empty():
-                        if isinstance(self._producer, MessageProducer):
-                            self._producer.send([jsonMsg])
-                            logger.info(f"Published Alert: {jsonMsg}")
-                        else:
-                            logger.info(f"MessageProducer instance is not available,"
-                                "adding message to accumulated queue.")
-                            self.store_queue.put(jsonMsg)
-                            self.create_MsgProducer_obj()
-                    else:
-                        logger.info("'Accumulated msg queue' is not Empty." +
-                                    " Adding the msg to the end of the queue")
-                        self.store_queue.put(jsonMsg)
-                except MessageBusError as e:
-                    logger.error(
-                        f"EgressProcessor, _transmit_msg_on_exchange, error {e} in producing message,\
-                                    adding message to consul {self._jsonMsg}")
-                    self.store_queue.put(jsonMsg)
-                except Exception as err:
-                    logger.error(
-                        f'EgressProcessor, _transmit_msg_on_exchange, Unknown error {err} while publishing the message, adding to persistent store {self._jsonMsg}')
-                    self.store_queue.put(jsonMsg)
-
-            # If event is added by sensors, set it
-            if self._event:
-                self._event.set()
+                logger.info("'Accumulated msg queue' is not Empty." +
+                            " Adding the msgs to the end of the queue")
+                failed = alerts
+            # Only the messages which could not be sent are accumulated
+            for jsonMsg in failed:
+                self.store_queue.put(jsonMsg)
+
+        self._sent_msgs += len(responses) + len(alerts)
+        self._sent_batches += 1
+
+        # If event is added by sensors, set it
+        for _, event in batch:
+            if event:
+                event.set()
+
+    def _send_batch(self, messages):
+        """Send messages with one producer call, returns the ones not sent."""
+        if not isinstance(self._producer, MessageProducer):
+            logger.info("MessageProducer instance is not available, "
+                        "adding messages to accumulated queue.")
+            self.create_MsgProducer_obj()
+            return messages
 
-        except Exception as ex:
-            logger.error(
-                f'EgressProcessor, _transmit_msg_on_exchange, problem while publishing the message:{ex}, adding message to consul: {self._jsonMsg}')
+        try:
+            self._producer.send(messages)
+            return []
+        except Exception as err:
+            # What the bus accepted of a failed batch is unknown, the whole
+            # batch is considered not sent rather than resending part of it
+            logger.error(f"EgressProcessor, _send_batch, error {err} in "
+                         f"producing batch of {len(messages)} messages")
+            return messages
+
+    def get_throughput(self):
+        """Returns messages/sec and average batch size since last reset"""
+        elapsed = max(time.time() - self._stats_start, 1e-6)
+        batch_size = self._sent_msgs / self._sent_batches \
+                        if self._sent_batches else 0
+        return {"msgs_per_sec": self._sent_msgs / elapsed,
+                "avg_batch_size": batch_size}
+
+    def _log_throughput(self):
+        """Log the throughput counters every STATS_INTERVAL secs"""
+        if time.time() - self._stats_start < self.STATS_INTERVAL:
+            return
+        if self._sent_batches:
+            stats = self.get_throughput()
+            logger.info(f"EgressProcessor, sent {self._sent_msgs} msgs in "
+                        f"{self._sent_batches} batches, "
+                        f"{stats['msgs_per_sec']:.2f} msgs/sec, "
+                        f"avg batch size {stats['avg_batch_size']:.2f}")
+        self._sent_msgs = 0
+        self._sent_batches = 0
+        self._stats_start = time.time()
 
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
@@ -21,21 +21,19 @@
 
 import ctypes
 import json
-import os
 import time
 
 from cortx.utils.message_bus import MessageConsumer
-from jsonschema import Draft3Validator, validate
 
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import ScheduledModuleThread
-from framework.base.sspl_constants import RESOURCE_PATH
 from framework.messaging.egress_processor import \
     EgressProcessor
 from framework.utils.conf_utils import (
     SSPL_CONF, Conf, GLOBAL_CONF, NODE_ID_KEY)
 from framework.utils.service_logging import logger
 from json_msgs.messages.actuators.ack_response import AckResponseMsg
+from json_msgs.schema_registry import SchemaRegistry
 from . import producer_initialized
 
 try:
@@ -74,29 +72,13 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
         super(IngressProcessor, self).__init__(self.MODULE_NAME,
                                                        self.PRIORITY)
 
-        # Read in the actuator schema for validating messages
-        schema_file = os.path.join(RESOURCE_PATH + '/actuators',
-                                   self.JSON_ACTUATOR_SCHEMA)
-        self._actuator_schema = self._load_schema(schema_file)
-
-        # Read in the sensor schema for validating messages
-        schema_file = os.path.join(RESOURCE_PATH + '/sensors',
-                                   self.JSON_SENSOR_SCHEMA)
-        self._sensor_schema = self._load_schema(schema_file)
-
-    def _load_schema(self, schema_file):
-        """Loads a schema from a file and validates
-
-        @param string schema_file     location of schema on the file system
-        @return string                Trimmed and validated schema
-        """
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
-
-        # Validate the schema to conform to Draft 3 specification
-        Draft3Validator.check_schema(schema)
-
-        return schema
+        # Requests are always validated, sampling applies to the messages
+        # sent only
+        registry = SchemaRegistry.get_instance()
+        self._actuator_validator = registry.get_validator(
+            SchemaRegistry.ACTUATOR_REQUEST)
+        self._sensor_validator = registry.get_validator(
+            SchemaRegistry.SENSOR_REQUEST)
 
     def initialize(self, conf_reader, msgQlist, product):
         """initialize configuration reader and internal msg queues"""
@@ -192,7 +174,7 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
                 msgType = message.get("actuator_request_type")
 
                 # Validate against the actuator schema
-                validate(ingressMsg, self._actuator_schema)
+                self._actuator_validator.validate(ingressMsg)
                 # Compare target_node_id from the request to determine
                 # if request is meant for the current node
                 target_node_id = message.get("target_node_id")
@@ -212,7 +194,7 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
                 msgType = message.get("sensor_request_type")
 
                 # Validate against the sensor schema
-                validate(ingressMsg, self._sensor_schema)
+                self._sensor_validator.validate(ingressMsg)
                 self._send_to_msg_handler(msgType, message, uuid)
 
             else:
@@ -225,7 +207,7 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
                 "IngressProcessor, _process_msg failed to recognize "
                 "message: %r with error %r" % (ingressMsg, ex))
             ack_msg = AckResponseMsg("Error Processing Msg",
-                                     "Msg Handler Not Found", uuid).getJson()
+                                     "Msg Handler Not Found", uuid).getMsg()
             self._write_internal_msgQ(EgressProcessor.name(), ack_msg)
 
     def _send_to_msg_handler(self, msgType, message, uuid):
@@ -256,7 +238,7 @@ class IngressProcessor(ScheduledModuleThread, InternalMsgQ):
             # Send ack about not finding a msg handler
             ack_msg = AckResponseMsg("Error Processing Message",
                                      "Message Handler Not Found",
-                                     uuid).getJson()
+                                     uuid).getMsg()
             self._write_internal_msgQ(EgressProcessor.name(),
                                       ack_msg)
 
@@ -0,0 +1,53 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Process wide pool of MessageProducer instances shared
+                    by the egress modules.
+ ****************************************************************************
+"""
+
+import threading
+
+from cortx.utils.message_bus import MessageProducer
+
+from framework.utils.service_logging import logger
+
+
+class ProducerPool(object):
+    """Hands out one MessageProducer per (producer_id, message_type, method)"""
+
+    _producers = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_producer(cls, producer_id, message_type, method):
+        """Returns the pooled producer, creating it on first use.
+
+        Returns None if the producer could not be created.
+        """
+        key = (producer_id, message_type, method)
+        with cls._lock:
+            producer = cls._producers.get(key)
+            if producer is None:
+                try:
+                    producer = MessageProducer(producer_id=producer_id,
+                        message_type=message_type, method=method)
+                    cls._producers[key] = producer
+                except Exception as err:
+                    logger.error('Instance creation for MessageProducer '
+                                 'class failed due to %s' % err)
+            return producer
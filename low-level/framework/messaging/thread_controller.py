@@ -28,6 +28,7 @@ from socket import gethostname
 from threading import Thread
 
 from framework.base.internal_msgQ import InternalMsgQ
+from framework.base.scheduler_core import SchedulerCore
 from framework.base.module_thread import (ScheduledModuleThread, SensorThread,
     SensorThreadState)
 from framework.base.sspl_constants import (OperatingSystem, cs_legacy_products,
@@ -91,6 +92,9 @@ def execute_thread(module, msgQlist, conf_reader, product, resume=True):
         and failure alert will be raised due to its impact.
     If recovery count=0,
         no recovery attempt will be made.
+
+    Modules running on the scheduler core workers return right away, their
+    failures are reported by the core and recovered from a scheduled job.
     """
     module_name = module.name()
     # Suspend module threads
@@ -110,6 +114,12 @@ def execute_thread(module, msgQlist, conf_reader, product, resume=True):
         recovery_count, recovery_interval = _get_recovery_config(module_name)
         is_sensor_thread = True
 
+    if module.runs_on_core_workers():
+        _start_on_core_workers(module, msgQlist, conf_reader, product,
+            per_data_path, is_sensor_thread, recovery_count,
+            recovery_interval, 1)
+        return
+
     attempt = 0
 
     while attempt <= recovery_count:
@@ -119,50 +129,92 @@ def execute_thread(module, msgQlist, conf_reader, product, resume=True):
             # can transmit internal messages to other modules as desired
             module.start_thread(conf_reader, msgQlist, product)
         except Exception as err:
-            curr_state = "fault"
-            err_msg = f"{module_name}, {err}"
-            logger.error(err_msg)
-            if attempt > recovery_count:
-                logger.debug(traceback.format_exc())
-                description = f"{module_name} is stopped and unrecoverable. {err_msg}"
-                impact = module.impact()
-                recommendation = "Restart SSPL service"
-                logger.critical(
-                    f"{description}. Impact: {impact} Recommendation: {recommendation}")
-                # Check previous state of the module and send fault alert
-                if os.path.isfile(per_data_path):
-                    module_persistent_data[module_name] = store.get(per_data_path)
-                prev_state = module_persistent_data[module_name].get('prev_state')
-                if is_sensor_thread and curr_state != prev_state:
-                    module_persistent_data[module_name] = {"prev_state": curr_state}
-                    store.put(module_persistent_data[module_name], per_data_path)
-                    specific_info = Conf.get(SSPL_CONF, f"{module_name.upper()}")
-                    info = {
-                        "module_name": module_name,
-                        "alert_type": curr_state,
-                        "description": description,
-                        "impact": impact,
-                        "recommendation": recommendation,
-                        "severity": "critical",
-                        "specific_info": specific_info
-                    }
-                    jsonMsg = ThreadMonitorMsg(info).getJson()
-                    module._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-            else:
+            _report_module_failure(module, err, attempt > recovery_count,
+                                   per_data_path, is_sensor_thread)
+            if attempt <= recovery_count:
                 logger.debug(f"Recovering {module_name} from failure, "
                              f"attempt: {attempt}")
                 time.sleep(recovery_interval)
+            _terminate_module(module)
 
-            # Shutdown if no recovery attempt
-            logger.info(f"Terminating monitoring thread {module_name}")
-            module.shutdown()
-            retry = 5
-            while module.is_running():
-                module.shutdown()
-                retry -= 1
-                if not retry:
-                    break
-                time.sleep(2)
+
+def _start_on_core_workers(module, msgQlist, conf_reader, product,
+                           per_data_path, is_sensor_thread, recovery_count,
+                           recovery_interval, attempt):
+    """
+    Start a module running on the scheduler core workers. A failure
+    schedules the next start after the recovery interval, as long as
+    recovery attempts are left.
+    """
+    def _on_failure(err):
+        _report_module_failure(module, err, attempt > recovery_count,
+                               per_data_path, is_sensor_thread)
+        _terminate_module(module)
+        if attempt <= recovery_count:
+            logger.debug(f"Recovering {module.name()} from failure, "
+                         f"attempt: {attempt}")
+            SchedulerCore.get_instance().schedule(recovery_interval,
+                _start_on_core_workers, (module, msgQlist, conf_reader,
+                product, per_data_path, is_sensor_thread, recovery_count,
+                recovery_interval, attempt + 1))
+
+    # Drop the events left by a failed run, its shut down included
+    module._cleanup_and_stop()
+    module.set_failure_handler(_on_failure)
+    try:
+        module.start_thread(conf_reader, msgQlist, product)
+    except Exception as err:
+        _on_failure(err)
+
+
+def _report_module_failure(module, err, unrecoverable, per_data_path,
+                           is_sensor_thread):
+    """Log the failure, raise the fault alert if module is unrecoverable"""
+    module_name = module.name()
+    curr_state = "fault"
+    err_msg = f"{module_name}, {err}"
+    logger.error(err_msg)
+    if not unrecoverable:
+        return
+    logger.debug("".join(traceback.format_exception(
+        type(err), err, err.__traceback__)))
+    description = f"{module_name} is stopped and unrecoverable. {err_msg}"
+    impact = module.impact()
+    recommendation = "Restart SSPL service"
+    logger.critical(
+        f"{description}. Impact: {impact} Recommendation: {recommendation}")
+    # Check previous state of the module and send fault alert
+    if os.path.isfile(per_data_path):
+        module_persistent_data[module_name] = store.get(per_data_path)
+    prev_state = module_persistent_data[module_name].get('prev_state')
+    if is_sensor_thread and curr_state != prev_state:
+        module_persistent_data[module_name] = {"prev_state": curr_state}
+        store.put(module_persistent_data[module_name], per_data_path)
+        specific_info = Conf.get(SSPL_CONF, f"{module_name.upper()}")
+        info = {
+            "module_name": module_name,
+            "alert_type": curr_state,
+            "description": description,
+            "impact": impact,
+            "recommendation": recommendation,
+            "severity": "critical",
+            "specific_info": specific_info
+        }
+        jsonMsg = ThreadMonitorMsg(info).getMsg()
+        module._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
+
+
+def _terminate_module(module):
+    """Shutdown the module and wait for it to stop"""
+    logger.info(f"Terminating monitoring thread {module.name()}")
+    module.shutdown()
+    retry = 5
+    while module.is_running():
+        module.shutdown()
+        retry -= 1
+        if not retry:
+            break
+        time.sleep(2)
 
 
 def _check_module_recovered(module):
@@ -202,7 +254,7 @@ def _check_module_recovered(module):
             "severity": "info",
             "specific_info": specific_info
         }
-        jsonMsg = ThreadMonitorMsg(info).getJson()
+        jsonMsg = ThreadMonitorMsg(info).getMsg()
         module._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
 
 
@@ -222,6 +274,9 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
     SSPL_SETTING = 'SSPL_LL_SETTING'
     DEGRADED_STATE_MODULES = 'degraded_state_modules'
 
+    # Interval in secs for logging the internal queue metrics
+    MSGQ_STATS_INTERVAL = 300
+
     @staticmethod
     def name():
         """ @return: name of the monitoring module."""
@@ -233,6 +288,7 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
         self._threads_initialized = False
         self._thread_response = "N/A"
         self.debug_section = None
+        self._msgQ_stats_job = None
 
         # Location of hpi data directory populated by dcs-collector
         self._hpi_base_dir = "/tmp/dcs/hpi"
@@ -256,6 +312,10 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
         super(ThreadController, self).initialize_msgQ(msgQlist)
         self._modules_to_resume = self._get_degraded_state_modules_list()
 
+        if self._msgQ_stats_job is None:
+            self._msgQ_stats_job = SchedulerCore.get_instance().schedule_periodic(
+                self.MSGQ_STATS_INTERVAL, self._log_msgQ_stats)
+
     def initialize_thread_list(self, sspl_modules, operating_system, product,
                                systemd_support):
         """initialize list of references to all modules"""
@@ -327,7 +387,7 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
 
             # Notify external applications that've started up successfully
             startup_msg = "SSPL-LL service has started successfully"
-            json_msg = ThreadControllerMsg(ThreadController.name(), startup_msg).getJson()
+            json_msg = ThreadControllerMsg(ThreadController.name(), startup_msg).getMsg()
             self._write_internal_msgQ(EgressProcessor.name(), json_msg)
             self._threads_initialized = True
 
@@ -357,7 +417,7 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
             # Log it and restart the whole process when a failure occurs
             logger.exception("ThreadController restarting: %r" % ex)
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
     def _process_msg(self, jsonMsg):
@@ -404,6 +464,8 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
             self._stop_module(module_name)
         elif thread_request == "status":
             self._status_module(module_name)
+        elif thread_request == "queue_stats":
+            self._queue_stats(module_name)
         elif thread_request == "degrade":
             if module_name.lower() != "all":
                 logger.warn(
@@ -436,7 +498,7 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
 
         if uuid is not None:
             threadControllerMsg.set_uuid(uuid)
-        msgString = threadControllerMsg.getJson()
+        msgString = threadControllerMsg.getMsg()
         logger.info("ThreadController, response: %s" % str(msgString))
         if self._product.lower() in [x.lower() for x in enabled_products]:
             self._write_internal_msgQ(EgressProcessor.name(), msgString)
@@ -562,6 +624,20 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
                         (module_name, self._thread_response))
         return self._sspl_modules[module_name].is_running()
 
+    def _queue_stats(self, module_name):
+        """Sets the response to the internal queue metrics of a module,
+           all of them if module_name is 'all'"""
+        stats = self._get_msgQ_stats()
+        if module_name.lower() != "all":
+            stats = {module_name: stats.get(module_name)}
+        self._thread_response = json.dumps(stats)
+
+    def _log_msgQ_stats(self):
+        """Logs depth, rates and message age of the busy internal queues"""
+        for module_name, stats in self._get_msgQ_stats().items():
+            if stats["enqueue_rate"] or stats["depth"]:
+                logger.info(f"ThreadController, {module_name} queue: {stats}")
+
     def _check_reset_all_modules(self, jsonMsg):
         """Restarts all modules with debug mode off. Activated by internal_msgQ"""
         if jsonMsg.get("sspl_ll_debug") is not None and \
@@ -574,7 +650,7 @@ class ThreadController(ScheduledModuleThread, InternalMsgQ):
                         self._restart_module(module)
 
                 # Populate an actuator response message and transmit
-                msgString = ThreadControllerMsg("All Modules", "Restarted with debug mode off").getJson()
+                msgString = ThreadControllerMsg("All Modules", "Restarted with debug mode off").getMsg()
                 self._write_internal_msgQ(EgressProcessor.name(), msgString)
                 return True
 
@@ -21,9 +21,15 @@
 
 import hashlib
 import json
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.exceptions import RequestException
 
 from framework.base import sspl_constants as sspl_const
+from framework.platforms.realstor.realstor_snapshot import RealStorSnapshotService
 from framework.target.enclosure import StorageEnclosure
 from framework.utils import encryptor
 from framework.utils.conf_utils import (GLOBAL_CONF, MGMT_INTERFACE,
@@ -80,6 +86,23 @@ class RealStorEnclosure(StorageEnclosure):
     URI_CLIAPI_BASE = "/"
     URI_CLIAPI_DOWNLOADDEBUGDATA = "/downloadDebugData"
     URL_ENCLLOGS_POSTDATA = "/api/collectDebugData"
+    ENCL_LOGS_ATTACHMENT = 'attachment; filename="store.zip"'
+
+    # FRU to show API used by get_realstor_encl_data
+    FRU_URI_MAP = {
+        "controllers": URI_CLIAPI_SHOWCONTROLLERS,
+        "power-supplies": URI_CLIAPI_SHOWPSUS,
+        "sensors": URI_CLIAPI_SHOWSENSORSTATUS,
+        "volumes": URI_CLIAPI_SHOWVOLUMES,
+        "disk-groups": URI_CLIAPI_SHOWDISKGROUPS,
+        "enclosures": URI_CLIAPI_SHOWENCLOSURE,
+        "network-parameters": URI_CLIAPI_NETWORKHEALTHSTATUS,
+        "drives": URI_CLIAPI_SHOWDISKS,
+        "expander-ports": URI_CLIAPI_SASHEALTHSTATUS,
+        "fan-modules": URI_CLIAPI_SHOWFANMODULES,
+        "frus": URI_CLIAPI_SHOWFRUS,
+        "versions": URI_CLIAPI_SHOWVERSION
+    }
 
     # CLI APIs Response status strings
     CLIAPI_RESP_INVSESSION = "Invalid sessionkey"
@@ -119,6 +142,9 @@ class RealStorEnclosure(StorageEnclosure):
     # faults, so no comparison to check for new faults is feasible
     existing_faults = False
 
+    # Concurrent show requests issued by fetch_many
+    FETCH_WORKERS = 4
+
     def __init__(self):
         super(RealStorEnclosure, self).__init__()
 
@@ -126,6 +152,9 @@ class RealStorEnclosure(StorageEnclosure):
         self.ws = WebServices()
         self.common_reqheaders = {}
 
+        # Serializes the logins of the threads sharing the session key
+        self._login_lock = threading.Lock()
+
         self.encl_conf = self.CONF_SECTION_MC
 
         self.system_persistent_cache = self.encl_cache + "system/"
@@ -148,6 +177,10 @@ class RealStorEnclosure(StorageEnclosure):
         self.pollfreq = int(Conf.get(SSPL_CONF, f"{self.CONF_REALSTORSENSORS}>{POLLING_FREQUENCY}",
                         self.DEFAULT_POLL))
 
+        # FRU data shared by the realstor sensors
+        self.snapshots = RealStorSnapshotService(self, self.pollfreq,
+                                                 self.FETCH_WORKERS)
+
         # Decrypt MC secret
         decryption_key = encryptor.gen_key(ENCLOSURE,
                     sspl_const.ServiceTypes.STORAGE_ENCLOSURE.value)
@@ -202,8 +235,11 @@ class RealStorEnclosure(StorageEnclosure):
             ".format(self.active_ip, self.active_wsport))
 
     def ws_request(self, url, method, retry_count=MAX_RETRIES,
-            post_data=""):
-        """Make webservice requests using common utils"""
+            post_data="", headers=None, stream=False):
+        """Make webservice requests using common utils, headers are added to
+           the common request headers. The body of a stream request is not
+           loaded unless it is json.
+        """
         response = None
         retried_login = False
         need_relogin = False
@@ -214,9 +250,13 @@ class RealStorEnclosure(StorageEnclosure):
                 # Extract show fru name from old URL to update alternative IP.
                 url = self.build_url(url[url.index('/api/'):].replace('/api',''))
 
+            session_key = self.common_reqheaders.get('sessionKey')
+            reqheaders = self.common_reqheaders
+            if headers:
+                reqheaders = dict(reqheaders, **headers)
             response = self.ws.ws_request(method, url,
-                       self.common_reqheaders, post_data,
-                       self.WEBSERVICE_TIMEOUT)
+                       reqheaders, post_data,
+                       self.WEBSERVICE_TIMEOUT, stream=stream)
 
             retry_count -= 1
 
@@ -229,6 +269,10 @@ class RealStorEnclosure(StorageEnclosure):
 
                 self.mc_timeout_counter = 0
 
+                if stream and not response.headers.get(
+                        'Content-Type', '').startswith('application/json'):
+                    break
+
                 try:
                     jresponse = json.loads(response.content)
 
@@ -252,7 +296,7 @@ class RealStorEnclosure(StorageEnclosure):
                 need_relogin) and retried_login is False:
                 logger.info("%s failed, retrying after login " % (url))
 
-                self.login()
+                self.login(stale_key=session_key)
                 retried_login = True
                 need_relogin = False
                 continue
@@ -270,10 +314,20 @@ class RealStorEnclosure(StorageEnclosure):
 
         return response
 
-    def login(self):
+    def login(self, stale_key=None):
         """Perform realstor login to get session key & make it available
-           in common request headers"""
+           in common request headers.
 
+           stale_key is the session key rejected by the controller, login is
+           skipped if another thread already replaced it.
+        """
+        with self._login_lock:
+            if stale_key is not None and \
+                    self.common_reqheaders.get('sessionKey') != stale_key:
+                return
+            self._login()
+
+    def _login(self):
         cli_api_auth = self.user + '_' + self.__passwd
 
         url = self.build_url(self.URI_CLIAPI_LOGIN)
@@ -365,118 +419,68 @@ class RealStorEnclosure(StorageEnclosure):
     def get_system_status(self):
         """Retreive realstor system state info using cli api /show/system"""
 
-        # poll system would get invoked through multiple realstor sensors
-        # with less frequency compared to configured polling frequency
-        # adding check to comply with polling frequency
-        elapsed = time.time() - self.poll_system_ts
+        # poll system gets invoked through multiple realstor sensors, the
+        # system data is fetched once per polling cycle by the snapshot
+        # service and processed once per fetch
+        snapshot = self.snapshots.get_snapshot(["system"])
+        fetched = snapshot.updated.get("system")
+        if fetched == self.poll_system_ts:
+            return
+        self.poll_system_ts = fetched
 
-        if elapsed < self.pollfreq:
-            logger.warn("/show/system request came in {0} seconds,"
-                "while configured polling frequency is {1} seconds,"
-                "ignoring".format(elapsed, self.pollfreq))
+        system = snapshot.get("system")
+        if not system:
+            logger.warn("System status unavailable as ws request failed")
+            return
+        system = system[0]
+        self.memcache_system = system
+
+        # Check if fault exists
+        # TODO: use self.FAULT_KEY in system: system.key() generates
+        # list and find item in that.
+        if not self.FAULT_KEY in system.keys():
+            logger.debug("{0} Healthy, no faults seen".format(self.LDR_R1_ENCL))
+            self.latest_faults = {}
             return
 
-        system = None
+        # Extract system faults
+        self.latest_faults = system[self.FAULT_KEY]
 
-        # make ws request
-        url = self.build_url(self.URI_CLIAPI_SHOWSYSTEM)
-        #logger.info("show system url: %s" % url)
+        #If no in-memory fault cache built yet!
+        if not self.memcache_faults:
+            # build from persistent cache if available
+            logger.info(
+                "No cached faults, building from  persistent cache {0}"\
+                .format(self.faults_persistent_cache))
 
-        response = self.ws_request(url, self.ws.HTTP_GET)
+            self.memcache_faults = store.get(
+                                       self.faults_persistent_cache)
 
-        if not response:
-            logger.warn("System status unavailable as ws request failed")
-            return
+            # still if none, build from latest faults & persist
+            if not self.memcache_faults:
+                logger.info("No persistent faults cache, building "
+                    "cache from latest faults")
 
-        if response.status_code != self.ws.HTTP_OK:
-            logger.info("{0}:: http request {1} polling system status failed"
-                " with http err {2}".format(self.LDR_R1_ENCL, url, \
-                response.status_code))
-            return
+                self.memcache_faults = self.latest_faults
 
-        self.poll_system_ts = time.time()
+                # On SSPL boot, run through existing faults as no cache to
+                # verify with for new faults
+                self.existing_faults = True
 
-        try:
-            jresponse = json.loads(response.content)
-        except ValueError as badjson:
-            logger.error("%s returned mal-formed json:\n%s" % (url, badjson))
+                #logger.debug("existing_faults {0}".\
+                #    format(self.existing_faults))
 
-        if jresponse:
-            api_resp = self.get_api_status(jresponse['status'])
-
-            if ((api_resp == -1) and
-                   (response.status_code == self.ws.HTTP_OK)):
-                logger.warn("/show/system api response unavailable, "
-                    "marking success as http code is 200")
-                api_resp = 0
-
-            if api_resp == 0:
-                system = jresponse['system'][0]
-                self.memcache_system = system
-
-            if system:
-                # Check if fault exists
-                # TODO: use self.FAULT_KEY in system: system.key() generates
-                # list and find item in that.
-                if not self.FAULT_KEY in system.keys():
-                    logger.debug("{0} Healthy, no faults seen".format(self.LDR_R1_ENCL))
-                    self.latest_faults = {}
-                    return
-
-                # Extract system faults
-                self.latest_faults = system[self.FAULT_KEY]
-
-                #If no in-memory fault cache built yet!
-                if not self.memcache_faults:
-                    # build from persistent cache if available
-                    logger.info(
-                        "No cached faults, building from  persistent cache {0}"\
-                        .format(self.faults_persistent_cache))
-
-                    self.memcache_faults = store.get(
-                                               self.faults_persistent_cache)
-
-                    # still if none, build from latest faults & persist
-                    if not self.memcache_faults:
-                        logger.info("No persistent faults cache, building "
-                            "cache from latest faults")
-
-                        self.memcache_faults = self.latest_faults
-
-                        # On SSPL boot, run through existing faults as no cache to
-                        # verify with for new faults
-                        self.existing_faults = True
-
-                        #logger.debug("existing_faults {0}".\
-                        #    format(self.existing_faults))
-
-                        store.put(self.memcache_faults,
-                            self.faults_persistent_cache)
-                else:
-                     # Reset flag as existing faults processed by now
-                     # and cached faults are built already
-                     self.existing_faults = False
-            else:
-                logger.error("poll system failed with err %d" % api_resp)
+                store.put(self.memcache_faults,
+                    self.faults_persistent_cache)
+        else:
+            # Reset flag as existing faults processed by now
+            # and cached faults are built already
+            self.existing_faults = False
 
     def get_realstor_encl_data(self, fru: str):
         """Fetch fru information through webservice API."""
         fru_data = []
-        fru_uri_map = {
-            "controllers": self.URI_CLIAPI_SHOWCONTROLLERS,
-            "power-supplies": self.URI_CLIAPI_SHOWPSUS,
-            "sensors": self.URI_CLIAPI_SHOWSENSORSTATUS,
-            "volumes": self.URI_CLIAPI_SHOWVOLUMES,
-            "disk-groups": self.URI_CLIAPI_SHOWDISKGROUPS,
-            "enclosures": self.URI_CLIAPI_SHOWENCLOSURE,
-            "network-parameters": self.URI_CLIAPI_NETWORKHEALTHSTATUS,
-            "drives": self.URI_CLIAPI_SHOWDISKS,
-            "expander-ports": self.URI_CLIAPI_SASHEALTHSTATUS,
-            "fan-modules": self.URI_CLIAPI_SHOWFANMODULES,
-            "frus": self.URI_CLIAPI_SHOWFRUS,
-            "versions": self.URI_CLIAPI_SHOWVERSION
-        }
-        url = self.build_url(fru_uri_map.get(fru))
+        url = self.build_url(self.FRU_URI_MAP.get(fru))
         response = self.ws_request(url, self.ws.HTTP_GET)
         if fru == "frus":
             fru = "enclosure-fru"
@@ -489,6 +493,18 @@ class RealStorEnclosure(StorageEnclosure):
 
         return fru_data
 
+    def fetch_many(self, frus):
+        """Fetch information of several frus concurrently over the pooled
+           controller connections, returns dict of fru to its data."""
+        frus = list(frus)
+        if len(frus) <= 1:
+            return {fru: self.get_realstor_encl_data(fru) for fru in frus}
+
+        with ThreadPoolExecutor(max_workers=min(self.FETCH_WORKERS,
+                                                len(frus))) as executor:
+            fru_data = executor.map(self.get_realstor_encl_data, frus)
+            return dict(zip(frus, fru_data))
+
     def load_storage_fru_list(self):
         """Get Storage FRU list and merge it with storage_fru_list,
         maintained in global config, with which FRU list can be extended
@@ -594,7 +610,7 @@ class RealStorEnclosure(StorageEnclosure):
             for encl_download_retry_index in range(0,
                                     sspl_const.ENCL_DOWNLOAD_LOG_MAX_RETRY):
                 response = self.ws_request(
-                    url, self.ws.HTTP_GET)
+                    url, self.ws.HTTP_GET, stream=True)
                 if not response:
                     logger.error("{0}:: {2} status unavailable as ws request {1}"
                                  " failed".format(
@@ -619,10 +635,9 @@ class RealStorEnclosure(StorageEnclosure):
                                 response_data["status"][0]["response-type"], url))
                             break
                     elif response.headers.get('Content-Type') == 'IntentionallyUnknownMimeType; charset="utf-8"':
-                        if response.headers.get('content-disposition') == 'attachment; filename="store.zip"':
-                            with open(file_name, 'wb') as enclosure_resp:
-                                enclosure_resp.write(response.content)
-                                enclosure_resp.close()
+                        if response.headers.get('content-disposition') == self.ENCL_LOGS_ATTACHMENT:
+                            if self._save_enclosure_logs(url, response,
+                                                         file_name, logger):
                                 logger.info(
                                     "Enclosure debug logs saved successfully")
                         else:
@@ -637,6 +652,77 @@ class RealStorEnclosure(StorageEnclosure):
                     logger.error("ERR: Enclosure debug logs retry count "
                                  "exceeded::{0}".format(url))
 
+    def _save_enclosure_logs(self, url, response, file_name, logger):
+        """Streams the debug logs downloaded to file_name in chunks. An
+           interrupted download is resumed from the bytes saved with a Range
+           request. Returns True if the logs were saved.
+        """
+        part_name = f"{file_name}.part"
+        saved = 0
+        with open(part_name, 'wb') as enclosure_resp:
+            for resume_index in range(
+                    sspl_const.ENCL_DOWNLOAD_LOG_RESUME_MAX_RETRY + 1):
+                if resume_index:
+                    logger.warn("{0}:: Debug log download {1} interrupted "
+                                "after {2} bytes, resuming: {3}".format(
+                                    self.LDR_R1_ENCL, url, saved, error))
+                    response = self.ws_request(url, self.ws.HTTP_GET,
+                        headers={'Range': f'bytes={saved}-'}, stream=True)
+                error = self._check_download_response(response, saved)
+                if error:
+                    continue
+                if response.status_code == self.ws.HTTP_OK:
+                    # Controller sent the whole file
+                    enclosure_resp.seek(0)
+                    enclosure_resp.truncate()
+                    saved = 0
+                size = self._get_download_size(response)
+                try:
+                    for chunk in response.iter_content(
+                            sspl_const.ENCL_DOWNLOAD_LOG_CHUNK_SIZE):
+                        enclosure_resp.write(chunk)
+                        saved += len(chunk)
+                except RequestException as err:
+                    error = err
+                finally:
+                    response.close()
+                if not error and (size is None or saved >= size):
+                    break
+                error = error or f"{saved} of {size} bytes received"
+            else:
+                logger.error("ERR: Enclosure debug logs download retry count "
+                             "exceeded::{0}: {1}".format(url, error))
+        if error:
+            os.remove(part_name)
+            return False
+        os.replace(part_name, file_name)
+        return True
+
+    def _check_download_response(self, response, offset):
+        """Returns the error of a response to a debug log download resumed
+           from offset, None if its body is to be saved.
+        """
+        if response is None:
+            return "no response"
+        if response.status_code == self.ws.HTTP_PARTIAL_CONTENT:
+            if not response.headers.get('Content-Range', '').startswith(
+                    f"bytes {offset}-"):
+                return "unexpected Content-Range {0}".format(
+                    response.headers.get('Content-Range'))
+        elif response.status_code != self.ws.HTTP_OK:
+            return f"http error {response.status_code}"
+        elif response.headers.get('content-disposition') != \
+                self.ENCL_LOGS_ATTACHMENT:
+            return "no attachment found"
+        return None
+
+    @staticmethod
+    def _get_download_size(response):
+        """Returns the size of the file downloaded, None if unknown"""
+        size = response.headers.get('Content-Range', '').rpartition('/')[2] \
+            or response.headers.get('Content-Length', '')
+        return int(size) if size.isdigit() else None
+
     def get_enclosure_wwn(self, logger):
         """Get enclosure wwn."""
         url = self.build_url(self.URI_CLIAPI_SHOWENCLOSURE)
@@ -0,0 +1,156 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Snapshot of the FRUs of a RealStor enclosure shared by
+                    the enclosure sensors. The show APIs are queried once
+                    per polling cycle, concurrently, and published as an
+                    immutable versioned snapshot.
+ ****************************************************************************
+"""
+
+import json
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+from framework.utils.service_logging import logger
+
+
+class RealStorSnapshot(namedtuple('RealStorSnapshot',
+                                  'version, frus, errors, updated')):
+    """FRU data of the enclosure.
+
+    frus maps the FRU, e.g. 'power-supplies', to its list as returned by
+    the show API, None if the API failed, errors to the reason of the
+    failure and updated to the time the FRU was fetched. The data is
+    shared by the sensors and must not be modified.
+    """
+
+    __slots__ = ()
+
+    def get(self, fru):
+        return self.frus.get(fru)
+
+    def changed(self, previous, fru):
+        """True if the data of fru differs from the one of previous"""
+        return previous is None or previous.frus.get(fru) != self.frus.get(fru)
+
+
+class RealStorSnapshotService(object):
+    """Fetches the FRUs of the enclosure for all the sensors.
+
+    A sensor asks for the FRUs it monitors and the age it accepts. The
+    ones older than that are fetched again together with every other FRU
+    older than the polling cycle, so the first sensor polling in a cycle
+    fetches everything and the others are served from its snapshot.
+    Fetches are serialized, a sensor arriving during one waits for it
+    instead of querying the controller again.
+    """
+
+    # FRU to its show API and the key of its list in the response
+    FRU_ENDPOINTS = {
+        "system": ("/show/system", "system"),
+        "drives": ("/show/disks/detail", "drives"),
+        "power-supplies": ("/show/power-supplies", "power-supplies"),
+        "fan-modules": ("/show/fan-modules", "fan-modules"),
+        "controllers": ("/show/controllers", "controllers"),
+        "enclosures": ("/show/enclosure", "enclosures"),
+        "disk-groups": ("/show/disk-groups", "disk-groups")
+    }
+
+    def __init__(self, encl, cycle, workers=4):
+        self._encl = encl
+        self._cycle = cycle
+        self._workers = workers
+        self._lock = threading.Lock()
+        self._snapshot = RealStorSnapshot(0, MappingProxyType({}),
+            MappingProxyType({}), MappingProxyType({}))
+
+    @property
+    def snapshot(self):
+        """Latest snapshot, without refreshing it"""
+        return self._snapshot
+
+    def _fetch(self, fru):
+        """Returns the data of fru and the reason it is None"""
+        uri, key = self.FRU_ENDPOINTS[fru]
+        url = self._encl.build_url(uri)
+        response = self._encl.ws_request(url, self._encl.ws.HTTP_GET)
+        if not response:
+            return None, f"ws request {url} failed"
+        if response.status_code != self._encl.ws.HTTP_OK:
+            return None, f"http request {url} failed with err " \
+                         f"{response.status_code}"
+        try:
+            jresponse = json.loads(response.text)
+        except ValueError as badjson:
+            return None, f"{url} returned mal-formed json: {badjson}"
+        # -1 when the api response is unavailable, success as http code is 200
+        api_resp = self._encl.get_api_status(jresponse.get('status', []))
+        if api_resp not in (0, -1):
+            return None, f"{url} failed with api err {api_resp}"
+        return jresponse.get(key), None
+
+    def _fetch_many(self, frus):
+        if len(frus) == 1:
+            return {fru: self._fetch(fru) for fru in frus}
+        with ThreadPoolExecutor(max_workers=min(self._workers, len(frus))) \
+                as executor:
+            return dict(zip(frus, executor.map(self._fetch, frus)))
+
+    def get_snapshot(self, frus=(), max_age=None):
+        """Returns the latest snapshot with frus fetched at most max_age
+           secs ago, the polling cycle by default.
+        """
+        max_age = self._cycle if max_age is None else max_age
+        with self._lock:
+            snapshot = self._snapshot
+            now = time.time()
+            stale = [fru for fru in frus
+                     if now - snapshot.updated.get(fru, 0) >= max_age]
+            if not stale:
+                return snapshot
+            stale.extend(fru for fru in self.FRU_ENDPOINTS if fru not in stale
+                         and now - snapshot.updated.get(fru, 0) >= self._cycle)
+
+            fetched = self._fetch_many(stale)
+            now = time.time()
+            data = dict(snapshot.frus)
+            errors = dict(snapshot.errors)
+            updated = dict(snapshot.updated)
+            for fru, (value, error) in fetched.items():
+                data[fru] = value
+                updated[fru] = now
+                if error is None:
+                    errors.pop(fru, None)
+                    continue
+                errors[fru] = error
+                if self._encl.active_ip != self._encl.ws.LOOPBACK:
+                    logger.warn(f"{self._encl.LDR_R1_ENCL}:: {fru} status "
+                                f"unavailable, {error}")
+            self._snapshot = RealStorSnapshot(snapshot.version + 1,
+                MappingProxyType(data), MappingProxyType(errors),
+                MappingProxyType(updated))
+            return self._snapshot
+
+    def get_fru(self, fru, max_age=None):
+        """Returns the data of fru from the latest snapshot, None if not
+           available.
+        """
+        return self.get_snapshot([fru], max_age).get(fru)
@@ -13,70 +13,120 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
-import json
+import math
 import re
 
-from cortx.utils.process import SimpleProcess
-from framework.base.sspl_constants import MDADM_PATH, RaidDataConfig
-from framework.utils.conf_utils import (SSPL_CONF, Conf, SYSTEM_INFORMATION,
-                                        SYSFS_PATH)
+from framework.base.sspl_constants import MDADM_PATH
+from framework.utils.md_raid import MdRaid
 
 
 class RAID:
 
+    # Secs a snapshot of the arrays is shared by the calls of a health scan
+    MAX_AGE = 5
+
+    # Array states of an array that is not running
+    STOPPED_STATES = ("clear", "inactive")
+
+    # Failed members an array survives per level, raid1 survives all but
+    # one and raid10 all but the copies of a chunk
+    REDUNDANCY = {"linear": 0, "raid0": 0, "raid4": 1, "raid5": 1, "raid6": 2}
+    # raid10 layout of 2 near copies, the mdadm default
+    DEFAULT_RAID10_LAYOUT = 0x102
+
+    # mdadm --detail device state of a member per its sysfs state
+    MEMBER_STATES = {"in_sync": "active sync", "faulty": "faulty",
+                     "spare": "spare", "write_mostly": "active sync writemostly"}
+
     def __init__(self, raid) -> None:
         """Initialize RAID class."""
         self.raid = raid
         self.id = raid.split('/')[-1]
+        self._md_raid = MdRaid.get_instance()
+
+    def _get_array(self):
+        try:
+            return self._md_raid.get_array(self.id, self.MAX_AGE)
+        except Exception:
+            return None
 
     def get_devices(self):
-        output, err, returncode = SimpleProcess(f"mdadm --detail --test {self.raid}").run()
-        output = (output + err).decode()
+        array = self._get_array()
         devices = []
-        for state in re.findall(r"^\s*\d+\s*\d+\s*\d+\s*\d+\s*(.*)", output, re.MULTILINE):
-            device = {}
-            device["state"] = state
-            device["identity"] = {}
-            path = re.findall(r"\/dev\/(.*)", state)
-            if path:
-                device["identity"]["path"] = f"/dev/{path[0]}"
-                output, _, returncode = SimpleProcess(f'smartctl -i {device["identity"]["path"]} --json').run()
-                if returncode == 0:
-                    output = json.loads(output)
-                    try:
-                        device["identity"]["serialNumber"] = output["serial_number"]
-                    except KeyError:
-                        device["identity"]["serialNumber"] = "None"
-                else:
-                    device["identity"]["serialNumber"] = "None"
-            devices.append(device)
+        for member in array.members if array else ():
+            state = self.MEMBER_STATES.get(member.state.split(",")[0],
+                                           member.state)
+            devices.append({
+                "state": f"{state}   /dev/{member.name}",
+                "identity": self._md_raid.get_identity(member.name)
+            })
         return devices
 
     def get_health(self):
-        _, _, returncode = SimpleProcess(f"mdadm --detail --test {self.raid}").run()
-        if returncode == 0:
-            return ("OK", "The array is in good health")
-        elif returncode == 2:
+        array = self._get_array()
+        if array is None:
+            return ("Fault", "There was an error while trying to get information about the array.")
+        working = [member for member in array.members
+                   if "in_sync" in member.state]
+        if array.state == "inactive" or array.array_state in self.STOPPED_STATES \
+                or not working or self._exceeds_redundancy(array):
             return ("Fault", "The array has multiple failed devices such that it is unusable.")
-        elif returncode == 1:
+        elif array.degraded or "_" in array.status:
             return ("Degraded", "The array has at least one failed device.")
         else:
-            return ("Fault", "There was an error while trying to get information about the array.")
+            return ("OK", "The array is in good health")
+
+    @staticmethod
+    def _get_missing_slots(array):
+        if array.status:
+            return {slot for slot, flag in enumerate(array.status)
+                    if flag == "_"}
+        working = {member.slot for member in array.members
+                   if "in_sync" in member.state and member.slot is not None}
+        return set(range(array.raid_disks or 0)) - working
+
+    def _exceeds_redundancy(self, array):
+        """Returns True if more members failed than the level survives,
+           as 'mdadm --detail --test' exiting with 2"""
+        missing = self._get_missing_slots(array)
+        degraded = max(array.degraded or 0, len(missing))
+        if not degraded:
+            return False
+        if array.level == "raid1":
+            return array.raid_disks is not None and \
+                degraded >= array.raid_disks
+        if array.level == "raid10":
+            return self._is_chunk_lost(array, missing)
+        redundancy = self.REDUNDANCY.get(array.level)
+        return redundancy is not None and degraded > redundancy
+
+    def _is_chunk_lost(self, array, missing):
+        """Returns True if all the copies of a raid10 chunk are missing.
+           Near copies are on consecutive slots starting from a multiple of
+           gcd(copies, raid_disks), far and offset ones on the next slots.
+        """
+        raid_disks = array.raid_disks or len(array.status)
+        if not raid_disks:
+            return False
+        layout = array.layout or self.DEFAULT_RAID10_LAYOUT
+        near, far = max(layout & 0xff, 1), max((layout >> 8) & 0xff, 1)
+        copies = near * far
+        step = math.gcd(copies, raid_disks) if far == 1 else 1
+        return any(all((start + copy) % raid_disks in missing
+                       for copy in range(copies))
+                   for start in range(0, raid_disks, step))
 
     def get_data_integrity_status(self):
         status = {
                     "raid_integrity_error": "NA",
                     "raid_integrity_mismatch_count": "NA"
                 }
-        try:
-            sysfs = Conf.get(SSPL_CONF, f'{SYSTEM_INFORMATION}>{SYSFS_PATH}')
-            with open(f"/{sysfs}/block/{self.id}/{RaidDataConfig.MISMATCH_COUNT_FILE.value}") as f:
-                mismatch_count = f.read().strip("\n")
-                status["raid_integrity_error"] = mismatch_count != "0"
-                status["raid_integrity_mismatch_count"] = mismatch_count
-                return status
-        except Exception:
+        array = self._get_array()
+        if array is None or array.mismatch_cnt is None:
             return status
+        status["raid_integrity_error"] = array.mismatch_cnt != 0
+        status["raid_integrity_mismatch_count"] = str(array.mismatch_cnt)
+        return status
 
 
 class RAIDs:
@@ -17,6 +17,8 @@
 
 import os
 import shlex
+import threading
+import time
 
 from cortx.utils.process import SimpleProcess
 from cortx.utils.conf_store.error import ConfError
@@ -24,8 +26,8 @@ from cortx.utils.service.service_handler import DbusServiceHandler
 from framework.platforms.server.error import BuildInfoError, ServiceError
 from framework.utils.conf_utils import SSPL_CONF, Conf
 from framework.base.sspl_constants import (CORTX_RELEASE_FACTORY_INFO,
-    CONFIG_SPEC_TYPE, SYSTEMD_BUS, SERVICE_IFACE, UNIT_IFACE,
-    DEFAULT_RECOMMENDATION)
+    CONFIG_SPEC_TYPE, SYSTEMD_BUS, SERVICE_IFACE, UNIT_IFACE, MANAGER_IFACE,
+    DEFAULT_RECOMMENDATION, RPMDB_PATH)
 from framework.utils.service_logging import logger
 from dbus import PROPERTIES_IFACE, DBusException, Interface
 
@@ -54,6 +56,184 @@ class BuildInfo:
         return result if result else "NA"
 
 
+class SoftwareInventory:
+    """
+    Process wide index of the RPM and systemd metadata of the services.
+
+    The RPM index maps the systemd unit files to their package and is built
+    by a single bulk 'rpm -qa' query, rebuilt when the rpmdb mtime changes.
+    The unit index holds the object path and static properties of the units,
+    the states of all the loaded units are read by a single ListUnits call.
+    Static properties are dropped on systemd UnitFilesChanged signals, or
+    after UNIT_CACHE_TTL when the process runs no main loop to get them.
+    """
+
+    name = "SoftwareInventory"
+    # Unit file directories, in lookup order
+    SYSTEMD_PATH_LIST = ["/usr/lib/systemd/system/", "/etc/systemd/system/"]
+    # Fields of the bulk query, one line per file of each package
+    RPM_QUERY_TAGS = ["VERSION", "LICENSE"]
+    RPM_QUERY_FORMAT = "[%{FILENAMES}\\t%{=NAME}-%{=VERSION}-%{=RELEASE}." \
+        "%{=ARCH}\\t%{=VERSION}\\t%{=LICENSE}\\n]"
+    UNIT_CACHE_TTL = 300
+    UNIT_STATE_TTL = 2
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        """Initialize the class."""
+        self._lock = threading.RLock()
+        self._rpmdb_mtime = None
+        # unit file path to package, package to its queried tags
+        self._unit_file_rpms = {}
+        self._rpms = {}
+        self._bus = None
+        self._manager = None
+        # unit name to static properties and time they were read
+        self._units = {}
+        self._units_time = 0
+        # Loaded units, name and object path to (active state, sub state,
+        # object path), from ListUnits
+        self._unit_states = {}
+        self._unit_states_time = 0
+
+    def get_systemd_interface(self):
+        """Returns the bus and systemd manager, subscribing to changes."""
+        with self._lock:
+            if self._manager is None:
+                self._bus, self._manager = \
+                    DbusServiceHandler._get_systemd_interface()
+                try:
+                    self._manager.connect_to_signal('UnitFilesChanged',
+                        self.invalidate_units, dbus_interface=MANAGER_IFACE)
+                except DBusException as err:
+                    logger.warning(f"{self.name}, unable to subscribe to "
+                                   f"UnitFilesChanged: {err}")
+            return self._bus, self._manager
+
+    @staticmethod
+    def _get_rpmdb_mtime():
+        try:
+            return os.stat(RPMDB_PATH).st_mtime
+        except OSError:
+            return None
+
+    def _build_rpm_index(self):
+        """Indexes the packages installing systemd unit files."""
+        command = shlex.split(
+            f"rpm -qa --queryformat '{self.RPM_QUERY_FORMAT}'")
+        output, error, ret_code = SimpleProcess(command).run()
+        if ret_code != 0:
+            raise ServiceError(ret_code,
+                "Unable to query RPM database due to Error: '%s'", error)
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", errors="replace")
+        unit_file_rpms = {}
+        rpms = {}
+        for line in output.splitlines():
+            if not line.startswith(tuple(self.SYSTEMD_PATH_LIST)):
+                continue
+            fields = line.split("\t", len(self.RPM_QUERY_TAGS) + 1)
+            if len(fields) < len(self.RPM_QUERY_TAGS) + 2:
+                continue
+            unit_file_rpms[fields[0]] = fields[1]
+            rpms[fields[1]] = dict(zip(self.RPM_QUERY_TAGS, fields[2:]))
+        self._unit_file_rpms = unit_file_rpms
+        self._rpms = rpms
+
+    def get_rpm_property(self, unit_file_path, prop):
+        """
+        Returns the property of the package installing the unit file,
+        "NA" if the file does not belong to any package.
+        """
+        with self._lock:
+            mtime = self._get_rpmdb_mtime()
+            if mtime is None or mtime != self._rpmdb_mtime:
+                self._build_rpm_index()
+                self._rpmdb_mtime = mtime
+            service_rpm = self._unit_file_rpms.get(unit_file_path)
+            if service_rpm is None:
+                return "NA"
+            value = self._rpms[service_rpm].get(prop)
+        if value is None:
+            # Property not in the bulk query
+            command = shlex.split(" ".join(
+                ["rpm", "-q", "--queryformat", "%{"+prop+"}", service_rpm]))
+            value, _, ret_code = SimpleProcess(command).run()
+            if ret_code == 0 and isinstance(value, bytes):
+                value = value.decode("utf-8")
+        return value
+
+    def invalidate_units(self, *args):
+        """UnitFilesChanged handler, unit files enabled/disabled/changed."""
+        with self._lock:
+            self._units = {}
+            self._unit_states_time = 0
+
+    def _get_unit_states(self):
+        """Returns active state, sub state and path of the loaded units."""
+        if time.time() - self._unit_states_time >= self.UNIT_STATE_TTL:
+            _, manager = self.get_systemd_interface()
+            unit_states = {}
+            # name, description, load state, active state, sub state,
+            # followed, object path, job id, job type, job path
+            for unit in manager.ListUnits():
+                state = (str(unit[3]), str(unit[4]), str(unit[6]))
+                unit_states[str(unit[0])] = state
+                unit_states[str(unit[6])] = state
+            self._unit_states = unit_states
+            self._unit_states_time = time.time()
+        return self._unit_states
+
+    def get_unit(self, service_name):
+        """
+        Returns the static properties, active state and sub state of the
+        unit. Raises DBusException when the unit can not be loaded.
+        """
+        with self._lock:
+            if time.time() - self._units_time >= self.UNIT_CACHE_TTL:
+                self._units = {}
+                self._units_time = time.time()
+            bus, manager = self.get_systemd_interface()
+            unit_states = self._get_unit_states()
+            unit = self._units.get(service_name)
+            if unit is None:
+                loaded = unit_states.get(service_name)
+                path = loaded[2] if loaded else manager.LoadUnit(service_name)
+                properties_iface = Interface(
+                    bus.get_object(SYSTEMD_BUS, path),
+                    dbus_interface=PROPERTIES_IFACE)
+                unit_props = properties_iface.GetAll(UNIT_IFACE)
+                try:
+                    exec_start = properties_iface.Get(SERVICE_IFACE,
+                                                      'ExecStart')
+                    command_line_path = str(exec_start[0][0])
+                except (DBusException, IndexError):
+                    command_line_path = "NA"
+                unit = {
+                    "path": str(path),
+                    "properties_iface": properties_iface,
+                    "id": str(unit_props['Id']),
+                    "description": str(unit_props['Description']),
+                    "unit_file_state": str(unit_props['UnitFileState']),
+                    "command_line_path": command_line_path
+                }
+                self._units[service_name] = unit
+            unit = dict(unit)
+            # Units not loaded by systemd are inactive
+            unit["active_state"], unit["sub_state"], _ = unit_states.get(
+                unit["path"], ("inactive", "dead", None))
+            return unit
+
+
 class Service:
     """ Provides methods to fetch information for systemd services """
 
@@ -63,7 +243,8 @@ class Service:
 
     def __init__(self):
         """Initialize the class."""
-        self._bus, self._manager = DbusServiceHandler._get_systemd_interface()
+        self._inventory = SoftwareInventory.get_instance()
+        self._bus, self._manager = self._inventory.get_systemd_interface()
 
     def get_external_service_list(self):
         """Get list of external services."""
@@ -106,65 +287,37 @@ class Service:
         eg. (kafka.service,'LICENSE') -> 'Apache License, Version 2.0'
         """
         # TODO Include service execution path in systemd_path_list
-        systemd_path_list = ["/usr/lib/systemd/system/",
-                             "/etc/systemd/system/"]
         result = "NA"
-        for path in systemd_path_list:
+        for path in SoftwareInventory.SYSTEMD_PATH_LIST:
             # unit_file_path represents the path where
             # systemd service file resides
             # eg. kafka service -> /etc/systemd/system/kafka.service
             unit_file_path = path + service
             if os.path.isfile(unit_file_path):
-                # this command will return the full name of RPM
-                # which installs the service at given unit_file_path
-                # eg. /etc/systemd/system/kafka.service -> kafka-2.13_2.7.0-el7.x86_64
-                command = " ".join(["rpm", "-qf", unit_file_path])
-                command = shlex.split(command)
-                service_rpm, _, ret_code = SimpleProcess(command).run()
-                if ret_code != 0:
-                    return result
-                try:
-                    service_rpm = service_rpm.decode("utf-8")
-                except AttributeError:
-                    return result
-                # this command will extract specified property from given RPM
+                # Looked up in the index of the packages installing unit
+                # files instead of 'rpm -qf' and 'rpm -q' per service
                 # eg. (kafka-2.13_2.7.0-el7.x86_64, 'LICENSE') -> 'Apache License, Version 2.0'
-                command = " ".join(
-                    ["rpm", "-q", "--queryformat", "%{"+prop+"}", service_rpm])
-                command = shlex.split(command)
-                result, _, ret_code = SimpleProcess(command).run()
-                if ret_code != 0:
-                    return result
-                try:
-                    # returned result should be in byte which need to be decoded
-                    # eg. b'Apache License, Version 2.0' -> 'Apache License, Version 2.0'
-                    result = result.decode("utf-8")
-                except AttributeError:
-                    return result
+                result = SoftwareInventory.get_instance().get_rpm_property(
+                    unit_file_path, prop)
                 break
         return result
 
     def get_systemd_service_info(self, log, service_name):
         """Get info of specified service using dbus API."""
         try:
-            unit = self._bus.get_object(
-                SYSTEMD_BUS, self._manager.LoadUnit(service_name))
-            properties_iface = Interface(unit, dbus_interface=PROPERTIES_IFACE)
+            unit = self._inventory.get_unit(service_name)
         except DBusException as err:
             logger.error(log.svc_log(
                 f"Unable to initialize {service_name} due to {err}"))
             return None
-        path_array = properties_iface.Get(SERVICE_IFACE, 'ExecStart')
-        try:
-            command_line_path = str(path_array[0][0])
-        except IndexError as err:
+        command_line_path = unit["command_line_path"]
+        if command_line_path == "NA":
             logger.error(log.svc_log(
-                f"Unable to find {service_name} path due to {err}"))
-            command_line_path = "NA"
+                f"Unable to find {service_name} path"))
 
-        is_installed = True if command_line_path != "NA" or 'invalid' in properties_iface.Get(
-            UNIT_IFACE, 'UnitFileState') else False
-        uid = str(properties_iface.Get(UNIT_IFACE, 'Id'))
+        is_installed = True if command_line_path != "NA" or \
+            'invalid' in unit["unit_file_state"] else False
+        uid = unit["id"]
         if not is_installed:
             health_status = "NA"
             health_description = f"Software enabling {uid} is not installed"
@@ -186,14 +339,13 @@ class Service:
         else:
             service_license = "NA"
             version = "NA"
-            service_description = str(
-                properties_iface.Get(UNIT_IFACE, 'Description'))
-            state = str(properties_iface.Get(UNIT_IFACE, 'ActiveState'))
-            substate = str(properties_iface.Get(UNIT_IFACE, 'SubState'))
-            service_status = 'enabled' if 'disabled' not in properties_iface.Get(
-                UNIT_IFACE, 'UnitFileState') else 'disabled'
+            service_description = unit["description"]
+            state = unit["active_state"]
+            substate = unit["sub_state"]
+            service_status = 'enabled' if 'disabled' not in \
+                unit["unit_file_state"] else 'disabled'
             pid = "NA" if state == "inactive" else str(
-                properties_iface.Get(SERVICE_IFACE, 'ExecMainPID'))
+                unit["properties_iface"].Get(SERVICE_IFACE, 'ExecMainPID'))
             try:
                 version = self.get_service_info_from_rpm(
                     uid, "VERSION")
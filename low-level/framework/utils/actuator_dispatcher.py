@@ -0,0 +1,260 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Dispatch of actuator requests. Runs the requests on a
+                    worker pool per actuator type, one request at a time
+                    per device, coalesces identical requests in flight,
+                    times requests out and keeps latency histograms per
+                    request type.
+ ****************************************************************************
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.base.scheduler_core import SchedulerCore
+from framework.utils.service_logging import logger
+
+
+class ActuatorTimeout(Exception):
+    """Raised to the requests not completed within their timeout"""
+
+
+class LatencyHistogram(object):
+    """Count of latencies per bucket, bucket bounds in secs"""
+
+    BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+
+    def __init__(self, buckets=BUCKETS):
+        self._buckets = tuple(buckets)
+        # Last count is for latencies above the last bound
+        self._counts = [0] * (len(self._buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, latency):
+        self._counts[bisect_left(self._buckets, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def get_stats(self):
+        buckets = {f"le_{bound}": count
+                   for bound, count in zip(self._buckets, self._counts)}
+        buckets["inf"] = self._counts[-1]
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 6) if self.count else 0,
+            "max": round(self.max, 6),
+            "buckets": buckets
+        }
+
+
+class _Request(object):
+    __slots__ = ("pool", "request_type", "work", "callbacks", "key", "device",
+                 "submitted", "timer", "done")
+
+    def __init__(self, pool, request_type, work, callback, key, device):
+        self.pool = pool
+        self.request_type = request_type
+        self.work = work
+        self.callbacks = [callback]
+        self.key = key
+        self.device = device
+        self.submitted = time.time()
+        self.timer = None
+        self.done = False
+
+
+class ActuatorDispatcher(object):
+    """Runs actuator requests concurrently.
+
+    Each pool, e.g. one per actuator type, has its own workers so a slow
+    request only delays the requests of its pool. Requests on the same
+    device, e.g. '/dev/sda', run one at a time in submission order
+    whatever their pool. A request submitted with the key of a request in
+    flight is not run again, its callback gets the result of the request
+    in flight.
+
+    callback(result, error) is called once per request, with the result
+    of work() or the exception it raised, ActuatorTimeout if it did not
+    complete within timeout secs. A request timed out before it started
+    is not run, one timed out while running keeps its device until work()
+    returns.
+    """
+
+    DEFAULT_WORKERS = 1
+    DEFAULT_TIMEOUT = 300
+
+    def __init__(self, workers=None, default_workers=DEFAULT_WORKERS,
+                 timeout=DEFAULT_TIMEOUT, name="ActuatorDispatcher",
+                 core=None):
+        """workers maps a pool to its number of workers, default_workers
+           is used for the other pools.
+        """
+        self._workers = dict(workers or {})
+        self._default_workers = max(int(default_workers), 1)
+        self._timeout = float(timeout)
+        self._name = name
+        self._core = core
+        self._lock = threading.Lock()
+        self._executors = {}
+        self._in_flight = {}
+        # Device to the requests waiting for it, a device is busy while
+        # it is a key
+        self._devices = {}
+        self._local = threading.local()
+        self.histograms = {}
+        self.coalesced = 0
+        self.timed_out = 0
+
+    def _get_core(self):
+        if self._core is None:
+            self._core = SchedulerCore.get_instance()
+        return self._core
+
+    def _get_executor(self, pool):
+        executor = self._executors.get(pool)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max(int(self._workers.get(pool,
+                                    self._default_workers)), 1),
+                thread_name_prefix=f"{self._name}-{pool}")
+            self._executors[pool] = executor
+        return executor
+
+    def submit(self, pool, request_type, work, callback, key=None,
+               device=None, timeout=None):
+        """Runs work() on the workers of pool. Returns False if the request
+           was coalesced with the request in flight with the same key.
+        """
+        with self._lock:
+            request = self._in_flight.get(key) if key is not None else None
+            if request is not None:
+                request.callbacks.append(callback)
+                self.coalesced += 1
+                return False
+            request = _Request(pool, request_type, work, callback, key, device)
+            if key is not None:
+                self._in_flight[key] = request
+            timeout = self._timeout if timeout is None else timeout
+            if timeout > 0:
+                request.timer = self._get_core().schedule(
+                    timeout, self._expire, (request,))
+            if device is not None:
+                if device in self._devices:
+                    self._devices[device].append(request)
+                    return True
+                self._devices[device] = deque()
+            self._get_executor(pool).submit(self._run, request)
+        return True
+
+    def is_expired(self):
+        """Returns True if the request run by the calling worker has
+           completed, i.e. timed out, its late results are to be dropped.
+        """
+        request = getattr(self._local, "request", None)
+        return request is not None and request.done
+
+    def _run(self, request):
+        if request.done:
+            # Timed out while queued, the work is not run late
+            self._release(request.device)
+            return
+        self._local.request = request
+        result = error = None
+        try:
+            result = request.work()
+        except Exception as err:
+            error = err
+        finally:
+            self._local.request = None
+        if not self._complete(request, result, error):
+            logger.warn(f"{self._name}, {request.request_type} request "
+                        f"completed after its timeout, result dropped")
+        self._release(request.device)
+
+    def _release(self, device):
+        if device is None:
+            return
+        with self._lock:
+            waiting = self._devices[device]
+            while waiting:
+                request = waiting.popleft()
+                if not request.done:
+                    self._get_executor(request.pool).submit(self._run, request)
+                    return
+            del self._devices[device]
+
+    def _expire(self, request):
+        if self._complete(request, None, ActuatorTimeout(
+                f"{request.request_type} request timed out")):
+            with self._lock:
+                self.timed_out += 1
+            logger.warn(f"{self._name}, {request.request_type} request timed "
+                        f"out after {time.time() - request.submitted:.1f} secs")
+
+    def _complete(self, request, result, error):
+        """Calls the callbacks of a request once, returns False if it was
+           already completed.
+        """
+        with self._lock:
+            if request.done:
+                return False
+            request.done = True
+            if request.key is not None and \
+                    self._in_flight.get(request.key) is request:
+                del self._in_flight[request.key]
+            histogram = self.histograms.get(request.request_type)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self.histograms[request.request_type] = histogram
+            histogram.observe(time.time() - request.submitted)
+            callbacks = request.callbacks
+        if request.timer is not None:
+            self._get_core().cancel(request.timer)
+        for callback in callbacks:
+            try:
+                callback(result, error)
+            except Exception as err:
+                logger.exception(f"{self._name}, {request.request_type} "
+                                 f"callback failed: {err}")
+        return True
+
+    def get_stats(self):
+        """Returns the latency histograms per request type and counters"""
+        with self._lock:
+            return {
+                "latency": {request_type: histogram.get_stats()
+                            for request_type, histogram in self.histograms.items()},
+                "in_flight": len(self._in_flight),
+                "busy_devices": len(self._devices),
+                "coalesced": self.coalesced,
+                "timed_out": self.timed_out
+            }
+
+    def shutdown(self):
+        """Stops the worker pools, requests running are not waited for"""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors = {}
+        for executor in executors:
+            executor.shutdown(wait=False)
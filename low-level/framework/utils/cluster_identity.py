@@ -0,0 +1,78 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Identity of the node in the cluster, i.e. its site,
+                    node, rack and cluster ids, added to the info of every
+                    message. Read once from the global config and again
+                    when SSPL-LL is signalled to reload it.
+ ****************************************************************************
+"""
+
+import threading
+
+from framework.base.sspl_constants import (DEFAULT_DC, DEFAULT_RACK,
+        DEFAULT_SN, DEFAULT_CLUSTER)
+
+
+class ClusterIdentity(object):
+    """Ids of the node read from GLOBAL_CONF, cached until refresh()"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Returns the identity shared by the process"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                from framework.utils.conf_utils import (GLOBAL_CONF,
+                    SITE_ID_KEY, NODE_ID_KEY, RACK_ID_KEY, CLUSTER_ID_KEY, Conf)
+                fields = (("site_id", SITE_ID_KEY, DEFAULT_DC),
+                          ("node_id", NODE_ID_KEY, DEFAULT_SN),
+                          ("rack_id", RACK_ID_KEY, DEFAULT_RACK),
+                          ("cluster_id", CLUSTER_ID_KEY, DEFAULT_CLUSTER))
+                cls._instance = cls(
+                    lambda key, default: Conf.get(GLOBAL_CONF, key, default),
+                    fields)
+            return cls._instance
+
+    def __init__(self, conf_get, fields):
+        """conf_get(key, default) reads a config value, fields are the
+           (info key, config key, default) of the ids.
+        """
+        self._conf_get = conf_get
+        self._fields = fields
+        self._ids = None
+
+    def refresh(self):
+        """Reads the ids from the config and returns them"""
+        self._ids = {name: self._conf_get(key, default)
+                     for name, key, default in self._fields}
+        return self._ids
+
+    def get_ids(self):
+        """Returns the ids, read from the config on first use"""
+        ids = self._ids
+        return ids if ids is not None else self.refresh()
+
+    def fill(self, info):
+        """Sets the ids and the fru flag missing from a message info"""
+        for name, value in self.get_ids().items():
+            if info.get(name) is None:
+                info[name] = value
+        if info.get("fru") is None:
+            info["fru"] = "false"
@@ -19,38 +19,41 @@
                     dump or load from consul
  ****************************************************************************
 """
-import os
-import consul
-from framework.utils.store import Store
-from framework.utils.service_logging import logger
+import base64
 import pickle
-from framework.base.sspl_constants import MAX_CONSUL_RETRY, WAIT_BEFORE_RETRY, CONSUL_ERR_STRING
 import time
+from urllib.parse import quote
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from framework.utils.store import Store
+from framework.utils.service_logging import logger
+from framework.base.sspl_constants import MAX_CONSUL_RETRY, WAIT_BEFORE_RETRY, CONSUL_ERR_STRING
+
 
 class ConsulStore(Store):
+    """Store on the consul KV HTTP API.
 
-    def __init__(self, host, port):
-        super(Store, self).__init__()
-        for retry_index in range(0, MAX_CONSUL_RETRY):
-            try:
-                self.consul_conn = consul.Consul(host=host, port=port)
-                break
+    Requests share one pooled HTTP session and are retried with an
+    exponential backoff, capped at WAIT_BEFORE_RETRY secs, while consul is
+    unreachable or has no leader. The *_many methods group their keys in
+    /v1/txn transactions of at most TXN_MAX_OPS operations.
+    """
 
-            except requests.exceptions.ConnectionError as connerr:
-                logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                    .format(connerr, retry_index))
-                time.sleep(WAIT_BEFORE_RETRY)
-
-            except Exception as gerr:
-                consuerr = str(gerr)
-                if CONSUL_ERR_STRING == consuerr:
-                    logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                        .format(gerr, retry_index))
-                    time.sleep(WAIT_BEFORE_RETRY)
-                else:
-                    logger.warn("Error[{0}] consul error".format(gerr))
-                    break
+    POOL_SIZE = 4
+    REQUEST_TIMEOUT = 10
+    BACKOFF_BASE = 0.1
+    # Limit of operations of a transaction in consul
+    TXN_MAX_OPS = 64
+    WATCH_WAIT = 60
+
+    def __init__(self, host, port):
+        super(ConsulStore, self).__init__()
+        self._url = f"http://{host}:{port}/v1"
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=1,
+                                                   pool_maxsize=self.POOL_SIZE))
 
     def _get_key(self, key):
         """remove '/' from begining of the key"""
@@ -60,70 +63,96 @@ class ConsulStore(Store):
         else:
             return key
 
-    def put(self, value, key, pickled=True):
-        """ write data to given key"""
-        key = self._get_key(key)
-        if pickled:
-            value = pickle.dumps(value)
+    def _kv_path(self, key):
+        return "kv/" + quote(self._get_key(key), safe="/")
 
+    def _request(self, method, path, timeout=REQUEST_TIMEOUT, **kwargs):
+        """Send a request to consul, returns the response or None if consul
+           could not be reached.
+        """
+        delay = self.BACKOFF_BASE
         for retry_index in range(0, MAX_CONSUL_RETRY):
             try:
-                self.consul_conn.kv.put(key, value)
-                break
-
-            except requests.exceptions.ConnectionError as connerr:
+                response = self._session.request(method, f"{self._url}/{path}",
+                                                 timeout=timeout, **kwargs)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout) as connerr:
                 logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
                     .format(connerr, retry_index))
-                time.sleep(WAIT_BEFORE_RETRY)
-
-            except Exception as gerr:
-                consuerr = str(gerr)
-                if CONSUL_ERR_STRING == consuerr:
-                    logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                        .format(gerr, retry_index))
-                    time.sleep(WAIT_BEFORE_RETRY)
-                else:
-                    logger.warn("Error[{0}] consul error".format(gerr))
-                    break
+            else:
+                if response.status_code < 500:
+                    return response
+                consulerr = f"{response.status_code} {response.text.strip()}"
+                if CONSUL_ERR_STRING != consulerr:
+                    logger.warn("Error[{0}] consul error".format(consulerr))
+                    return None
+                logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
+                    .format(consulerr, retry_index))
+            time.sleep(delay)
+            delay = min(delay * 2, WAIT_BEFORE_RETRY)
+        return None
+
+    @staticmethod
+    def _encode(value, pickled):
+        if pickled:
+            return pickle.dumps(value)
+        if isinstance(value, str):
+            return value.encode('utf-8')
+        return value
+
+    @staticmethod
+    def _decode(value):
+        if not value:
+            return None
+        try:
+            return pickle.loads(value)
+        except Exception:
+            return value
+
+    def _decode_items(self, items):
+        """Key and value pairs of the entries of a kv or txn response"""
+        return [(item["Key"], self._decode(base64.b64decode(item["Value"])
+                                           if item.get("Value") else None))
+                for item in items]
+
+    def put(self, value, key, pickled=True):
+        """ write data to given key"""
+        response = self._request("PUT", self._kv_path(key),
+                                 data=self._encode(value, pickled))
+        if response is not None and response.status_code != 200:
+            logger.warn("Error[{0}] while writing key {1} to consul" \
+                .format(response.text, key))
 
     def _consul_get(self, key, **kwargs):
         """Load consul data from the given key."""
         data = None
         status = "Failure"
 
-        for retry_index in range(0, MAX_CONSUL_RETRY):
-            try:
-                _opt_recurse = kwargs.get("recurse", False)
-                key = self._get_key(key)
-                data = self.consul_conn.kv.get(key, recurse=_opt_recurse)[1]
-                if data:
-                    data = data["Value"]
-                    try:
-                        data = pickle.loads(data)
-                    except:
-                        pass
-                status = "Success"
-                break
-
-            except requests.exceptions.ConnectionError as connerr:
-                logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                    .format(connerr, retry_index))
-                time.sleep(WAIT_BEFORE_RETRY)
-
-            except Exception as gerr:
-                consuerr = str(gerr)
-                if CONSUL_ERR_STRING == consuerr:
-                    logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                        .format(gerr, retry_index))
-                    time.sleep(WAIT_BEFORE_RETRY)
-                else:
-                    logger.warn("Error[{0}] consul error".format(gerr))
-                    break
-
+        if kwargs.get("recurse", False):
+            response = self._request("GET", self._kv_path(key),
+                                     params={"recurse": "true"})
+        else:
+            response = self._request("GET", self._kv_path(key),
+                                     params={"raw": "true"})
+        if response is None:
+            return data, status
+        if response.status_code == 200:
+            if kwargs.get("recurse", False):
+                data = self._decode_items(response.json())
+            else:
+                data = self._decode(response.content)
+            status = "Success"
+        elif response.status_code == 404:
+            status = "Success"
+        else:
+            logger.warn("Error[{0}] while reading key {1} from consul" \
+                .format(response.text, key))
         return data, status
 
     def get(self, key, **kwargs):
-        """ Load data from given key"""
+        """ Load data from given key, with recurse=True the key and value
+            pairs of all the keys under it.
+        """
         data, _ = self._consul_get(key, **kwargs)
         return data
 
@@ -141,53 +170,106 @@ class ConsulStore(Store):
     def delete(self, key):
         """ delete a key
         """
-        for retry_index in range(0, MAX_CONSUL_RETRY):
-            try:
-                key = self._get_key(key)
-                self.consul_conn.kv.delete(key)
-                break
-
-            except requests.exceptions.ConnectionError as connerr:
-                logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                    .format(connerr, retry_index))
-                time.sleep(WAIT_BEFORE_RETRY)
-
-            except Exception as gerr:
-                consulerr = str(gerr)
-                if CONSUL_ERR_STRING == consulerr:
-                    logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                        .format(gerr, retry_index))
-                    time.sleep(WAIT_BEFORE_RETRY)
-                else:
-                    logger.warn("Error[{0}] while deleting key from consul {1}" \
-                        .format(gerr, key))
-                    break
+        response = self._request("DELETE", self._kv_path(key))
+        if response is not None and response.status_code != 200:
+            logger.warn("Error[{0}] while deleting key from consul {1}" \
+                .format(response.text, key))
 
     def get_keys_with_prefix(self, prefix):
         """ get keys with given prefix
         """
-        for retry_index in range(0, MAX_CONSUL_RETRY):
-            try:
-                prefix = self._get_key(prefix)
-                data = self.consul_conn.kv.get(prefix, recurse=True)[1]
-                if data:
-                    return [item["Key"][item["Key"].rindex("/")+1:] for item in data]
-                else:
-                    return []
+        response = self._request("GET", self._kv_path(prefix),
+                                 params={"keys": "true"})
+        if response is None or response.status_code != 200:
+            if response is not None and response.status_code != 404:
+                logger.warn("Error[{0}] while getting the keys from consul" \
+                    .format(response.text))
+            return []
+        return [key.rsplit("/", 1)[-1] for key in response.json()]
+
+    def _txn(self, ops):
+        """Run the KV operations in transactions, returns the KV entries
+           of the results and the indexes of the failed operations, None
+           if consul could not be reached.
+        """
+        results = []
+        failed = []
+        for start in range(0, len(ops), self.TXN_MAX_OPS):
+            chunk = ops[start:start + self.TXN_MAX_OPS]
+            response = self._request("PUT", "txn", json=chunk)
+            if response is None:
+                return None, None
+            if response.status_code == 200:
+                results.extend(result["KV"]
+                               for result in response.json()["Results"] or [])
+            elif response.status_code == 409:
+                # Transaction rolled back
+                failed.extend(start + error["OpIndex"]
+                              for error in response.json()["Errors"])
+            else:
+                logger.warn("Error[{0}] consul transaction failed" \
+                    .format(response.text))
+                return None, None
+        return results, failed
+
+    def put_many(self, items, pickled=True):
+        """Write the values of a dict of keys, returns True on success"""
+        ops = [{"KV": {"Verb": "set", "Key": self._get_key(key),
+                       "Value": base64.b64encode(
+                           self._encode(value, pickled)).decode()}}
+               for key, value in items.items()]
+        results, failed = self._txn(ops)
+        return results is not None and not failed
+
+    def get_many(self, keys):
+        """Returns a dict of the values of the keys, None for the missing
+           ones, or None if consul could not be read.
+        """
+        keys = list(keys)
+        values = dict.fromkeys(keys)
+        names = {self._get_key(key): key for key in keys}
+        pending = list(names)
+        while pending:
+            results, failed = self._txn(
+                [{"KV": {"Verb": "get", "Key": name}} for name in pending])
+            if results is None:
+                return None
+            if not failed:
+                for name, value in self._decode_items(results):
+                    values[names[name]] = value
                 break
+            # A get of a missing key fails the whole transaction, the
+            # others are read again
+            failed = set(failed)
+            pending = [name for index, name in enumerate(pending)
+                       if index not in failed]
+        return values
 
-            except requests.exceptions.ConnectionError as connerr:
-                logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                    .format(connerr, retry_index))
-                time.sleep(WAIT_BEFORE_RETRY)
-
-            except Exception as gerr:
-                consulerr = str(gerr)
-                if CONSUL_ERR_STRING == consulerr:
-                    logger.warn("Error[{0}] consul connection refused Retry Index {1}" \
-                        .format(gerr, retry_index))
-                    time.sleep(WAIT_BEFORE_RETRY)
-                else:
-                    logger.warn("Error[{0}] while getting the keys from consul" \
-                        .format(gerr))
-                    break
+    def delete_many(self, keys):
+        """Delete the keys, returns True on success"""
+        results, failed = self._txn(
+            [{"KV": {"Verb": "delete", "Key": self._get_key(key)}}
+             for key in keys])
+        return results is not None and not failed
+
+    def watch(self, key, index=None, wait=WATCH_WAIT, recurse=False):
+        """Blocks until the key, or any key under it with recurse=True,
+           changes after index or wait secs elapse.
+
+        Returns the index to pass to the next call and the value as read
+        by get(), the call returns at once when index is None.
+        """
+        params = {"recurse": "true"} if recurse else {}
+        if index is not None:
+            params.update(index=index, wait=f"{int(wait)}s")
+        response = self._request("GET", self._kv_path(key), params=params,
+                                 timeout=wait + self.REQUEST_TIMEOUT)
+        if response is None:
+            return index, None
+        new_index = response.headers.get("X-Consul-Index", index)
+        if response.status_code != 200:
+            return new_index, None
+        items = self._decode_items(response.json())
+        if recurse:
+            return new_index, items
+        return new_index, items[0][1] if items else None
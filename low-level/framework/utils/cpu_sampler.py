@@ -0,0 +1,216 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Process wide CPU usage sampler. A single thread reads
+                    /proc/stat once per tick into a fixed size ring buffer,
+                    the current and 1/5/15 minute usage of every core and
+                    of the whole node are then computed from the buffer
+                    without blocking the caller.
+ ****************************************************************************
+"""
+
+import os
+import threading
+import time
+from array import array
+
+from framework.utils.service_logging import logger
+
+
+class CpuSampler(object):
+    """Ring buffer of cumulative busy and total jiffies per core.
+
+    Row 0 of every sample holds the aggregated 'cpu' line, row n + 1 the
+    'cpun' line. Rows are sized from the highest core id in /proc/stat and
+    added when a core with a higher id comes online. The usage over a
+    window is the busy share of the jiffies elapsed between the latest
+    sample and the sample taken window secs before it, or the oldest one
+    while the buffer is filling up.
+    """
+
+    PROC_STAT = "/proc/stat"
+    DEFAULT_TICK = 1
+    # Longest window served, in secs
+    MAX_WINDOW = 15 * 60
+
+    CURRENT = 0
+    WINDOWS = {"1min": 60, "5min": 5 * 60, "15min": 15 * 60}
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Returns the sampler shared by the process, started on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def __init__(self, tick=DEFAULT_TICK, max_window=MAX_WINDOW,
+                 cpus=None, stat_path=PROC_STAT):
+        self._tick = float(tick)
+        self._stat_path = stat_path
+        self.cpus = cpus or self._get_cpu_count(stat_path) or \
+            os.cpu_count() or 1
+        self._rows = self.cpus + 1
+        self._slots = int(max_window / self._tick) + 2
+        self._busy = array('d', bytes(8 * self._slots * self._rows))
+        self._total = array('d', bytes(8 * self._slots * self._rows))
+        # Slot of the latest sample and number of samples held
+        self._head = -1
+        self._count = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _get_cpu_count(stat_path):
+        """Returns the highest core id in stat_path plus one, None if the
+           file can not be read"""
+        try:
+            with open(stat_path) as stat:
+                ids = [int(line.split()[0][3:]) for line in stat
+                       if line.startswith("cpu") and not line.startswith("cpu ")]
+        except (OSError, ValueError) as err:
+            logger.warn(f"CpuSampler, failed to read {stat_path}: {err}")
+            return None
+        return max(ids) + 1 if ids else None
+
+    def _add_rows(self, rows, counters):
+        """Grows the samples to rows, called with the lock held. The rows
+           added are filled with the counters of their core in all the
+           slots, so their usage starts from the latest sample"""
+        busy = array('d', bytes(8 * self._slots * rows))
+        total = array('d', bytes(8 * self._slots * rows))
+        for slot in range(self._slots):
+            old, new = slot * self._rows, slot * rows
+            busy[new:new + self._rows] = self._busy[old:old + self._rows]
+            total[new:new + self._rows] = self._total[old:old + self._rows]
+            for row, (row_busy, row_total) in counters.items():
+                if row >= self._rows:
+                    busy[new + row] = row_busy
+                    total[new + row] = row_total
+        self._busy, self._total = busy, total
+        self._rows = rows
+        self.cpus = rows - 1
+
+    def start(self):
+        if self._thread is None:
+            self.sample()
+            self._thread = threading.Thread(target=self._run,
+                                            name="CpuSampler", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self._tick)
+            try:
+                self.sample()
+            except Exception as err:
+                logger.error(f"CpuSampler, failed to read {self._stat_path}: {err}")
+
+    def sample(self):
+        """Reads /proc/stat and stores it as the latest sample"""
+        with open(self._stat_path) as stat:
+            lines = stat.readlines()
+
+        # Row to busy and total jiffies
+        counters = {}
+        for line in lines:
+            if not line.startswith("cpu"):
+                break
+            fields = line.split()
+            name = fields[0]
+            row = 0 if name == "cpu" else int(name[3:]) + 1
+            # user nice system idle iowait irq softirq steal, guest times
+            # are already accounted in user and nice
+            values = [int(value) for value in fields[1:9]]
+            total = sum(values)
+            idle = values[3] + (values[4] if len(values) > 4 else 0)
+            counters[row] = (total - idle, total)
+
+        rows = max(counters, default=0) + 1
+        if rows > self._rows:
+            with self._lock:
+                self._add_rows(rows, counters)
+
+        slot = (self._head + 1) % self._slots
+        base = slot * self._rows
+        if self._head >= 0:
+            # Cores missing from /proc/stat, i.e. offline, keep their counters
+            prev = self._head * self._rows
+            self._busy[base:base + self._rows] = \
+                self._busy[prev:prev + self._rows]
+            self._total[base:base + self._rows] = \
+                self._total[prev:prev + self._rows]
+        for row, (busy, total) in counters.items():
+            self._busy[base + row] = busy
+            self._total[base + row] = total
+
+        with self._lock:
+            self._head = slot
+            self._count = min(self._count + 1, self._slots)
+        if self._count > 1:
+            self._ready.set()
+
+    def _window_slots(self, window):
+        """Returns the latest slot and the slot starting the window"""
+        head = self._head
+        count = self._count
+        if window == self.CURRENT:
+            return head, (head - 1) % self._slots
+        steps = min(int(round(window / self._tick)), count - 1)
+        return head, (head - steps) % self._slots
+
+    def _usage(self, row, end, start):
+        total = self._total[end * self._rows + row] - \
+            self._total[start * self._rows + row]
+        if total <= 0:
+            return 0.0
+        busy = self._busy[end * self._rows + row] - \
+            self._busy[start * self._rows + row]
+        return round(min(max(busy * 100.0 / total, 0.0), 100.0), 1)
+
+    def wait_ready(self, timeout=None):
+        """Waits until two samples are held, i.e. usage can be computed"""
+        return self._ready.wait(timeout)
+
+    def get_usage(self, window=CURRENT, percpu=False):
+        """Returns the usage in percent over the last window secs, CURRENT
+           being the last tick. percpu returns a list indexed by core id.
+
+           Only the first call after the sampler started can block, for at
+           most one tick, waiting for its second sample.
+        """
+        self.wait_ready(self._tick * 2)
+        with self._lock:
+            if self._count < 2:
+                return [0.0] * self.cpus if percpu else 0.0
+            end, start = self._window_slots(window)
+            if percpu:
+                return [self._usage(row, end, start)
+                        for row in range(1, self._rows)]
+            return self._usage(0, end, start)
+
+    def get_window_usage(self, percpu=False):
+        """Returns the current, 1, 5 and 15 minutes usage"""
+        usage = {"current": self.get_usage(self.CURRENT, percpu)}
+        for name, window in self.WINDOWS.items():
+            usage[name] = self.get_usage(window, percpu)
+        return usage
@@ -18,27 +18,44 @@
 
 import json
 import shlex
+from concurrent.futures import ThreadPoolExecutor
+
 from cortx.utils.process import PipedProcess, SimpleProcess
 
 
 class DriveUtils:
     """Base class for drive related utility functions."""
 
+    # Drives whose SMART data is read at the same time
+    SMART_WORKERS = 8
+
     @staticmethod
-    def get_smart_data():
-        """Extract drive SMART test data using smartctl."""
-        response = []
+    def get_smart_data(workers=SMART_WORKERS):
+        """Extract drive SMART test data using smartctl, run on up to
+           workers drives concurrently. Returned in the lsscsi order.
+        """
         lsscsi_cmd = "lsscsi | grep disk"
         lsscsi_response, _, _ = PipedProcess(lsscsi_cmd).run()
         lsscsi_response = lsscsi_response.decode()
+        drive_paths = []
         for res in lsscsi_response.split("\n"):
             drive_path = res.strip().split(' ')[-1]
             if drive_path not in ["", "-"]:
-                smartctl_cmd = " ".join(
-                        ["smartctl", "-a", drive_path, "--json"])
-                smartctl_cmd = shlex.split(smartctl_cmd)
-                smartctl_response, _, _ = SimpleProcess(smartctl_cmd).run()
-                smartctl_response = json.loads(smartctl_response)
-                smartctl_response["drive_path"] = drive_path
-                response.append(smartctl_response)
-        return response
+                drive_paths.append(drive_path)
+        if not drive_paths:
+            return []
+        with ThreadPoolExecutor(
+                max_workers=max(min(int(workers), len(drive_paths)), 1),
+                thread_name_prefix="smartctl") as executor:
+            return list(executor.map(DriveUtils._get_drive_smart_data,
+                                     drive_paths))
+
+    @staticmethod
+    def _get_drive_smart_data(drive_path):
+        smartctl_cmd = " ".join(
+                ["smartctl", "-a", drive_path, "--json"])
+        smartctl_cmd = shlex.split(smartctl_cmd)
+        smartctl_response, _, _ = SimpleProcess(smartctl_cmd).run()
+        smartctl_response = json.loads(smartctl_response)
+        smartctl_response["drive_path"] = drive_path
+        return smartctl_response
@@ -24,6 +24,8 @@ import errno
 import json
 import pickle
 import shutil
+import threading
+from collections import OrderedDict
 from configparser import ConfigParser
 from framework.utils.store import Store
 from framework.utils.service_logging import logger, init_logging
@@ -31,11 +33,46 @@ from cortx.utils.process import SimpleProcess
 from framework.base.sspl_constants import SSPL_LOG_PATH
 
 class FileStore(Store):
+    """Store keeping every key in its own file.
 
-    def __init__(self):
+    Writes go to a temporary file renamed over the key. With cached=True
+    the content of the files is kept in memory and served while the
+    inode, mtime and size of the file are unchanged, so a get costs a stat
+    instead of a read. Only contents up to cache_max_value bytes are
+    cached, e.g. counters and states rather than queued messages, and the
+    least recently used of more than cache_size files are dropped.
+    Immutable values are also kept deserialized and returned as is,
+    mutable ones are unpickled again so that every get returns a copy.
+    fsync_batch sets how many writes are made durable
+    together: 0 never syncs, 1 syncs every write before its rename, N
+    syncs the last N written files and their directories at once.
+    """
+
+    TMP_SUFFIX = ".sspltmp"
+    # Values shared by all the gets of a cached file
+    IMMUTABLE_TYPES = (bool, int, float, str, bytes, type(None))
+    # Cache miss, or value of a cached file to be deserialized
+    _NOT_CACHED = object()
+    DEFAULT_CACHE_SIZE = 1024
+    DEFAULT_CACHE_MAX_VALUE = 4096
+
+    def __init__(self, cached=False, fsync_batch=0,
+                 cache_size=DEFAULT_CACHE_SIZE,
+                 cache_max_value=DEFAULT_CACHE_MAX_VALUE):
         super(FileStore, self).__init__()
         self.config_parser = ConfigParser()
         init_logging("sspl", SSPL_LOG_PATH)
+        self._cached = cached
+        self._fsync_batch = max(int(fsync_batch), 0)
+        self._lock = threading.Lock()
+        self._cache_size = max(int(cache_size), 1)
+        self._cache_max_value = int(cache_max_value)
+        # Path to the signature and the content of the file, least
+        # recently used first
+        self._cache = OrderedDict()
+        self._unsynced = set()
+        self._hits = 0
+        self._misses = 0
 
     def read(self, config_path=None):
         if config_path is None:
@@ -66,13 +103,15 @@ class FileStore(Store):
                     may get missed on sspl restart or failover!!")
 
         try:
-            fh = open(absfilepath,"wb")
             if pickled:
-                pickle.dump(value, fh)
+                data = pickle.dumps(value)
+            elif isinstance(value, str):
+                data = value.encode('utf-8')
+                value = self._NOT_CACHED
             else:
-                if isinstance(value, str):
-                    value = value.encode('utf-8')
-                fh.write(value)
+                data = value
+                value = self._NOT_CACHED
+            self._write(absfilepath, data, value)
 
         except IOError as err:
             logger.warn("I/O error[{0}] while dumping data to file {1}): {2}"\
@@ -80,8 +119,110 @@ class FileStore(Store):
         except Exception as gerr:
             logger.warn("Error[{0}] while dumping data to file {1}"\
                 .format(gerr, absfilepath))
-        else:
-            fh.close()
+
+    @staticmethod
+    def _signature(stat):
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _write(self, absfilepath, data, value):
+        """Write data to a temporary file and rename it over absfilepath,
+           value is what data deserializes to if known"""
+        tmp_path = f"{absfilepath}.{os.getpid()}.{threading.get_ident()}" \
+                   f"{self.TMP_SUFFIX}"
+        try:
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+                fh.flush()
+                if self._fsync_batch == 1:
+                    os.fsync(fh.fileno())
+                stat = os.fstat(fh.fileno())
+            os.replace(tmp_path, absfilepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self._fsync_batch == 1:
+            self._sync_dirs([os.path.dirname(absfilepath)])
+        with self._lock:
+            if self._cached:
+                self._cache_put(absfilepath, self._signature(stat), data,
+                                value)
+            if self._fsync_batch > 1:
+                self._unsynced.add(absfilepath)
+                if len(self._unsynced) < self._fsync_batch:
+                    return
+        if self._fsync_batch > 1:
+            self.sync()
+
+    @staticmethod
+    def _sync_dirs(directories):
+        for directory in directories:
+            try:
+                fd = os.open(directory or ".", os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as err:
+                logger.warn(f"Failed to sync directory {directory}: {err}")
+
+    def sync(self):
+        """Make the writes not synced yet durable"""
+        with self._lock:
+            paths, self._unsynced = self._unsynced, set()
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as err:
+                logger.warn(f"Failed to sync file {path}: {err}")
+        self._sync_dirs({os.path.dirname(path) for path in paths})
+
+    def get_cache_stats(self):
+        """Returns the hits and misses of the cache and its entries"""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses,
+                    "entries": len(self._cache)}
+
+    def _cache_put(self, absfilepath, signature, data, value):
+        """Caches the content of the file, called with the lock held"""
+        self._cache.pop(absfilepath, None)
+        if len(data) > self._cache_max_value:
+            return
+        if type(value) not in self.IMMUTABLE_TYPES:
+            value = self._NOT_CACHED
+        self._cache[absfilepath] = (signature, data, value)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _get_cached(self, absfilepath):
+        """Returns the cached value of the file, _NOT_CACHED if stale"""
+        try:
+            signature = self._signature(os.stat(absfilepath))
+        except OSError:
+            signature = None
+        with self._lock:
+            entry = self._cache.get(absfilepath)
+            if entry is None or entry[0] != signature:
+                self._cache.pop(absfilepath, None)
+                self._misses += 1
+                return self._NOT_CACHED
+            self._hits += 1
+            self._cache.move_to_end(absfilepath)
+            _, data, value = entry
+        if value is self._NOT_CACHED:
+            value = self._decode(data)
+        return value
+
+    @staticmethod
+    def _decode(data):
+        try:
+            return pickle.loads(data)
+        except:
+            return data
 
     def get(self, key, option=None):
         """
@@ -106,6 +247,11 @@ class FileStore(Store):
         value = None
         absfilepath = key
 
+        if self._cached:
+            cached_value = self._get_cached(absfilepath)
+            if cached_value is not self._NOT_CACHED:
+                return cached_value
+
         # Check if directory exists
         directory_path = os.path.join(os.path.dirname(absfilepath), "")
         if not os.path.isdir(directory_path):
@@ -114,10 +260,12 @@ class FileStore(Store):
 
         try:
             fh = open(absfilepath,"rb")
-            try:
-                value = pickle.load(fh)
-            except:
-                value = fh.read()
+            data = fh.read()
+            value = self._decode(data)
+            if self._cached:
+                signature = self._signature(os.fstat(fh.fileno()))
+                with self._lock:
+                    self._cache_put(absfilepath, signature, data, value)
         except IOError as err:
             logger.warn("I/O error[{0}] while loading data from file {1}): {2}"\
                 .format(err.errno,absfilepath,err))
@@ -170,6 +318,11 @@ class FileStore(Store):
                 os.unlink(path)
             elif os.path.isdir(path):
                 shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            for cached_path in [cached_path for cached_path in self._cache
+                    if cached_path == path or
+                    cached_path.startswith(os.path.join(path, ""))]:
+                del self._cache[cached_path]
 
     def get_keys_with_prefix(self, prefix):
         """ get keys with given prefix
@@ -177,7 +330,8 @@ class FileStore(Store):
         if not os.path.exists(prefix):
             return []
         else:
-            return os.listdir(prefix)
+            return [name for name in os.listdir(prefix)
+                    if not name.endswith(self.TMP_SUFFIX)]
 
     def truncate(self, path, fformat=""):
         """Truncate a file.
@@ -54,3 +54,10 @@ class IPMI(object):
            sensor id using IPMI
         """
         raise NotImplementedError("sub class should implement this")
+
+    def get_sensors_props(self, sensor_ids):
+        """Returns the properties of several sensors as a dict of sensor
+           id to the (common, specific) tuple of get_sensor_props
+        """
+        return {sensor_id: self.get_sensor_props(sensor_id)
+                for sensor_id in sensor_ids}
@@ -16,6 +16,7 @@
 import re
 import os
 import shlex
+import threading
 
 from framework.utils.ipmi import IPMI
 from framework.utils.service_logging import logger
@@ -46,6 +47,18 @@ class IPMITool(IPMI):
     MANUFACTURER = "Manufacturer Name"
     ACTIVE_IPMI_TOOL = None
     VM_ERROR = 'Could not open device at'
+    IPMISIMTOOL_FLAG = f"{DATA_PATH}/server/activate_ipmisimtool"
+    # Properties of 'sensor get' common to all sensors
+    COMMON_PROPS = ('Sensor ID', 'Entity ID')
+
+    # Cached tool and interface arguments, resolved again only when the
+    # simulator flag file, the active interface cache or the BMC config
+    # change. See _get_active_tool() and _get_host_conf_cmd()
+    _lock = threading.Lock()
+    _sim_flag_stat = None
+    _active_tool = IPMITOOL
+    _host_conf_key = None
+    _host_conf_cmd = ""
 
     def __new__(cls):
         """new method"""
@@ -162,6 +175,78 @@ class IPMITool(IPMI):
 
         return (common, specific)
 
+    def get_sensors_props(self, sensor_ids):
+        """Returns the properties of several sensors with a single
+           ipmitool sensor get "Sys Fan 1A" "Sys Fan 1B" ...
+           Sensors missing from its output are read one by one with
+           get_sensor_props, which reports their error.
+           Output Format : {sensor_id: ({common dict data},{specific dict data})}
+        """
+        if not sensor_ids:
+            return {}
+        props_list_out, error, retcode = self._run_ipmitool_subcommand(
+            "sensor get " + " ".join(f"'{sensor_id}'" for sensor_id in sensor_ids))
+        if retcode != 0:
+            # Records of the sensors found are still printed
+            logger.warn(f"ipmitool sensor get command failed: {error}")
+        sensors = self.parse_sensor_get(props_list_out)
+        props = {}
+        for sensor_id in sensor_ids:
+            props[sensor_id] = sensors.get(sensor_id) or \
+                self.get_sensor_props(sensor_id)
+        return props
+
+    @staticmethod
+    def parse_sensor_get(props_list_out):
+        """Parses output of 'sensor get' for one or more sensors, records
+           start with their 'Sensor ID : PS1 Temperature (0x5c)' line.
+           Output Format : {sensor_id: ({common dict data},{specific dict data})}
+        """
+        sensors = {}
+        common = specific = None
+        props = curr_key = None
+        for prop in props_list_out.split("\n"):
+            key, sep, val = prop.partition(":")
+            if sep:
+                curr_key = key.strip()
+                val = val.strip()
+                if curr_key == 'Sensor ID':
+                    common, specific = {}, {}
+                    sensors[IPMITool._get_sensor_id(val)] = (common, specific)
+                if common is None:
+                    continue
+                props = common if curr_key in IPMITool.COMMON_PROPS else specific
+                props[curr_key] = val
+            elif props is not None and prop.strip():
+                props[curr_key] += "\n" + prop
+        return sensors
+
+    @staticmethod
+    def split_sdr_get(props_list_out):
+        """Splits output of 'sdr get' for one or more sensors into the
+           records of each, records start with their
+           'Sensor ID : PS1 Status (0xc8)' line.
+           Output Format : {sensor_id: record output}
+        """
+        records = {}
+        lines = None
+        for line in props_list_out.split("\n"):
+            key, sep, val = line.partition(":")
+            if sep and key.strip() == 'Sensor ID':
+                lines = records[IPMITool._get_sensor_id(val.strip())] = []
+            if lines is not None:
+                lines.append(line)
+        return {sensor_id: "\n".join(lines)
+                for sensor_id, lines in records.items()}
+
+    @staticmethod
+    def _get_sensor_id(val):
+        """Drops the sensor number from 'PS1 Status (0xc8)'"""
+        sensor_id, _, number = val.rpartition(" (")
+        if not sensor_id or not number.startswith("0x"):
+            sensor_id = val
+        return sensor_id
+
     def get_fru_list_by_type(self, fru_list, sensor_id_map):
         """Returns FRU instances list using ipmitool sdr type command
             Params : self, fru_list, sensor_id_map
@@ -174,52 +259,92 @@ class IPMITool(IPMI):
                 for fru in fru_detail}
         return sensor_id_map
 
+    @staticmethod
+    def _get_file_stat(path):
+        """Returns what identifies a version of the file, None if missing"""
+        try:
+            stat = os.stat(path)
+            return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _get_active_tool(self):
+        """Returns ipmisimtool if activated, ipmitool otherwise.
+           The simulator is probed only when its flag file changes."""
+        sim_flag_stat = self._get_file_stat(self.IPMISIMTOOL_FLAG)
+        with self._lock:
+            if sim_flag_stat != IPMITool._sim_flag_stat:
+                active_tool = self.IPMITOOL
+                # Set ipmitool to ipmisimtool if activated.
+                if sim_flag_stat is not None:
+                    cmd = self.IPMISIMTOOL + " sel info"
+                    _, _, retcode = SimpleProcess(cmd).run()
+                    if retcode in [0, 2]:
+                        active_tool = self.IPMISIMTOOL
+                        logger.debug("IPMI simulator is activated.")
+                IPMITool._active_tool = active_tool
+                IPMITool._sim_flag_stat = sim_flag_stat
+            return IPMITool._active_tool
+
+    def _get_host_conf_cmd(self, active_tool):
+        """Returns the interface and credential arguments of ipmitool.
+           The BMC password is decrypted again only when the active
+           interface cache or the BMC config change."""
+        if active_tool == self.IPMISIMTOOL:
+            return ""
+        bmc_ip = Conf.get(GLOBAL_CONF, BMC_IP_KEY, '')
+        bmc_user = Conf.get(GLOBAL_CONF, BMC_USER_KEY, 'ADMIN')
+        bmc_secret = Conf.get(GLOBAL_CONF, BMC_SECRET_KEY, 'ADMIN')
+        key = (self._get_file_stat(BMCInterface.ACTIVE_BMC_IF.value),
+               bmc_ip, bmc_user, bmc_secret)
+        with self._lock:
+            if key == IPMITool._host_conf_key:
+                return IPMITool._host_conf_cmd
+
+            host_conf_cmd = ""
+            _active_interface = store.get(BMCInterface.ACTIVE_BMC_IF.value, None)
+            if isinstance(_active_interface, bytes):
+                _active_interface = _active_interface.decode()
+            # Set host_conf_cmd based on channel info.
+            if _active_interface in BMCInterface.LAN_IF.value:
+                decryption_key = encryptor.gen_key(
+                    MACHINE_ID, ServiceTypes.SERVER_NODE.value)
+                bmc_pass = encryptor.decrypt(
+                    decryption_key, bmc_secret, self.NAME)
+
+                host_conf_cmd = BMCInterface.LAN_CMD.value.format(
+                        _active_interface, bmc_ip, bmc_user, bmc_pass)
+            IPMITool._host_conf_key = key
+            IPMITool._host_conf_cmd = host_conf_cmd
+            return host_conf_cmd
+
+    def invalidate_cache(self):
+        """Forces the tool, interface and credentials to be resolved again"""
+        with self._lock:
+            IPMITool._sim_flag_stat = None
+            IPMITool._host_conf_key = None
+
+    def _get_command(self, subcommand):
+        self.ACTIVE_IPMI_TOOL = self._get_active_tool()
+        host_conf_cmd = self._get_host_conf_cmd(self.ACTIVE_IPMI_TOOL)
+        return shlex.split(
+            " ".join([self.ACTIVE_IPMI_TOOL, host_conf_cmd, subcommand]))
+
+    def _decode(self, value):
+        if not isinstance(value, str):
+            value = value.decode(self.IPMI_ENCODING)
+        return value
+
     def _run_ipmitool_subcommand(self, subcommand, grep_args=None):
         """Executes ipmitool sub-commands, and optionally greps the output."""
-        self.ACTIVE_IPMI_TOOL = self.IPMITOOL
-        host_conf_cmd = ""
-
-        # Set ipmitool to ipmisimtool if activated.
-        if os.path.exists(f"{DATA_PATH}/server/activate_ipmisimtool"):
-            cmd = self.IPMISIMTOOL + " sel info"
-            _, _, retcode = SimpleProcess(cmd).run()
-            if retcode in [0, 2]:
-                self.ACTIVE_IPMI_TOOL = self.IPMISIMTOOL
-                logger.debug("IPMI simulator is activated.")
-
-        # Fetch channel info from config file and cache.
-        _channel_interface = Conf.get(SSPL_CONF, "%s>%s" %
-                                (BMC_INTERFACE, BMC_CHANNEL_IF))
-
-        _active_interface = store.get(BMCInterface.ACTIVE_BMC_IF.value, None)
-        if isinstance(_active_interface, bytes):
-            _active_interface = _active_interface.decode()
-        # Set host_conf_cmd based on channel info.
-        if (self.ACTIVE_IPMI_TOOL != self.IPMISIMTOOL and _active_interface
-                in BMCInterface.LAN_IF.value):
-            bmc_ip = Conf.get(GLOBAL_CONF, BMC_IP_KEY, '')
-            bmc_user = Conf.get(GLOBAL_CONF, BMC_USER_KEY, 'ADMIN')
-            bmc_secret = Conf.get(GLOBAL_CONF, BMC_SECRET_KEY, 'ADMIN')
-
-            decryption_key = encryptor.gen_key(
-                MACHINE_ID, ServiceTypes.SERVER_NODE.value)
-            bmc_pass = encryptor.decrypt(
-                decryption_key, bmc_secret, self.NAME)
-
-            host_conf_cmd = BMCInterface.LAN_CMD.value.format(
-                    _active_interface, bmc_ip, bmc_user, bmc_pass)
-
         # generate the final cmd and execute on shell.
-        command = " ".join([self.ACTIVE_IPMI_TOOL, host_conf_cmd, subcommand])
-        command = shlex.split(command)
+        command = self._get_command(subcommand)
 
         out, error, retcode = SimpleProcess(command).run()
 
         # Decode bytes encoded strings.
-        if not isinstance(out, str):
-            out = out.decode(self.IPMI_ENCODING)
-        if not isinstance(error, str):
-            error = error.decode(self.IPMI_ENCODING)
+        out = self._decode(out)
+        error = self._decode(error)
 
         # Grep the output as per grep_args provided.
         if grep_args is not None and retcode == 0:
@@ -238,6 +363,21 @@ class IPMITool(IPMI):
 
         return out, error, retcode
 
+    @staticmethod
+    def parse_sdr_list(sdr_out):
+        """Parses output of 'sdr elist', 'sdr type' or 'sdr entity'
+           Sys Fan 2B       | 33h | ok  | 29.4 | 5332 RPM
+        """
+        sensors = {}
+        for line in sdr_out.split("\n"):
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) != 5:
+                continue
+            sensor_id, sensor_num, status, entity_id, reading = fields
+            sensors[sensor_id] = (sensor_num.strip("h").lower(), status,
+                                  entity_id, reading)
+        return sensors
+
     def load_server_fru_list(self):
         """Get Server FRU list and merge it with server_fru_list,
         maintained in global config, with which FRU list can be extended
@@ -0,0 +1,282 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       In process model of the md RAID arrays of the node.
+                    Reads /proc/mdstat and /sys/block/md*/md directly, diffs
+                    consecutive snapshots into change events and caches the
+                    identity of the members until they change.
+ ****************************************************************************
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+
+from framework.utils.service_logging import logger
+from framework.utils.utility import run_command
+
+
+# slot is the role of the member in the array, None for spares and
+# members being added, state the sysfs state e.g. 'in_sync', 'faulty',
+# dev its major:minor
+MdMember = namedtuple('MdMember', 'name, slot, state, dev')
+
+# status is the [UU_] string of mdstat without brackets, working the count
+# of working members it reports, layout the raid10 copies layout of sysfs,
+# members are ordered by slot
+MdArray = namedtuple('MdArray', 'name, state, array_state, level, raid_disks, '
+                     'working, degraded, status, sync_action, mismatch_cnt, '
+                     'layout, members')
+
+# kind is one of MdRaid.*_ADDED/REMOVED/CHANGED, old and new the MdArray or
+# MdMember before and after the change
+MdEvent = namedtuple('MdEvent', 'kind, array, member, old, new')
+
+
+class MdRaid(object):
+    """Snapshots of the md arrays shared by the RAID modules.
+
+    A snapshot maps the array name, e.g. 'md0', to its MdArray. Arrays
+    missing from sysfs are described from mdstat alone, their members
+    having no slot.
+    """
+
+    MDSTAT = "/proc/mdstat"
+    SYSFS = "/sys/"
+
+    ARRAY_ADDED = "array_added"
+    ARRAY_REMOVED = "array_removed"
+    ARRAY_CHANGED = "array_changed"
+    MEMBER_ADDED = "member_added"
+    MEMBER_REMOVED = "member_removed"
+    MEMBER_CHANGED = "member_changed"
+
+    # md0 : active raid1 sdb1[1] sda1[0](F)
+    ARRAY_LINE = re.compile(r"^(md\S*)\s*:\s*(.*)$")
+    MEMBER_FIELD = re.compile(r"^(\S+)\[(\d+)\](?:\((\w)\))?$")
+    # 1046528 blocks super 1.2 [2/1] [U_]
+    STATUS_LINE = re.compile(r"\[(\d+)/(\d+)\]\s*\[([U_]+)\]")
+    # mdstat member flags, for arrays missing from sysfs
+    FLAG_STATES = {"F": "faulty", "S": "spare", "W": "write_mostly",
+                   "R": "replacement"}
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Returns the model shared by the process"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                from framework.utils.sysfs_interface import SysFS
+                cls._instance = cls(sysfs=SysFS.get_sysfs_base_path())
+            return cls._instance
+
+    def __init__(self, mdstat=MDSTAT, sysfs=SYSFS, serial_lookup=None):
+        self._mdstat = mdstat
+        self._sysfs = sysfs
+        self._serial_lookup = serial_lookup or self._get_serial_number
+        self._lock = threading.Lock()
+        self._snapshot = {}
+        self._updated = None
+        # Member name to its dev and identity
+        self._identities = {}
+
+    def _read(self, path, default=None):
+        try:
+            with open(path) as attr:
+                return attr.read().strip()
+        except (IOError, OSError):
+            return default
+
+    def _md_dir(self, name):
+        return os.path.join(self._sysfs, "block", name, "md")
+
+    def _parse_mdstat(self, content):
+        """Returns the name, mdstat state, level, members and status line
+           of every array in mdstat.
+        """
+        arrays = []
+        for line in content.splitlines():
+            match = self.ARRAY_LINE.match(line)
+            if match:
+                fields = match.group(2).split()
+                state = fields[0] if fields else ""
+                level = None
+                members = []
+                for field in fields[1:]:
+                    member = self.MEMBER_FIELD.match(field)
+                    if member:
+                        members.append(member.groups())
+                    elif level is None and not field.startswith("("):
+                        level = field
+                arrays.append([match.group(1), state, level, members, None])
+            elif arrays and arrays[-1][4] is None:
+                status = self.STATUS_LINE.search(line)
+                if status:
+                    arrays[-1][4] = status.groups()
+        return arrays
+
+    def _read_member(self, md_dir, name, flag):
+        dev_dir = os.path.join(md_dir, f"dev-{name}")
+        slot = self._read(os.path.join(dev_dir, "slot"))
+        state = self._read(os.path.join(dev_dir, "state"))
+        if state is None:
+            state = self.FLAG_STATES.get(flag, "in_sync")
+        return MdMember(name, int(slot) if slot and slot.isdigit() else None,
+                        state, self._read(os.path.join(dev_dir, "block", "dev")))
+
+    def _read_array(self, name, state, level, members, status):
+        md_dir = self._md_dir(name)
+        members = [self._read_member(md_dir, member, flag)
+                   for member, _, flag in members]
+        members.sort(key=lambda member: (member.slot is None,
+                                         member.slot or 0, member.name))
+        raid_disks, working, status = status if status else (None, None, "")
+        raid_disks = self._read(os.path.join(md_dir, "raid_disks"), raid_disks)
+        degraded = self._read(os.path.join(md_dir, "degraded"))
+        mismatch_cnt = self._read(os.path.join(md_dir, "mismatch_cnt"))
+        layout = self._read(os.path.join(md_dir, "layout"))
+        return MdArray(name, state,
+                       self._read(os.path.join(md_dir, "array_state")),
+                       self._read(os.path.join(md_dir, "level"), level),
+                       int(raid_disks) if raid_disks else None,
+                       int(working) if working else None,
+                       int(degraded) if degraded else None,
+                       status,
+                       self._read(os.path.join(md_dir, "sync_action")),
+                       int(mismatch_cnt) if mismatch_cnt else None,
+                       int(layout) if layout and layout.isdigit() else None,
+                       tuple(members))
+
+    def refresh(self):
+        """Reads the arrays and returns the snapshot and the events since
+           the previous refresh.
+        """
+        with open(self._mdstat) as mdstat:
+            content = mdstat.read()
+        snapshot = {}
+        for array in self._parse_mdstat(content):
+            snapshot[array[0]] = self._read_array(*array)
+        with self._lock:
+            events = self.diff(self._snapshot, snapshot)
+            self._snapshot = snapshot
+            self._updated = time.time()
+            self._expire_identities(snapshot)
+        for event in events:
+            logger.debug(f"MdRaid, {event.kind} {event.array} "
+                         f"{event.member or ''}")
+        return snapshot, events
+
+    def get_snapshot(self, max_age=0):
+        """Returns the latest snapshot, refreshed if older than max_age
+           secs.
+        """
+        with self._lock:
+            if self._updated is not None and \
+                    time.time() - self._updated <= max_age:
+                return self._snapshot
+        return self.refresh()[0]
+
+    def get_array(self, name, max_age=0):
+        """Returns the MdArray of name, e.g. 'md0' or '/dev/md0', None if
+           not assembled.
+        """
+        return self.get_snapshot(max_age).get(os.path.basename(name))
+
+    @classmethod
+    def diff(cls, old, new):
+        """Returns the MdEvents turning snapshot old into new"""
+        events = []
+        for name in old.keys() - new.keys():
+            events.append(MdEvent(cls.ARRAY_REMOVED, name, None, old[name], None))
+        for name, array in new.items():
+            prev = old.get(name)
+            if prev is None:
+                events.append(MdEvent(cls.ARRAY_ADDED, name, None, None, array))
+                continue
+            if prev[:-1] != array[:-1]:
+                events.append(MdEvent(cls.ARRAY_CHANGED, name, None, prev, array))
+            prev_members = {member.name: member for member in prev.members}
+            members = {member.name: member for member in array.members}
+            for member in prev_members.keys() - members.keys():
+                events.append(MdEvent(cls.MEMBER_REMOVED, name, member,
+                                      prev_members[member], None))
+            for member, value in members.items():
+                prev_value = prev_members.get(member)
+                if prev_value is None:
+                    events.append(MdEvent(cls.MEMBER_ADDED, name, member,
+                                          None, value))
+                elif prev_value != value:
+                    events.append(MdEvent(cls.MEMBER_CHANGED, name, member,
+                                          prev_value, value))
+        return events
+
+    def _expire_identities(self, snapshot):
+        devs = {member.name: member.dev for array in snapshot.values()
+                for member in array.members}
+        for name in list(self._identities):
+            if name not in devs or devs[name] != self._identities[name][0]:
+                del self._identities[name]
+
+    def get_identity(self, member):
+        """Returns the path and serial number of a member, looked up once
+           until the member leaves the arrays or its device changes.
+        """
+        with self._lock:
+            cached = self._identities.get(member)
+            dev = next((value.dev for array in self._snapshot.values()
+                        for value in array.members if value.name == member),
+                       None)
+        if cached is not None and cached[0] == dev:
+            return dict(cached[1])
+        identity = {"path": f"/dev/{member}",
+                    "serialNumber": self._serial_lookup(member) or "None"}
+        with self._lock:
+            self._identities[member] = (dev, identity)
+        return dict(identity)
+
+    def _get_serial_number(self, member):
+        """Reads the serial number of the disk holding a member from sysfs,
+           running smartctl only if sysfs does not report it.
+        """
+        block_dir = os.path.realpath(
+            os.path.join(self._sysfs, "class", "block", member))
+        if os.path.exists(os.path.join(block_dir, "partition")):
+            block_dir = os.path.dirname(block_dir)
+        serial = self._read(os.path.join(block_dir, "device", "serial"))
+        if serial:
+            return serial
+        try:
+            with open(os.path.join(block_dir, "device", "vpd_pg80"), "rb") as vpd:
+                # Unit serial number page, 4 bytes header
+                serial = vpd.read()[4:].decode(errors="ignore").strip(" \x00")
+            if serial:
+                return serial
+        except (IOError, OSError):
+            pass
+        response, _, returncode = run_command(
+            f"smartctl -i /dev/{member} --json")
+        if returncode == 0:
+            try:
+                return json.loads(response).get("serial_number")
+            except ValueError:
+                pass
+        return None
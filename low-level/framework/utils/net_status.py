@@ -0,0 +1,229 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Network status collector. Reads the operational state,
+                    carrier and IPv4 address of every interface from sysfs
+                    and netlink in one pass, probes the BMC on its own
+                    slower schedule and optionally listens to netlink link
+                    events to report cable pulls without waiting for the
+                    next poll.
+ ****************************************************************************
+"""
+
+import os
+import re
+import socket
+import struct
+import threading
+import time
+from collections import namedtuple
+
+import psutil
+
+from framework.utils.service_logging import logger
+from framework.utils.utility import run_command
+
+
+# nw_status is the operational state as reported by 'ip --br a', e.g. 'UP',
+# cable_status one of 'CONNECTED', 'DISCONNECTED' and 'UNKNOWN'
+IfStatus = namedtuple('IfStatus', 'nw_status, ipv4, cable_status')
+
+
+class NetworkStatus(object):
+    """Status of the network interfaces and of the BMC LAN.
+
+    The BMC LAN address is read with ipmitool once and kept until the BMC
+    stops answering the probe, it is then read again as its configuration
+    may have changed, or until the LAN cache TTL elapses.
+    """
+
+    SYSFS = "/sys/"
+    DEFAULT_BMC_PROBE_INTERVAL = 60
+    DEFAULT_BMC_LAN_TTL = 3600
+
+    CARRIER_STATES = {"0": "DISCONNECTED", "1": "CONNECTED"}
+    IPV4 = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}")
+
+    # rtnetlink, linux/rtnetlink.h and linux/if_link.h
+    RTMGRP_LINK = 1
+    RTM_NEWLINK = 16
+    RTM_DELLINK = 17
+    IFLA_IFNAME = 3
+    NLMSG_HDR = struct.Struct("=IHHII")
+    IFINFO_MSG = struct.Struct("=BxHiII")
+    RT_ATTR = struct.Struct("=HH")
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, bmc_probe_interval=DEFAULT_BMC_PROBE_INTERVAL,
+                     bmc_lan_ttl=DEFAULT_BMC_LAN_TTL):
+        """Returns the collector shared by the process"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                from framework.utils.sysfs_interface import SysFS
+                cls._instance = cls(SysFS.get_sysfs_base_path(),
+                                    bmc_probe_interval, bmc_lan_ttl)
+            return cls._instance
+
+    def __init__(self, sysfs=SYSFS, bmc_probe_interval=DEFAULT_BMC_PROBE_INTERVAL,
+                 bmc_lan_ttl=DEFAULT_BMC_LAN_TTL, runner=run_command):
+        self._net_dir = os.path.join(sysfs, "class", "net")
+        self._bmc_probe_interval = max(float(bmc_probe_interval), 1.0)
+        self._bmc_lan_ttl = float(bmc_lan_ttl)
+        self._run = runner
+        self._lock = threading.Lock()
+        self._bmc_ip = None
+        self._bmc_lan_updated = None
+        self._bmc_reachable = False
+        self._bmc_probed = threading.Event()
+        self._probe_thread = None
+        self._netlink_thread = None
+        # Set when a netlink link event is received, cleared by the reader
+        self.link_changed = threading.Event()
+
+    def _read(self, interface, attr):
+        try:
+            with open(os.path.join(self._net_dir, interface, attr)) as f:
+                return f.read().strip()
+        except (IOError, OSError):
+            return None
+
+    def get_interfaces(self):
+        """Returns the IfStatus of every interface"""
+        try:
+            interfaces = os.listdir(self._net_dir)
+        except OSError as err:
+            logger.error(f"NetworkStatus, failed to list {self._net_dir}: {err}")
+            interfaces = []
+        addresses = psutil.net_if_addrs()
+        status = {}
+        for interface in interfaces:
+            operstate = (self._read(interface, "operstate") or "unknown").upper()
+            ipv4 = next((addr.address for addr in addresses.get(interface, ())
+                         if addr.family == socket.AF_INET), "")
+            cable_status = self.CARRIER_STATES.get(
+                self._read(interface, "carrier"), "UNKNOWN")
+            status[interface] = IfStatus(operstate, ipv4, cable_status)
+        return status
+
+    def _read_bmc_lan(self):
+        response, _, _ = self._run("sudo ipmitool lan print")
+        bmc_ip = self.IPV4.findall(response)
+        return bmc_ip[0] if bmc_ip else None
+
+    def invalidate_bmc(self):
+        """Reads the BMC LAN configuration again at the next probe"""
+        with self._lock:
+            self._bmc_lan_updated = None
+
+    def probe_bmc(self):
+        """Reads the BMC LAN address if not cached and pings it"""
+        with self._lock:
+            lan_valid = self._bmc_lan_updated is not None and \
+                time.time() - self._bmc_lan_updated < self._bmc_lan_ttl
+        if not lan_valid:
+            bmc_ip = self._read_bmc_lan()
+            with self._lock:
+                self._bmc_ip = bmc_ip
+                self._bmc_lan_updated = time.time()
+        bmc_ip = self._bmc_ip
+        reachable = False
+        if bmc_ip:
+            _, _, returncode = self._run(f"ping -c1 -W1 -q {bmc_ip}")
+            reachable = returncode == 0
+            if not reachable:
+                logger.warn("BMC Host:{0} is not reachable".format(bmc_ip))
+                # BMC address may have been changed
+                self.invalidate_bmc()
+        with self._lock:
+            self._bmc_reachable = reachable
+        self._bmc_probed.set()
+
+    def get_bmc_status(self, timeout=None):
+        """Returns the BMC address and reachability as last probed, waiting
+           at most timeout secs for the first probe.
+        """
+        if not self._bmc_probed.is_set():
+            if self._probe_thread is None:
+                self.probe_bmc()
+            else:
+                self._bmc_probed.wait(timeout)
+        with self._lock:
+            return self._bmc_ip, self._bmc_reachable
+
+    def start(self, netlink_events=False):
+        """Starts the BMC probe and, if enabled, the netlink listener"""
+        if self._probe_thread is None:
+            self._probe_thread = threading.Thread(target=self._run_probe,
+                name="NetworkStatusBmcProbe", daemon=True)
+            self._probe_thread.start()
+        if netlink_events and self._netlink_thread is None:
+            self._netlink_thread = threading.Thread(target=self._run_netlink,
+                name="NetworkStatusNetlink", daemon=True)
+            self._netlink_thread.start()
+
+    def _run_probe(self):
+        while True:
+            try:
+                self.probe_bmc()
+            except Exception as err:
+                logger.error(f"NetworkStatus, BMC probe failed: {err}")
+                self._bmc_probed.set()
+            time.sleep(self._bmc_probe_interval)
+
+    def _parse_link_events(self, data):
+        """Returns the names of the interfaces of the link messages"""
+        interfaces = []
+        offset = 0
+        while offset + self.NLMSG_HDR.size <= len(data):
+            length, msg_type, _, _, _ = self.NLMSG_HDR.unpack_from(data, offset)
+            if length < self.NLMSG_HDR.size:
+                break
+            if msg_type in (self.RTM_NEWLINK, self.RTM_DELLINK):
+                attr = offset + self.NLMSG_HDR.size + self.IFINFO_MSG.size
+                while attr + self.RT_ATTR.size <= offset + length:
+                    attr_len, attr_type = self.RT_ATTR.unpack_from(data, attr)
+                    if attr_len < self.RT_ATTR.size:
+                        break
+                    if attr_type == self.IFLA_IFNAME:
+                        name = data[attr + self.RT_ATTR.size:attr + attr_len]
+                        interfaces.append(name.rstrip(b"\0").decode())
+                        break
+                    attr += (attr_len + 3) & ~3
+            offset += (length + 3) & ~3
+        return interfaces
+
+    def _run_netlink(self):
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW,
+                                 socket.NETLINK_ROUTE)
+            sock.bind((0, self.RTMGRP_LINK))
+        except OSError as err:
+            logger.warn(f"NetworkStatus, netlink link events not available: {err}")
+            return
+        while True:
+            try:
+                interfaces = self._parse_link_events(sock.recv(65536))
+            except Exception as err:
+                logger.error(f"NetworkStatus, failed to read netlink: {err}")
+                time.sleep(1)
+                continue
+            if interfaces:
+                logger.debug(f"NetworkStatus, link changed: {interfaces}")
+                self.link_changed.set()
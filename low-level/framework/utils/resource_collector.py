@@ -0,0 +1,180 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Resource collection engine. Runs independent collectors
+                    concurrently with a timeout each and caches their
+                    results with a TTL per collector. Results not refreshed
+                    in time are served from the cache and marked stale.
+ ****************************************************************************
+"""
+
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from framework.utils.service_logging import logger
+
+
+# status is one of ResourceCollector.STATUS_*, updated the time the value
+# was collected, None if never collected
+CollectResult = namedtuple('CollectResult', 'value, status, updated')
+
+
+class _Collector(object):
+    """Registered collector and its cached result"""
+
+    def __init__(self, name, method, ttl, timeout, fingerprint, group):
+        self.name = name
+        self.method = method
+        self.ttl = ttl
+        self.timeout = timeout
+        self.fingerprint = fingerprint
+        self.group = group
+        self.value = None
+        self.updated = None
+        self.version = None
+        self.expired = False
+        self.future = None
+
+
+class ResourceCollector(object):
+    """Collects resources concurrently and caches them per TTL.
+
+    A cached value is served while it is younger than the TTL of its
+    collector and, if the collector has a fingerprint function, while the
+    fingerprint is unchanged, e.g. the mtime of a database the resource is
+    read from. Otherwise the collector is run on the worker pool, a run
+    still pending from an earlier call is waited on instead of started
+    again. Collectors sharing a group never run at the same time.
+    """
+
+    DEFAULT_WORKERS = 8
+    DEFAULT_TIMEOUT = 10
+
+    # Collected by this call
+    STATUS_FRESH = "fresh"
+    # Served from the cache within its TTL
+    STATUS_CACHED = "cached"
+    # Collection failed or timed out, last value served
+    STATUS_STALE = "stale"
+    # Collection failed or timed out and nothing was ever collected
+    STATUS_UNAVAILABLE = "unavailable"
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self._collectors = {}
+        self._group_locks = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix="ResourceCollector")
+
+    def register(self, name, method, ttl, timeout=DEFAULT_TIMEOUT,
+                 fingerprint=None, group=None):
+        """Registers method as the collector of resource name"""
+        with self._lock:
+            self._collectors[name] = _Collector(name, method, ttl, timeout,
+                                                fingerprint, group)
+            if group is not None:
+                self._group_locks.setdefault(group, threading.Lock())
+
+    def invalidate(self, name=None):
+        """Drops the cached value of one or all the collectors"""
+        with self._lock:
+            collectors = [self._collectors[name]] if name \
+                else self._collectors.values()
+            for collector in collectors:
+                collector.expired = True
+
+    def _get_fingerprint(self, collector):
+        if collector.fingerprint is None:
+            return None
+        try:
+            return collector.fingerprint()
+        except Exception as err:
+            logger.debug(f"ResourceCollector, {collector.name} fingerprint "
+                         f"failed: {err}")
+            return None
+
+    def _is_valid(self, collector, now, version):
+        return collector.updated is not None and not collector.expired and \
+            now - collector.updated < collector.ttl and \
+            collector.version == version
+
+    def _run(self, collector, version):
+        group_lock = self._group_locks.get(collector.group)
+        try:
+            if group_lock is None:
+                value = collector.method()
+            else:
+                with group_lock:
+                    value = collector.method()
+        except Exception as err:
+            logger.error(f"ResourceCollector, {collector.name} failed: "
+                         f"{err.__class__.__name__}: {err}")
+            raise
+        with self._lock:
+            collector.value = value
+            collector.updated = time.time()
+            collector.version = version
+            collector.expired = False
+        return value
+
+    def collect(self, names=None):
+        """Returns the CollectResult of the given or all the resources.
+
+        Blocks at most the largest timeout of the collectors run, a
+        collector still running then completes in the background and
+        refreshes the cache for the next calls.
+        """
+        now = time.time()
+        results = {}
+        pending = {}
+        with self._lock:
+            collectors = [self._collectors[name] for name in names] if names \
+                else list(self._collectors.values())
+        for collector in collectors:
+            version = self._get_fingerprint(collector)
+            with self._lock:
+                if self._is_valid(collector, now, version):
+                    results[collector.name] = CollectResult(
+                        collector.value, self.STATUS_CACHED, collector.updated)
+                    continue
+                if collector.future is None or collector.future.done():
+                    collector.future = self._executor.submit(
+                        self._run, collector, version)
+                pending[collector.name] = (collector, collector.future)
+
+        for name, (collector, future) in pending.items():
+            remaining = now + collector.timeout - time.time()
+            wait([future], timeout=max(remaining, 0))
+            if future.done() and future.exception() is None:
+                results[name] = CollectResult(future.result(),
+                    self.STATUS_FRESH, collector.updated)
+                continue
+            if not future.done():
+                logger.warning(f"ResourceCollector, {name} not collected "
+                               f"within {collector.timeout} secs")
+            with self._lock:
+                status = self.STATUS_UNAVAILABLE if collector.updated is None \
+                    else self.STATUS_STALE
+                results[name] = CollectResult(collector.value, status,
+                                              collector.updated)
+        return results
+
+    def get(self, name):
+        """Returns the value of one resource, None if unavailable"""
+        return self.collect([name])[name].value
@@ -0,0 +1,281 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Append-only segment log used as local backend of
+                    StoreQueue. Records are written to rotating segment
+                    files as <length><crc32><payload> and the head of the
+                    queue is kept in a single checkpoint file.
+ ****************************************************************************
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+
+from framework.utils.service_logging import logger
+
+
+class SegmentLog(object):
+    """FIFO of byte records persisted in append-only segment files"""
+
+    DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024
+    DEFAULT_FSYNC_BATCH = 64
+
+    SEGMENT_PREFIX = "segment-"
+    SEGMENT_SUFFIX = ".log"
+    CHECKPOINT = "checkpoint"
+
+    # Record header, payload length and crc32 of the payload
+    HEADER = struct.Struct(">II")
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, path, segment_size=DEFAULT_SEGMENT_SIZE,
+                     fsync_batch=DEFAULT_FSYNC_BATCH):
+        """Returns the log of a directory, shared within the process"""
+        path = os.path.abspath(path)
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path, segment_size, fsync_batch)
+            return cls._instances[path]
+
+    def __init__(self, path, segment_size=DEFAULT_SEGMENT_SIZE,
+                 fsync_batch=DEFAULT_FSYNC_BATCH):
+        self._path = path
+        self._segment_size = segment_size
+        self._fsync_batch = max(int(fsync_batch), 1)
+        self._lock = threading.RLock()
+        self._unsynced = 0
+        self._reader = None
+        self._reader_seq = None
+        os.makedirs(self._path, exist_ok=True)
+        self._recover()
+
+    def _segment_path(self, seq):
+        return os.path.join(self._path,
+                            f"{self.SEGMENT_PREFIX}{seq:016d}{self.SEGMENT_SUFFIX}")
+
+    def _list_segments(self):
+        segments = []
+        for name in os.listdir(self._path):
+            if name.startswith(self.SEGMENT_PREFIX) and \
+                    name.endswith(self.SEGMENT_SUFFIX):
+                try:
+                    segments.append(int(name[len(self.SEGMENT_PREFIX):
+                                             -len(self.SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(segments)
+
+    def _read_checkpoint(self):
+        """Returns the segment, offset and number of the head record"""
+        try:
+            with open(os.path.join(self._path, self.CHECKPOINT)) as fh:
+                checkpoint = json.load(fh)
+            return int(checkpoint["segment"]), int(checkpoint["offset"]), \
+                int(checkpoint.get("number", 0))
+        except FileNotFoundError:
+            return None, 0, 0
+        except (ValueError, KeyError, TypeError) as err:
+            logger.warn(f"SegmentLog, invalid checkpoint in {self._path}, "
+                        f"replaying from oldest segment: {err}")
+            return None, 0, 0
+
+    def _write_checkpoint(self):
+        checkpoint = os.path.join(self._path, self.CHECKPOINT)
+        tmp_path = f"{checkpoint}.tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump({"segment": self._head_seq,
+                       "offset": self._head_offset,
+                       "number": self._head_number}, fh)
+        os.replace(tmp_path, checkpoint)
+
+    def _read_record(self, fh, offset):
+        """Returns (payload, next offset) or None at end of valid data"""
+        fh.seek(offset)
+        header = fh.read(self.HEADER.size)
+        if len(header) < self.HEADER.size:
+            return None
+        length, crc = self.HEADER.unpack(header)
+        payload = fh.read(length)
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return None
+        return payload, offset + self.HEADER.size + length
+
+    def _recover(self):
+        """Count the pending records and drop a torn write at the tail"""
+        segments = self._list_segments()
+        head_seq, head_offset, head_number = self._read_checkpoint()
+        if head_seq is None or head_seq not in segments:
+            head_seq = segments[0] if segments else 0
+            head_offset = 0
+        for seq in segments:
+            if seq < head_seq:
+                os.remove(self._segment_path(seq))
+        self._segments = [seq for seq in segments if seq >= head_seq] or [head_seq]
+        self._head_seq = head_seq
+        self._head_offset = head_offset
+        # Records are numbered in append order, the head has head_number
+        self._head_number = head_number
+
+        self._count = 0
+        self._bytes = 0
+        for seq in self._segments:
+            offset = head_offset if seq == head_seq else 0
+            path = self._segment_path(seq)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as fh:
+                while True:
+                    record = self._read_record(fh, offset)
+                    if record is None:
+                        break
+                    self._count += 1
+                    self._bytes += record[1] - offset
+                    offset = record[1]
+                end = fh.seek(0, os.SEEK_END)
+            if offset < end:
+                if seq == self._segments[-1]:
+                    logger.warn(f"SegmentLog, truncating {end - offset} bytes "
+                                f"of partial record in {path}")
+                    os.truncate(path, offset)
+                else:
+                    logger.warn(f"SegmentLog, skipping {end - offset} bytes "
+                                f"of corrupted records in {path}")
+
+        self._tail_seq = self._segments[-1]
+        self._writer = open(self._segment_path(self._tail_seq), "ab", buffering=0)
+        self._tail_size = self._writer.seek(0, os.SEEK_END)
+
+    def _rotate(self):
+        self.sync()
+        self._writer.close()
+        self._tail_seq += 1
+        self._segments.append(self._tail_seq)
+        self._writer = open(self._segment_path(self._tail_seq), "ab", buffering=0)
+        self._tail_size = 0
+
+    def append(self, payload):
+        """Append a record, returns the number of bytes used on disk"""
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        record = self.HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self._tail_size and \
+                    self._tail_size + len(record) > self._segment_size:
+                self._rotate()
+            self._writer.write(record)
+            self._tail_size += len(record)
+            self._count += 1
+            self._bytes += len(record)
+            self._unsynced += 1
+            if self._unsynced >= self._fsync_batch:
+                self.sync()
+        return len(record)
+
+    def sync(self):
+        """Flush appended records to disk"""
+        with self._lock:
+            if self._unsynced:
+                os.fsync(self._writer.fileno())
+                self._unsynced = 0
+
+    def _get_reader(self, seq):
+        if self._reader_seq != seq:
+            if self._reader is not None:
+                self._reader.close()
+            self._reader = open(self._segment_path(seq), "rb")
+            self._reader_seq = seq
+        return self._reader
+
+    def _scan(self, count):
+        """Returns up to count (payload, segment, end offset, size) of the
+           records from the head
+        """
+        records = []
+        seq, offset = self._head_seq, self._head_offset
+        index = self._segments.index(seq)
+        while len(records) < count and len(records) < self._count:
+            record = self._read_record(self._get_reader(seq), offset)
+            if record is None:
+                # End of segment, continue with the next one
+                index += 1
+                if index >= len(self._segments):
+                    break
+                seq, offset = self._segments[index], 0
+                continue
+            payload, end = record
+            records.append((payload, seq, end, end - offset))
+            offset = end
+        return records
+
+    def peek(self, count=1):
+        """Returns (number of the first record, up to count records) from
+           the head without removing them. The number is passed to ack.
+        """
+        with self._lock:
+            return self._head_number, \
+                [payload for payload, _, _, _ in self._scan(count)]
+
+    def ack(self, until):
+        """Removes the records numbered below until, returns bytes freed.
+
+        Records already removed, e.g. by another consumer, are skipped so
+        a consumer only removes records it peeked.
+        """
+        with self._lock:
+            count = min(until - self._head_number, self._count)
+            if count <= 0:
+                return 0
+            acked = self._scan(count)
+            if not acked:
+                return 0
+            freed = sum(size for _, _, _, size in acked)
+            _, self._head_seq, self._head_offset, _ = acked[-1]
+            self._head_number += len(acked)
+            self._count -= len(acked)
+            self._bytes -= freed
+
+            # Drop the fully consumed segments
+            while self._segments[0] != self._head_seq:
+                seq = self._segments.pop(0)
+                if self._reader_seq == seq:
+                    self._reader.close()
+                    self._reader, self._reader_seq = None, None
+                os.remove(self._segment_path(seq))
+            if self._count == 0 and self._head_seq == self._tail_seq and \
+                    self._tail_size > self._segment_size // 2:
+                # Start a fresh segment once the queue is drained
+                self._rotate()
+                self._head_seq, self._head_offset = self._tail_seq, 0
+                os.remove(self._segment_path(self._segments.pop(0)))
+                if self._reader is not None:
+                    self._reader.close()
+                    self._reader, self._reader_seq = None, None
+            self._write_checkpoint()
+            return freed
+
+    def __len__(self):
+        return self._count
+
+    def size(self):
+        """Bytes used on disk by the pending records"""
+        return self._bytes
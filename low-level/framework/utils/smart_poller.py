@@ -0,0 +1,123 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Rate limited SMART health polling engine. Runs
+                    'smartctl -H' for due drives on a bounded worker pool
+                    and spreads the per drive checks with a jittered
+                    schedule.
+ ****************************************************************************
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.utils.service_logging import logger
+from framework.utils.utility import run_command
+
+
+class SmartHealthPoller(object):
+    """Schedules SMART health checks per drive.
+
+    A drive is checked when it is seen for the first time, when it has
+    been invalidated (its udisks2 state changed) or when its health
+    interval has elapsed. All other drives are skipped in a sweep.
+    """
+
+    DEFAULT_INTERVAL = 300
+    DEFAULT_WORKERS = 4
+    DEFAULT_JITTER = 0.1
+    DEFAULT_MAX_CHECKS = 32
+
+    def __init__(self, interval=DEFAULT_INTERVAL, workers=DEFAULT_WORKERS,
+                 jitter=DEFAULT_JITTER, max_checks=DEFAULT_MAX_CHECKS,
+                 runner=run_command):
+        self._interval = max(float(interval), 1.0)
+        self._workers = max(int(workers), 1)
+        self._jitter = min(max(float(jitter), 0.0), 1.0)
+        self._max_checks = max(int(max_checks), 1)
+        self._runner = runner
+        # Next due time per drive, drives missing here are due right away
+        self._next_due = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _next_check_time(self, now):
+        """Return the jittered time of the next periodic check"""
+        spread = self._interval * self._jitter
+        return now + self._interval + random.uniform(-spread, spread)
+
+    def invalidate(self, drive):
+        """Force a health check of the drive in the next sweep"""
+        with self._lock:
+            self._next_due.pop(drive, None)
+
+    def remove(self, drive):
+        """Stop tracking a drive which is no longer present"""
+        self.invalidate(drive)
+
+    def due_drives(self, drives, now=None):
+        """Return the drives which need a health check, oldest first.
+
+        The result is capped to the configured number of checks per sweep,
+        the remaining drives stay due for the following sweeps.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            for drive in list(self._next_due):
+                if drive not in drives:
+                    del self._next_due[drive]
+            due = [(self._next_due.get(drive, 0), drive) for drive in drives
+                   if self._next_due.get(drive, 0) <= now]
+        due.sort(key=lambda item: item[0])
+        return [drive for _, drive in due[:self._max_checks]]
+
+    def poll(self, commands, now=None):
+        """Run health check commands of due drives on the worker pool.
+
+        commands: dict of drive to the smartctl command for that drive.
+        Returns dict of drive to (response, error, returncode) for the
+        drives checked in this sweep.
+        """
+        now = time.time() if now is None else now
+        due = self.due_drives(commands, now)
+        if not due:
+            return {}
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        futures = {drive: self._executor.submit(self._runner, commands[drive])
+                   for drive in due}
+
+        results = {}
+        for drive, future in futures.items():
+            try:
+                results[drive] = future.result()
+            except Exception as err:
+                logger.error(f"SmartHealthPoller, poll, check failed for "
+                             f"{drive}: {err}")
+                results[drive] = ("", str(err), -1)
+            with self._lock:
+                self._next_due[drive] = self._next_check_time(now)
+        return results
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,114 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Write-behind cache for sensor state. Every entry is
+                    persisted as its own record under a store prefix and
+                    only dirty entries are written back.
+ ****************************************************************************
+"""
+
+import os
+import time
+from urllib.parse import quote, unquote
+
+from framework.utils.service_logging import logger
+
+
+class WriteBehindCache(dict):
+    """Dict of sensor state which tracks dirty entries.
+
+    Assigning or deleting an entry marks it dirty. Nested values changed
+    in place must be marked with mark_dirty(). Dirty entries are written
+    by flush() once the flush window has elapsed since the first change,
+    or right away when flush(force=True) is called.
+    """
+
+    DEFAULT_FLUSH_WINDOW = 30
+
+    def __init__(self, store, prefix, flush_window=DEFAULT_FLUSH_WINDOW):
+        super(WriteBehindCache, self).__init__()
+        self._store = store
+        self._prefix = prefix
+        self._flush_window = flush_window
+        self._dirty = set()
+        self._removed = set()
+        self._dirty_since = None
+
+    def _record_path(self, key):
+        """Store path of the record of an entry"""
+        return os.path.join(self._prefix, quote(key, safe=''))
+
+    def load(self):
+        """Load all records persisted under the prefix"""
+        super(WriteBehindCache, self).clear()
+        for record in self._store.get_keys_with_prefix(self._prefix):
+            value = self._store.get(os.path.join(self._prefix, record))
+            if value is not None:
+                super(WriteBehindCache, self).__setitem__(unquote(record), value)
+        self._dirty.clear()
+        self._removed.clear()
+        self._dirty_since = None
+        return self
+
+    def mark_dirty(self, key):
+        """Mark an entry to be written by the next flush"""
+        if self._dirty_since is None:
+            self._dirty_since = time.time()
+        self._removed.discard(key)
+        self._dirty.add(key)
+
+    def __setitem__(self, key, value):
+        super(WriteBehindCache, self).__setitem__(key, value)
+        self.mark_dirty(key)
+
+    def __delitem__(self, key):
+        super(WriteBehindCache, self).__delitem__(key)
+        if self._dirty_since is None:
+            self._dirty_since = time.time()
+        self._dirty.discard(key)
+        self._removed.add(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def is_dirty(self):
+        return bool(self._dirty or self._removed)
+
+    def flush(self, force=False):
+        """Write dirty entries and delete removed ones.
+
+        Without force the write is deferred till the flush window has
+        elapsed since the first pending change.
+        """
+        if not self.is_dirty():
+            return
+        if not force and \
+            time.time() - self._dirty_since < self._flush_window:
+            return
+
+        for key in self._removed:
+            self._store.delete(self._record_path(key))
+        for key in self._dirty:
+            if key in self:
+                self._store.put(self[key], self._record_path(key))
+        logger.debug(f"WriteBehindCache, flushed {len(self._dirty)} "
+                     f"and removed {len(self._removed)} records under "
+                     f"{self._prefix}")
+        self._dirty.clear()
+        self._removed.clear()
+        self._dirty_since = None
@@ -60,3 +60,29 @@ class Store(object):
         """ get keys with given prefix
         """
         raise NotImplementedError("sub class should implement this")
+
+    def put_many(self, items, pickled=True):
+        """Write the values of a dict of keys, returns True on success
+        """
+        for key, value in items.items():
+            self.put(value, key, pickled)
+        return True
+
+    def get_many(self, keys):
+        """Returns a dict of the values of the keys, None for the missing
+           ones, or None if the store could not be read
+        """
+        values = {}
+        for key in keys:
+            present, status = self.exists(key)
+            if status != "Success":
+                return None
+            values[key] = self.get(key) if present else None
+        return values
+
+    def delete_many(self, keys):
+        """Delete the keys, returns True on success
+        """
+        for key in keys:
+            self.delete(key)
+        return True
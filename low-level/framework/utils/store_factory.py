@@ -19,7 +19,27 @@ from configparser import ConfigParser
 
 from framework.utils.filestore import FileStore
 from framework.utils.consulstore import ConsulStore
-from framework.base.sspl_constants import StoreTypes, SSPL_STORE_TYPE, CONSUL_HOST, CONSUL_PORT, file_store_config_path
+from framework.utils.conf_utils import Conf, SSPL_CONF, DATASTORE
+from framework.base.sspl_constants import (StoreTypes, SSPL_STORE_TYPE, CONSUL_HOST, CONSUL_PORT,
+    file_store_config_path, FILE_STORE_CACHED, FILE_STORE_FSYNC_BATCH)
+
+
+def _get_file_store():
+    """Returns a FileStore with the cache and fsync settings of the
+       DATASTORE section, FILE_STORE_CACHED and FILE_STORE_FSYNC_BATCH
+       by default"""
+    cached = Conf.get(SSPL_CONF, f"{DATASTORE}>file_store_cached",
+                      FILE_STORE_CACHED)
+    fsync_batch = Conf.get(SSPL_CONF, f"{DATASTORE}>file_store_fsync_batch",
+                           FILE_STORE_FSYNC_BATCH)
+    try:
+        fsync_batch = int(fsync_batch)
+    except (TypeError, ValueError):
+        print(f"Invalid file_store_fsync_batch {fsync_batch}, using "
+              f"{FILE_STORE_FSYNC_BATCH}")
+        fsync_batch = FILE_STORE_FSYNC_BATCH
+    return FileStore(str(cached).lower() not in ("false", "no", "0"),
+                     fsync_batch)
 
 
 class StorFactory:
@@ -32,7 +52,7 @@ class StorFactory:
             try:
                 store_type = os.getenv('SSPL_STORE_TYPE', SSPL_STORE_TYPE)
                 if store_type == StoreTypes.FILE.value:
-                    StorFactory.__store = FileStore()
+                    StorFactory.__store = _get_file_store()
                 elif store_type == StoreTypes.CONSUL.value:
                     host = os.getenv('CONSUL_HOST', CONSUL_HOST)
                     port = os.getenv('CONSUL_PORT', CONSUL_PORT)
@@ -47,6 +67,6 @@ class StorFactory:
                 sys.exit(os.EX_USAGE)
         return StorFactory.__store
 
-file_store=FileStore()
+file_store=_get_file_store()
 #store based on configuration
 store=StorFactory.get_store()
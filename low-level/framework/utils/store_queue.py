@@ -25,36 +25,79 @@ import sys
 from framework.base.sspl_constants import DATA_PATH
 from framework.utils.conf_utils import SSPL_CONF, Conf
 from framework.utils.config_reader import ConfigReader
+from framework.utils.segment_log import SegmentLog
 from framework.utils.service_logging import logger
 from framework.utils.store_factory import store
 
 
 class StoreQueue:
+    """Queue of unsent messages.
 
-    PROCESSOR    = 'EgressProcessor'
+    Messages are kept either in the configured store, one key per message,
+    or in a local append-only segment log when queue_backend is 'segment'.
+    """
+
+    PROCESSOR    = 'EGRESSPROCESSOR'
     LIMIT_CONSUL_MEMORY  = 'limit_consul_memory'
+    QUEUE_BACKEND        = 'queue_backend'
+    SEGMENT_SIZE         = 'queue_segment_size'
+    FSYNC_BATCH          = 'queue_fsync_batch'
     CACHE_DIR_NAME       = "SSPL_UNSENT_MESSAGES"
+    SEGMENT_DIR_NAME     = "SSPL_UNSENT_MESSAGES_LOG"
+    BACKEND_STORE        = "store"
+    BACKEND_SEGMENT      = "segment"
 
     def __init__(self):
         self._max_size = int(Conf.get(SSPL_CONF, f"{self.PROCESSOR}>{self.LIMIT_CONSUL_MEMORY}", 50000000))
 
+        self._segment_log = None
+        backend = Conf.get(SSPL_CONF, f"{self.PROCESSOR}>{self.QUEUE_BACKEND}",
+                           self.BACKEND_STORE)
+        if backend == self.BACKEND_SEGMENT:
+            segment_size = int(Conf.get(SSPL_CONF,
+                f"{self.PROCESSOR}>{self.SEGMENT_SIZE}",
+                SegmentLog.DEFAULT_SEGMENT_SIZE))
+            fsync_batch = int(Conf.get(SSPL_CONF,
+                f"{self.PROCESSOR}>{self.FSYNC_BATCH}",
+                SegmentLog.DEFAULT_FSYNC_BATCH))
+            self._segment_log = SegmentLog.get_instance(
+                os.path.join(DATA_PATH, self.SEGMENT_DIR_NAME),
+                segment_size, fsync_batch)
+            return
+
         self.cache_dir_path = os.path.join(DATA_PATH, self.CACHE_DIR_NAME)
         self.SSPL_MEMORY_USAGE = os.path.join(self.cache_dir_path, 'SSPL_MEMORY_USAGE')
-        self._current_size = store.get(self.SSPL_MEMORY_USAGE)
-        if self._current_size is None:
-            store.put(0, self.SSPL_MEMORY_USAGE)
-
         self.SSPL_MESSAGE_HEAD_INDEX = os.path.join(self.cache_dir_path, 'SSPL_MESSAGE_HEAD_INDEX')
-        self._head = store.get(self.SSPL_MESSAGE_HEAD_INDEX)
-        if self._head is None:
-            store.put(0, self.SSPL_MESSAGE_HEAD_INDEX)
-
         self.SSPL_MESSAGE_TAIL_INDEX = os.path.join(self.cache_dir_path, 'SSPL_MESSAGE_TAIL_INDEX')
-        self._tail = store.get(self.SSPL_MESSAGE_TAIL_INDEX)
-        if self._tail is None:
-            store.put(0, self.SSPL_MESSAGE_TAIL_INDEX)
         self.SSPL_UNSENT_MESSAGES = os.path.join(self.cache_dir_path, 'MESSAGES')
 
+        counters = store.get_many([self.SSPL_MEMORY_USAGE,
+            self.SSPL_MESSAGE_HEAD_INDEX, self.SSPL_MESSAGE_TAIL_INDEX])
+        if counters is None:
+            # Left as they are, missing ones are read as 0 anyway
+            logger.warn("StoreQueue, unable to read the queue counters")
+            return
+        missing = {key: 0 for key, value in counters.items() if value is None}
+        if missing:
+            store.put_many(missing)
+
+    def _get_counters(self):
+        """Returns the size, head and tail of the queue read at once, None if
+           the store could not be read. Nothing is to be written from counters
+           not read.
+        """
+        counters = store.get_many([self.SSPL_MEMORY_USAGE,
+            self.SSPL_MESSAGE_HEAD_INDEX, self.SSPL_MESSAGE_TAIL_INDEX])
+        if counters is None:
+            logger.warn("StoreQueue, unable to read the queue counters")
+            return None
+        return (counters.get(self.SSPL_MEMORY_USAGE) or 0,
+                counters.get(self.SSPL_MESSAGE_HEAD_INDEX) or 0,
+                counters.get(self.SSPL_MESSAGE_TAIL_INDEX) or 0)
+
+    def _message_key(self, index):
+        return f"{self.SSPL_UNSENT_MESSAGES}/{index}"
+
     @property
     def current_size(self):
         return store.get(self.SSPL_MEMORY_USAGE)
@@ -80,45 +123,144 @@ class StoreQueue:
         store.put(index, self.SSPL_MESSAGE_TAIL_INDEX)
 
     def is_empty(self):
-        if self.tail == self.head:
-            self.head = 0
-            self.tail = 0
-            self.current_size = 0
+        """Returns True if there is no message to read, also when the counters
+           can not be read so the messages are read on a later call.
+        """
+        if self._segment_log is not None:
+            return len(self._segment_log) == 0
+        counters = self._get_counters()
+        if counters is None:
+            return True
+        _, head, tail = counters
+        if tail == head:
+            if head:
+                store.put_many({self.SSPL_MESSAGE_HEAD_INDEX: 0,
+                                self.SSPL_MESSAGE_TAIL_INDEX: 0,
+                                self.SSPL_MEMORY_USAGE: 0})
             return True
         else:
             return False
 
     def is_full(self, size_of_item):
-        return (self.current_size + size_of_item) >= self._max_size
+        if self._segment_log is not None:
+            return (self._segment_log.size() + size_of_item) >= self._max_size
+        counters = self._get_counters()
+        if counters is None:
+            return False
+        return (counters[0] + size_of_item) >= self._max_size
 
-    def _create_space(self, size_of_item, reclaimed_space=0):
-        if (self.current_size - reclaimed_space + size_of_item) >= self._max_size:
-            reclaimed_space += sys.getsizeof(self.get())
-            self._create_space(size_of_item, reclaimed_space)
-        else:
-            return
+    def _create_space(self, size_of_item):
+        """Drop the oldest messages till the new item fits in the limit"""
+        while self.is_full(size_of_item) and not self.is_empty():
+            self.delete()
 
     def get(self):
         if self.is_empty():
             return
-        item = store.get(f"{self.SSPL_UNSENT_MESSAGES}/{self.head}")
+        if self._segment_log is not None:
+            _, items = self._segment_log.peek(1)
+            return items[0] if items else None
+        counters = self._get_counters()
+        if counters is None:
+            return
+        item = store.get(self._message_key(counters[1]))
         return item
 
+    def get_batch(self, count):
+        """Returns (index of the first message, up to count messages) from
+           the head of the queue. Messages handled are removed with
+           ack(index + number handled).
+        """
+        if self.is_empty():
+            return 0, []
+        if self._segment_log is not None:
+            return self._segment_log.peek(count)
+        counters = self._get_counters()
+        if counters is None:
+            return 0, []
+        _, head, tail = counters
+        keys = [self._message_key(index)
+                for index in range(head, head + min(count, tail - head))]
+        items = store.get_many(keys)
+        if items is None:
+            return 0, []
+        return head, [items.get(key) for key in keys]
+
     def delete(self):
+        """Removes the message at the head of the queue"""
+        if self._segment_log is not None:
+            head, _ = self._segment_log.peek(0)
+        else:
+            counters = self._get_counters()
+            if counters is None:
+                return
+            _, head, _ = counters
+        self.ack(head + 1)
+
+    def ack(self, until):
+        """Removes the messages indexed below until. Messages already
+           removed by another caller are skipped, so only messages read
+           by get_batch are removed.
+        """
         if self.is_empty():
             return
-        item = store.get(f"{self.SSPL_UNSENT_MESSAGES}/{self.head}")
-        store.delete(f"{self.SSPL_UNSENT_MESSAGES}/{self.head}")
-        self.head += 1
-        self.current_size -= sys.getsizeof(item)
+        if self._segment_log is not None:
+            self._segment_log.ack(until)
+            return
+        counters = self._get_counters()
+        if counters is None:
+            return
+        current_size, head, tail = counters
+        keys = [self._message_key(index)
+                for index in range(head, min(until, tail))]
+        if not keys:
+            return
+        items = store.get_many(keys)
+        if items is None:
+            # Acked again on a later call
+            return
+        reclaimed_space = sum(self._get_size(item) for item in items.values())
+        store.delete_many(keys)
+        store.put_many({self.SSPL_MESSAGE_HEAD_INDEX: head + len(keys),
+            self.SSPL_MEMORY_USAGE: max(current_size - reclaimed_space, 0)})
+
+    @staticmethod
+    def _get_size(item):
+        """Bytes taken by a message when stored"""
+        if item is None:
+            return 0
+        if isinstance(item, str):
+            return len(item.encode('utf-8'))
+        if isinstance(item, bytes):
+            return len(item)
+        return sys.getsizeof(item)
 
     def put(self, item):
-        size_of_item = sys.getsizeof(item)
-        if self.is_full(size_of_item):
+        if self._segment_log is not None:
+            size_of_item = len(item.encode('utf-8')) if isinstance(item, str) \
+                            else len(item)
+            size_of_item += SegmentLog.HEADER.size
+            if self.is_full(size_of_item):
+                logger.debug("StoreQueue, put, consul memory usage exceded limit, \
+                    removing old message")
+                self._create_space(size_of_item)
+            self._segment_log.append(item)
+            logger.debug("StoreQueue, put, current memory usage %s" % self._segment_log.size())
+            return
+        size_of_item = self._get_size(item)
+        counters = self._get_counters()
+        if counters is not None and \
+                counters[0] + size_of_item >= self._max_size:
             logger.debug("StoreQueue, put, consul memory usage exceded limit, \
                 removing old message")
             self._create_space(size_of_item)
-        store.put(item, f"{self.SSPL_UNSENT_MESSAGES}/{self.tail}", pickled=False)
-        self.tail += 1
-        self.current_size += size_of_item
-        logger.debug("StoreQueue, put, current memory usage %s" % self.current_size)
+            counters = self._get_counters()
+        if counters is None:
+            # The tail is unknown, storing the message could overwrite another
+            logger.error(f"StoreQueue, put, dropping message {item}")
+            return
+        current_size, _, tail = counters
+        store.put(item, self._message_key(tail), pickled=False)
+        store.put_many({self.SSPL_MESSAGE_TAIL_INDEX: tail + 1,
+                        self.SSPL_MEMORY_USAGE: current_size + size_of_item})
+        logger.debug("StoreQueue, put, current memory usage %s" % (current_size + size_of_item))
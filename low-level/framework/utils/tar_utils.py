@@ -0,0 +1,55 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Writes tar.gz archives as the files are added, with
+                    gzip compression by tarfile or, multi-threaded, by
+                    pigz when installed.
+ ****************************************************************************
+"""
+
+import shutil
+import subprocess
+import tarfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def open_tar_gz(tar_location, logger, threads=1, level=6):
+    """Opens a tar.gz for writing. Compressed by pigz with threads threads
+       when more than 1 and pigz is installed, by tarfile otherwise.
+    """
+    pigz = None
+    if threads > 1:
+        pigz = shutil.which("pigz")
+        if not pigz:
+            logger.warn("pigz not found, compressing {0} with a single "
+                        "thread".format(tar_location))
+    if not pigz:
+        with tarfile.open(tar_location, "w:gz", compresslevel=level) as tar:
+            yield tar
+        return
+    with open(tar_location, "wb") as tar_file:
+        process = subprocess.Popen([pigz, "-p", str(threads), f"-{level}"],
+                                   stdin=subprocess.PIPE, stdout=tar_file)
+        try:
+            with tarfile.open(fileobj=process.stdin, mode="w|") as tar:
+                yield tar
+        finally:
+            process.stdin.close()
+            retcode = process.wait()
+        if retcode != 0:
+            raise OSError(f"pigz failed with return code {retcode}")
@@ -0,0 +1,168 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       In memory state of resource usage threshold alerts.
+                    Loaded once from the store and written back as a single
+                    record when an alert is raised or resolved.
+ ****************************************************************************
+"""
+
+from framework.utils.service_logging import logger
+
+
+FAULT = "fault"
+FAULT_RESOLVED = "fault_resolved"
+
+
+def parse_threshold(value, default, name=""):
+    """Returns a threshold config value as an int or float, default if it
+       is not a number.
+    """
+    value = str(value)
+    try:
+        return int(value) if value.isdigit() else float(value)
+    except ValueError:
+        logger.warn(f"Invalid {name} value {value} entered in config, "
+                    f"using {default}.")
+        return default
+
+
+class ThresholdTracker(object):
+    """Usage of a resource against its threshold.
+
+    A fault is raised once the usage stays at or above the threshold for
+    wait secs, i.e. since the last sample below it, and resolved after
+    iteration_limit consecutive samples below the threshold.
+    """
+
+    __slots__ = ("resource", "high_usage", "usage_time",
+                 "fault_resolved_iterations")
+
+    def __init__(self, resource, high_usage=False, usage_time=-1,
+                 fault_resolved_iterations=0):
+        self.resource = resource
+        self.high_usage = high_usage
+        # Start of the samples at or above the threshold, -1 if unknown
+        self.usage_time = usage_time
+        self.fault_resolved_iterations = fault_resolved_iterations
+
+    def update(self, usage, threshold, now, wait=0, iteration_limit=0):
+        """Returns FAULT or FAULT_RESOLVED when the sample changes the
+           alert state, None otherwise.
+        """
+        if usage >= threshold:
+            if self.high_usage:
+                return None
+            if self.usage_time == -1:
+                self.usage_time = now
+            if now - self.usage_time >= wait:
+                self.high_usage = True
+                self.fault_resolved_iterations = 0
+                return FAULT
+        elif not self.high_usage:
+            self.usage_time = now
+        elif self.fault_resolved_iterations < iteration_limit:
+            self.fault_resolved_iterations += 1
+        else:
+            self.high_usage = False
+            self.usage_time = -1
+            self.fault_resolved_iterations = 0
+            return FAULT_RESOLVED
+        return None
+
+    def to_record(self):
+        """Returns the tracker in the format persisted by former versions"""
+        resource = self.resource
+        return {
+            f'high_{resource}_usage': str(self.high_usage),
+            f'{resource}_usage_time_map': str(self.usage_time),
+            f'{resource}_fault_resolved_iterations':
+                str(self.fault_resolved_iterations)
+        }
+
+    @classmethod
+    def from_record(cls, resource, record):
+        record = record or {}
+        try:
+            return cls(resource,
+                str(record.get(f'high_{resource}_usage')).lower() == "true",
+                int(record.get(f'{resource}_usage_time_map', -1)),
+                int(record.get(f'{resource}_fault_resolved_iterations', 0)))
+        except (TypeError, ValueError):
+            logger.warn(f"Invalid persisted {resource} usage state {record}")
+            return cls(resource)
+
+
+class AlertState(object):
+    """Threshold trackers and network alert state persisted as one record.
+
+    The record is loaded once; changes are written by flush() only if
+    mark_dirty() was called, i.e. an alert was raised or resolved.
+    """
+
+    def __init__(self, store, path, resources, legacy_paths=None):
+        self._store = store
+        self._path = path
+        self._legacy_paths = legacy_paths or {}
+        self._dirty = False
+        self.trackers = {resource: ThresholdTracker(resource)
+                         for resource in resources}
+        self.prev_nw_if_status = {}
+        self.prev_cable_status = {}
+
+    def _get(self, path):
+        if self._store.exists(path)[0]:
+            return self._store.get(path)
+        return None
+
+    def load(self):
+        record = self._get(self._path)
+        if not isinstance(record, dict):
+            # Records written per resource by former versions
+            record = {resource: self._get(path)
+                      for resource, path in self._legacy_paths.items()}
+            self._dirty = True
+        for resource in self.trackers:
+            tracker = ThresholdTracker.from_record(resource, record.get(resource))
+            if not tracker.high_usage:
+                # Restart the wait, samples taken while down are unknown
+                tracker.usage_time = -1
+            self.trackers[resource] = tracker
+        nw = record.get('nw') or {}
+        self.prev_nw_if_status = dict(nw.get('prev_nw_if_status', {}))
+        self.prev_cable_status = dict(nw.get('prev_cable_status', {}))
+        return self
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def to_record(self):
+        record = {resource: tracker.to_record()
+                  for resource, tracker in self.trackers.items()}
+        record['nw'] = {
+            'prev_nw_if_status': self.prev_nw_if_status,
+            'prev_cable_status': self.prev_cable_status
+        }
+        return record
+
+    def flush(self):
+        """Writes the record if an alert state changed since the last flush"""
+        if not self._dirty:
+            return False
+        self._store.put(self.to_record(), self._path)
+        self._dirty = False
+        return True
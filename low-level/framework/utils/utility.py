@@ -167,6 +167,14 @@ class Utility(object):
         """Returns the time as integer number in seconds since the epoch in UTC."""
         return int(time.time())
 
+def run_command(command):
+    """Run the command and get the response and error returned"""
+    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, encoding='utf-8')
+    response, error = process.communicate()
+    return response.rstrip('\n'), error.rstrip('\n'), process.returncode
+
+
 def errno_to_str_mapping(err_no):
     """Convert numerical errno to its meaning."""
     try:
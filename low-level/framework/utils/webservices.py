@@ -21,7 +21,10 @@
 """
 
 
+import threading
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout, ConnectionError, HTTPError
 from framework.base.sspl_constants import SSPL_LOG_PATH
 from framework.utils.service_logging import init_logging, logger
@@ -36,6 +39,7 @@ class WebServices(object):
     # HTTP Response codes
     HTTP_CONN_REFUSED = 111
     HTTP_OK = 200
+    HTTP_PARTIAL_CONTENT = 206
     HTTP_BADRQ = 400
     HTTP_FORBIDDEN = 403
     HTTP_NOTFOUND = 404
@@ -45,22 +49,47 @@ class WebServices(object):
 
     LOOPBACK = "127.0.0.1"
 
+    # Keep-alive connections kept per host
+    POOL_MAXSIZE = 8
+
+    # Session shared by all the instances, its connection pool keeps the
+    # connections to each controller alive between requests
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self):
         super(WebServices, self).__init__()
 
         init_logging("sspl", SSPL_LOG_PATH)
         self.http_methods = [self.HTTP_GET, self.HTTP_POST]
 
-    def ws_request(self, method, url, hdrs, postdata, tout):
-        """Make webservice request"""
+    @classmethod
+    def get_session(cls):
+        """Returns the pooled session, creating it on first use"""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4,
+                                      pool_maxsize=cls.POOL_MAXSIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._session = session
+            return cls._session
+
+    def ws_request(self, method, url, hdrs, postdata, tout, stream=False):
+        """Make webservice request, the body of a stream request is read
+           on demand, e.g. by iter_content, instead of being loaded.
+        """
         wsresponse = None
 
         try:
+            session = self.get_session()
             if method == self.HTTP_GET:
-                wsresponse = requests.get(url, headers=hdrs, timeout=tout)
+                wsresponse = session.get(url, headers=hdrs, timeout=tout,
+                               stream=stream)
             elif method == self.HTTP_POST:
-                wsresponse = requests.post(url, headers=hdrs, data=postdata,
-                               timeout=tout)
+                wsresponse = session.post(url, headers=hdrs, data=postdata,
+                               timeout=tout, stream=stream)
 
             wsresponse.raise_for_status()
 
@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.actuators.base_actuators_msg import BaseActuatorMsg
 
 class AckResponseMsg(BaseActuatorMsg):
@@ -80,12 +78,6 @@ class AckResponseMsg(BaseActuatorMsg):
                           }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def get_ack_type(self):
         return self._ack_type
 
@@ -20,14 +20,8 @@
  ****************************************************************************
 """
 
-import os
-import json
-from jsonschema import Draft3Validator
-from jsonschema import validate
-
 from json_msgs.messages.base_msg import BaseMsg
-from json_msgs.schemas import actuators
-from framework.base.sspl_constants import RESOURCE_PATH
+from json_msgs.schema_registry import SchemaRegistry
 
 class BaseActuatorMsg(BaseMsg):
     '''
@@ -38,20 +32,6 @@ class BaseActuatorMsg(BaseMsg):
     DESCRIPTION          = "Seagate Storage Platform Library - Actuator Response"
     JSON_ACTUATOR_SCHEMA = "SSPL-LL_Actuator_Response.json"
 
-
-    def __init__(self):
-        """Reads in the json schema for all actuator response messages"""
-        super(BaseActuatorMsg, self).__init__()
-
-        # Read in the schema for validating messages
-        fileName = os.path.join(RESOURCE_PATH + '/actuators',
-                                self.JSON_ACTUATOR_SCHEMA)
-        with open(fileName, 'r') as f:
-            self._schema = json.load(f)
-
-        # Validate the schema
-        Draft3Validator.check_schema(self._schema)
-
     def validateMsg(self, _jsonMsg):
         """Validate the json message against the schema"""
 
@@ -59,5 +39,6 @@ class BaseActuatorMsg(BaseMsg):
         self.prepare_message(_jsonMsg, "actuator_response_type")
 
         _jsonMsg = self.normalize_kv(_jsonMsg)
-        validate(_jsonMsg, self._schema)
+        SchemaRegistry.get_instance().validate(
+            SchemaRegistry.ACTUATOR_RESPONSE, _jsonMsg, sampled=True)
         return _jsonMsg
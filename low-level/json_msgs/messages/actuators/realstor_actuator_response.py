@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.actuators.base_actuators_msg import BaseActuatorMsg
 
 class RealStorActuatorMsg(BaseActuatorMsg):
@@ -91,9 +89,3 @@ class RealStorActuatorMsg(BaseActuatorMsg):
                           }
                       }
                   }
-
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.actuators.base_actuators_msg import BaseActuatorMsg
 
 class ServiceControllerMsg(BaseActuatorMsg):
@@ -78,12 +76,6 @@ class ServiceControllerMsg(BaseActuatorMsg):
                       }
                   }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def get_service_name(self):
         return self._service_name
     
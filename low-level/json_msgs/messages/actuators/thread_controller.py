@@ -25,7 +25,6 @@
  ****************************************************************************
 """
 
-import json
 import socket
 from json_msgs.messages.actuators.base_actuators_msg import BaseActuatorMsg
 
@@ -77,12 +76,6 @@ class ThreadControllerMsg(BaseActuatorMsg):
                           }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def get_module_name(self):
         return self._module_name
 
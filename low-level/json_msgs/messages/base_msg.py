@@ -21,12 +21,11 @@
 """
 
 import abc
+import json
 from framework.utils.service_logging import logger
-from framework.utils.conf_utils import (GLOBAL_CONF, SITE_ID_KEY,
-        RACK_ID_KEY, NODE_ID_KEY, CLUSTER_ID_KEY, Conf)
-from framework.base.sspl_constants import (DEFAULT_DC, DEFAULT_RACK,
-        DEFAULT_SN, DEFAULT_CLUSTER)
-from cortx.utils.kv_store import KvPayload
+from framework.utils.cluster_identity import ClusterIdentity
+
+_CONTAINERS = (dict, list)
 
 class BaseMsg(metaclass=abc.ABCMeta):
     '''
@@ -42,41 +41,69 @@ class BaseMsg(metaclass=abc.ABCMeta):
         pass
 
     @abc.abstractmethod
-    def getJson(self):
+    def validateMsg(self, _jsonMsg):
         raise NotImplementedError("Subclasses should implement this!")
 
+    def getMsg(self):
+        """Return the validated message as a dict, to be passed to the other
+           modules and serialized once by the EgressProcessor"""
+        self._json = self.validateMsg(self._json)
+        return self._json
+
+    def getJson(self):
+        """Return the validated message as a JSON string"""
+        return json.dumps(self.getMsg())
+
     def prepare_message(self, jsonMsg, message_type):
         """Adds all common key fields to the JsonMsg"""
         try:
-            if jsonMsg.get("message").get(
-                message_type).get("info") is None:
+            info = jsonMsg.get("message").get(message_type).get("info")
+            if info is None:
                 return
-            payload = KvPayload(jsonMsg)
-            if payload.get(f"message>{message_type}>info>site_id") is None:
-                jsonMsg["message"][message_type]["info"]["site_id"] = Conf.get(
-                    GLOBAL_CONF, SITE_ID_KEY, DEFAULT_DC)
-            if payload.get(f"message>{message_type}>info>node_id") is None:
-                jsonMsg["message"][message_type]["info"]["node_id"] = Conf.get(
-                    GLOBAL_CONF, NODE_ID_KEY, DEFAULT_SN)
-            if payload.get(f"message>{message_type}>info>rack_id") is None:
-                jsonMsg["message"][message_type]["info"]["rack_id"] = Conf.get(
-                    GLOBAL_CONF, RACK_ID_KEY, DEFAULT_RACK)
-            if payload.get(f"message>{message_type}>info>cluster_id") is None:
-                jsonMsg["message"][message_type]["info"]["cluster_id"] = Conf.get(
-                    GLOBAL_CONF, CLUSTER_ID_KEY, DEFAULT_CLUSTER)
-            if payload.get(f"message>{message_type}>info>fru") is None:
-                jsonMsg["message"][message_type]["info"]["fru"] = "false"
-            logger.debug("prepare_message, jsonMsg: %s" % jsonMsg)
+            ClusterIdentity.get_instance().fill(info)
         except KeyError as ex:
             logger.exception(f"Failed to prepare json message. JsonMsg:{jsonMsg}."
                          f"Error:{str(ex)}")
 
     def normalize_kv(self, item):
-        """Normalize all keys coming from firmware from - to _"""
-        if isinstance(item, dict):
-            return {key.replace("-", "_"): self.normalize_kv(value) for key, value in item.items()}
+        """Normalize all keys coming from firmware from - to _ and N/A
+           values to NA. Dicts and lists needing no change are returned
+           as is, only the changed ones are copied.
+        """
+        if type(item) is dict:
+            if "-" in "".join(item) or "N/A" in item.values():
+                return {key.replace("-", "_"): self.normalize_kv(value)
+                        if isinstance(value, _CONTAINERS) else
+                        "NA" if value == "N/A" else value
+                        for key, value in item.items()}
+            normalized = None
+            for key, value in item.items():
+                if isinstance(value, _CONTAINERS):
+                    new_value = self.normalize_kv(value)
+                    if new_value is not value:
+                        if normalized is None:
+                            normalized = dict(item)
+                        normalized[key] = new_value
+            return item if normalized is None else normalized
+        elif type(item) is list:
+            if "N/A" in item:
+                return [self.normalize_kv(value)
+                        if isinstance(value, _CONTAINERS) else
+                        "NA" if value == "N/A" else value
+                        for value in item]
+            normalized = None
+            for index, value in enumerate(item):
+                if isinstance(value, _CONTAINERS):
+                    new_value = self.normalize_kv(value)
+                    if new_value is not value:
+                        if normalized is None:
+                            normalized = list(item)
+                        normalized[index] = new_value
+            return item if normalized is None else normalized
+        elif isinstance(item, dict):
+            return self.normalize_kv(dict(item))
         elif isinstance(item, list):
-            return [self.normalize_kv(_) for _ in item]
+            return self.normalize_kv(list(item))
         elif item == "N/A":
             return "NA"
         else:
@@ -20,14 +20,8 @@
  ****************************************************************************
 """
 
-import os
-import json
-from jsonschema import Draft3Validator
-from jsonschema import validate
-
 from json_msgs.messages.base_msg import BaseMsg
-from json_msgs.schemas import sensors
-from framework.base.sspl_constants import RESOURCE_PATH
+from json_msgs.schema_registry import SchemaRegistry
 
 class BaseSensorMsg(BaseMsg):
     '''
@@ -38,23 +32,6 @@ class BaseSensorMsg(BaseMsg):
     DESCRIPTION         = "Seagate Storage Platform Library - Sensor Response"
     JSON_SENSOR_SCHEMA  = "SSPL-LL_Sensor_Response.json"
 
-
-    def __init__(self):
-        """Reads in the json schema for all sensor response messages"""
-        super(BaseSensorMsg, self).__init__()
-
-        # Read in the sensor schema for validating messages
-        fileName = os.path.join(RESOURCE_PATH + '/sensors',
-                                self.JSON_SENSOR_SCHEMA)
-        with open(fileName, 'r') as f:
-            _schema = f.read()
-
-        # Remove tabs and newlines
-        self._schema = json.loads(' '.join(_schema.split()))
-
-        # Validate the schema
-        Draft3Validator.check_schema(self._schema)
-
     def validateMsg(self, _jsonMsg):
         """Validate the json message against the schema"""
 
@@ -62,5 +39,6 @@ class BaseSensorMsg(BaseMsg):
         self.prepare_message(_jsonMsg, "sensor_response_type")
 
         _jsonMsg = self.normalize_kv(_jsonMsg)
-        validate(_jsonMsg, self._schema)
+        SchemaRegistry.get_instance().validate(
+            SchemaRegistry.SENSOR_RESPONSE, _jsonMsg, sampled=True)
         return _jsonMsg
@@ -25,7 +25,6 @@
  ****************************************************************************
 """
 
-import json
 import calendar
 import time
 
@@ -117,10 +116,5 @@ class DiskSpaceAlertMsg(BaseSensorMsg):
                       }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def set_uuid(self, _uuid):
         self._json["message"]["sspl_ll_msg_header"]["uuid"] = _uuid
@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class DriveMngrMsg(BaseSensorMsg):
@@ -87,12 +85,6 @@ class DriveMngrMsg(BaseSensorMsg):
                           }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""    
-        # Validate the current message    
-        self._json = self.validateMsg(self._json)       
-        return json.dumps(self._json)
-
     def getEnclosure(self):
         return self._enclosure
 
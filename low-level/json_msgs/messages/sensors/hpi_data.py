@@ -20,8 +20,6 @@
 ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class HPIDataMsg(BaseSensorMsg):
@@ -101,12 +99,6 @@ class HPIDataMsg(BaseSensorMsg):
                           }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def getHostId(self):
         return self._hostId
 
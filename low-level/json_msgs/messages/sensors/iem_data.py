@@ -20,7 +20,6 @@
   ****************************************************************************
 """
 
-import json
 import socket
 import time
 
@@ -82,9 +81,3 @@ class IEMDataMsg(BaseSensorMsg):
                 }
             }
         }
-
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
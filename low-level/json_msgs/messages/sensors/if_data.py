@@ -25,7 +25,6 @@
  ****************************************************************************
 """
 
-import json
 import time
 
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
@@ -99,11 +98,5 @@ class IFdataMsg(BaseSensorMsg):
                        }
                     }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def set_uuid(self, _uuid):
         self._json["message"]["sspl_ll_msg_header"]["uuid"] = _uuid
@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class LocalMountDataMsg(BaseSensorMsg):
@@ -103,11 +101,5 @@ class LocalMountDataMsg(BaseSensorMsg):
                           }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def set_uuid(self, _uuid):
         self._json["message"]["sspl_ll_msg_header"]["uuid"] = _uuid
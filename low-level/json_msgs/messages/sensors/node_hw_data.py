@@ -20,8 +20,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class NodeHWDataMsg(BaseSensorMsg):
@@ -59,12 +57,6 @@ class NodeHWDataMsg(BaseSensorMsg):
                             }
                         }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def set_uuid(self, _uuid):
         self._json["message"]["sspl_ll_msg_header"]["uuid"] = _uuid
 
@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class RAIDdataMsg(BaseSensorMsg):
@@ -98,12 +96,6 @@ class RAIDdataMsg(BaseSensorMsg):
                           }
                       }
 
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
-
     def get_host_id(self):
         return self.host_id
 
@@ -13,7 +13,6 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
-import json
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 
@@ -81,9 +80,3 @@ class RealStorDiskGroupDataMsg(BaseSensorMsg):
                           }
                       }
                     }
-
-    def getJson(self):
-        """Return a validated JSON object."""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
@@ -21,8 +21,6 @@
   ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class RealStorEnclDataMsg(BaseSensorMsg):
@@ -92,10 +90,3 @@ class RealStorEnclDataMsg(BaseSensorMsg):
                     }
                 }
             }
-
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-
-        return json.dumps(self._json)
@@ -21,8 +21,6 @@
   ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 
@@ -93,9 +91,3 @@ class RealStorLogicalVolumeDataMsg(BaseSensorMsg):
                           }
                       }
                     }
-
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
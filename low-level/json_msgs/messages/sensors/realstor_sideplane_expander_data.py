@@ -21,8 +21,6 @@
   ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 
@@ -89,9 +87,3 @@ class RealStorSideplaneExpanderDataMsg(BaseSensorMsg):
                                 }
                             }
                         }
-
-    def getJson(self):
-        """Return a validated JSON object"""
-        # Validate the current message
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
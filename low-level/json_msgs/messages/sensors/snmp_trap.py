@@ -25,8 +25,6 @@
  ****************************************************************************
 """
 
-import json
-
 from json_msgs.messages.sensors.base_sensors_msg import BaseSensorMsg
 
 class SNMPtrapMsg(BaseSensorMsg):
@@ -68,9 +66,3 @@ class SNMPtrapMsg(BaseSensorMsg):
                                 }
                           }
                       }
-
-    def getJson(self):
-        """Return a validated JSON object"""    
-        # Validate the current message    
-        self._json = self.validateMsg(self._json)       
-        return json.dumps(self._json)
@@ -13,7 +13,6 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
-import json
 import socket
 import time
 
@@ -63,8 +62,3 @@ class ThreadMonitorMsg(BaseSensorMsg):
                 }
             }
         }
-
-    def getJson(self):
-        """Return a validated JSON object."""
-        self._json = self.validateMsg(self._json)
-        return json.dumps(self._json)
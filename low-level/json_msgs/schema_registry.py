@@ -0,0 +1,124 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Registry of the JSON schemas of the SSPL-LL messages.
+                    Each schema is read and checked once per process and
+                    its validator shared by all the messages.
+ ****************************************************************************
+"""
+
+import json
+import os
+import threading
+
+from jsonschema import Draft3Validator
+
+from framework.base.sspl_constants import RESOURCE_PATH
+from framework.utils.service_logging import logger
+
+
+class SchemaRegistry(object):
+    """Validators of the message schemas, by path relative to the schemas
+       directory, e.g. 'sensors/SSPL-LL_Sensor_Response.json'.
+
+    Messages sent by SSPL-LL may be validated on a sample only, set by
+    EGRESSPROCESSOR>message_validation_sample_rate: 1 validates every
+    message, 0.1 one message in ten per schema and 0 none. Requests
+    received are always validated.
+    """
+
+    SAMPLE_RATE_KEY = "EGRESSPROCESSOR>message_validation_sample_rate"
+    DEFAULT_SAMPLE_RATE = 1.0
+
+    SENSOR_RESPONSE = "sensors/SSPL-LL_Sensor_Response.json"
+    SENSOR_REQUEST = "sensors/SSPL-LL_Sensor_Request.json"
+    ACTUATOR_RESPONSE = "actuators/SSPL-LL_Actuator_Response.json"
+    ACTUATOR_REQUEST = "actuators/SSPL-LL_Actuator_Request.json"
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Returns the registry shared by the process"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(RESOURCE_PATH, cls._read_sample_rate())
+            return cls._instance
+
+    @classmethod
+    def _read_sample_rate(cls):
+        try:
+            from framework.utils.conf_utils import SSPL_CONF, Conf
+            return float(Conf.get(SSPL_CONF, cls.SAMPLE_RATE_KEY,
+                                  cls.DEFAULT_SAMPLE_RATE))
+        except Exception as err:
+            logger.warn(f"SchemaRegistry, invalid {cls.SAMPLE_RATE_KEY}, "
+                        f"validating every message: {err}")
+            return cls.DEFAULT_SAMPLE_RATE
+
+    def __init__(self, resource_path=RESOURCE_PATH,
+                 sample_rate=DEFAULT_SAMPLE_RATE):
+        self._resource_path = resource_path
+        self._lock = threading.Lock()
+        self._validators = {}
+        # Schema to the share of a message validation accumulated
+        self._credits = {}
+        self.set_sample_rate(sample_rate)
+
+    def set_sample_rate(self, sample_rate):
+        self._sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+
+    def get_validator(self, schema_file):
+        """Returns the validator of a schema, loading it on first use"""
+        validator = self._validators.get(schema_file)
+        if validator is not None:
+            return validator
+        with self._lock:
+            validator = self._validators.get(schema_file)
+            if validator is None:
+                with open(os.path.join(self._resource_path, schema_file)) as f:
+                    schema = json.load(f)
+                # Validate the schema to conform to Draft 3 specification
+                Draft3Validator.check_schema(schema)
+                validator = Draft3Validator(schema)
+                self._validators[schema_file] = validator
+            return validator
+
+    def _is_sampled(self, schema_file):
+        if self._sample_rate >= 1.0:
+            return True
+        if self._sample_rate <= 0.0:
+            return False
+        with self._lock:
+            # The first message of a schema is always validated
+            credit = self._credits.get(schema_file, 1.0)
+            sampled = credit >= 1.0
+            if sampled:
+                credit -= 1.0
+            self._credits[schema_file] = credit + self._sample_rate
+            return sampled
+
+    def validate(self, schema_file, msg, sampled=False):
+        """Validates msg against a schema, raises jsonschema ValidationError
+           if invalid. If sampled, only the configured sample of the
+           messages is validated. Returns True if msg was validated.
+        """
+        if sampled and not self._is_sampled(schema_file):
+            return False
+        self.get_validator(schema_file).validate(msg)
+        return True
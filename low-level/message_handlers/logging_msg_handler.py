@@ -101,7 +101,7 @@ class LoggingMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Log it and restart the whole process when a failure occurs
             logger.exception(f"LoggingMsgHandler restarting: {ae}")
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
     def _process_msg(self, jsonMsg):
@@ -158,7 +158,7 @@ class LoggingMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # result = self._iem_logger.log_msg(jsonMsg)
 
             # Send ack about logging msg
-            ack_msg = AckResponseMsg(log_type, result, uuid).getJson()
+            ack_msg = AckResponseMsg(log_type, result, uuid).getMsg()
             self._write_internal_msgQ(EgressProcessor.name(), ack_msg)
 
         # ... handle other logging types
@@ -22,14 +22,18 @@
 import errno
 import json
 import socket
+import threading
+import time
 
 # Import Actuator states table
 from framework.actuator_state_manager import actuator_state_manager
-from framework.base.internal_msgQ import InternalMsgQ
+from framework.base.internal_msgQ import InternalMsgQ, MsgPriority
 from framework.base.module_thread import ScheduledModuleThread
 from framework.base.sspl_constants import enabled_products
 from framework.utils.conf_utils import (GLOBAL_CONF, SSPL_CONF, Conf,
                                         SETUP_KEY, NODEHWACTUATOR, IPMI_CLIENT)
+from framework.utils.actuator_dispatcher import (ActuatorDispatcher,
+                                                 ActuatorTimeout)
 from framework.utils.service_logging import logger
 from json_msgs.messages.actuators.ack_response import AckResponseMsg
 from json_msgs.messages.actuators.ndhw_ack_response import NodeHwAckResponseMsg
@@ -47,6 +51,33 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
     SYS_INFORMATION = 'SYSTEM_INFORMATION'
 
     UNSUPPORTED_REQUEST = "Unsupported Request"
+    TIMED_OUT = "Timed out"
+
+    # Section and keys in configuration file
+    NODECONTROLLERMSGHANDLER = MODULE_NAME.upper()
+    ACTUATOR_WORKERS = "actuator_workers"
+    REQUEST_TIMEOUT = "request_timeout"
+
+    # Worker pool of the requests by component, the requests of a pool
+    # use the same actuator
+    ACTUATOR_POOLS = {
+        "SSPL": "command_line",
+        "LED:": "hpi",
+        "STOP": "hpi",
+        "STAR": "hpi",
+        "RESE": "hpi",
+        "BEZE": "gem",
+        "PDU:": "pdu",
+        "RAID": "raid",
+        "IPMI": "ipmi",
+        "HDPA": "hdparm",
+        "SMAR": "disk",
+        "DRVM": "disk",
+        "HPI_": "disk",
+        "SIMU": "disk",
+        "NDHW": "node_hw"
+    }
+    LATENCY_LOG_INTERVAL = 600
 
     # Dependency list
     DEPENDENCIES = {
@@ -99,6 +130,17 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
         self._import_products(product)
         self.setup = Conf.get(GLOBAL_CONF, SETUP_KEY, "ssu")
         self.ipmi_client_name = None
+        self._node_hw_lock = threading.Lock()
+
+        self._dispatcher = ActuatorDispatcher(
+            default_workers=int(Conf.get(SSPL_CONF,
+                f"{self.NODECONTROLLERMSGHANDLER}>{self.ACTUATOR_WORKERS}",
+                ActuatorDispatcher.DEFAULT_WORKERS)),
+            timeout=float(Conf.get(SSPL_CONF,
+                f"{self.NODECONTROLLERMSGHANDLER}>{self.REQUEST_TIMEOUT}",
+                ActuatorDispatcher.DEFAULT_TIMEOUT)),
+            name=self.MODULE_NAME)
+        self._latency_logged = time.time()
 
     def _import_products(self, product):
         """Import classes based on which product is being used"""
@@ -121,21 +163,103 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Block on message queue until it contains an entry
             jsonMsg, _ = self._read_my_msgQ()
             if jsonMsg is not None:
-                self._process_msg(jsonMsg)
+                self._dispatch_msg(jsonMsg)
 
             # Keep processing until the message queue is empty
             while not self._is_my_msgQ_empty():
                 jsonMsg, _ = self._read_my_msgQ()
                 if jsonMsg is not None:
-                    self._process_msg(jsonMsg)
+                    self._dispatch_msg(jsonMsg)
+
+            self._log_latency_stats()
 
         except Exception as ae:
             # Log it and restart the whole process when a failure occurs
             logger.exception(f"NodeControllerMsgHandler restarting: {ae}")
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
+    def _dispatch_msg(self, jsonMsg):
+        """Runs the request on the worker pool of its actuator, so that a
+           slow actuator does not delay the requests to the other ones"""
+        if isinstance(jsonMsg, dict) is False:
+            jsonMsg = json.loads(jsonMsg)
+
+        uuid = jsonMsg.get("sspl_ll_msg_header").get("uuid")
+        node_request = jsonMsg.get("actuator_request_type").get("node_controller").get("node_request")
+        if node_request is None:
+            return
+
+        component = node_request[0:4]
+        pool = self.ACTUATOR_POOLS.get(component, "default")
+        request_type = component.rstrip(":_")
+        if component == "NDHW":
+            # Queries, identical ones in flight, i.e. with the same
+            # node_request and resource, are performed once and acked to
+            # each requester
+            request = jsonMsg.get("actuator_request_type")
+            self._dispatcher.submit(pool, request_type,
+                lambda: self._perform_node_hw_request(request),
+                lambda response, error: self._node_hw_request_done(
+                    request, response, error, uuid),
+                key=(component, json.dumps(request.get("node_controller"),
+                                           sort_keys=True)))
+        else:
+            # Drive the request is about, e.g. /dev/sda, requests on a
+            # drive are performed one at a time
+            device = next((field for field in node_request.split()
+                           if field.startswith("/dev/")), None)
+            self._dispatcher.submit(pool, request_type,
+                lambda: self._process_msg(jsonMsg),
+                lambda _, error: self._request_done(node_request, error, uuid),
+                key=("uuid", uuid) if uuid is not None else None,
+                device=device)
+
+    def _request_done(self, node_request, error, uuid):
+        """Acks the requests timed out and logs the failed ones, the other
+           requests are acked by _process_msg"""
+        if isinstance(error, ActuatorTimeout):
+            json_msg = AckResponseMsg(node_request, self.TIMED_OUT, uuid,
+                                      error_no=errno.ETIMEDOUT).getMsg()
+            self._write_internal_msgQ(EgressProcessor.name(), json_msg)
+        elif error is not None:
+            logger.error(f"NodeControllerMsgHandler, failed to process "
+                         f"{node_request}: {error}")
+
+    def _node_hw_request_done(self, request, response, error, uuid):
+        if error is not None:
+            node_request = request.get("node_controller").get("node_request")
+            self._request_done(node_request, error, uuid)
+        elif response is not None:
+            json_msg = NodeHwAckResponseMsg(request, response, uuid).getMsg()
+            self._write_internal_msgQ(EgressProcessor.name(), json_msg)
+
+    def _write_internal_msgQ(self, toModule, jsonMsg, event=None,
+                             priority=MsgPriority.NORMAL):
+        """Drops the response of a request completing after its timeout,
+           the requester has been acked already. The messages to the other
+           modules, e.g. to restart openhpid once a RAID is assembled, are
+           the follow-up of work that has been done and are still sent"""
+        dispatcher = getattr(self, "_dispatcher", None)
+        if toModule == EgressProcessor.name() and dispatcher is not None \
+                and dispatcher.is_expired():
+            logger.warn("NodeControllerMsgHandler, request timed out, "
+                        "dropping its response")
+            return
+        super(NodeControllerMsgHandler, self)._write_internal_msgQ(
+            toModule, jsonMsg, event, priority)
+
+    def _log_latency_stats(self):
+        """Logs the request latency histograms every LATENCY_LOG_INTERVAL"""
+        now = time.time()
+        if now - self._latency_logged < self.LATENCY_LOG_INTERVAL:
+            return
+        self._latency_logged = now
+        stats = self._dispatcher.get_stats()
+        if stats["latency"]:
+            logger.info(f"NodeControllerMsgHandler, requests: {stats}")
+
     def _process_msg(self, jsonMsg):
         """Parses the incoming message and handles appropriately"""
         self._log_debug(f"_process_msg, jsonMsg: {jsonMsg}")
@@ -168,7 +292,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                         self._command_line_actuator = command_line_actuator_class(self._conf_reader)
                     else:
                         logger.warn("CommandLine Actuator not loaded")
-                        json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -176,7 +300,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 command_line_response = self._command_line_actuator.perform_request(jsonMsg).strip()
                 self._log_debug(f"_process_msg, command line response: {command_line_response}")
 
-                json_msg = AckResponseMsg(node_request, command_line_response, uuid).getJson()
+                json_msg = AckResponseMsg(node_request, command_line_response, uuid).getMsg()
                 self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             # Handle LED effects using the HPI actuator
@@ -196,7 +320,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     else:
                         logger.warn("HPIActuator not loaded")
                         if self._product.lower() in [x.lower() for x in enabled_products]:
-                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                             self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -206,7 +330,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     hpi_response = self._HPI_actuator.perform_request(jsonMsg).strip()
                     self._log_debug(f"_process_msg, hpi_response: {hpi_response}")
 
-                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getJson()
+                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             # Set the Bezel LED color using the GEM interface
@@ -220,7 +344,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 gem_response = self._GEM_actuator.perform_request(jsonMsg).strip()
                 self._log_debug(f"_process_msg, gem_response: {gem_response}")
 
-                json_msg = AckResponseMsg(node_request, gem_response, uuid).getJson()
+                json_msg = AckResponseMsg(node_request, gem_response, uuid).getMsg()
                 self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             elif component == "PDU:":
@@ -234,7 +358,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                         self._PDU_actuator = PDU_actuator_class(self._conf_reader)
                     else:
                         logger.warn("RaritanPDU Actuator not loaded")
-                        json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -242,7 +366,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 pdu_response = self._PDU_actuator.perform_request(jsonMsg).strip()
                 self._log_debug(f"_process_msg, pdu_response: {pdu_response}")
 
-                json_msg = AckResponseMsg(node_request, pdu_response, uuid).getJson()
+                json_msg = AckResponseMsg(node_request, pdu_response, uuid).getMsg()
                 self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             elif component == "RAID":
@@ -258,7 +382,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     # This state will not be reached. Kept here for consistency.
                     logger.info("RAID actuator is initializing")
                     busy_json_msg = AckResponseMsg(
-                        node_request, "BUSY", uuid, error_no=errno.EBUSY).getJson()
+                        node_request, "BUSY", uuid, error_no=errno.EBUSY).getMsg()
                     self._write_internal_msgQ(
                         "EgressProcessor", busy_json_msg)
 
@@ -302,7 +426,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                         self._IPMI_actuator = IPMI_actuator_class(self._conf_reader)
                     else:
                         logger.warn("IPMI Actuator not loaded")
-                        json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -310,7 +434,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 ipmi_response = self._IPMI_actuator.perform_request(jsonMsg).strip()
                 self._log_debug(f"_process_msg, ipmi_response: {ipmi_response}")
 
-                json_msg = AckResponseMsg(node_request, ipmi_response, uuid).getJson()
+                json_msg = AckResponseMsg(node_request, ipmi_response, uuid).getMsg()
                 self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             elif component == "STOP":
@@ -329,7 +453,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     else:
                         logger.warn("HPIActuator not loaded")
                         if self._product.lower() in [x.lower() for x in enabled_products]:
-                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                             self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -352,7 +476,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     if "Success" in hpi_response:
                         hpi_response = "Successful"
 
-                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getJson()
+                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             elif component == "STAR":
@@ -371,7 +495,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     else:
                         logger.warn("HPIActuator not loaded")
                         if self._product.lower() in [x.lower() for x in enabled_products]:
-                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                             self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -394,7 +518,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     if "Success" in hpi_response:
                         hpi_response = "Successful"
 
-                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getJson()
+                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
 
@@ -414,7 +538,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     else:
                         logger.warn("HPIActuator not loaded")
                         if self._product.lower() in [x.lower() for x in enabled_products]:
-                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                            json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                             self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
 
@@ -448,7 +572,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                         if "Success" in hpi_response:
                             hpi_response = "Successful"
 
-                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getJson()
+                    json_msg = AckResponseMsg(node_request, hpi_response, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             elif component == "HDPA":
@@ -460,7 +584,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     hdparm_response = self._hdparm_actuator.perform_request(jsonMsg).strip()
                     self._log_debug(f"_process_msg, hdparm_response: {hdparm_response}")
 
-                    json_msg = AckResponseMsg(node_request, hdparm_response, uuid).getJson()
+                    json_msg = AckResponseMsg(node_request, hdparm_response, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
                 # If the state is INITIALIZING, need to send message
@@ -468,7 +592,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     # This state will not be reached. Kept here for consistency.
                     logger.info("Hdparm actuator is initializing")
                     busy_json_msg = AckResponseMsg(
-                        node_request, "BUSY", uuid, error_no=errno.EBUSY).getJson()
+                        node_request, "BUSY", uuid, error_no=errno.EBUSY).getMsg()
                     self._write_internal_msgQ(
                         "EgressProcessor", busy_json_msg)
 
@@ -493,7 +617,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                         hdparm_response = self._hdparm_actuator.perform_request(jsonMsg).strip()
                         self._log_debug(f"_process_msg, hdparm_response: {hdparm_response}")
 
-                        json_msg = AckResponseMsg(node_request, hdparm_response, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, hdparm_response, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         actuator_state_manager.set_state(
                             "Hdparm", actuator_state_manager.INITIALIZED)
@@ -530,7 +654,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
                     # Send error response back on ack channel
                     if error != "":
-                        json_msg = AckResponseMsg(node_request, error, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, error, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
                 else:
@@ -544,7 +668,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
                             logger.error(" No module Smartctl is present to load")
                     serial_compare = self._smartctl_actuator._check_serial_number(drive_request)
                     if not serial_compare:
-                        json_msg = AckResponseMsg(node_request, "Drive Not Found", uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, "Drive Not Found", uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
                     else:
@@ -587,7 +711,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
                     # Send error response back on ack channel
                     if error != "":
-                        json_msg = AckResponseMsg(node_request, error, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, error, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
                 else:
@@ -613,7 +737,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
                 if self.setup == 'cortx':
                     logger.warn("HPIMonitor not loaded")
-                    json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getJson()
+                    json_msg = AckResponseMsg(node_request, NodeControllerMsgHandler.UNSUPPORTED_REQUEST, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                     return
 
@@ -641,7 +765,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
                     # Send error response back on ack channel
                     if error != "":
-                        json_msg = AckResponseMsg(node_request, error, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, error, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
                 else:
@@ -671,7 +795,7 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
                     # Send error response back on ack channel
                     if error != "":
-                        json_msg = AckResponseMsg(node_request, error, uuid).getJson()
+                        json_msg = AckResponseMsg(node_request, error, uuid).getMsg()
                         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                         return
                 else:
@@ -705,46 +829,54 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
             elif component == "NDHW":
                 # NDHW Stands for Node HW.
-                try:
-                    # Load and Instantiate the Actuator for the first request
-                    if self._NodeHW_actuator is None:
-                        from actuators.impl.generic.node_hw import NodeHWactuator
-                        from framework.utils.ipmi_client import IpmiFactory
-                        self.ipmi_client_name = Conf.get(SSPL_CONF,
-                            f"{NODEHWACTUATOR}>{IPMI_CLIENT}", "ipmitool")
-                        ipmi_factory = IpmiFactory()
-                        ipmi_client = \
-                           ipmi_factory.get_implementor(self.ipmi_client_name)
-                        # Instantiate NodeHWactuator only if class is loaded
-                        if ipmi_client is not None:
-                            self._NodeHW_actuator = NodeHWactuator(ipmi_client, self._conf_reader)
-                            self._NodeHW_actuator.initialize()
-                        else:
-                            logger.error(f"IPMI client: '{self.ipmi_client_name}' doesn't exist")
-                            return
-                    node_request = jsonMsg.get("actuator_request_type")
-                    # Perform the NodeHW request on the node and get the response
-                    #TODO: Send message to Ack as well as Sensor in their respective channel.
-                    node_hw_response = self._NodeHW_actuator.perform_request(node_request)
-                    self._log_debug(f"_process_msg, node_hw_response: {node_hw_response}")
-                    json_msg = NodeHwAckResponseMsg(node_request, node_hw_response, uuid).getJson()
+                node_request = jsonMsg.get("actuator_request_type")
+                node_hw_response = self._perform_node_hw_request(node_request)
+                if node_hw_response is not None:
+                    json_msg = NodeHwAckResponseMsg(node_request, node_hw_response, uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
-                except ImportError as e:
-                    logger.error(f"Modules could not be loaded: {e}")
-                    return
-                except Exception as e:
-                    logger.error(f"NodeControllerMsgHandler, _process_msg, Exception in request handling: {e}")
-                    return
 
             else:
                 response = f"NodeControllerMsgHandler, _process_msg, unknown node controller msg: {node_request}"
                 self._log_debug(response)
 
-                json_msg = AckResponseMsg(node_request, response, uuid).getJson()
+                json_msg = AckResponseMsg(node_request, response, uuid).getMsg()
                 self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
             # ... handle other node message types
 
+    def _perform_node_hw_request(self, node_request):
+        """Performs a NodeHW request, returns the response or None if the
+           request failed"""
+        try:
+            # Load and Instantiate the Actuator for the first request
+            with self._node_hw_lock:
+                if self._NodeHW_actuator is None:
+                    from actuators.impl.generic.node_hw import NodeHWactuator
+                    from framework.utils.ipmi_client import IpmiFactory
+                    self.ipmi_client_name = Conf.get(SSPL_CONF,
+                        f"{NODEHWACTUATOR}>{IPMI_CLIENT}", "ipmitool")
+                    ipmi_factory = IpmiFactory()
+                    ipmi_client = \
+                       ipmi_factory.get_implementor(self.ipmi_client_name)
+                    # Instantiate NodeHWactuator only if class is loaded
+                    if ipmi_client is not None:
+                        node_hw_actuator = NodeHWactuator(ipmi_client, self._conf_reader)
+                        node_hw_actuator.initialize()
+                        self._NodeHW_actuator = node_hw_actuator
+                    else:
+                        logger.error(f"IPMI client: '{self.ipmi_client_name}' doesn't exist")
+                        return None
+            # Perform the NodeHW request on the node and get the response
+            #TODO: Send message to Ack as well as Sensor in their respective channel.
+            node_hw_response = self._NodeHW_actuator.perform_request(node_request)
+            self._log_debug(f"_process_msg, node_hw_response: {node_hw_response}")
+            return node_hw_response
+        except ImportError as e:
+            logger.error(f"Modules could not be loaded: {e}")
+        except Exception as e:
+            logger.error(f"NodeControllerMsgHandler, _process_msg, Exception in request handling: {e}")
+        return None
+
     def _retrieve_serial_number(self, drive_request):
         """Retrieves serial number using smartctl tool with /dev/* path"""
         serial_number = "Not Found"
@@ -797,8 +929,8 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
         raid_response = actuator_instance.perform_request(json_msg).strip()
         self._log_debug(f"_process_msg, raid_response: {raid_response}")
 
-        json_msg = AckResponseMsg(node_request, raid_response, uuid).getJson()
-        self._write_internal_msgQ(EgressProcessor.name(), json_msg)
+        ack_msg = AckResponseMsg(node_request, raid_response, uuid).getMsg()
+        self._write_internal_msgQ(EgressProcessor.name(), ack_msg)
 
         # Restart openhpid to update HPI data only if it is a H/W environment
         if self.setup in [ "hw", "ssu" ]:
@@ -830,3 +962,4 @@ class NodeControllerMsgHandler(ScheduledModuleThread, InternalMsgQ):
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
         super(NodeControllerMsgHandler, self).shutdown()
+        self._dispatcher.shutdown()
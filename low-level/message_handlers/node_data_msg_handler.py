@@ -23,7 +23,7 @@ import json
 import time
 import os
 
-from framework.base.internal_msgQ import InternalMsgQ
+from framework.base.internal_msgQ import InternalMsgQ, MsgPriority
 from framework.base.module_thread import ScheduledModuleThread
 from framework.base.sspl_constants import enabled_products, DATA_PATH
 from framework.utils.conf_utils import (GLOBAL_CONF, SSPL_CONF, Conf,
@@ -40,6 +40,7 @@ from json_msgs.messages.sensors.raid_data import RAIDdataMsg
 from json_msgs.messages.sensors.raid_integrity_msg import RAIDIntegrityMsg
 from framework.messaging.egress_processor import EgressProcessor
 from framework.utils.store_factory import file_store
+from framework.utils.threshold_state import AlertState, parse_threshold
 from framework.utils.utility import Utility
 
 # Override default store
@@ -75,29 +76,20 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
     IPMI_RESOURCE_TYPE_CURRENT = "node:sensor:current"
     NW_RESOURCE_TYPE = "node:interface:nw"
     NW_CABLE_RESOURCE_TYPE = "node:interface:nw:cable"
-    high_usage = {
-        'cpu' : False,
-        'disk' : False,
-        'memory' : False
-    }
-    usage_time_map = {
-        'cpu' : -1,
-        'memory' : -1,
-        'disk' : -1
-    }
-    fault_resolved_iterations = {
-        'cpu': 0,
-        'memory': 0,
-        'disk': 0
-    }
-    prev_nw_if_status = {}
-    prev_cable_status = {}
     FAULT = "fault"
     FAULT_RESOLVED = "fault_resolved"
 
     INTERFACE_FAULT_DETECTED = False
 
     CACHE_DIR_NAME = "server"
+    ALERT_STATE_DATA = "NODE_DATA_ALERT_STATE"
+    # Records of the alert state persisted per resource by former versions
+    LEGACY_STATE_DATA = {
+        'cpu': 'CPU_USAGE_DATA',
+        'disk': 'DISK_USAGE_DATA',
+        'memory': 'MEMORY_USAGE_DATA',
+        'nw': 'NW_SENSOR_DATA'
+    }
 
     # Dependency list
     DEPENDENCIES = {
@@ -139,14 +131,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                                                 f"{self.NODEDATAMSGHANDLER}>{self.HIGH_MEMORY_USAGE_WAIT_THRESHOLD}",60))
         self._units = Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.UNITS}",
                                                 "MB")
-        self._disk_usage_threshold = Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.DISK_USAGE_THRESHOLD}",
-                                                self.DEFAULT_DISK_USAGE_THRESHOLD)
-
-        self._cpu_usage_threshold = Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.CPU_USAGE_THRESHOLD}",
-                                                self.DEFAULT_CPU_USAGE_THRESHOLD)
-
-        self._host_memory_usage_threshold = Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.HOST_MEMORY_USAGE_THRESHOLD}",
-                                                self.DEFAULT_HOST_MEMORY_USAGE_THRESHOLD)
+        self._load_thresholds()
 
         self.node_id = Conf.get(GLOBAL_CONF, NODE_ID_KEY, "SN01")
 
@@ -183,67 +168,39 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
         self._import_products(product)
         self.cache_dir_path = os.path.join(DATA_PATH, self.CACHE_DIR_NAME)
 
-        self.persistent_data = {
-            'cpu' : {},
-            'disk' : {},
-            'memory' : {},
-            'nw' : {}
-        }
-        # Persistent Cache for High CPU usage
-        self.init_from_persistent_cache('cpu', 'CPU_USAGE_DATA')
-        # Persistent Cache for High Disk Usage
-        self.init_from_persistent_cache('disk', 'DISK_USAGE_DATA')
-        # Persistent Cache for High Memory Usage
-        self.init_from_persistent_cache('memory', 'MEMORY_USAGE_DATA')
-        # Persistent Cache for Nework sensor
-        self.init_from_persistent_cache('nw', 'NW_SENSOR_DATA')
-
-    def init_from_persistent_cache(self, resource, data_path):
-        PER_DATA_PATH = os.path.join(self.cache_dir_path,
-                            f'{data_path}_{self.node_id}')
-
-        if os.path.isfile(PER_DATA_PATH):
-            self.persistent_data[resource] = store.get(PER_DATA_PATH)
-        if self.persistent_data[resource]:
-            if resource == 'nw':
-                self.prev_nw_if_status = \
-                    self.persistent_data[resource].get('prev_nw_if_status', {})
-                self.prev_cable_status = \
-                    self.persistent_data[resource].get('prev_cable_status', {})
-            elif self.persistent_data[resource]\
-                [f'high_{resource}_usage'].lower() == "true":
-                self.high_usage[resource] = True
-            else:
-                self.high_usage[resource] = False
-        else:
-            self.persist_state_data(resource, data_path)
-
-    def persist_state_data(self, resource, data_path):
-        PER_DATA_PATH = os.path.join(self.cache_dir_path,
-                            f'{data_path}_{self.node_id}')
-        if resource == 'nw':
-            self.persistent_data[resource] = {
-                'prev_nw_if_status': self.prev_nw_if_status,
-                'prev_cable_status': self.prev_cable_status
-            }
-        else:
-            self.persistent_data[resource] = {
-                f'high_{resource}_usage': str(self.high_usage[resource]),
-                f'{resource}_usage_time_map':
-                    str(self.usage_time_map[resource]),
-                f'{resource}_fault_resolved_iterations':
-                    str(self.fault_resolved_iterations[resource])
-            }
-        store.put(self.persistent_data[resource], PER_DATA_PATH)
-
-    def read_persistent_data(self, data_path):
-        """Read resource data from persistent cache."""
-        persistent_data = {}
-        PER_DATA_PATH = os.path.join(self.cache_dir_path,
-                            f'{data_path}_{self.node_id}')
-        if os.path.isfile(PER_DATA_PATH):
-            persistent_data = store.get(PER_DATA_PATH)
-        return persistent_data
+        # Alert state, written back only when an alert is raised or resolved
+        self._alert_state = AlertState(store,
+            os.path.join(self.cache_dir_path, f'{self.ALERT_STATE_DATA}_{self.node_id}'),
+            ('cpu', 'disk', 'memory'),
+            {resource: os.path.join(self.cache_dir_path, f'{data_path}_{self.node_id}')
+                for resource, data_path in self.LEGACY_STATE_DATA.items()}).load()
+        self.prev_nw_if_status = self._alert_state.prev_nw_if_status
+        self.prev_cable_status = self._alert_state.prev_cable_status
+        self._alert_state.flush()
+
+    def _load_thresholds(self):
+        """Parses the usage thresholds from the config"""
+        self._disk_usage_threshold = parse_threshold(
+            Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.DISK_USAGE_THRESHOLD}",
+                     self.DEFAULT_DISK_USAGE_THRESHOLD),
+            self.DEFAULT_DISK_USAGE_THRESHOLD, self.DISK_USAGE_THRESHOLD)
+        self._cpu_usage_threshold = parse_threshold(
+            Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.CPU_USAGE_THRESHOLD}",
+                     self.DEFAULT_CPU_USAGE_THRESHOLD),
+            self.DEFAULT_CPU_USAGE_THRESHOLD, self.CPU_USAGE_THRESHOLD)
+        self._host_memory_usage_threshold = parse_threshold(
+            Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.HOST_MEMORY_USAGE_THRESHOLD}",
+                     self.DEFAULT_HOST_MEMORY_USAGE_THRESHOLD),
+            self.DEFAULT_HOST_MEMORY_USAGE_THRESHOLD, self.HOST_MEMORY_USAGE_THRESHOLD)
+
+        # Samples below the threshold before a usage fault is resolved
+        try:
+            self._cpu_iteration_limit = int(
+                self._high_cpu_usage_wait_threshold/self._transmit_interval)
+            self._memory_iteration_limit = int(
+                self._high_memory_usage_wait_threshold/self._transmit_interval)
+        except ZeroDivisionError:
+            self._cpu_iteration_limit = self._memory_iteration_limit = 0
 
     def _import_products(self, product):
         """Import classes based on which product is being used"""
@@ -274,12 +231,19 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
             if self._transmit_interval > 0:
                 logger.debug("self._transmit_interval:{}".format(self._transmit_interval))
                 timer = self._transmit_interval
+                nw_status = getattr(self._node_sensor, "nw_status", None)
                 while timer > 0:
                     # See if the message queue contains an entry and process
                     jsonMsg, _ = self._read_my_msgQ_noWait()
                     if jsonMsg is not None:
                         self._process_msg(jsonMsg)
 
+                    # Report link changes, e.g. cable pulls, right away
+                    if nw_status is not None and nw_status.link_changed.is_set():
+                        nw_status.link_changed.clear()
+                        self._generate_if_data()
+
+                    self._alert_state.flush()
                     time.sleep(1)
                     timer -= 1
 
@@ -288,6 +252,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 self._generate_cpu_data()
                 self._generate_if_data()
                 self._generate_disk_space_alert()
+                self._alert_state.flush()
 
             # If the timer is zero then block for incoming requests notifying to transmit data
             else:
@@ -301,12 +266,18 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                     jsonMsg, _ = self._read_my_msgQ()
                     if jsonMsg is not None:
                         self._process_msg(jsonMsg)
+                self._alert_state.flush()
 
         except Exception as ae:
             # Log it and restart the whole process when a failure occurs
             logger.exception("NodeDataMsgHandler restarting: %s" % ae)
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        if self._transmit_interval > 0:
+            # Periodic data is sent whether requests come or not, the wait
+            # for the interval is done by the loop above
+            self._scheduler.enter(1, self._priority, self.run, ())
+        else:
+            self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
     def _process_msg(self, jsonMsg):
@@ -334,7 +305,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 sensor_message_type = self.os_sensor_type.get(self.sensor_type, "")
                 if sensor_message_type:
                     self._write_internal_msgQ(EgressProcessor.name(),
-                                          sensor_message_type)
+                                          sensor_message_type, priority=MsgPriority.LOW)
                 else:
                     self._log_debug(f"NodeDataMsgHandler, _process_msg, \
                         No past data found for {self.sensor_type} sensor type")
@@ -344,7 +315,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 sensor_message_type = self.os_sensor_type.get(self.sensor_type, "")
                 if sensor_message_type:
                     self._write_internal_msgQ(EgressProcessor.name(),
-                                          sensor_message_type)
+                                          sensor_message_type, priority=MsgPriority.LOW)
                 else:
                     self._log_debug(f"NodeDataMsgHandler, _process_msg, \
                         No past data found for {self.sensor_type} sensor type")
@@ -354,7 +325,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 sensor_message_type = self.os_sensor_type.get(self.sensor_type, "")
                 if sensor_message_type:
                     self._write_internal_msgQ(EgressProcessor.name(),
-                                          sensor_message_type)
+                                          sensor_message_type, priority=MsgPriority.LOW)
                 else:
                     self._log_debug(f"NodeDataMsgHandler, _process_msg, \
                         No past data found for {self.sensor_type} sensor type")
@@ -364,7 +335,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 sensor_message_type = self.os_sensor_type.get(self.sensor_type, "")
                 if sensor_message_type:
                     self._write_internal_msgQ(EgressProcessor.name(),
-                                          sensor_message_type)
+                                          sensor_message_type, priority=MsgPriority.LOW)
                 else:
                     self._log_debug(f"NodeDataMsgHandler, _process_msg, \
                         No past data found for {self.sensor_type} sensor type")
@@ -374,7 +345,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 sensor_message_type = self.os_sensor_type.get(self.sensor_type, "")
                 if sensor_message_type:
                     self._write_internal_msgQ(EgressProcessor.name(),
-                                            sensor_message_type)
+                                            sensor_message_type, priority=MsgPriority.LOW)
                 else:
                     self._log_debug("NodeDataMsgHandler, _process_msg " +
                             f"No past data found for {self.sensor_type} sensor type")
@@ -384,7 +355,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
                 sensor_message_type = self.os_sensor_type.get(self.sensor_type, "")
                 if sensor_message_type:
                     self._write_internal_msgQ(EgressProcessor.name(),
-                                            sensor_message_type)
+                                            sensor_message_type, priority=MsgPriority.LOW)
                 else:
                     self._log_debug("NodeDataMsgHandler, _process_msg " +
                             f"No past data found for {self.sensor_type} sensor type")
@@ -425,125 +396,53 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
         if not successful:
             logger.error("NodeDataMsgHandler, _generate_host_update was NOT successful.")
 
-        self._host_memory_usage_threshold = str(self._host_memory_usage_threshold)
-        try:
-            if self._host_memory_usage_threshold.isdigit():
-                self._host_memory_usage_threshold = int(self._host_memory_usage_threshold)
-            else:
-                self._host_memory_usage_threshold = float(self._host_memory_usage_threshold)
-        except ValueError:
-            logger.warn("Host Memory Alert, Invalid host_memory_usage_threshold value are entered in config.")
-            # Assigning default value to _memory_usage_threshold
-            self._host_memory_usage_threshold = self.DEFAULT_HOST_MEMORY_USAGE_THRESHOLD
-
-        memory_persistent_data = self.read_persistent_data('MEMORY_USAGE_DATA')
-        if memory_persistent_data.get('memory_usage_time_map') is not None:
-            previous_check_time = int(memory_persistent_data['memory_usage_time_map'])
-        else:
-            previous_check_time = int(-1)
-        if memory_persistent_data\
-                .get('memory_fault_resolved_iterations') is not None:
-            fault_resolved_iters = int(
-                memory_persistent_data['memory_fault_resolved_iterations'])
+        transition = self._alert_state.trackers['memory'].update(
+            self._node_sensor.total_memory["percent"],
+            self._host_memory_usage_threshold, current_time,
+            self._high_memory_usage_wait_threshold,
+            self._memory_iteration_limit)
+
+        if transition == self.FAULT:
+            fault_event = "Host memory usage has increased to {}%,"\
+                "beyond the configured threshold of {}% "\
+                "for more than {} seconds.".format(
+                    self._node_sensor.total_memory["percent"],
+                    self._host_memory_usage_threshold,
+                    self._high_memory_usage_wait_threshold
+                )
+            logger.warn(fault_event)
+        elif transition == self.FAULT_RESOLVED:
+            fault_event = "Host memory usage has decreased to {}%, "\
+                "lower than the configured threshold of {}%.".format(
+                    self._node_sensor.total_memory["percent"],
+                    self._host_memory_usage_threshold
+                )
+            logger.info(fault_event)
         else:
-            fault_resolved_iters = 0
-        try:
-            iteration_limit = int(
-                self._high_memory_usage_wait_threshold/self._transmit_interval)
-        except ZeroDivisionError:
-            iteration_limit = 0
-        self.usage_time_map['memory'] = current_time
-
-        if self._node_sensor.total_memory["percent"] >= self._host_memory_usage_threshold \
-           and not self.high_usage['memory']:
-            if previous_check_time == -1:
-                previous_check_time = current_time
-                self.persist_state_data('memory', 'MEMORY_USAGE_DATA')
-
-            if self.usage_time_map['memory'] - previous_check_time >= self._high_memory_usage_wait_threshold:
-                self.high_usage['memory'] = True
-                self.fault_resolved_iterations['memory'] = 0
-                # Create the memory data message and hand it over
-                # to the egress processor to transmit
-                fault_event = "Host memory usage has increased to {}%,"\
-                    "beyond the configured threshold of {}% "\
-                    "for more than {} seconds.".format(
-                        self._node_sensor.total_memory["percent"],
-                        self._host_memory_usage_threshold,
-                        self._high_memory_usage_wait_threshold
-                    )
-
-                logger.warn(fault_event)
-
-                logged_in_users = []
-                # Create the host update message and hand it over to the egress processor to transmit
-                hostUpdateMsg = HostUpdateMsg(self._node_sensor.host_id,
-                                        self._epoch_time,
-                                        self._node_sensor.boot_time,
-                                        self._node_sensor.up_time,
-                                        self._node_sensor.uname, self._units,
-                                        self._node_sensor.total_memory,
-                                        self._node_sensor.logged_in_users,
-                                        self._node_sensor.process_count,
-                                        self._node_sensor.running_process_count,
-                                        self.FAULT,
-                                        fault_event
-                                        )
-                # Add in uuid if it was present in the json request
-                if self._uuid is not None:
-                    hostUpdateMsg.set_uuid(self._uuid)
-                jsonMsg = hostUpdateMsg.getJson()
-                # Transmit it to message processor
-                self.host_sensor_data = jsonMsg
-                self.os_sensor_type["memory_usage"] = self.host_sensor_data
-                self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-                self.persist_state_data('memory', 'MEMORY_USAGE_DATA')
-
-        if self._node_sensor.total_memory["percent"] < self._host_memory_usage_threshold:
-            if not self.high_usage['memory']:
-                self.persist_state_data('memory', 'MEMORY_USAGE_DATA')
-            else:
-                if fault_resolved_iters < iteration_limit:
-                    fault_resolved_iters += 1
-                    self.fault_resolved_iterations['memory'] = fault_resolved_iters
-                    self.persist_state_data('memory', 'MEMORY_USAGE_DATA')
-                elif fault_resolved_iters >= iteration_limit:
-                    # Create the memory data message and hand it over
-                    # to the egress processor to transmit
-                    fault_resolved_event = "Host memory usage has decreased to {}%, "\
-                        "lower than the configured threshold of {}%.".format(
-                            self._node_sensor.total_memory["percent"],
-                            self._host_memory_usage_threshold
-                        )
-                    logger.info(fault_resolved_event)
-                    logged_in_users = []
-
-                    # Create the host update message and hand it over to the egress processor to transmit
-                    hostUpdateMsg = HostUpdateMsg(self._node_sensor.host_id,
-                                            self._epoch_time,
-                                            self._node_sensor.boot_time,
-                                            self._node_sensor.up_time,
-                                            self._node_sensor.uname, self._units,
-                                            self._node_sensor.total_memory,
-                                            self._node_sensor.logged_in_users,
-                                            self._node_sensor.process_count,
-                                            self._node_sensor.running_process_count,
-                                            self.FAULT_RESOLVED,
-                                            fault_resolved_event
-                                            )
-
-                    # Add in uuid if it was present in the json request
-                    if self._uuid is not None:
-                        hostUpdateMsg.set_uuid(self._uuid)
-                    jsonMsg = hostUpdateMsg.getJson()
-                    # Transmit it to message processor
-                    self.host_sensor_data = jsonMsg
-                    self.os_sensor_type["memory_usage"] = self.host_sensor_data
-                    self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-                    self.high_usage['memory'] = False
-                    self.usage_time_map['memory'] = int(-1)
-                    self.fault_resolved_iterations['memory'] = 0
-                    self.persist_state_data('memory', 'MEMORY_USAGE_DATA')
+            return
+
+        # Create the host update message and hand it over to the egress processor to transmit
+        hostUpdateMsg = HostUpdateMsg(self._node_sensor.host_id,
+                                self._epoch_time,
+                                self._node_sensor.boot_time,
+                                self._node_sensor.up_time,
+                                self._node_sensor.uname, self._units,
+                                self._node_sensor.total_memory,
+                                self._node_sensor.logged_in_users,
+                                self._node_sensor.process_count,
+                                self._node_sensor.running_process_count,
+                                transition,
+                                fault_event
+                                )
+        # Add in uuid if it was present in the json request
+        if self._uuid is not None:
+            hostUpdateMsg.set_uuid(self._uuid)
+        jsonMsg = hostUpdateMsg.getMsg()
+        # Transmit it to message processor
+        self.host_sensor_data = jsonMsg
+        self.os_sensor_type["memory_usage"] = self.host_sensor_data
+        self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
+        self._alert_state.mark_dirty()
 
     def _generate_local_mount_data(self):
         """Create & transmit a local_mount_data message as defined
@@ -567,7 +466,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
         # Add in uuid if it was present in the json request
         if self._uuid is not None:
             localMountDataMsg.set_uuid(self._uuid)
-        jsonMsg = localMountDataMsg.getJson()
+        jsonMsg = localMountDataMsg.getMsg()
 
         # Transmit it to message processor
         self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
@@ -583,136 +482,58 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
         if not successful:
             logger.error("NodeDataMsgHandler, _generate_cpu_data was NOT successful.")
 
-        self._cpu_usage_threshold = str(self._cpu_usage_threshold)
-        try:
-            if self._cpu_usage_threshold.isdigit():
-                self._cpu_usage_threshold = int(self._cpu_usage_threshold)
-            else:
-                self._cpu_usage_threshold = float(self._cpu_usage_threshold)
-        except ValueError:
-            logger.warn("CPU Usage Alert, Invalid host_memory_usage_threshold value are entered in config.")
-            # Assigning default value to _cpu_usage_threshold
-            self._cpu_usage_threshold = self.DEFAULT_CPU_USAGE_THRESHOLD
-
-        cpu_persistent_data = self.read_persistent_data('CPU_USAGE_DATA')
-        if cpu_persistent_data.get('cpu_usage_time_map') is not None:
-            previous_check_time = int(cpu_persistent_data['cpu_usage_time_map'])
-        else:
-            previous_check_time = int(-1)
-        if cpu_persistent_data.get('cpu_fault_resolved_iterations') is not None:
-            fault_resolved_iters = int(
-                cpu_persistent_data['cpu_fault_resolved_iterations'])
+        transition = self._alert_state.trackers['cpu'].update(
+            self._node_sensor.cpu_usage, self._cpu_usage_threshold,
+            current_time, self._high_cpu_usage_wait_threshold,
+            self._cpu_iteration_limit)
+
+        if transition == self.FAULT:
+            fault_event = "CPU usage has increased to {}%, "\
+                "beyond the configured threshold of {}% "\
+                "for more than {} seconds.".format(
+                    self._node_sensor.cpu_usage,
+                    self._cpu_usage_threshold,
+                    self._high_cpu_usage_wait_threshold
+                )
+            logger.warn(fault_event)
+        elif transition == self.FAULT_RESOLVED:
+            fault_event = "CPU usage has decreased to {}%, "\
+                "lower than the configured threshold of {}%.".format(
+                    self._node_sensor.cpu_usage,
+                    self._cpu_usage_threshold
+                )
+            logger.info(fault_event)
         else:
-            fault_resolved_iters = 0
-        try:
-            iteration_limit = int(
-                self._high_cpu_usage_wait_threshold/self._transmit_interval)
-        except ZeroDivisionError:
-            iteration_limit = 0
-        self.usage_time_map['cpu'] = current_time
-
-        if self._node_sensor.cpu_usage >= self._cpu_usage_threshold \
-           and not self.high_usage['cpu']:
-            if previous_check_time == -1:
-                previous_check_time = current_time
-                self.persist_state_data('cpu', 'CPU_USAGE_DATA')
-
-            if self.usage_time_map['cpu'] - previous_check_time >= self._high_cpu_usage_wait_threshold:
-
-                self.high_usage['cpu'] = True
-                self.fault_resolved_iterations['cpu'] = 0
-                # Create the cpu usage data message and hand it over
-                # to the egress processor to transmit
-                fault_event = "CPU usage has increased to {}%, "\
-                    "beyond the configured threshold of {}% "\
-                    "for more than {} seconds.".format(
-                        self._node_sensor.cpu_usage,
-                        self._cpu_usage_threshold,
-                        self._high_cpu_usage_wait_threshold
-                    )
-                logger.warn(fault_event)
-
-                # Create the cpu usage update message and hand it over to the egress processor to transmit
-                cpuDataMsg = CPUdataMsg(self._node_sensor.host_id,
-                                    self._epoch_time,
-                                    self._node_sensor.csps,
-                                    self._node_sensor.idle_time,
-                                    self._node_sensor.interrupt_time,
-                                    self._node_sensor.iowait_time,
-                                    self._node_sensor.nice_time,
-                                    self._node_sensor.softirq_time,
-                                    self._node_sensor.steal_time,
-                                    self._node_sensor.system_time,
-                                    self._node_sensor.user_time,
-                                    self._node_sensor.cpu_core_data,
-                                    self._node_sensor.cpu_usage,
-                                    self.FAULT,
-                                    fault_event
-                                )
+            return
 
-                # Add in uuid if it was present in the json request
-                if self._uuid is not None:
-                    cpuDataMsg.set_uuid(self._uuid)
-                jsonMsg = cpuDataMsg.getJson()
-                self.cpu_sensor_data = jsonMsg
-                self.os_sensor_type["cpu_usage"] = self.cpu_sensor_data
-
-                # Transmit it to message processor
-                self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-                # Store the state to Persistent Cache.
-                self.persist_state_data('cpu', 'CPU_USAGE_DATA')
-
-        if self._node_sensor.cpu_usage < self._cpu_usage_threshold:
-            if not self.high_usage['cpu']:
-                self.persist_state_data('cpu', 'CPU_USAGE_DATA')
-            else:
-                if fault_resolved_iters < iteration_limit:
-                    fault_resolved_iters += 1
-                    self.fault_resolved_iterations['cpu'] = fault_resolved_iters
-                    self.persist_state_data('cpu', 'CPU_USAGE_DATA')
-                elif fault_resolved_iters >= iteration_limit:
-
-                    # Create the cpu usage data message and hand it over
-                    # to the egress processor to transmit
-                    fault_resolved_event = "CPU usage has decreased to {}%, "\
-                        "lower than the configured threshold of {}%.".format(
+        # Create the cpu usage update message and hand it over to the egress processor to transmit
+        cpuDataMsg = CPUdataMsg(self._node_sensor.host_id,
+                            self._epoch_time,
+                            self._node_sensor.csps,
+                            self._node_sensor.idle_time,
+                            self._node_sensor.interrupt_time,
+                            self._node_sensor.iowait_time,
+                            self._node_sensor.nice_time,
+                            self._node_sensor.softirq_time,
+                            self._node_sensor.steal_time,
+                            self._node_sensor.system_time,
+                            self._node_sensor.user_time,
+                            self._node_sensor.cpu_core_data,
                             self._node_sensor.cpu_usage,
-                            self._cpu_usage_threshold
+                            transition,
+                            fault_event
                         )
-                    logger.info(fault_resolved_event)
-
-                    # Create the cpu usage update message and hand it over to the egress processor to transmit
-                    cpuDataMsg = CPUdataMsg(self._node_sensor.host_id,
-                                        self._epoch_time,
-                                        self._node_sensor.csps,
-                                        self._node_sensor.idle_time,
-                                        self._node_sensor.interrupt_time,
-                                        self._node_sensor.iowait_time,
-                                        self._node_sensor.nice_time,
-                                        self._node_sensor.softirq_time,
-                                        self._node_sensor.steal_time,
-                                        self._node_sensor.system_time,
-                                        self._node_sensor.user_time,
-                                        self._node_sensor.cpu_core_data,
-                                        self._node_sensor.cpu_usage,
-                                        self.FAULT_RESOLVED,
-                                        fault_resolved_event
-                                    )
-
-                    # Add in uuid if it was present in the json request
-                    if self._uuid is not None:
-                        cpuDataMsg.set_uuid(self._uuid)
-                    jsonMsg = cpuDataMsg.getJson()
-                    self.cpu_sensor_data = jsonMsg
-                    self.os_sensor_type["cpu_usage"] = self.cpu_sensor_data
-
-                    # Transmit it to message processor
-                    self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-                    self.high_usage['cpu'] = False
-                    self.usage_time_map['cpu'] = int(-1)
-                    self.fault_resolved_iterations['cpu'] = 0
-                    # Store the state to Persistent Cache.
-                    self.persist_state_data('cpu', 'CPU_USAGE_DATA')
+
+        # Add in uuid if it was present in the json request
+        if self._uuid is not None:
+            cpuDataMsg.set_uuid(self._uuid)
+        jsonMsg = cpuDataMsg.getMsg()
+        self.cpu_sensor_data = jsonMsg
+        self.os_sensor_type["cpu_usage"] = self.cpu_sensor_data
+
+        # Transmit it to message processor
+        self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
+        self._alert_state.mark_dirty()
 
     def _send_ifdata_json_msg(self, resource_id, resource_type, state, event=""):
         """A resuable method for transmitting IFDataMsg to RMQ and IEM logging"""
@@ -726,13 +547,13 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
         # Add in uuid if it was present in the json request
         if self._uuid is not None:
             ifDataMsg.set_uuid(self._uuid)
-        jsonMsg = ifDataMsg.getJson()
+        jsonMsg = ifDataMsg.getMsg()
         self.if_sensor_data = jsonMsg
         self.os_sensor_type["nw"] = self.if_sensor_data
 
         # Transmit it to message processor
         self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-        self.persist_state_data('nw', 'NW_SENSOR_DATA')
+        self._alert_state.mark_dirty()
 
     def _generate_if_data(self):
         """Create & transmit a network interface data message as defined
@@ -808,83 +629,47 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
             logger.error("NodeDataMsgHandler, _generate_disk_space_alert was NOT successful.")
             return
 
-        # Changing disk_usage_threshold type according to what value type entered in config file
-        self._disk_usage_threshold = str(self._disk_usage_threshold)
-        try:
-            if self._disk_usage_threshold.isdigit():
-                self._disk_usage_threshold = int(self._disk_usage_threshold)
-            else:
-                self._disk_usage_threshold = float(self._disk_usage_threshold)
-        except ValueError:
-            logger.warn("Disk Space Alert, Invalid disk_usage_threshold value are entered in config.")
-            # Assigning default value to _disk_usage_threshold
-            self._disk_usage_threshold = self.DEFAULT_DISK_USAGE_THRESHOLD
-
-        if self._node_sensor.disk_used_percentage >= self._disk_usage_threshold \
-           and not self.high_usage['disk']:
-
-            self.high_usage['disk'] = True
-            # Create the disk space data message and hand it over
-            # to the egress processor to transmit
+        transition = self._alert_state.trackers['disk'].update(
+            self._node_sensor.disk_used_percentage,
+            self._disk_usage_threshold, Utility.get_current_time())
+
+        if transition == self.FAULT:
             fault_event = "Disk usage has increased to {}%, "\
                 "beyond the configured threshold of {}%.".format(
                     self._node_sensor.disk_used_percentage,
                     self._disk_usage_threshold
                 )
             logger.warn(fault_event)
-            diskSpaceAlertMsg = DiskSpaceAlertMsg(self._node_sensor.host_id,
-                                    self._epoch_time,
-                                    self._node_sensor.total_space,
-                                    self._node_sensor.free_space,
-                                    self._node_sensor.disk_used_percentage,
-                                    self._units,
-                                    self.FAULT,fault_event)
-
-            # Add in uuid if it was present in the json request
-            if self._uuid is not None:
-                diskSpaceAlertMsg.set_uuid(self._uuid)
-            jsonMsg = diskSpaceAlertMsg.getJson()
-            self.disk_sensor_data = jsonMsg
-            self.os_sensor_type["disk_space"] = self.disk_sensor_data
-
-            # Transmit it to message processor
-            self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-            # Save the new state in Persistent Cache.
-            self.persist_state_data('disk', 'DISK_USAGE_DATA')
-
-        if self._node_sensor.disk_used_percentage <= self._disk_usage_threshold \
-           and self.high_usage['disk']:
-
-            # Create the disk space data message and hand it over
-            # to the egress processor to transmit
-            fault_resolved_event = "Disk usage has decreased to {}%, "\
+        elif transition == self.FAULT_RESOLVED:
+            fault_event = "Disk usage has decreased to {}%, "\
                 "lower than the configured threshold of {}%.".format(
                     self._node_sensor.disk_used_percentage,
                     self._disk_usage_threshold
                 )
-            logger.info(fault_resolved_event)
-            diskSpaceAlertMsg = DiskSpaceAlertMsg(self._node_sensor.host_id,
-                                    self._epoch_time,
-                                    self._node_sensor.total_space,
-                                    self._node_sensor.free_space,
-                                    self._node_sensor.disk_used_percentage,
-                                    self._units,
-                                    self.FAULT_RESOLVED,
-                                    fault_resolved_event
-                                    )
+            logger.info(fault_event)
+        else:
+            return
 
-            # Add in uuid if it was present in the json request
-            if self._uuid is not None:
-                diskSpaceAlertMsg.set_uuid(self._uuid)
-            jsonMsg = diskSpaceAlertMsg.getJson()
-            self.disk_sensor_data = jsonMsg
-            self.os_sensor_type["disk_space"] = self.disk_sensor_data
+        diskSpaceAlertMsg = DiskSpaceAlertMsg(self._node_sensor.host_id,
+                                self._epoch_time,
+                                self._node_sensor.total_space,
+                                self._node_sensor.free_space,
+                                self._node_sensor.disk_used_percentage,
+                                self._units,
+                                transition,
+                                fault_event
+                                )
 
-            # Transmit it to message processor
-            self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
-            self.high_usage['disk'] = False
-            # Save the new state in Persistent Cache.
-            self.persist_state_data('disk', 'DISK_USAGE_DATA')
+        # Add in uuid if it was present in the json request
+        if self._uuid is not None:
+            diskSpaceAlertMsg.set_uuid(self._uuid)
+        jsonMsg = diskSpaceAlertMsg.getMsg()
+        self.disk_sensor_data = jsonMsg
+        self.os_sensor_type["disk_space"] = self.disk_sensor_data
+
+        # Transmit it to message processor
+        self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
+        self._alert_state.mark_dirty()
 
     def _generate_raid_data(self, jsonMsg):
         """Create & transmit a RAID status data message as defined
@@ -909,7 +694,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Add in uuid if it was present in the json request
             if self._uuid is not None:
                 raidDataMsg.set_uuid(self._uuid)
-            jsonMsg = raidDataMsg.getJson()
+            jsonMsg = raidDataMsg.getMsg()
             self.raid_sensor_data = jsonMsg
             self.os_sensor_type["raid_data"] = self.raid_sensor_data
 
@@ -954,7 +739,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Add in uuid if it was present in the json request
             if self._uuid is not None:
                 RAIDintegrityMsg.set_uuid(self._uuid)
-            jsonMsg = RAIDintegrityMsg.getJson()
+            jsonMsg = RAIDintegrityMsg.getMsg()
             self.raid_integrity_data = jsonMsg
             self.os_sensor_type["raid_integrity"] = self.raid_integrity_data
 
@@ -976,7 +761,7 @@ class NodeDataMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
         if self._uuid is not None:
             node_ipmi_data_msg.set_uuid(self._uuid)
-        jsonMsg = node_ipmi_data_msg.getJson()
+        jsonMsg = node_ipmi_data_msg.getMsg()
         self._write_internal_msgQ(EgressProcessor.name(), jsonMsg)
 
     def suspend(self):
@@ -88,7 +88,7 @@ class PlaneCntrlMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Log it and restart the whole process when a failure occurs
             logger.exception(f"PlaneCntrlMsgHandler restarting: {str(ae)}")
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
     def _process_msg(self, jsonMsg):
@@ -118,7 +118,7 @@ class RealStorActuatorMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Log it and restart the whole process when a failure occurs
             logger.exception(f"RealStorActuatorMsgHandler restarting: {ae}")
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
     def _process_msg(self, jsonMsg):
@@ -157,7 +157,7 @@ class RealStorActuatorMsgHandler(ScheduledModuleThread, InternalMsgQ):
             real_stor_response = self._real_stor_actuator.perform_request(jsonMsg)
             self._log_debug(f"_process_msg, RealStor response: {real_stor_response}")
 
-            json_msg = RealStorActuatorMsg(real_stor_response, uuid).getJson()
+            json_msg = RealStorActuatorMsg(real_stor_response, uuid).getMsg()
             self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
     def suspend(self):
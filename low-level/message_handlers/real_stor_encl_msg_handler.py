@@ -129,7 +129,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Log it and restart the whole process when a failure occurs
             logger.exception(f"RealStorEnclMsgHandler restarting: {ae}")
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         self._log_debug("Finished processing successfully")
 
     def _process_msg(self, json_msg):
@@ -205,7 +205,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
         real_stor_disk_data_msg = \
             RealStorDiskDataMsg(host_name, alert_type, alert_id, severity, info, specific_info)
-        json_msg = real_stor_disk_data_msg.getJson()
+        json_msg = real_stor_disk_data_msg.getMsg()
 
         # save the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -221,7 +221,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
         real_stor_psu_data_msg = \
             RealStorPSUDataMsg(host_name, alert_type, alert_id, severity, info, specific_info)
-        json_msg = real_stor_psu_data_msg.getJson()
+        json_msg = real_stor_psu_data_msg.getMsg()
 
         # Saves the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -237,7 +237,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
         real_stor_fan_data_msg = \
             RealStorFanDataMsg(host_name, alert_type, alert_id, severity, info, specific_info)
-        json_msg = real_stor_fan_data_msg.getJson()
+        json_msg = real_stor_fan_data_msg.getMsg()
 
         # save the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -254,7 +254,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
         real_stor_controller_data_msg = \
             RealStorControllerDataMsg(host_name, alert_type, alert_id, severity, info,
                                       specific_info)
-        json_msg = real_stor_controller_data_msg.getJson()
+        json_msg = real_stor_controller_data_msg.getMsg()
 
         # save the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -271,7 +271,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
         real_stor_expander_data_msg = \
             RealStorSideplaneExpanderDataMsg(host_name, alert_type, alert_id, severity, info,
                                              specific_info)
-        json_msg = real_stor_expander_data_msg.getJson()
+        json_msg = real_stor_expander_data_msg.getMsg()
 
         # save the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -288,7 +288,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
         real_stor_logical_volume_data_msg = \
             RealStorLogicalVolumeDataMsg(host_name, alert_type, alert_id, severity, info,
                                       specific_info)
-        json_msg = real_stor_logical_volume_data_msg.getJson()
+        json_msg = real_stor_logical_volume_data_msg.getMsg()
 
         # save the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -305,7 +305,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
         real_stor_disk_group_data_msg = \
             RealStorDiskGroupDataMsg(host_name, alert_type, alert_id, severity, info,
                                       specific_info)
-        json_msg = real_stor_disk_group_data_msg.getJson()
+        json_msg = real_stor_disk_group_data_msg.getMsg()
 
         # save the json message in memory to serve sspl CLI sensor request
         self._fru_type[sensor_type] = json_msg
@@ -321,7 +321,7 @@ class RealStorEnclMsgHandler(ScheduledModuleThread, InternalMsgQ):
 
         real_stor_encl_msg = RealStorEnclDataMsg(host_name, alert_type, alert_id, severity,
                                                 info, specific_info)
-        json_msg = real_stor_encl_msg.getJson()
+        json_msg = real_stor_encl_msg.getMsg()
         self._fru_type[sensor_type] = json_msg
         self._write_internal_msgQ(EgressProcessor.name(), json_msg, self._event)
 
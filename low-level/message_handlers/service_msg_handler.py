@@ -127,7 +127,7 @@ class ServiceMsgHandler(ScheduledModuleThread, InternalMsgQ):
             # Log it and restart the whole process when a failure occurs
             logger.exception(f"ServiceMsgHandler restarting: {ae}")
 
-        self._scheduler.enter(1, self._priority, self.run, ())
+        self._schedule_read_my_msgQ()
         logger.debug("Finished processing successfully")
 
     def _process_msg(self, jsonMsg):
@@ -219,7 +219,7 @@ class ServiceMsgHandler(ScheduledModuleThread, InternalMsgQ):
         elif "sensor_request_type" in jsonMsg and \
             "service_status_alert" in jsonMsg["sensor_request_type"]:
             logger.debug(f"Received alert from ServiceMonitor : {jsonMsg}")
-            jsonMsg1 = ServiceMonitorMsg(jsonMsg["sensor_request_type"]).getJson()
+            jsonMsg1 = ServiceMonitorMsg(jsonMsg["sensor_request_type"]).getMsg()
             self._write_internal_msgQ("EgressProcessor", jsonMsg1)
 
         # ... handle other service message types
@@ -250,7 +250,7 @@ class ServiceMsgHandler(ScheduledModuleThread, InternalMsgQ):
         service_controller_msg = ServiceControllerMsg(response)
         if uuid is not None:
             service_controller_msg.set_uuid(uuid)
-        json_msg = service_controller_msg.getJson()
+        json_msg = service_controller_msg.getMsg()
         self._write_internal_msgQ("EgressProcessor", json_msg)
 
     def send_error_response(self, request, service_name, err_msg, err_no=None):
@@ -264,7 +264,7 @@ class ServiceMsgHandler(ScheduledModuleThread, InternalMsgQ):
             str_err = errno_to_str_mapping(err_no)
             error_info["error_no"] = f"{err_no} - {str_err}"
         response = self._create_actuator_response(error_info, error_response)
-        service_controller_msg = ServiceControllerMsg(response).getJson()
+        service_controller_msg = ServiceControllerMsg(response).getMsg()
         self._write_internal_msgQ("EgressProcessor",
                                                     service_controller_msg)
 
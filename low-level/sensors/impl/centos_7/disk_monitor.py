@@ -45,6 +45,8 @@ from framework.messaging.egress_processor import \
 from framework.utils.conf_utils import DATA_PATH_KEY, SSPL_CONF, Conf
 from framework.utils.service_logging import logger
 from framework.utils.severity_reader import SeverityReader
+from framework.utils.smart_poller import SmartHealthPoller
+from framework.utils.state_cache import WriteBehindCache
 from framework.utils.store_factory import file_store
 from json_msgs.messages.actuators.ack_response import AckResponseMsg
 from message_handlers.disk_msg_handler import DiskMsgHandler
@@ -66,6 +68,12 @@ class DiskMonitor(SensorThread, InternalMsgQ):
     DISKMONITOR        = SENSOR_NAME.upper()
     SMART_TEST_INTERVAL= 'smart_test_interval'
     SMART_ON_START     = 'run_smart_on_start'
+    # Period of the smartctl -H health checks, not of the SMART self-tests
+    SMART_HEALTH_INTERVAL   = 'smart_health_interval'
+    SMART_HEALTH_WORKERS    = 'smart_health_workers'
+    SMART_HEALTH_JITTER     = 'smart_health_jitter'
+    SMART_HEALTH_MAX_CHECKS = 'smart_health_max_checks'
+    CACHE_FLUSH_WINDOW      = 'cache_flush_window'
     SYSTEM_INFORMATION = 'SYSTEM_INFORMATION'
     SETUP              = 'setup'
 
@@ -142,6 +150,10 @@ class DiskMonitor(SensorThread, InternalMsgQ):
         self._smart_supported = self._is_smart_supported()
         self._log_debug(f"DiskMonitor, SMART supported: {self._smart_supported}")
 
+        # SMART health checks run on their own interval, decoupled from
+        # the 1 second dbus loop
+        self._smart_poller = self._get_smart_poller()
+
         # Dict of drives by-id symlink from systemd
         self._drive_by_id = {}
 
@@ -178,12 +190,23 @@ class DiskMonitor(SensorThread, InternalMsgQ):
 
         self.server_cache = self.vol_ras + "server/"
         self.disk_cache_path = self.server_cache + "systemd_watchdog/disks/disks.json"
+        self.disk_cache_dir = self.server_cache + "systemd_watchdog/disks/drives"
+
+        # Existing drives, persisted as one record per drive and written
+        # back only when a drive changed
+        flush_window = int(Conf.get(SSPL_CONF,
+            f"{self.DISKMONITOR}>{self.CACHE_FLUSH_WINDOW}",
+            WriteBehindCache.DEFAULT_FLUSH_WINDOW))
+        self._existing_drive = WriteBehindCache(store, self.disk_cache_dir,
+                                                flush_window).load()
 
-        # Existing drives
-        self._existing_drive = store.get(self.disk_cache_path)
-        if self._existing_drive is None:
-            self._existing_drive = {}
-            store.put(self._existing_drive, self.disk_cache_path)
+        # Migrate the drive map written by older versions as a single file
+        if store.exists(self.disk_cache_path)[0]:
+            legacy_drives = store.get(self.disk_cache_path)
+            if isinstance(legacy_drives, dict):
+                self._existing_drive.update(legacy_drives)
+                self._existing_drive.flush(force=True)
+            store.delete(self.disk_cache_path)
 
 
         # Integrate into the main dbus loop to catch events
@@ -244,6 +267,11 @@ class DiskMonitor(SensorThread, InternalMsgQ):
             # Assign callbacks to all devices to capture signals
             self._disk_manager.connect_to_signal('InterfacesAdded', self._interface_added)
             self._disk_manager.connect_to_signal('InterfacesRemoved', self._interface_removed)
+            self._bus.add_signal_receiver(self._properties_changed,
+                signal_name='PropertiesChanged',
+                dbus_interface='org.freedesktop.DBus.Properties',
+                bus_name='org.freedesktop.UDisks2',
+                path_keyword='object_path')
 
             # Notify DiskMsgHandler of available drives and schedule SMART tests
             self._init_drives()
@@ -283,7 +311,8 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                     del self._existing_drive[drive_path]
 
                 self._update_drive_faults()
-                store.put(self._existing_drive, self.disk_cache_path)
+                # Written by the main loop once the flush window elapsed
+                self._existing_drive.flush()
 
             # Retrieve the main loop which will be called in the run method
             self._loop = gobject.MainLoop()
@@ -311,7 +340,8 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                 self._check_msg_queue()
                 with self._drive_info_lock:
                     self._update_drive_faults()
-                    store.put(self._existing_drive, self.disk_cache_path)
+                    # No-op unless an entry is dirty and the window elapsed
+                    self._existing_drive.flush()
 
                 # Safe guard to slow the thread down after busy exp resets
                 # self._thread_speed_safeguard += 1
@@ -410,7 +440,7 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                     # Create the request to be sent back
                     request = f"SMART_TEST: {jsonMsg_serial_number}"
                     # Send an Ack msg back with SMART results as Unsupported
-                    json_msg = AckResponseMsg(request, self.SMART_STATUS_UNSUPPORTED, "").getJson()
+                    json_msg = AckResponseMsg(request, self.SMART_STATUS_UNSUPPORTED, "").getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
                     return
 
@@ -462,7 +492,7 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                                 response = "Failed"
 
                                 # Send an Ack msg back with SMART results
-                                json_msg = AckResponseMsg(request, response, uuid).getJson()
+                                json_msg = AckResponseMsg(request, response, uuid).getMsg()
                                 self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
                                 # Remove from our list if it's present
@@ -570,7 +600,7 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                     serial_number == uuid_serial_number:
 
                     # Send an Ack msg back with SMART results
-                    json_msg = AckResponseMsg(request, ack_response, smart_uuid).getJson()
+                    json_msg = AckResponseMsg(request, ack_response, smart_uuid).getMsg()
                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
                     # Remove from our list
@@ -735,7 +765,9 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                         "faulty": False
                     }
                     self._update_drive_faults()
-                    store.put(self._existing_drive, self.disk_cache_path)
+                    # Coalesced with the other drives of a burst, e.g. an
+                    # expander reset
+                    self._existing_drive.flush()
 
             # Handle jobs like SMART tests being initiated
             elif interfaces_and_properties.get("org.freedesktop.UDisks2.Job") is not None:
@@ -752,6 +784,14 @@ class DiskMonitor(SensorThread, InternalMsgQ):
         except Exception as ae:
             self._log_debug("_interface_added: Exception: %r" % ae)
 
+    def _properties_changed(self, interface, changed_properties,
+                            invalidated_properties, object_path=None):
+        """Callback for when udisks2 properties of a drive have changed"""
+        if interface in ["org.freedesktop.UDisks2.Drive",
+                         "org.freedesktop.UDisks2.Drive.Ata"]:
+            # Drive state changed, check its health in the next sweep
+            self._smart_poller.invalidate(object_path)
+
     def _interface_removed(self, object_path, interfaces):
         """Callback for when an interface like drive or SMART job has been removed"""
         self._log_debug(f"Interface Removed, Object Path: {object_path}, interfaces: {interfaces}")
@@ -791,11 +831,12 @@ class DiskMonitor(SensorThread, InternalMsgQ):
 
                         # Remove drive
                         del self._drives[object_path]
+                        self._smart_poller.remove(object_path)
 
                         # Update cache with latest info
                         del self._existing_drive[object_path]
                         self._update_drive_faults()
-                        store.put(self._existing_drive, self.disk_cache_path)
+                        self._existing_drive.flush()
 
                 # Handle jobs completed like SMART tests
                 elif interface == "org.freedesktop.UDisks2.Job":
@@ -862,7 +903,7 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                                     serial_number == uuid_serial_number:
 
                                     # Send an Ack msg back with SMART results
-                                    json_msg = AckResponseMsg(request, response, smart_uuid).getJson()
+                                    json_msg = AckResponseMsg(request, response, smart_uuid).getMsg()
                                     self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
                                     # Remove from our list
@@ -1058,6 +1099,26 @@ class DiskMonitor(SensorThread, InternalMsgQ):
             smart_interval = 900
         return smart_interval
 
+    def _get_smart_poller(self):
+        """Creates the SMART health poller from the configuration"""
+        interval = int(Conf.get(SSPL_CONF,
+            f"{self.DISKMONITOR}>{self.SMART_HEALTH_INTERVAL}",
+            SmartHealthPoller.DEFAULT_INTERVAL))
+        workers = int(Conf.get(SSPL_CONF,
+            f"{self.DISKMONITOR}>{self.SMART_HEALTH_WORKERS}",
+            SmartHealthPoller.DEFAULT_WORKERS))
+        jitter = float(Conf.get(SSPL_CONF,
+            f"{self.DISKMONITOR}>{self.SMART_HEALTH_JITTER}",
+            SmartHealthPoller.DEFAULT_JITTER))
+        max_checks = int(Conf.get(SSPL_CONF,
+            f"{self.DISKMONITOR}>{self.SMART_HEALTH_MAX_CHECKS}",
+            SmartHealthPoller.DEFAULT_MAX_CHECKS))
+        self._log_debug(f"DiskMonitor, SMART health interval: {interval}, "
+                        f"workers: {workers}, jitter: {jitter}, "
+                        f"max checks per sweep: {max_checks}")
+        return SmartHealthPoller(interval, workers, jitter, max_checks,
+                                 runner=self._run_command)
+
     def _is_smart_supported(self):
         """Retrieves the current setup. This was added to not to run actual SMART test
            in VM environment because virtual drives don't support SMART test.
@@ -1078,24 +1139,34 @@ class DiskMonitor(SensorThread, InternalMsgQ):
         if not self._smart_supported:
             return
 
+        commands = {}
         for object_path in self._drives.keys():
+            if not self._drives[object_path]["node_disk"]:
+                commands[object_path] = f"sudo smartctl -d scsi -H {self._drive_by_device_name[object_path]} --json"
+            else:
+                commands[object_path] = f"sudo smartctl -H {self._drive_by_device_name[object_path]} --json"
+
+        # Only drives which are due or whose state changed are checked,
+        # the rest are skipped till their next health interval
+        results = self._smart_poller.poll(commands)
+
+        # SMARTCTL IEMs are raised once per sweep whatever the number of
+        # drives failing
+        smartctl_failed = smartctl_available = False
+        fault_changed = False
+        for object_path, (response, err, retcode) in results.items():
 
             # To handle case when drive is removed, but interface_removed function is not yet
             # called, so drive will be still in self._drives, but smartctl command will fail as
             # device is removed.
-            if not self._drives[object_path]["node_disk"]:
-                cmd = f"sudo smartctl -d scsi -H {self._drive_by_device_name[object_path]} --json"
-            else:
-                cmd = f"sudo smartctl -H {self._drive_by_device_name[object_path]} --json"
-            response, err, retcode = self._run_command(cmd)
+            if object_path not in self._drives or \
+                object_path not in self._existing_drive:
+                continue
             if retcode != 0 and err:
-                self._iem.iem_fault("SMARTCTL_ERROR")
-                if self.SMARTCTL not in self._iem.fault_iems:
-                    self._iem.fault_iems.append(self.SMARTCTL)
-                return
-            if retcode == 0 and response and self.SMARTCTL in self._iem.fault_iems:
-                self._iem.iem_fault_resolved("SMARTCTL_AVAILABLE")
-                self._iem.fault_iems.remove(self.SMARTCTL)
+                smartctl_failed = True
+                continue
+            if retcode == 0 and response:
+                smartctl_available = True
 
             response = json.loads(response)
             try:
@@ -1113,6 +1184,8 @@ class DiskMonitor(SensorThread, InternalMsgQ):
             if not self._existing_drive[object_path]['faulty'] and \
                 fault_detected:
                 self._existing_drive[object_path]['faulty'] = True
+                self._existing_drive.mark_dirty(object_path)
+                fault_changed = True
                 self._drives[object_path][self.DRIVE_FAULT_ATTR] = self._get_drive_fault_info(object_path)
                 resource_type = self._get_resource_type(object_path)
                 specific_info = self._get_specific_info(object_path, self.DISK_FAULT_ALERT_TYPE)
@@ -1125,6 +1198,8 @@ class DiskMonitor(SensorThread, InternalMsgQ):
             elif self._existing_drive[object_path]['faulty'] and \
                 not fault_detected:
                 self._existing_drive[object_path]['faulty'] = False
+                self._existing_drive.mark_dirty(object_path)
+                fault_changed = True
                 self._drives[object_path][self.DRIVE_FAULT_ATTR] = self._get_drive_fault_info(object_path)
                 resource_type = self._get_resource_type(object_path)
                 specific_info = self._get_specific_info(object_path, self.DISK_FAULT_RESOLVED_ALERT_TYPE)
@@ -1136,6 +1211,19 @@ class DiskMonitor(SensorThread, InternalMsgQ):
                                specific_info)
             # else no change
 
+        if smartctl_failed:
+            self._iem.iem_fault("SMARTCTL_ERROR")
+            if self.SMARTCTL not in self._iem.fault_iems:
+                self._iem.fault_iems.append(self.SMARTCTL)
+        elif smartctl_available and self.SMARTCTL in self._iem.fault_iems:
+            self._iem.iem_fault_resolved("SMARTCTL_AVAILABLE")
+            self._iem.fault_iems.remove(self.SMARTCTL)
+
+        # Persist fault transitions right away, a fault alert must not be
+        # sent again after a restart
+        if fault_changed:
+            self._existing_drive.flush(force=True)
+
     def _is_drive_faulty(self, path):
         if not self._drives[path]["node_disk"]:
             cmd = f"sudo smartctl -d scsi -H {self._drive_by_device_name[path]} --json"
@@ -1203,6 +1291,9 @@ class DiskMonitor(SensorThread, InternalMsgQ):
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
         super(DiskMonitor, self).shutdown()
+        self._smart_poller.shutdown()
+        with self._drive_info_lock:
+            self._existing_drive.flush(force=True)
 
 def is_physical_drive(interfaces_and_property):
     """
@@ -42,6 +42,7 @@ class SMRdriveData(SensorThread, InternalMsgQ):
 
     SENSOR_NAME       = "SMRdriveData"
     PRIORITY          = 1
+    RUN_ON_CORE_WORKERS = True
 
     # Section and keys in configuration file
     SMRDRIVEDATA      = SENSOR_NAME.upper()
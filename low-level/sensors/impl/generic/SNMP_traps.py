@@ -228,7 +228,7 @@ class SNMPtraps(SensorThread, InternalMsgQ):
     def _transmit_json_msg(self, json_data):
         """Transmit message to halon by passing it to egress msg handler"""
         json_data["trapName"] = self._trap_name
-        json_msg = SNMPtrapMsg(json_data).getJson()
+        json_msg = SNMPtrapMsg(json_data).getMsg()
         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
     def _get_config(self):
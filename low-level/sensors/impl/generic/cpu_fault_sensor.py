@@ -18,7 +18,6 @@ Sensor Module Thread responsible for reporting CPU faults
 on the Node server
 """
 
-import json
 import os
 import time
 import uuid
@@ -242,8 +241,7 @@ class CPUFaultSensor(SensorThread, InternalMsgQ):
                 "description": description
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "node_data": {
                         "status": "update",
                         "host_id": host_name,
@@ -253,7 +251,7 @@ class CPUFaultSensor(SensorThread, InternalMsgQ):
                         "info": info,
                         "specific_info": alert_specific_info
                     }
-            }})
+            }}
 
         return internal_json_msg
 
@@ -22,12 +22,14 @@
 import csv
 import datetime
 import errno
+import json
 import os
 import select
 import subprocess
 import threading
 import time
-from functools import lru_cache
+
+import pyinotify
 
 from framework.base.internal_msgQ import InternalMsgQ
 from framework.base.module_thread import SensorThread
@@ -51,6 +53,7 @@ class IEMSensor(SensorThread, InternalMsgQ):
     # Keys for config settings
     LOG_FILE_PATH_KEY = "log_file_path"
     TIMESTAMP_FILE_PATH_KEY = "timestamp_file_path"
+    CHECKPOINT_BATCH_KEY = "checkpoint_batch"
 
     # Default values for config  settings
     DEFAULT_LOG_FILE_PATH = f"/var/log/{PRODUCT_FAMILY}/iem/iem_messages"
@@ -59,6 +62,14 @@ class IEMSensor(SensorThread, InternalMsgQ):
     DEFAULT_RACK_ID = "RC01"
     DEFAULT_NODE_ID = "SN01"
     DEFAULT_CLUSTER_ID= "CC01"
+    # IEMs processed between two checkpoint writes while catching up
+    DEFAULT_CHECKPOINT_BATCH = 1000
+
+    # Secs to wait for inotify events before checking the log anyway
+    POLL_TIMEOUT = 10
+    # Events of the log directory waking the sensor up
+    INOTIFY_MASK = pyinotify.IN_MODIFY | pyinotify.IN_CREATE | \
+        pyinotify.IN_MOVED_TO
 
     # RANGE/VALID VALUES for IEC Components
     # NOTE: Ranges are   in hex number system.
@@ -108,8 +119,22 @@ class IEMSensor(SensorThread, InternalMsgQ):
             self.SENSOR_NAME, self.PRIORITY)
         self._log_file_path = None
         self._timestamp_file_path = None
+        self._checkpoint_batch = self.DEFAULT_CHECKPOINT_BATCH
         self._iem_logs = None
         self._iem_log_file_lock = threading.Lock()
+        # Inode of the log, byte offsets of the end and start of the last
+        # processed line and its timestamp
+        self._checkpoint = {"inode": None, "offset": 0, "line_offset": 0,
+                            "timestamp": ""}
+        # Timestamp of the last IEM processed when the position in the log
+        # is unknown, older IEMs are skipped
+        self._skip_until = None
+        self._reopen = False
+        self._notifier = None
+        # IEC mapping CSVs, component code to name and per component event
+        # code to module and event names
+        self._component_index = None
+        self._event_index = {}
 
     def initialize(self, conf_reader, msgQlist, products):
         """initialize configuration reader and internal msg queues"""
@@ -127,6 +152,10 @@ class IEMSensor(SensorThread, InternalMsgQ):
 
         self._timestamp_file_path = Conf.get(SSPL_CONF, f"{self.SENSOR_NAME.upper()}>{self.TIMESTAMP_FILE_PATH_KEY}",
                 self.DEFAULT_TIMESTAMP_FILE_PATH)
+
+        self._checkpoint_batch = max(int(Conf.get(SSPL_CONF,
+                f"{self.SENSOR_NAME.upper()}>{self.CHECKPOINT_BATCH_KEY}",
+                self.DEFAULT_CHECKPOINT_BATCH)), 1)
         return True
 
     def read_data(self):
@@ -141,46 +170,171 @@ class IEMSensor(SensorThread, InternalMsgQ):
         # Check for debug mode being activated
         self._read_my_msgQ_noWait()
         try:
-            with self._iem_log_file_lock:
-                self._iem_logs = open(self._log_file_path)
-            self._create_file(self._timestamp_file_path)
+            if self._iem_logs is None or self._reopen:
+                self._open_log()
 
-            with open(self._timestamp_file_path, "r") as timestamp_file:
-                last_processed_log_timestamp = timestamp_file.read().strip()
-
-            # Read and send unprocessed messages
-            with self._iem_log_file_lock:
-                for iem_log in self._iem_logs:
-                    log = iem_log.rstrip()
-                    log_timestamp = log[:log.index(" ")]
-                    if not last_processed_log_timestamp or log_timestamp > last_processed_log_timestamp:
-                        self._process_iem(log)
+            # Read and send messages appended since the checkpoint
+            self._read_iem()
 
             # Reset debug mode if persistence is not enabled
             self._disable_debug_if_persist_false()
 
-            # Read new messages
-            self._read_iem()
+            # Sleep until the log changes
+            self._wait_for_iem()
 
         except IOError as io_error:
             raise Exception(f"Failed in monitoring IEM, {io_error.args} {io_error.filename}")
         except Exception as exception:
             raise Exception(f"Failed in monitoring IEM, {exception.args}")
 
-        self._scheduler.enter(10, self._priority, self.run, ())
+        self._scheduler.enter(0, self._priority, self.run, ())
+
+    def _open_log(self):
+        """Opens the log and moves to the checkpoint"""
+        if self._iem_logs is not None and self._reopen:
+            # Rotated, read the lines written before the move first
+            self._read_iem()
+        self._create_file(self._timestamp_file_path)
+        self._checkpoint = self._load_checkpoint()
+        with self._iem_log_file_lock:
+            if self._iem_logs:
+                self._iem_logs.close()
+            self._reopen = False
+            self._iem_logs = open(self._log_file_path, "rb")
+            self._seek_checkpoint(os.fstat(self._iem_logs.fileno()))
+        self._watch_log()
+
+    def _seek_checkpoint(self, stat):
+        """Moves to the checkpoint offset if it still ends the last processed
+           line. Otherwise, log rotated or truncated or checkpoint holding a
+           timestamp only, the log is read from the start skipping the IEMs
+           not newer than the last processed one.
+        """
+        checkpoint = self._checkpoint
+        if checkpoint["inode"] == stat.st_ino and \
+                checkpoint["offset"] <= stat.st_size:
+            self._iem_logs.seek(checkpoint["line_offset"])
+            line = self._iem_logs.readline()
+            if checkpoint["line_offset"] + len(line) == checkpoint["offset"] \
+                    and self._get_timestamp(line) == checkpoint["timestamp"]:
+                self._skip_until = None
+                return
+        self._iem_logs.seek(0)
+        self._skip_until = checkpoint["timestamp"] or None
+        checkpoint.update({"inode": stat.st_ino, "offset": 0,
+                           "line_offset": 0})
+
+    @staticmethod
+    def _get_timestamp(line):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        return line[:line.find(" ")] if " " in line else ""
+
+    def _load_checkpoint(self):
+        checkpoint = {"inode": None, "offset": 0, "line_offset": 0,
+                      "timestamp": ""}
+        with open(self._timestamp_file_path, "r") as timestamp_file:
+            content = timestamp_file.read().strip()
+        if content.startswith("{"):
+            try:
+                checkpoint.update(json.loads(content))
+            except ValueError:
+                logger.warn(f"IEMSensor, invalid checkpoint {content}")
+        else:
+            # Timestamp of the last processed IEM, written by former versions
+            checkpoint["timestamp"] = content
+        return checkpoint
+
+    def _save_checkpoint(self):
+        """Replaces the checkpoint file so it is never left half written"""
+        tmp_path = f"{self._timestamp_file_path}.tmp"
+        with open(tmp_path, "w") as timestamp_file:
+            json.dump(self._checkpoint, timestamp_file)
+        os.replace(tmp_path, self._timestamp_file_path)
+
+    def _watch_log(self):
+        """Watches the log directory, so writes, rotation and recreation of
+           the log wake the sensor up.
+        """
+        if self._notifier is not None:
+            return
+        try:
+            watch_manager = pyinotify.WatchManager()
+            watch_manager.add_watch(os.path.dirname(self._log_file_path),
+                                    self.INOTIFY_MASK,
+                                    proc_fun=self._log_dir_event,
+                                    quiet=False)
+            self._notifier = pyinotify.Notifier(watch_manager)
+        except Exception as err:
+            logger.warn(f"IEMSensor, unable to watch {self._log_file_path}, "
+                        f"polling every {self.POLL_TIMEOUT} secs: {err}")
+
+    def _log_dir_event(self, event):
+        if event.pathname == self._log_file_path and \
+                event.mask & (pyinotify.IN_CREATE | pyinotify.IN_MOVED_TO):
+            # Log moved away by rotation and created again
+            self._reopen = True
+
+    def _wait_for_iem(self):
+        if self._reopen:
+            return
+        if self._notifier is None:
+            time.sleep(self.POLL_TIMEOUT)
+        elif self._notifier.check_events(timeout=self.POLL_TIMEOUT * 1000):
+            self._notifier.read_events()
+            self._notifier.process_events()
 
     def _read_iem(self):
+        """Processes the complete lines appended since the last read,
+           writing the checkpoint once per batch of lines.
+        """
         try:
             with self._iem_log_file_lock:
-                for iem_log in self._iem_logs:
-                    self._process_iem(iem_log.rstrip())
+                stat = os.fstat(self._iem_logs.fileno())
+                if stat.st_size < self._iem_logs.tell():
+                    # Truncated by logrotate copytruncate
+                    logger.info(f"IEMSensor, {self._log_file_path} truncated")
+                    self._iem_logs.seek(0)
+                pending = 0
+                while True:
+                    line_offset = self._iem_logs.tell()
+                    line = self._iem_logs.readline()
+                    if not line.endswith(b"\n"):
+                        # Line still being written, read it next time
+                        self._iem_logs.seek(line_offset)
+                        break
+                    log = line.decode("utf-8", errors="replace").rstrip()
+                    timestamp = self._get_timestamp(log)
+                    if self._skip_until is not None:
+                        if timestamp and timestamp <= self._skip_until:
+                            continue
+                        self._skip_until = None
+                    if log:
+                        try:
+                            self._process_iem(log)
+                        except Exception as err:
+                            logger.warn(f"IEMSensor, discarding IEM {log}: {err}")
+                    self._checkpoint.update({"inode": stat.st_ino,
+                        "offset": line_offset + len(line),
+                        "line_offset": line_offset, "timestamp": timestamp})
+                    pending += 1
+                    if pending >= self._checkpoint_batch:
+                        self._save_checkpoint()
+                        pending = 0
+                if pending:
+                    self._save_checkpoint()
         except IOError as io_error:
             raise Exception(
                 f"IEMSensor, self._read_iem, {io_error.args} {io_error.filename}")
         except Exception as exception:
             raise Exception(f"IEMSensor, self._read_iem, {exception.args}")
 
-        self._scheduler.enter(10, self._priority, self._read_iem, ())
+        try:
+            if os.stat(self._log_file_path).st_ino != stat.st_ino:
+                # Rotated and recreated, the old file has been read till end
+                self._reopen = True
+        except FileNotFoundError:
+            pass
 
     def _process_iem(self, iem_log):
         log_timestamp = iem_log[:iem_log.index(" ")]
@@ -189,8 +343,6 @@ class IEMSensor(SensorThread, InternalMsgQ):
         if iem_components:
             logger.debug("IEM mesage {} {}".format(log_timestamp, iem_components))
             self._send_msg(iem_components, log_timestamp)
-        with open(self._timestamp_file_path, "w") as timestamp_file:
-            timestamp_file.write(log_timestamp)
 
     def _send_msg(self, iem_components, log_timestamp):
         """Creates JSON message from iem components and sends to message bus.
@@ -259,40 +411,39 @@ class IEMSensor(SensorThread, InternalMsgQ):
             "IEC": "".join(iem_components[:-1])
         }
         iem_data_msg = IEMDataMsg(info)
-        json_msg = iem_data_msg.getJson()
+        json_msg = iem_data_msg.getMsg()
         self._write_internal_msgQ(EgressProcessor.name(), json_msg)
 
+    def _read_mapping(self, name):
+        """Returns the rows of an IEC mapping CSV indexed by code"""
+        index = {}
+        path = f"{self.IEC_MAPPING_DIR_PATH}/{name}"
+        if os.path.exists(path):
+            with open(path, newline='') as f:
+                for row in csv.reader(f):
+                    if row:
+                        index.setdefault(row[0], row[1:])
+        return index
+
     def _get_component(self, component):
         "Decode a component"
-        if os.path.exists(f"{self.IEC_MAPPING_DIR_PATH}/components"):
-            with open(f"{self.IEC_MAPPING_DIR_PATH}/components", newline='') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if component == row[0]:
-                        return row[1]
-                else:
-                    return None
-        else:
-            return None
+        if self._component_index is None:
+            self._component_index = {code: row[0] for code, row in
+                self._read_mapping("components").items() if row}
+        return self._component_index.get(component)
 
-
-    @lru_cache(maxsize=32)
     def _decode_msg(self, code):
         "Decode a msg"
 
         component_id, module_id, event_id = code[:3], code[3:6], code[6:]
         component = self._get_component(component_id)
         if component:
-            if os.path.exists(f"{self.IEC_MAPPING_DIR_PATH}/{component}"):
-                with open(f"{self.IEC_MAPPING_DIR_PATH}/{component}", newline='') as f:
-                    reader = csv.reader(f)
-                    for row in reader:
-                        if code == row[0]:
-                            return component, row[1], row[2]
-                    else:
-                       return component, module_id, event_id
-            else:
-                return component, module_id, event_id
+            if component not in self._event_index:
+                self._event_index[component] = self._read_mapping(component)
+            row = self._event_index[component].get(code)
+            if row and len(row) >= 2:
+                return component, row[0], row[1]
+            return component, module_id, event_id
         else:
             return component_id, module_id, event_id
 
@@ -395,12 +546,15 @@ class IEMSensor(SensorThread, InternalMsgQ):
             return None
 
     def refresh_file(self):
+        """Called on log rotation, the log is opened again at its next read
+           and the position checked against the checkpoint.
+        """
         if os.path.exists(self._log_file_path):
-            with self._iem_log_file_lock:
-                if self._iem_logs:
-                    self._iem_logs.close()
-                    self._iem_logs = open(self._log_file_path)
+            self._reopen = True
 
     def shutdown(self):
         """Clean up scheduler queue and gracefully shutdown thread"""
         super(IEMSensor, self).shutdown()
+        if self._notifier is not None:
+            self._notifier.stop()
+            self._notifier = None
@@ -22,9 +22,6 @@
 import errno
 import math
 import os
-import re
-import subprocess as sp
-import threading
 import time
 from datetime import datetime
 
@@ -34,13 +31,13 @@ from zope.interface import implementer
 from framework.base.debug import Debug
 from framework.utils.conf_utils import SSPL_CONF, Conf
 from framework.utils.config_reader import ConfigReader
+from framework.utils.cpu_sampler import CpuSampler
+from framework.utils.net_status import NetworkStatus
 from framework.utils.service_logging import logger
 from framework.utils.sysfs_interface import SysFS
 from framework.utils.tool_factory import ToolFactory
 from framework.utils.os_utils import OSUtils
 from sensors.INode_data import INodeData
-from framework.platforms.server.network import Network
-from framework.platforms.server.error import NetworkError
 
 
 @implementer(INodeData)
@@ -52,6 +49,10 @@ class NodeData(Debug):
 
     # conf attribute initialization
     PROBE = 'probe'
+    NODEDATAMSGHANDLER = 'NODEDATAMSGHANDLER'
+    BMC_PROBE_INTERVAL = 'bmc_probe_interval'
+    BMC_LAN_CACHE_TTL = 'bmc_lan_cache_ttl'
+    NETLINK_LINK_EVENTS = 'netlink_link_events'
 
     @staticmethod
     def name():
@@ -73,14 +74,23 @@ class NodeData(Debug):
         self.cpus = psutil.cpu_count()
         self.host_id = self.os_utils.get_fqdn()
 
-        # Calculate the load averages on separate blocking threads
+        # Load averages are computed from the process wide CPU sampler
+        self.cpu_sampler = CpuSampler.get_instance()
         self.load_1min_average  = []
         self.load_5min_average  = []
         self.load_15min_average = []
         self.prev_bmcip = None
-        load_1min_avg  = threading.Thread(target=self._load_1min_avg).start()
-        load_5min_avg  = threading.Thread(target=self._load_5min_avg).start()
-        load_15min_avg = threading.Thread(target=self._load_15min_avg).start()
+
+        # Interfaces status is read from sysfs, the BMC probed on its own
+        # schedule
+        self.nw_status = NetworkStatus.get_instance(
+            Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.BMC_PROBE_INTERVAL}",
+                     NetworkStatus.DEFAULT_BMC_PROBE_INTERVAL),
+            Conf.get(SSPL_CONF, f"{self.NODEDATAMSGHANDLER}>{self.BMC_LAN_CACHE_TTL}",
+                     NetworkStatus.DEFAULT_BMC_LAN_TTL))
+        self.nw_status.start(str(Conf.get(SSPL_CONF,
+            f"{self.NODEDATAMSGHANDLER}>{self.NETLINK_LINK_EVENTS}",
+            "false")).lower() == "true")
 
         self.conf_reader = ConfigReader()
 
@@ -196,11 +206,15 @@ class NodeData(Debug):
         self.softirq_time   = int(cpu_data[6])
         self.steal_time     = int(cpu_data[7])
 
-        self.cpu_usage = psutil.cpu_percent(interval=1, percpu=False)
+        self.cpu_usage = self.cpu_sampler.get_usage(CpuSampler.CURRENT)
+        load_average = self.cpu_sampler.get_window_usage(percpu=True)
+        self.load_1min_average  = load_average["1min"]
+        self.load_5min_average  = load_average["5min"]
+        self.load_15min_average = load_average["15min"]
         # Array to hold data about each CPU core
         self.cpu_core_data = []
         index = 0
-        while index < self.cpus:
+        while index < len(self.load_1min_average):
             self._log_debug("_get_cpu_data, index: %s, 1 min: %s, 5 min: %s, 15 min: %s" %
                             (index,
                             self.load_1min_average[index],
@@ -222,10 +236,10 @@ class NodeData(Debug):
         # Array to hold data about each network interface
         self.if_data = []
         bmc_data = self._get_bmc_info()
+        nw_status = self._fetch_nw_status()
         for interface, if_data in net_data.items():
             self._log_debug("_get_if_data, interface: %s %s" % (interface, net_data))
-            nw_status = self._fetch_nw_status()
-            nw_cable_conn_status = self.fetch_nw_cable_conn_status(interface)
+            status = nw_status.get(interface, ["UNKNOWN", "", "UNKNOWN"])
             if_data = {"ifId" : interface,
                        "networkErrors"      : (net_data[interface].errin +
                                                net_data[interface].errout),
@@ -235,67 +249,37 @@ class NodeData(Debug):
                        "droppedPacketsOut"  : net_data[interface].dropout,
                        "packetsOut"         : net_data[interface].packets_sent,
                        "trafficOut"         : net_data[interface].bytes_sent,
-                       "nwStatus"           : nw_status[interface][0],
-                       "ipV4"               : nw_status[interface][1],
-                       "nwCableConnStatus"  : nw_cable_conn_status
+                       "nwStatus"           : status[0],
+                       "ipV4"               : status[1],
+                       "nwCableConnStatus"  : status[2]
                        }
             self.if_data.append(if_data)
         self.if_data.append(bmc_data)
 
     def _fetch_nw_status(self):
-        nw_dict = {}
-        nws = os.popen("ip --br a | awk '{print $1, $2, $3}'").read().split('\n')[:-1]
-        for nw in nws:
-            if nw.split(' ')[2]:
-                ip = nw.split(' ')[2].split("/")[0]
-            else:
-                ip = ""
-            nw_dict[nw.split(' ')[0]] = [nw.split(' ')[1], ip]
+        """Returns the status, IPv4 address and cable status per interface"""
+        nw_dict = {interface: list(status) for interface, status in
+                   self.nw_status.get_interfaces().items()}
         logger.debug("network info going is : {}".format(nw_dict))
         return nw_dict
 
-    def fetch_nw_cable_conn_status(self, interface):
-        carrier_status = None
-        try:
-            carrier_status = Network().get_link_state(interface)
-        except NetworkError as err:
-            # NetworkError i.e. all OSError exceptions indicate that
-            # the carrier file is not available to access which
-            # constitute the UNKOWN status for network cable.
-            logger.debug(err)
-            carrier_status = "UNKNOWN"
-        except Exception as e:
-            # All other exceptions are unexpected and are logged as errors.
-            logger.excpetion(
-                "Problem occured while reading from nw carrier file:"
-                f" {self.nw_interface_path}/{interface}/carrier. Error: {e}")
-        return carrier_status
-
     def _get_bmc_info(self):
         """
         nwCableConnection will be default UNKNOWN,
         Until solution to find bmc eth port cable connection status is found.
         """
+        bmcdata = {'ifId': 'ebmc0', 'ipV4Prev': "", 'ipV4': "", 'nwStatus': "DOWN", 'nwCableConnStatus': 'UNKNOWN'}
         try:
-            bmcdata = {'ifId': 'ebmc0', 'ipV4Prev': "", 'ipV4': "", 'nwStatus': "DOWN", 'nwCableConnStatus': 'UNKNOWN'}
-            ipdata = sp.Popen("sudo ipmitool lan print", shell=True, stdout=sp.PIPE, stderr=sp.PIPE).communicate()[0].decode().strip()
-            bmcip = re.findall("\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}", ipdata)
+            bmcip, reachable = self.nw_status.get_bmc_status(timeout=5)
             if bmcip:
-                bmcip = bmcip[0]
-                pingbmchost = "ping -c1 -W1 -q "+bmcip
-                child = sp.Popen(pingbmchost.split(), stdout=sp.PIPE)
-                streamdata = child.communicate()[0] #child must be communicated before fetching return code.
-                retcode = child.returncode
                 if self.prev_bmcip is not None and self.prev_bmcip != bmcip:
                     bmcdata['ipV4Prev'] = self.prev_bmcip
                     bmcdata['ipV4'] = bmcip
                     self.prev_bmcip = bmcip
                 else:
                     self.prev_bmcip = bmcdata['ipV4Prev'] = bmcdata['ipV4'] = bmcip
-                if retcode == 0:
+                if reachable:
                     bmcdata['nwStatus'] = "UP"
-                else:
-                    logger.warn("BMC Host:{0} is not reachable".format(bmcip))
         except Exception as e:
             logger.error("Exception occurs while fetching bmc_info:{}".format(e))
         return bmcdata
@@ -305,39 +289,3 @@ class NodeData(Debug):
         self.total_space = int(psutil.disk_usage("/")[0])//int(self.units_factor)
         self.free_space  = int(psutil.disk_usage("/")[2])//int(self.units_factor)
         self.disk_used_percentage  = psutil.disk_usage("/")[3]
-
-    def _load_1min_avg(self):
-        """Loop forever calculating the one minute average load"""
-        # Initialize list to -1 indicating the time interval has not occurred yet
-        index = 0
-        while index < self.cpus:
-            self.load_1min_average.append(-1)
-            index += 1
-
-        while True:
-            # API call blocks for one minute and then returns the value
-            self.load_1min_average = psutil.cpu_percent(interval=1, percpu=True)
-
-    def _load_5min_avg(self):
-        """Loop forever calculating the five minute average load"""
-        # Initialize list to -1 indicating the time interval has not occurred yet
-        index = 0
-        while index < self.cpus:
-            self.load_5min_average.append(-1)
-            index += 1
-
-        while True:
-            # API call blocks for five minutes and then returns the value
-            self.load_5min_average = psutil.cpu_percent(interval=5, percpu=True)
-
-    def _load_15min_avg(self):
-        """Loop forever calculating the fifteen minute average load"""
-        # Initialize list to -1 indicating the time interval has not occurred yet
-        index = 0
-        while index < self.cpus:
-            self.load_15min_average.append(-1)
-            index += 1
-
-        while True:
-            # API call blocks for fifteen minutes and then returns the value
-            self.load_15min_average = psutil.cpu_percent(interval=15, percpu=True)
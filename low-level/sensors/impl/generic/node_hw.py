@@ -20,7 +20,7 @@
 """
 
 import calendar
-import json
+import functools
 import os
 import re
 import subprocess
@@ -84,6 +84,7 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME = "NodeHWsensor"
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
 
     sel_event_info = ""
@@ -118,6 +119,9 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
     UPDATE_ONLY_MODE   = "r+"
 
     IPMI_SDR_ERR = "command failed"
+    # 'sdr elist' status of a sensor crossing a critical, non-critical or
+    # non-recoverable threshold
+    SDR_THRESHOLD_FAULT_STATUS = ("cr", "nc", "nr")
 
     CHANNEL_INFO = {}
 
@@ -139,6 +143,14 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
     POLLING_INTERVAL = "polling_interval"
     DEFAULT_POLLING_INTERVAL = "30"
+    # Number of latest SEL entries fetched to find the new ones,
+    # 0 lists the whole SEL on every poll
+    SEL_FETCH_WINDOW = "sel_fetch_window"
+    DEFAULT_SEL_FETCH_WINDOW = 32
+    # Above this many entries the whole SEL is listed
+    SEL_MAX_FETCH_WINDOW = 2048
+
+    DEVICE_ID_REGEX = re.compile('(.*) (#0x([0-9a-f]+))?')
 
     IPMITOOL = "sudo ipmitool "
     IPMISIMTOOL = "ipmisimtool "
@@ -180,6 +192,9 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             self.TYPE_CURRENT: self._parse_current_info,
         }
         self.faulty_resources = {}
+        # Index of the newest SEL entry listed, checkpointed once the
+        # listed FRU events are processed
+        self._sel_seen_index = None
 
         # Flag to indicate suspension of module
         self._suspended = False
@@ -194,6 +209,9 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         self.polling_interval = \
             int(Conf.get(SSPL_CONF, f"{NODEHWSENSOR}>{self.POLLING_INTERVAL}",
                          self.DEFAULT_POLLING_INTERVAL))
+        self._sel_fetch_window = \
+            int(Conf.get(SSPL_CONF, f"{NODEHWSENSOR}>{self.SEL_FETCH_WINDOW}",
+                         self.DEFAULT_SEL_FETCH_WINDOW))
 
     def _get_file(self, name):
         if os.path.exists(name):
@@ -309,11 +327,6 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
         return True
 
-    @staticmethod
-    def check_cache_exists(path):
-        exists, _ = store.exists(path)
-        return exists
-
     def get_interface_from_cache(self):
         """Read the data from persistent cache."""
         self.lan_fault = None
@@ -322,24 +335,22 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         # To avoid raising duplicate alerts/to monitor fault_resolved alert
         # after reboot, check if alert already exists for supported
         # interface by reading persistent cache value.
+        cache = store.get_many(
+            [lan_cache_path, system_cache_path, active_bmc_if_cache]) or {}
+        cache = {path: value.decode() if isinstance(value, bytes) else value
+                 for path, value in cache.items()}
         for key in BMCInterface.SUPPORTED_BMC_IF.value:
-            if (key in BMCInterface.LAN_IF.value and
-                    self.check_cache_exists(lan_cache_path)):
-                self.lan_fault = store.get(lan_cache_path)
-                if isinstance(self.lan_fault, bytes):
-                    self.lan_fault = self.lan_fault.decode()
-            elif key == system and self.check_cache_exists(system_cache_path):
-                self.system_fault = store.get(system_cache_path)
-                if isinstance(self.system_fault, bytes):
-                    self.system_fault = self.system_fault.decode()
+            if key in BMCInterface.LAN_IF.value and \
+                    cache.get(lan_cache_path) is not None:
+                self.lan_fault = cache[lan_cache_path]
+            elif key == system and cache.get(system_cache_path) is not None:
+                self.system_fault = cache[system_cache_path]
         # Read BMC active_interface value from cache.
         # In case of lan/lanplus fault, we fallback to system(KCS).
         # If lan_fault="fault" and persistent cache for active_bmc_if exists
         # read active_bmc_if value from cache otherwise read from config.
-        if self.check_cache_exists(active_bmc_if_cache) and self.lan_fault == "fault":
-            self.active_bmc_if = store.get(active_bmc_if_cache)
-            if isinstance(self.active_bmc_if, bytes):
-                self.active_bmc_if = self.active_bmc_if.decode()
+        if cache.get(active_bmc_if_cache) is not None and self.lan_fault == "fault":
+            self.active_bmc_if = cache[active_bmc_if_cache]
         else:
             self.active_bmc_if = self._channel_interface
             store.put(self.active_bmc_if, active_bmc_if_cache)
@@ -367,19 +378,78 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                 self.get_channel_alert(ACTIVE_CHANNEL, self._channel_interface)
 
     def _update_list_file(self):
-        with open(self.list_file_collect_name, self.UPDATE_CREATE_MODE) as f:
-            # make sel list filter only for available frus. no extra data needed
-            # 'Power Supply|Power Unit|Fan|Drive Slot / Bay'
-            f.seek(0)
-            f.truncate()
-            available_fru = '|'.join(self.fru_types.keys())
-            _, err, retcode = self._run_ipmitool_subcommand(
-                    "sel list", grep_args=f"{available_fru}",
-                    out_file=f)
+        last_index = "{0:x}".format(self._read_index_file())
+        sel_lines = None
+        if self._sel_fetch_window > 0 and last_index != "0":
+            sel_lines = self._fetch_new_sel_lines(last_index)
+
+        if sel_lines is None:
+            sel_out, err, retcode = self._run_ipmitool_subcommand("sel list")
             if retcode != 0:
                 msg = f"{self.ipmi_client.ACTIVE_IPMI_TOOL} sel list command failed: {err}"
                 raise Exception(msg)
+            sel_lines = []
+            if not self.channel_err:
+                sel_lines = self._split_sel_lines(sel_out)
+                new_lines = self._sel_lines_after(sel_lines, last_index)
+                # All entries are new if the SEL has been cleared or
+                # rotated beyond the last processed index
+                if new_lines is not None:
+                    sel_lines = new_lines
+
+        if sel_lines:
+            # Checkpoint the newest entry, FRU or not, so that a burst of
+            # other events does not push the last processed index out of
+            # the fetch window
+            self._sel_seen_index = sel_lines[-1].split("|")[0].strip()
+
+        # make sel list filter only for available frus. no extra data needed
+        # 'Power Supply|Power Unit|Fan|Drive Slot / Bay'
+        available_fru = re.compile('|'.join(self.fru_types.keys()))
+        with open(self.list_file_collect_name, self.UPDATE_CREATE_MODE) as f:
+            f.seek(0)
+            f.truncate()
+            f.write("".join(f"{line}\n" for line in sel_lines
+                            if available_fru.search(line)))
+
+        self._replace_list_file()
+
+    def _fetch_new_sel_lines(self, last_index):
+        """Returns the SEL entries after last_index, fetching the latest
+           entries with 'sel list last N' and doubling N until last_index
+           is part of them. Returns None if the whole SEL has to be listed
+           instead."""
+        window = self._sel_fetch_window
+        while window <= self.SEL_MAX_FETCH_WINDOW:
+            sel_out, _, retcode = self._run_ipmitool_subcommand(
+                f"sel list last {window}")
+            if retcode != 0 or self.channel_err:
+                return None
+            sel_lines = self._split_sel_lines(sel_out)
+            new_lines = self._sel_lines_after(sel_lines, last_index)
+            if new_lines is not None:
+                return new_lines
+            if len(sel_lines) < window:
+                # The whole SEL was fetched without finding the last index,
+                # it has been cleared or rotated
+                return None
+            window *= 2
+        return None
 
+    @staticmethod
+    def _split_sel_lines(sel_out):
+        return [line for line in sel_out.split("\n") if line.strip()]
+
+    @staticmethod
+    def _sel_lines_after(sel_lines, index):
+        """Returns the entries after the one with the given index,
+           None if it is not listed"""
+        for pos, line in enumerate(sel_lines):
+            if line.split("|")[0].strip() == index:
+                return sel_lines[pos + 1:]
+        return None
+
+    def _replace_list_file(self):
         # os.rename() is required to be atomic on POSIX,
         # (from here: https://docs.python.org/2/library/os.html#os.rename)
         # which means that even if the current python process crashes
@@ -523,8 +593,19 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
         # Copying object to avoid RuntimeError: dictionary changed size during iteration
         faulty_res = self.faulty_resources.copy()
-        for sensor_id in faulty_res:
-            dynamic, static = self._get_sensor_sdr_props(sensor_id)
+        if not faulty_res:
+            return
+
+        # A single 'sdr elist' tells which threshold sensors are still
+        # crossing a threshold, only the others need their SDR checked
+        sdr_map = self._get_sdr_map() or {}
+        sensor_ids = [sensor_id for sensor_id in faulty_res
+            if sdr_map.get(sensor_id, (None, None))[1] not in
+                self.SDR_THRESHOLD_FAULT_STATUS]
+        sdr_props = self._get_sensors_sdr_props(sensor_ids)
+
+        for sensor_id in sensor_ids:
+            dynamic, static = sdr_props.get(sensor_id) or (None, None)
             if dynamic and 'States Asserted' in dynamic:
                 #  'States Asserted': 'Power Supply, Presence detected'
                 resource_state = re.sub(',  +', ', ', re.sub('[\[\]]','',
@@ -570,30 +651,26 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                 sel_event: {(index, date, event_time, device_id, device_type, sensor_num, event, status)}, ignoring event")
 
     def _get_sel_event(self):
-        last_index = self._read_index_file()
+        """Returns the events listed after the last processed index.
 
-        # TODO: See if the following 2 loops can be reduced to
-        # a single loop using mmap() and a fixed file format like
-        # the one produced by the 'ipmitool sel file' or
-        # 'ipmitool sel writeraw' commands.
-        found = False
+        All the listed events are returned if the index is not found. This
+        can mean one of a few things:
+        1. The SEL has been cleared beyond the last index we saw
+        2. It has rotated to beyond the last index we saw
+        3. self.list_file is empty
+        """
+        last_index = "{0:x}".format(self._read_index_file())
+
+        new_lines = []
         self.list_file.seek(0, os.SEEK_SET)
         for line in self.list_file:
-            if not found:
-                if line.split("|")[0].strip() == "{0:x}".format(last_index):
-                    found = True
-                continue
-
-            yield self._make_sel_event(line)
+            if line.split("|", 1)[0].strip() == last_index:
+                # Lines up to the last processed index were seen before
+                new_lines.clear()
+            else:
+                new_lines.append(line)
 
-        if not found:
-            # This can mean one of a few things:
-            # 1. The SEL has been cleared beyond the last index we saw
-            # 2. It has rotated to beyond the last index we saw
-            # 3. self.list_file is empty
-            self.list_file.seek(0, os.SEEK_SET)
-            for line in self.list_file:
-                yield self._make_sel_event(line)
+        return [self._make_sel_event(line) for line in new_lines]
 
     def _make_sel_event(self, sel_line):
         # Separate out the components of the sel event
@@ -606,10 +683,11 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         return (index, date, _time, device_id, device_type, sensor_num, event, status)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _get_device_type_num(device_id):
         try:
-            device_type, sensor_num = re.match(
-                    '(.*) (#0x([0-9a-f]+))?', device_id).group(1, 3)
+            device_type, sensor_num = NodeHWsensor.DEVICE_ID_REGEX.match(
+                    device_id).group(1, 3)
         except:
             # If device_type and sensor_num is not found in device_id
             device_type = device_id
@@ -621,15 +699,18 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         """See if there is any new event gets generated in the sel and notify
             node data message handler for generating JSON message"""
 
+        # Parse the list file once
+        sel_events = self._get_sel_event()
+
         last_fru_index = {}
         last_index = None
         for (index, date, event_time, device_id, device_type, sensor_num, event, status) \
-                in self._get_sel_event():
+                in sel_events:
             last_fru_index[device_type] = index
             last_index = index
 
         for (index, date, event_time, device_id, device_type, sensor_num, event, status) \
-                in self._get_sel_event():
+                in sel_events:
 
             is_last = (last_fru_index[device_type] == index)
             logger.debug(f"_notify_NodeDataMsgHandler '{device_type}': is_last: \
@@ -647,6 +728,9 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                     logger.error(f"_notify_NodeDataMsgHandler, error {e} while processing \
                         sel_event: {(index, date, event_time, device_id, device_type, sensor_num, event, status)}, ignoring event")
 
+        if self._sel_seen_index is not None:
+            last_index = self._sel_seen_index
+            self._sel_seen_index = None
         if last_index is not None:
             self._write_index_file(last_index)
         self.list_file.seek(0)
@@ -663,7 +747,17 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
 
         res, err, retcode = \
             self.ipmi_client._run_ipmitool_subcommand(subcommand, grep_args)
+        self._check_ipmitool_result(res, err, retcode)
+
+        # write res to out_file only if there is no channel error
+        if not self.channel_err and res:
+            if out_file != subprocess.PIPE:
+                out_file.write(res)
+
+        return res, err, retcode
 
+    def _check_ipmitool_result(self, res, err, retcode):
+        """Raises channel and ipmitool alerts from the result of a command"""
         if self.IPMISIMTOOL in self.ipmi_client.ACTIVE_IPMI_TOOL:
             self.sdr_reset_required = True
 
@@ -694,13 +788,6 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             self.iem.iem_fault_resolved("IPMITOOL_AVAILABLE")
             self.iem.fault_iems.remove(self.IPMI)
 
-        # write res to out_file only if there is no channel error
-        if not self.channel_err and res:
-            if out_file != subprocess.PIPE:
-                out_file.write(res)
-
-        return res, err, retcode
-
     def _check_channel_error(self, err, retcode):
         """Check BMC accessibility for active_interface."""
         logger.debug(f"Current active bmc interface is: {self.active_bmc_if}")
@@ -850,6 +937,37 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             out.append(sensor_id)
         return out
 
+    def _get_sdr_map(self):
+        """Returns the state of all the sensors from a single 'sdr elist'"""
+        sdr_out, err, retcode = self._run_ipmitool_subcommand("sdr elist")
+        if retcode != 0:
+            logger.warn(f"ipmitool sdr elist command failed: {err}")
+            return None
+        return self.ipmi_client.parse_sdr_list(sdr_out)
+
+    def _get_sensors_sdr_props(self, sensor_ids):
+        """Returns {sensor_id: (dynamic, static)} of the sensors from a
+           single 'sdr get'. Sensors missing from its output are read one
+           by one, which reports their error."""
+        if not sensor_ids:
+            return {}
+        props_list_out, err, retcode = self._run_ipmitool_subcommand(
+            "sdr get " + " ".join(f"'{sensor_id}'" for sensor_id in sensor_ids))
+        self._check_ipmitool_result(props_list_out, err, retcode)
+        if retcode != 0:
+            # Records of the sensors found are still printed
+            logger.warn(f"ipmitool sdr get command failed: {err}")
+        records = self.ipmi_client.split_sdr_get(props_list_out)
+        sdr_props = {}
+        for sensor_id in sensor_ids:
+            if sensor_id in records:
+                props = self._parse_sensor_sdr_props(records[sensor_id])
+            else:
+                props = self._get_sensor_sdr_props(sensor_id)
+            if props:
+                sdr_props[sensor_id] = props
+        return sdr_props
+
     def _get_sensor_sdr_props(self, sensor_id):
         props_list_out, err, retcode = \
             self._run_ipmitool_subcommand(f"sdr get '{sensor_id}'")
@@ -857,6 +975,10 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
             msg = f"ipmitool sensor get command failed: {err}"
             logger.warn(msg)
             return
+        return self._parse_sensor_sdr_props(props_list_out)
+
+    def _parse_sensor_sdr_props(self, props_list_out):
+        """Splits 'sdr get' output into (dynamic, static) properties"""
         props_list = props_list_out.split("\n")
 
         static_keys = {}
@@ -1375,7 +1497,7 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
         """Transmit data to NodeDataMsgHandler which takes two arguments.
            device will be device name and data will consist of relevant data"""
 
-        internal_json_msg = json.dumps({
+        internal_json_msg = {
             "sensor_request_type" : {
                 "node_data":{
                     "alert_type": alert_type,
@@ -1386,7 +1508,7 @@ class NodeHWsensor(SensorThread, InternalMsgQ):
                     "specific_info": specific_info
                 }
             }
-          })
+          }
 
         # Send the event to node data message handler to generate json message and send out
         self._write_internal_msgQ(NodeDataMsgHandler.name(), internal_json_msg)
@@ -18,7 +18,6 @@ Sensor Module Thread responsible for sensing RAM memory faults on the Node serve
 
 """
 
-import json
 import os
 import time
 import uuid
@@ -231,8 +230,7 @@ class MemFaultSensor(SensorThread, InternalMsgQ):
             "description": description
             }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "node_data": {
                     "status": "update",
                     "host_id": host_name,
@@ -242,7 +240,7 @@ class MemFaultSensor(SensorThread, InternalMsgQ):
                     "info": info,
                     "specific_info": alert_specific_info
                     }
-            }})
+            }}
 
         return internal_json_msg
 
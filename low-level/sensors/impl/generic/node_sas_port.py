@@ -19,7 +19,6 @@ on the Node server
 """
 
 import errno
-import json
 import os
 import time
 import uuid
@@ -71,6 +70,7 @@ class SASPortSensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME = "SASPortSensor"
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
     RESOURCE_TYPE = "node:interface:sas"
 
     # section in the configuration store
@@ -463,8 +463,7 @@ class SASPortSensor(SensorThread, InternalMsgQ):
                     "description": description
                     }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "node_data": {
                         "status": "update",
                         "host_id": host_name,
@@ -474,7 +473,7 @@ class SASPortSensor(SensorThread, InternalMsgQ):
                         "info": info,
                         "specific_info": alert_specific_info
                     }
-            }})
+            }}
 
         return internal_json_msg
 
@@ -19,9 +19,7 @@
                     the node_data_msg_handler when a change is detected
  ****************************************************************************
 """
-import json
 import os
-import subprocess
 import time
 import uuid
 
@@ -35,6 +33,7 @@ from framework.utils.conf_utils import (GLOBAL_CONF, SSPL_CONF, Conf,
 from framework.utils.service_logging import logger
 from framework.utils.severity_reader import SeverityReader
 from framework.utils.os_utils import OSUtils
+from framework.utils.md_raid import MdRaid
 # Modules that receive messages from this module
 from message_handlers.node_data_msg_handler import NodeDataMsgHandler
 from sensors.Iraid import IRAIDsensor
@@ -49,6 +48,7 @@ class RAIDsensor(SensorThread, InternalMsgQ):
 
     SENSOR_NAME       = "RAIDsensor"
     PRIORITY          = 1
+    RUN_ON_CORE_WORKERS = True
     RESOURCE_TYPE     = "node:os:raid_data"
 
     # Section and keys in configuration file
@@ -117,6 +117,10 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         # The mdX status line in the status file
         self._RAID_status = {}
 
+        # Arrays as read from sysfs, shared with the other RAID modules
+        self._md_raid = MdRaid.get_instance()
+        self._raid_snapshot = {}
+
         self._faulty_drive_list = {}
 
         self._faulty_device_list = set()
@@ -214,8 +218,19 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         with open(self._RAID_status_file, "r") as datafile:
             status = datafile.read()
 
-        # Do nothing if the RAID status file has not changed
-        if self._RAID_status_contents == status:
+        # Member roles and states, e.g. a member faulty in sysfs but not
+        # yet in mdstat
+        try:
+            snapshot, _ = self._md_raid.refresh()
+        except Exception as err:
+            logger.warn(f"_notify_NodeDataMsgHandler, failed to read RAID arrays: {err}")
+            snapshot = self._raid_snapshot
+        events = MdRaid.diff(self._raid_snapshot, snapshot) \
+            if self._raid_snapshot else []
+        self._raid_snapshot = snapshot
+
+        # Do nothing if the RAID status file and arrays have not changed
+        if self._RAID_status_contents == status and not events:
             self._log_debug(f"_notify_NodeDataMsgHandler status unchanged, ignoring: {status}")
             return
 
@@ -339,19 +354,17 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         first_bracket_index = field.find('[')
 
         # Parse out the drive path
-        drive_path = f"/dev/{field[: first_bracket_index]}"
-
-        # Parse out the drive index into [UU] status which is Device Role field
-        detail_command = f"/usr/sbin/mdadm --examine {drive_path} | grep 'Device Role'"
-        response, error = self._run_command(detail_command)
-
-        if error:
-            self._log_debug(f"_add_drive, Error retrieving drive index into status, example: [U_]: {str(error)}")
-        try:
-            drive_index = int(response.split(" ")[-1])
-        except Exception as ae:
-            self._log_debug(f"_add_drive, get drive_index error: {str(ae)}")
+        drive_name = field[: first_bracket_index]
+        drive_path = f"/dev/{drive_name}"
+
+        # The drive index into [UU] status is its slot in the array
+        array = self._raid_snapshot.get(os.path.basename(device))
+        member = next((member for member in array.members
+                       if member.name == drive_name), None) if array else None
+        if member is None or member.slot is None:
+            self._log_debug(f"_add_drive, no slot in {device} for {drive_path}")
             return
+        drive_index = member.slot
         self._log_debug(f"_add_drive, drive index: {drive_index}, path: {drive_path}")
 
         # Create the json msg, serial number will be filled in by NodeDataMsgHandler
@@ -372,7 +385,8 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         if first_bracket_index == -1:
             return False
 
-        self._total_drives[device] = int(status_line[first_bracket_index + 1])
+        self._total_drives[device] = int(status_line[first_bracket_index + 1:
+            status_line.index("/", first_bracket_index)])
         self._log_debug("_parse_raid_status, total_drives: %d" % self._total_drives[device])
 
         # Break the line apart into separate fields
@@ -509,8 +523,7 @@ class RAIDsensor(SensorThread, InternalMsgQ):
             "drives": drives
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type" : {
+        internal_json_msg = {"sensor_request_type" : {
                 "node_data": {
                     "status": "update",
                     "sensor_type" : "node:os:raid_data",
@@ -522,7 +535,7 @@ class RAIDsensor(SensorThread, InternalMsgQ):
                     "specific_info": specific_info
                     }
                 }
-            })
+            }
         self.prev_alert_type[device] = alert_type
         self.alert_type = None
 
@@ -560,19 +573,6 @@ class RAIDsensor(SensorThread, InternalMsgQ):
         super(RAIDsensor, self).resume()
         self._suspended = False
 
-    def _run_command(self, command):
-        """Run the command and get the response and error returned"""
-        self._log_debug(f"_run_command: {command}")
-        process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        response, error = process.communicate()
-
-        if response:
-            self._log_debug(f"_run_command, response: {str(response)}")
-        if error:
-            self._log_debug(f"_run_command: error: {str(error)}")
-
-        return response.decode().rstrip('\n'), error.decode().rstrip('\n')
-
     def _get_RAID_status_file(self):
         """Retrieves the file containing the RAID status information"""
         return Conf.get(SSPL_CONF, f"{self.RAIDSENSOR}>{self.RAID_STATUS_FILE}",
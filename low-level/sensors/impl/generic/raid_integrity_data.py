@@ -18,7 +18,6 @@
   Description:       Validates raid data for data corruption.
  ****************************************************************************
 """
-import json
 import os
 import subprocess
 import time
@@ -37,6 +36,7 @@ from framework.utils.conf_utils import (SSPL_CONF, Conf, SYSTEM_INFORMATION,
 from framework.utils.service_logging import logger
 from framework.utils.severity_reader import SeverityReader
 from framework.utils.os_utils import OSUtils
+from framework.utils.md_raid import MdRaid
 # Modules that receive messages from this module
 from message_handlers.node_data_msg_handler import NodeDataMsgHandler
 from sensors.Iraid import IRAIDsensor
@@ -91,6 +91,7 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
                                          self.PRIORITY)
         self._cache_state = None
         self.os_utils = OSUtils()
+        self._md_raid = None
 
     def initialize(self, conf_reader, msgQlist, product):
         """initialize configuration reader and internal msg queues"""
@@ -117,6 +118,7 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
         sysfs_path = Conf.get(SSPL_CONF,
                               f'{SYSTEM_INFORMATION}>{SYSFS_PATH}')
         self.raid_dir = sysfs_path + BLOCK_DIR
+        self._md_raid = MdRaid.get_instance()
 
         self.retry_interval = int(
             Conf.get(SSPL_CONF,
@@ -227,14 +229,9 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
 
     def _get_devices(self):
         try:
-            mdstat_file = RaidDataConfig.MDSTAT_FILE.value
-            with open (mdstat_file, 'r') as fp:
-                content = fp.readlines()
-            device_array = []
-            for line in content:
-                if "active" in line:
-                    device = line.split(":")[0].rstrip()
-                    device_array.append(device)
+            snapshot, _ = self._md_raid.refresh()
+            device_array = [name for name, array in snapshot.items()
+                            if array.state == "active"]
             if len(device_array) == 0:
                 logger.error("No RAID device found in mdstat file.")
             return device_array
@@ -245,14 +242,13 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
         try:
             status = None
             mismatch_cnt_file = RaidDataConfig.MISMATCH_COUNT_FILE.value
-            MISMATCH_COUNT_COMMAND = 'cat ' + self.raid_dir + device +\
-                                     mismatch_cnt_file
-            logger.debug('Executing MISMATCH_CNT_COMMAND:{}'
-                         .format(MISMATCH_COUNT_COMMAND))
-            response, error = self._run_command(MISMATCH_COUNT_COMMAND)
-            if error:
-                logger.error("Error in cmd{} in raid health monitor"
-                            .format(MISMATCH_COUNT_COMMAND))
+            array = self._md_raid.get_array(device)
+            response = None
+            if array is None or array.mismatch_cnt is None:
+                logger.error("Failed to read {} of {} in raid health monitor"
+                            .format(mismatch_cnt_file, device))
+            else:
+                response = str(array.mismatch_cnt)
             if response == RaidDataConfig.MISMATCH_COUNT_RESPONSE.value:
                 logger.debug("No mismatch count is found")
                 status = "success"
@@ -291,16 +287,13 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
             sync_action_file = RaidDataConfig.SYNC_ACTION_FILE.value
             while raid_check <= RaidDataConfig.MAX_RETRIES.value:
                 self.output_file = self._get_unique_filename(RaidDataConfig.RAID_RESULT_FILE_PATH.value, device)
-                STATE_COMMAND = 'cat ' + self.raid_dir + device +\
-                                sync_action_file
-                logger.debug('Executing STATE_COMMAND:{}'.format(STATE_COMMAND))
-                response, error = self._run_command(STATE_COMMAND)
-                if error:
-                    logger.warn("Error in cmd{} in raid health monitor"
-                                .format(STATE_COMMAND))
+                array = self._md_raid.get_array(device)
+                if array is None or array.sync_action is None:
+                    logger.warn("Failed to read {} of {} in raid health monitor"
+                                .format(sync_action_file, device))
                     raid_check += 1
                 else:
-                    if response == RaidDataConfig.STATE_COMMAND_RESPONSE.value:
+                    if array.sync_action == RaidDataConfig.STATE_COMMAND_RESPONSE.value:
                         status = "success"
                         with open(self.output_file, 'w') as raid_file:
                             raid_file.write(RaidDataConfig.STATE_COMMAND_RESPONSE.value + "\n")
@@ -373,8 +366,7 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
             "error": error_msg
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type" : {
+        internal_json_msg = {"sensor_request_type" : {
                 "node_data": {
                     "status": "update",
                     "sensor_type" : "node:os:raid_integrity",
@@ -386,7 +378,7 @@ class RAIDIntegritySensor(SensorThread, InternalMsgQ):
                     "specific_info": specific_info
                     }
                 }
-            })
+            }
         self.alert_type = None
 
         # Send the event to node data message handler to generate json message and send out
@@ -18,7 +18,6 @@
   Description:       Monitors Controller data using RealStor API.
  ****************************************************************************
 """
-import json
 import os
 import time
 import uuid
@@ -58,6 +57,7 @@ class RealStorControllerSensor(SensorThread, InternalMsgQ):
     RESOURCE_TYPE = "enclosure:hw:controller"
 
     PRIORITY          = 1
+    RUN_ON_CORE_WORKERS = True
 
     # Controllers directory name
     CONTROLLERS_DIR = "controllers"
@@ -165,26 +165,11 @@ class RealStorControllerSensor(SensorThread, InternalMsgQ):
                 self._priority, self.run, ())
 
     def _get_controllers(self):
-        """Receives list of Controllers from API.
+        """Receives list of Controllers from the enclosure snapshot.
            URL: http://<host>/api/show/controllers
         """
-        url = self.rssencl.build_url(self.rssencl.URI_CLIAPI_SHOWCONTROLLERS)
-
-        response = self.rssencl.ws_request(url, self.rssencl.ws.HTTP_GET)
-
-        if not response:
-            logger.warn(f"{self.rssencl.LDR_R1_ENCL}:: Controllers status unavailable as ws request {url}")
-            return
-
-        if response.status_code != self.rssencl.ws.HTTP_OK:
-            if url.find(self.rssencl.ws.LOOPBACK) == -1:
-                raise Exception(f"{self.rssencl.LDR_R1_ENCL}:: http request {url} "
-                                f"to get controllers failed with err {response.status_code}")
-            return
-
-        response_data = json.loads(response.text)
-        controllers = response_data.get("controllers")
-        return controllers
+        return self.rssencl.snapshots.get_fru("controllers",
+                                              self.pollfreq_controllersensor)
 
     def _get_msgs_for_faulty_controllers(self, controllers, send_message=True):
         """Checks for health of controllers and returns list of messages to be
@@ -316,8 +301,7 @@ class RealStorControllerSensor(SensorThread, InternalMsgQ):
                 "event_time": epoch_time
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                     "host_id": host_name,
                     "severity": severity,
@@ -327,7 +311,7 @@ class RealStorControllerSensor(SensorThread, InternalMsgQ):
                     "info": info,
                     "specific_info": controller_detail
                 }
-            }})
+            }}
 
         return internal_json_msg
 
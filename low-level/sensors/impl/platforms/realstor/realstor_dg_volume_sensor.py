@@ -53,6 +53,7 @@ class RealStorLogicalVolumeSensor(SensorThread, InternalMsgQ):
     RESOURCE_TYPE_DG = "enclosure:cortx:disk_group"
 
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
     # Dependency list
     DEPENDENCIES = {
@@ -234,26 +235,11 @@ class RealStorLogicalVolumeSensor(SensorThread, InternalMsgQ):
                 self._priority, self.run, ())
 
     def _get_disk_groups(self):
-        """Receives list of Disk Groups from API.
+        """Receives list of Disk Groups from the enclosure snapshot.
            URL: http://<host>/api/show/disk-groups
         """
-        url = self.rssencl.build_url(self.rssencl.URI_CLIAPI_SHOWDISKGROUPS)
-
-        response = self.rssencl.ws_request(url, self.rssencl.ws.HTTP_GET)
-
-        if not response:
-            logger.warn(f"{self.rssencl.LDR_R1_ENCL}:: Disk Groups status unavailable as ws request {url} failed")
-            return
-
-        if response.status_code != self.rssencl.ws.HTTP_OK:
-            if url.find(self.rssencl.ws.LOOPBACK) == -1:
-                raise Exception(f"{self.rssencl.LDR_R1_ENCL}:: http request {url} "
-                                f"to get disk groups failed with err {response.status_code}")
-            return
-
-        response_data = json.loads(response.text)
-        disk_groups = response_data.get("disk-groups")
-        return disk_groups
+        return self.rssencl.snapshots.get_fru("disk-groups",
+            self.pollfreq_DG_logical_volume_sensor)
 
     def _get_logical_volumes(self, pool_serial_number):
         """Receives list of Logical Volumes from API.
@@ -458,8 +444,7 @@ class RealStorLogicalVolumeSensor(SensorThread, InternalMsgQ):
                 "event_time": epoch_time
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                     "host_id": host_name,
                     "severity": severity,
@@ -469,7 +454,7 @@ class RealStorLogicalVolumeSensor(SensorThread, InternalMsgQ):
                     "info": info,
                     "specific_info": generic_info
                 }
-            }})
+            }}
         return internal_json_msg
 
     def _create_internal_msg_dg(self, alert_type, disk_group_detail):
@@ -509,8 +494,7 @@ class RealStorLogicalVolumeSensor(SensorThread, InternalMsgQ):
                 "event_time": epoch_time
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                     "host_id": host_name,
                     "severity": severity,
@@ -520,7 +504,7 @@ class RealStorLogicalVolumeSensor(SensorThread, InternalMsgQ):
                     "info": info,
                     "specific_info": generic_info
                 }
-            }})
+            }}
         return internal_json_msg
 
     def _get_alert_id(self, epoch_time):
@@ -54,6 +54,7 @@ class RealStorDiskSensor(SensorThread, InternalMsgQ):
     RESOURCE_TYPE = "enclosure:hw:disk"
 
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
     RSS_DISK_GET_ALL = "all"
 
@@ -291,18 +292,21 @@ class RealStorDiskSensor(SensorThread, InternalMsgQ):
 
         return
 
-    def rss_cliapi_poll_disks(self, disk):
-        """Retreive realstor disk info using cli api /show/disks"""
+    def _get_drives(self, disk):
+        """Retreive realstor disk info using cli api /show/disks, all the
+           disks from the enclosure snapshot"""
+
+        if disk == self.RSS_DISK_GET_ALL:
+            return self.rssencl.snapshots.get_fru("drives",
+                                                  self.pollfreq_disksensor)
 
         # make ws request
         url = self.rssencl.build_url(
                   self.rssencl.URI_CLIAPI_SHOWDISKS)
 
-        if(disk != self.RSS_DISK_GET_ALL):
-           diskId = disk.partition("0.")[2]
-
-           if(diskId.isdigit()):
-               url = f"{url}/{disk}"
+        diskId = disk.partition("0.")[2]
+        if(diskId.isdigit()):
+            url = f"{url}/{disk}"
         url = f"{url}/detail"
 
         response = self.rssencl.ws_request(
@@ -322,71 +326,76 @@ class RealStorDiskSensor(SensorThread, InternalMsgQ):
             jresponse = json.loads(response.content)
         except ValueError as badjson:
             logger.error(f"{url} returned mal-formed json:\n{badjson}")
+            return
 
-        if jresponse:
-            api_resp = self.rssencl.get_api_status(jresponse['status'])
-            #logger.debug("%s api response:%d" % (url.format(),api_resp))
-
-            if ((api_resp == -1) and
-                   (response.status_code == self.rssencl.ws.HTTP_OK)):
-                logger.warn("/show/disks api response unavailable, "
-                    "marking success as http code is 200")
-                api_resp = 0
-
-            if api_resp == 0:
-                drives = jresponse['drives']
-
-                # reset latest drive cache to build new
-                self.latest_disks = {}
-                self.invalidate_latest_disks_info = False
-
-                for drive in drives:
-                    slot = drive.get("slot", -1)
-                    sn = drive.get("serial-number", "NA")
-                    health = drive.get("health", "NA")
-
-                    if slot != -1:
-                        self.latest_disks[slot] = {"serial-number":sn, "health":health}
-
-                        #dump drive data to persistent cache
-                        dcache_path = f"{self.disks_prcache}disk_{slot}.json"
-
-                        # If drive is replaced, previous drive info needs
-                        # to be retained in disk_<slot>.json.prev file and
-                        # then only dump new data to disk_<slot>.json
-                        path_exists, ret_val = store.exists(dcache_path)
-                        if path_exists and ret_val == "Success":
-                            prevdrive = store.get(dcache_path)
-
-                            if prevdrive is not None:
-                                prevsn = prevdrive.get("serial-number","NA")
-                                prevhealth = prevdrive.get("health", "NA")
-
-                                if prevsn != sn or prevhealth != health:
-                                    # Rename path
-                                    store.put(store.get(dcache_path), dcache_path + ".prev")
-                                    store.delete(dcache_path)
+        api_resp = self.rssencl.get_api_status(jresponse['status'])
+        if api_resp == -1:
+            logger.warn("/show/disks api response unavailable, "
+                "marking success as http code is 200")
+            api_resp = 0
+        if api_resp != 0:
+            return
+        return jresponse['drives']
 
-                                    store.put(drive, dcache_path)
-                        elif not path_exists and ret_val == "Success":
-                            store.put(drive, dcache_path)
-                        else:
-                            # Invalidate latest disks info if persistence store error encountered
-                            logger.warn(f"store.exists {dcache_path} return value {ret_val}")
-                            self.invalidate_latest_disks_info = True
-                            break
+    def rss_cliapi_poll_disks(self, disk):
+        """Retreive realstor disk info using cli api /show/disks"""
 
-                if self.invalidate_latest_disks_info is True:
-                    # Reset latest disks info
-                    self.latest_disks = {}
+        drives = self._get_drives(disk)
+        if drives is None:
+            return
 
-            #If no in-memory cache, build from persistent cache
-            if not self.memcache_disks:
-                self._rss_build_disk_cache_from_persistent_cache()
+        # reset latest drive cache to build new
+        self.latest_disks = {}
+        self.invalidate_latest_disks_info = False
+
+        # Read the cached data of all the drives at once
+        cache_paths = [f"{self.disks_prcache}disk_{drive['slot']}.json"
+            for drive in drives if drive.get("slot", -1) != -1]
+        cached_drives = store.get_many(cache_paths)
+        if cached_drives is None:
+            # Invalidate latest disks info if persistence store error encountered
+            logger.warn(f"store.get_many {self.disks_prcache} failed")
+            self.invalidate_latest_disks_info = True
+            drives = []
+        updated_drives = {}
+
+        for drive in drives:
+            slot = drive.get("slot", -1)
+            sn = drive.get("serial-number", "NA")
+            health = drive.get("health", "NA")
+
+            if slot != -1:
+                self.latest_disks[slot] = {"serial-number":sn, "health":health}
+
+                #dump drive data to persistent cache
+                dcache_path = f"{self.disks_prcache}disk_{slot}.json"
+
+                # If drive is replaced, previous drive info needs
+                # to be retained in disk_<slot>.json.prev file and
+                # then only dump new data to disk_<slot>.json
+                prevdrive = cached_drives.get(dcache_path)
+                if prevdrive is None:
+                    updated_drives[dcache_path] = drive
+                elif prevdrive.get("serial-number", "NA") != sn or \
+                        prevdrive.get("health", "NA") != health:
+                    updated_drives[dcache_path + ".prev"] = prevdrive
+                    updated_drives[dcache_path] = drive
+
+        if updated_drives and not store.put_many(updated_drives):
+            logger.warn(f"store.put_many {self.disks_prcache} failed")
+            self.invalidate_latest_disks_info = True
+
+        if self.invalidate_latest_disks_info is True:
+            # Reset latest disks info
+            self.latest_disks = {}
+
+        #If no in-memory cache, build from persistent cache
+        if not self.memcache_disks:
+            self._rss_build_disk_cache_from_persistent_cache()
 
-            # if no memory cache still
-            if not self.memcache_disks:
-                self.memcache_disks = self.latest_disks
+        # if no memory cache still
+        if not self.memcache_disks:
+            self.memcache_disks = self.latest_disks
 
 
     def _rss_build_disk_cache_from_persistent_cache(self):
@@ -398,22 +407,25 @@ class RealStorDiskSensor(SensorThread, InternalMsgQ):
             logger.debug("No files in Disk cache folder, ignoring")
             return
 
-        for filename in files:
-            if filename.startswith('disk_') and filename.endswith('.json'):
-                if f"{filename}.prev" in files:
-                    filename = f"{filename}.prev"
-                drive = store.get(self.disks_prcache + filename)
-                slotstr = re.findall("disk_(\d+).json", filename)[0]
+        filenames = [f"{filename}.prev" if f"{filename}.prev" in files
+                     else filename for filename in files
+                     if filename.startswith('disk_') and filename.endswith('.json')]
+        cached_drives = store.get_many(
+            [self.disks_prcache + filename for filename in filenames]) or {}
+
+        for filename in filenames:
+            drive = cached_drives.get(self.disks_prcache + filename)
+            slotstr = re.findall("disk_(\d+).json", filename)[0]
 
-                if not slotstr.isdigit():
-                    logger.debug(f"slot {slotstr} not numeric, ignoring")
-                    continue
+            if not slotstr.isdigit():
+                logger.debug(f"slot {slotstr} not numeric, ignoring")
+                continue
 
-                slot = int(slotstr)
+            slot = int(slotstr)
 
-                if drive :
-                    sn = drive.get("serial-number","NA")
-                    self.memcache_disks[slot] = {"serial-number":sn}
+            if drive :
+                sn = drive.get("serial-number","NA")
+                self.memcache_disks[slot] = {"serial-number":sn}
 
         #logger.debug("Disk cache built from persistent cache {0}".
         #    format(self.memcache_disks))
@@ -515,8 +527,7 @@ class RealStorDiskSensor(SensorThread, InternalMsgQ):
                 specific_info[k] = "N/A"
 
 
-        json_msg = json.dumps(
-            {"sensor_request_type" : {
+        json_msg = {"sensor_request_type" : {
                 "enclosure_alert" : {
                     "status": "update",
                     "host_id": host_name,
@@ -526,7 +537,7 @@ class RealStorDiskSensor(SensorThread, InternalMsgQ):
                     "info": info,
                     "specific_info": specific_info
                 },
-            }})
+            }}
 
         return json_msg
 
@@ -62,6 +62,7 @@ class RealStorEnclosureSensor(SensorThread, InternalMsgQ):
                             "Management Controller configuration parameters were set"]
 
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
     alert_type = None
     previous_alert_type = None
@@ -226,8 +227,7 @@ class RealStorEnclosureSensor(SensorThread, InternalMsgQ):
                 "description": encl_status
             }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                     "host_id": host_name,
                     "severity": severity,
@@ -239,7 +239,7 @@ class RealStorEnclosureSensor(SensorThread, InternalMsgQ):
                         "event": encl_status
                         }
                     }
-                }})
+                }}
 
         self.previous_alert_type = alert_type
         self._write_internal_msgQ(RealStorEnclMsgHandler.name(), internal_json_msg)
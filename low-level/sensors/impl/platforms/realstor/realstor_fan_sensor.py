@@ -18,7 +18,6 @@
   Description:       Monitors FAN data using RealStor API
   ****************************************************************************
 """
-import json
 import os
 import re
 import time
@@ -51,6 +50,7 @@ class RealStorFanSensor(SensorThread, InternalMsgQ):
     RESOURCE_TYPE = "enclosure:hw:fan"
 
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
     # Fan Modules directory name
     FAN_MODULES_DIR = "fanmodules"
@@ -225,28 +225,10 @@ class RealStorFanSensor(SensorThread, InternalMsgQ):
         return bool(re.search(not_installed_health_string, health_reason))
 
     def _get_fan_modules_list(self):
-        """Returns fan module list using API /show/fan-modules"""
-
-        url = self.rssencl.build_url(
-                  self.rssencl.URI_CLIAPI_SHOWFANMODULES)
-
-        response = self.rssencl.ws_request(
-                        url, self.rssencl.ws.HTTP_GET)
-
-        if not response:
-            logger.warn(f"{self.rssencl.LDR_R1_ENCL}:: Fan-modules status unavailable as ws request {url} failed")
-            return
-
-        if response.status_code != self.rssencl.ws.HTTP_OK:
-            if url.find(self.rssencl.ws.LOOPBACK) == -1:
-                raise Exception(f"{self.rssencl.LDR_R1_ENCL}:: http request {url} "
-                                f"to get fan-modules failed with http err {response.status_code}")
-            return
-
-        response_data = json.loads(response.text)
-
-        fan_modules_list = response_data["fan-modules"]
-        return fan_modules_list
+        """Returns fan module list of the enclosure snapshot, from API
+           /show/fan-modules"""
+        return self.rssencl.snapshots.get_fru("fan-modules",
+                                              self.pollfreq_fansensor)
 
     def _get_fan_attributes(self, fan_module):
         """Returns individual fan attributes from each fan-module"""
@@ -306,8 +288,7 @@ class RealStorFanSensor(SensorThread, InternalMsgQ):
 
         # Creates internal json message request structure.
         # this message will be passed to the StorageEnclHandler
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                         "status": "update",
                         "host_id": host_name,
@@ -317,7 +298,7 @@ class RealStorFanSensor(SensorThread, InternalMsgQ):
                         "info": info,
                         "specific_info": fan_module_info_dict
                     }
-            }})
+            }}
 
         return internal_json_msg
 
@@ -18,7 +18,6 @@
   Description:       Monitors PSU using RealStor API.
  ****************************************************************************
 """
-import json
 import os
 import re
 import time
@@ -51,6 +50,7 @@ class RealStorPSUSensor(SensorThread, InternalMsgQ):
     RESOURCE_CATEGORY = "enclosure:hw:psu"
 
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
     # PSUs directory name
     PSUS_DIR = "psus"
@@ -163,28 +163,11 @@ class RealStorPSUSensor(SensorThread, InternalMsgQ):
                 self._priority, self.run, ())
 
     def _get_psus(self):
-        """Receives list of PSUs from API.
+        """Receives list of PSUs from the enclosure snapshot.
            URL: http://<host>/api/show/power-supplies
         """
-        url = self.rssencl.build_url(
-                  self.rssencl.URI_CLIAPI_SHOWPSUS)
-
-        response = self.rssencl.ws_request(
-                        url, self.rssencl.ws.HTTP_GET)
-
-        if not response:
-            logger.warn(f"{self.rssencl.LDR_R1_ENCL}:: PSUs status unavailable as ws request {url} failed")
-            return
-
-        if response.status_code != self.rssencl.ws.HTTP_OK:
-            if url.find(self.rssencl.ws.LOOPBACK) == -1:
-                raise Exception(f"{self.rssencl.LDR_R1_ENCL}:: http request {url} "
-                                f"to get power-supplies failed with err {response.status_code}")
-            return
-
-        response_data = json.loads(response.text)
-        psus = response_data.get("power-supplies")
-        return psus
+        return self.rssencl.snapshots.get_fru("power-supplies",
+                                              self.pollfreq_psusensor)
 
     def _get_msgs_for_faulty_psus(self, psus, send_message = True):
         """Checks for health of psus and returns list of messages to be
@@ -354,8 +337,7 @@ class RealStorPSUSensor(SensorThread, InternalMsgQ):
 
         # Creates internal json message request structure.
         # this message will be passed to the StorageEnclHandler
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                         "status": "update",
                         "host_id": host_name,
@@ -365,7 +347,7 @@ class RealStorPSUSensor(SensorThread, InternalMsgQ):
                         "info": info,
                         "specific_info": specific_info
                 }
-            }})
+            }}
 
         return internal_json_msg
 
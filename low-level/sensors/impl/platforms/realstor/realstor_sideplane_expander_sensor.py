@@ -18,7 +18,6 @@
   Description:       Monitors Sideplane Expander data using RealStor API
   ****************************************************************************
 """
-import json
 import os
 import time
 import uuid
@@ -50,6 +49,7 @@ class RealStorSideplaneExpanderSensor(SensorThread, InternalMsgQ):
     RESOURCE_TYPE = "enclosure:hw:sideplane"
 
     PRIORITY = 1
+    RUN_ON_CORE_WORKERS = True
 
     # Fan Modules directory name
     SIDEPLANE_EXPANDERS_DIR = "sideplane_expanders"
@@ -153,28 +153,17 @@ class RealStorSideplaneExpanderSensor(SensorThread, InternalMsgQ):
                 self._priority, self.run, ())
 
     def _get_sideplane_expander_list(self):
-        """return sideplane expander list using API /show/enclosure"""
+        """return sideplane expander list of the enclosure snapshot, from
+           API /show/enclosure"""
 
         sideplane_expanders = []
 
-        url = self.rssencl.build_url(
-                  self.rssencl.URI_CLIAPI_SHOWENCLOSURE)
-
-        response = self.rssencl.ws_request(
-                        url, self.rssencl.ws.HTTP_GET)
-
-        if not response:
-            logger.warn(f"{self.rssencl.LDR_R1_ENCL}:: Enclosure status unavailable as ws request {url} failed")
-            return
-
-        if response.status_code != self.rssencl.ws.HTTP_OK:
-            if url.find(self.rssencl.ws.LOOPBACK) == -1:
-                raise Exception(f"{self.rssencl.LDR_R1_ENCL}:: http request {url} "
-                                f"to get enclosure failed with err {response.status_code}")
+        enclosures = self.rssencl.snapshots.get_fru("enclosures",
+            self.pollfreq_sideplane_expander_sensor)
+        if not enclosures:
             return
 
-        response_data = json.loads(response.text)
-        encl_drawers = response_data["enclosures"][0]["drawers"]
+        encl_drawers = enclosures[0]["drawers"]
         if encl_drawers:
             for drawer in encl_drawers:
                 sideplane_list = drawer["sideplanes"]
@@ -309,8 +298,7 @@ class RealStorSideplaneExpanderSensor(SensorThread, InternalMsgQ):
                 "event_time": epoch_time
                 }
 
-        internal_json_msg = json.dumps(
-            {"sensor_request_type": {
+        internal_json_msg = {"sensor_request_type": {
                 "enclosure_alert": {
                         "status": "update",
                         "host_id": host_name,
@@ -320,7 +308,7 @@ class RealStorSideplaneExpanderSensor(SensorThread, InternalMsgQ):
                         "info": info,
                         "specific_info": sideplane_expander_info_dict
                         }
-             }})
+             }}
 
         return internal_json_msg
 
@@ -16,6 +16,7 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com
 
 import errno
+import os
 import re
 import socket
 import time
@@ -35,7 +36,9 @@ from framework.platforms.server.software import BuildInfo, Service
 from framework.utils.mon_utils import MonUtils
 from framework.utils.conf_utils import (GLOBAL_CONF, NODE_TYPE_KEY, SSPL_CONF,
                                         Conf)
+from framework.utils.cpu_sampler import CpuSampler
 from framework.utils.ipmi_client import IpmiFactory
+from framework.utils.resource_collector import ResourceCollector
 from framework.utils.service_logging import CustomLog, logger
 from framework.utils.tool_factory import ToolFactory
 from server.server_resource_map import ServerResourceMap
@@ -49,6 +52,32 @@ class ServerHealth():
 
     name = "server_health"
 
+    # Secs a collected resource is served from the cache
+    RESOURCE_CACHE_TTL = {
+        "cpu": 2,
+        "platform_sensor": 30,
+        "memory": 5,
+        "fan": 30,
+        "nw_port": 10,
+        "sas_hba": 60,
+        "sas_port": 60,
+        "disk": 60,
+        "psu": 60,
+        "cortx_sw_services": 30,
+        "external_sw_services": 30,
+        "raid": 60,
+        "cpu_usage": 2,
+        "disk_usage": 60,
+        "memory_usage": 5,
+        "server_details": 3600
+    }
+    # Secs a query waits for a collector before serving its cached value
+    COLLECT_TIMEOUT = 10
+    # Collectors talking to D-Bus, run one at a time
+    DBUS_RESOURCES = ("disk", "cortx_sw_services", "external_sw_services")
+    # Collectors whose data comes from the RPM database as well
+    RPM_RESOURCES = ("cortx_sw_services", "external_sw_services")
+
     def __init__(self):
         """Initialize server."""
         super().__init__()
@@ -84,6 +113,48 @@ class ServerHealth():
         self.service = Service()
         self.resource_indexing_map = ServerResourceMap.resource_indexing_map\
             ["health"]
+        self.collector = self._create_collector()
+
+    def _create_collector(self):
+        """Returns the collection engine running the collectors of this
+           instance, its cache lasts as long as the instance."""
+        collector = ResourceCollector()
+        resources = dict(self.server_resources["hw"])
+        resources.update(self.server_resources["sw"])
+        resources.update({
+            "cpu_usage": self.get_cpu_overall_usage,
+            "disk_usage": self.get_disk_overall_usage,
+            "memory_usage": self.get_memory_overall_usage,
+            "server_details": Platform().get_server_details
+        })
+        for name, method in resources.items():
+            collector.register(name, method,
+                self.RESOURCE_CACHE_TTL[name], self.COLLECT_TIMEOUT,
+                fingerprint=self._get_rpmdb_mtime
+                    if name in self.RPM_RESOURCES else None,
+                group="dbus" if name in self.DBUS_RESOURCES else None)
+        return collector
+
+    @staticmethod
+    def _get_rpmdb_mtime():
+        """Changes when packages are installed, updated or removed."""
+        return os.stat(const.RPMDB_PATH).st_mtime
+
+    def _log_stale_resources(self, results):
+        """Logs and returns the resources not collected in time."""
+        stale_resources = {}
+        for name, result in results.items():
+            if result.status in (ResourceCollector.STATUS_STALE,
+                                 ResourceCollector.STATUS_UNAVAILABLE):
+                stale_resources[name] = {
+                    "status": result.status,
+                    "last_updated": int(result.updated) if result.updated
+                        else "NA"
+                }
+        if stale_resources:
+            logger.warning(self.log.svc_log(
+                f"Health data not collected in time for: {stale_resources}"))
+        return stale_resources
 
     def get_data(self, rpath):
         """Fetch health information for given rpath."""
@@ -99,31 +170,25 @@ class ServerHealth():
             info = self.get_server_health_info()
             resource_found = True
         elif leaf_node in self.server_resources:
-            for resource, method in self.server_resources[leaf_node].items():
-                try:
-                    info.update({resource: method()})
-                    resource_found = True
-                except Exception as err:
-                    logger.error(
-                        self.log.svc_log(f"{err.__class__.__name__}: {err}"))
-                    info = None
+            results = self.collector.collect(
+                list(self.server_resources[leaf_node]))
+            self._log_stale_resources(results)
+            info = {resource: result.value
+                    for resource, result in results.items()}
+            resource_found = True
         else:
             for node in nodes:
                 resource, _ = ServerResourceMap.get_node_info(node)
                 for res_type in self.server_resources:
-                    method = self.server_resources[res_type].get(resource)
-                    if not method:
+                    if resource not in self.server_resources[res_type]:
                         logger.error(
                             self.log.svc_log(
                                 f"No mapping function found for {res_type}"))
                         continue
-                    try:
-                        info = method()
-                        resource_found = True
-                    except Exception as err:
-                        logger.error(
-                            self.log.svc_log(f"{err.__class__.__name__}: {err}"))
-                        info = None
+                    results = self.collector.collect([resource])
+                    self._log_stale_resources(results)
+                    info = results[resource].value
+                    resource_found = True
                 if resource_found:
                     break
 
@@ -186,14 +251,19 @@ class ServerHealth():
         })
 
     def get_server_health_info(self):
-        """Returns overall server information."""
+        """Returns overall server information.
+
+        All the resources are collected concurrently, the ones not collected
+        in time are listed with their last update in 'stale_resources'.
+        """
         unhealthy_resource_found = False
-        server_details = Platform().get_server_details()
+        results = self.collector.collect()
+        server_details = results["server_details"].value or {}
         # Currently only one instance of server is considered
         server = []
         info = {}
-        info["make"] = server_details["Board Mfg"]
-        info["model"]= server_details["Product Name"]
+        info["make"] = server_details.get("Board Mfg", "NA")
+        info["model"]= server_details.get("Product Name", "NA")
         try:
             build_instance = BuildInfo()
             info["product_family"] = build_instance.get_attribute("NAME")
@@ -203,21 +273,17 @@ class ServerHealth():
             logger.error(self.log.svc_log(
                 f"Unable to get build info due to {err}"))
         info["resource_usage"] = {}
-        info["resource_usage"]["cpu_usage"] = self.get_cpu_overall_usage()
-        info["resource_usage"]["disk_usage"] = self.get_disk_overall_usage()
-        info["resource_usage"]["memory_usage"] = self.get_memory_overall_usage()
+        for usage in ["cpu_usage", "disk_usage", "memory_usage"]:
+            info["resource_usage"][usage] = results[usage].value
 
         for res_type in self.server_resources:
             info.update({res_type: {}})
-            for fru, method in self.server_resources[res_type].items():
-                try:
-                    info[res_type].update({fru: method()})
+            for fru in self.server_resources[res_type]:
+                info[res_type].update({fru: results[fru].value})
+                if results[fru].value is not None:
                     unhealthy_resource_found = self._is_any_resource_unhealthy(
                         fru, info[res_type])
-                except Exception as err:
-                    logger.error(
-                        self.log.svc_log(f"{err.__class__.__name__}:{err}"))
-                    info[res_type].update({fru: None})
+        info["stale_resources"] = self._log_stale_resources(results)
 
         info["uid"] = socket.getfqdn()
         info["last_updated"] = int(time.time())
@@ -232,15 +298,10 @@ class ServerHealth():
         return server
 
     @staticmethod
-    def get_cpu_usage(index=2, percpu=False):
-        """Get CPU usage list."""
-        i = 0
-        cpu_usage = None
-        while i < index:
-            cpu_usage = psutil.cpu_percent(interval=None, percpu=percpu)
-            time.sleep(1)
-            i = i + 1
-        return cpu_usage
+    def get_cpu_usage(percpu=False):
+        """Get CPU usage over the last sampler tick, per core id if percpu."""
+        return CpuSampler.get_instance().get_usage(CpuSampler.CURRENT,
+                                                   percpu=percpu)
 
     def get_cpu_list(self, mode):
         """Returns the CPU list as per specified mode."""
@@ -259,7 +320,8 @@ class ServerHealth():
         cpu_present = self.get_cpu_list("present")
         cpu_online = self.get_cpu_list("online")
         cpu_usage = self.get_cpu_usage(percpu=True)
-        cpu_usage_dict = dict(zip(cpu_online, cpu_usage))
+        cpu_usage_dict = {cpu_id: cpu_usage[cpu_id] for cpu_id in cpu_online
+                          if cpu_id < len(cpu_usage)}
         overall_cpu_usage = list(psutil.getloadavg())
         cpu_count = len(cpu_present)
         overall_usage = {
@@ -275,7 +337,7 @@ class ServerHealth():
             online_status = "Online" if cpu_id in cpu_online else "Offline"
             health_status = "OK" if online_status == "Online" else "NA"
             usage = "NA" if health_status == "NA" \
-                else cpu_usage_dict[cpu_id]
+                else cpu_usage_dict.get(cpu_id, "NA")
             specifics = [
                 {
                     "cpu_usage": usage,
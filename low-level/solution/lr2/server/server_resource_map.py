@@ -16,6 +16,7 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com
 
 import re
+import threading
 from cortx.utils.discovery.resource_map import ResourceMap
 from framework.utils.service_logging import init_logging
 from framework.utils.conf_utils import (SSPL_CONF, Conf, SYSTEM_INFORMATION,
@@ -29,6 +30,9 @@ class ServerResourceMap(ResourceMap):
     """
 
     name = "server"
+    # Kept across the queries so collected resources are cached
+    _health = None
+    _health_lock = threading.Lock()
     # Resources and their common key path.
     resource_indexing_map = {
         "health": {
@@ -76,7 +80,10 @@ class ServerResourceMap(ResourceMap):
                     node>server[0]>hw>disks
         """
         from server.health import ServerHealth
-        health = ServerHealth()
+        with ServerResourceMap._health_lock:
+            if ServerResourceMap._health is None:
+                ServerResourceMap._health = ServerHealth()
+            health = ServerResourceMap._health
         info = health.get_data(rpath)
         return info
 
@@ -0,0 +1,80 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of ServerHealth.get_cpu_info latency. Times
+                    the calls with the former psutil based usage, sleeping
+                    between two samples, and with the shared CpuSampler.
+
+  Usage: python3 bench_cpu_sampler.py [--calls 3]
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import psutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "..", "solution", "lr2"))
+
+from framework.utils.cpu_sampler import CpuSampler
+from solution.lr2.server.health import ServerHealth
+
+
+def psutil_cpu_usage(index=2, percpu=False):
+    """CPU usage as computed by ServerHealth before the sampler"""
+    cpu_usage = None
+    for _ in range(index):
+        cpu_usage = psutil.cpu_percent(interval=None, percpu=percpu)
+        time.sleep(1)
+    return cpu_usage
+
+
+def measure(name, server_health, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        server_health.get_cpu_info(add_overall_usage=True)
+    elapsed = (time.perf_counter() - start) / calls
+    print(f"{name:>8}: get_cpu_info {elapsed * 1000000:12.1f} us per call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=3)
+    args = parser.parse_args()
+
+    server_health = ServerHealth()
+
+    sampler_usage = ServerHealth.__dict__["get_cpu_usage"]
+    ServerHealth.get_cpu_usage = staticmethod(psutil_cpu_usage)
+    measure("psutil", server_health, args.calls)
+
+    ServerHealth.get_cpu_usage = sampler_usage
+    # Sampler started by the modules at startup
+    CpuSampler.get_instance().wait_ready()
+    measure("sampler", server_health, args.calls * 1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of a NodeHW FRU request for all the sensors
+                    of a FRU type, e.g. NDHW:node:hw:disk with resource
+                    '*'. Compares the former query, one ipmitool 'sensor
+                    get' per sensor, with the single 'sensor get' of all
+                    the sensors and with a repeat request served from the
+                    NodeHWactuator cache.
+
+                    ipmitool is emulated by 'cat' on records recorded for
+                    the IPMI simulator of sspl_test, one per sensor. The
+                    BMC session setup and SDR read of every ipmitool run
+                    and the BMC reply time per sensor can be added with
+                    --startup-ms and --sensor-ms.
+
+  Usage: python3 bench_fru_query.py [--sensors 48] [--requests 5]
+                                    [--startup-ms 0] [--sensor-ms 0]
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from actuators.impl.generic.node_hw import NodeHWactuator
+from framework.utils.ipmi_client import IPMITool
+
+MOCK_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                         "..", "..", "sspl_test", "ipmi_simulator",
+                         "ipmi_mock_data")
+
+
+class FixtureIpmiTool(IPMITool):
+    """IPMITool running 'cat' on the recorded sensor records"""
+
+    _instance = None
+
+    def setup(self, path, startup, sensor_time):
+        self._path = path
+        self._startup = startup
+        self._sensor_time = sensor_time
+        self.runs = 0
+
+    def _run_ipmitool_subcommand(self, subcommand, grep_args=None):
+        sensor_ids = shlex.split(subcommand)[2:]
+        self.runs += 1
+        time.sleep(self._startup + self._sensor_time * len(sensor_ids))
+        process = subprocess.run(
+            ["cat"] + [os.path.join(self._path, sensor_id)
+                       for sensor_id in sensor_ids],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # ipmitool prints the line once per run whatever the sensors
+        return "Locating sensor record...\n" + process.stdout.decode(), \
+            process.stderr.decode(), process.returncode
+
+
+def create_fixture(path, sensors):
+    """Writes the record of HDD 0 Status for sensors drive bays"""
+    with open(os.path.join(MOCK_DATA, "sensor_hdd0.txt")) as record:
+        record = record.read().split("\n", 1)[1].rstrip("\n")
+    sensor_ids = []
+    for sensor in range(sensors):
+        sensor_id = f"HDD {sensor} Status"
+        content = re.sub(r"HDD 0 Status \(0xf0\)",
+                         f"{sensor_id} (0x{0xf0 + sensor:x})", record)
+        with open(os.path.join(path, sensor_id), "w") as f:
+            f.write(content + "\n\n")
+        sensor_ids.append(sensor_id)
+    return sensor_ids
+
+
+def former_query(tool, actuator, sensor_ids):
+    return {sensor_id: tool.get_sensor_props(sensor_id)
+            for sensor_id in sensor_ids}
+
+
+def bulk_query(tool, actuator, sensor_ids):
+    return tool.get_sensors_props(sensor_ids)
+
+
+def cached_query(tool, actuator, sensor_ids):
+    return actuator._get_sensors_props(sensor_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sensors", type=int, default=48)
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--startup-ms", type=float, default=0)
+    parser.add_argument("--sensor-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    path = tempfile.mkdtemp()
+    try:
+        sensor_ids = create_fixture(path, args.sensors)
+        tool = FixtureIpmiTool()
+        tool.setup(path, args.startup_ms / 1000, args.sensor_ms / 1000)
+        actuator = NodeHWactuator(tool, None)
+        # Fill the cache, requests within fru_cache_ttl are served from it
+        actuator._get_sensors_props(sensor_ids)
+        expected = former_query(tool, actuator, sensor_ids)
+        print(f"{args.sensors} sensors")
+        for name, query in (("former", former_query), ("bulk", bulk_query),
+                            ("cached", cached_query)):
+            assert query(tool, actuator, sensor_ids) == expected
+            tool.runs = 0
+            start = time.perf_counter()
+            for _ in range(args.requests):
+                query(tool, actuator, sensor_ids)
+            elapsed = (time.perf_counter() - start) / args.requests
+            print(f"{name:>8}: {elapsed * 1000:10.2f} ms per request, "
+                  f"{tool.runs / args.requests:5.0f} ipmitool runs")
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of IEMSensor catching up on a backlog of IEMs.
+                    Generates a synthetic IEM log and replays it with the
+                    former timestamp compare and checkpoint write per IEM
+                    and with the checkpointed tail of the sensor. Sending
+                    is replaced by a counter.
+
+  Usage: python3 bench_iem_replay.py [--size-mb 1024] [--dir /tmp]
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from sensors.impl.generic.iem_sensor import IEMSensor
+
+
+def generate_log(path, size_mb):
+    line = "2021-03-01T10:00:{:02d}.{:06d}+00:00 srvnode-1 IEC:IS0010010010:" \
+           "Synthetic IEM for replay benchmark\n"
+    size = size_mb * 1024 * 1024
+    count = 0
+    with open(path, "w") as log:
+        while log.tell() < size:
+            log.writelines(line.format((n // 1000000) % 60, n % 1000000)
+                           for n in range(count, count + 10000))
+            count += 10000
+    return count
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def process_iem(self, iem_log):
+        self.count += 1
+
+
+def replay_legacy(sensor, counter):
+    """Replay as done before the checkpointed tail"""
+    with open(sensor._timestamp_file_path, "r") as timestamp_file:
+        last_processed_log_timestamp = timestamp_file.read().strip()
+    with open(sensor._log_file_path) as iem_logs:
+        for iem_log in iem_logs:
+            log = iem_log.rstrip()
+            log_timestamp = log[:log.index(" ")]
+            if not last_processed_log_timestamp or \
+                    log_timestamp > last_processed_log_timestamp:
+                counter.process_iem(log)
+                with open(sensor._timestamp_file_path, "w") as timestamp_file:
+                    timestamp_file.write(log_timestamp)
+
+
+def replay_tail(sensor, counter):
+    sensor._open_log()
+    sensor._read_iem()
+    sensor._iem_logs.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--dir", default=tempfile.gettempdir())
+    args = parser.parse_args()
+
+    path = tempfile.mkdtemp(dir=args.dir)
+    try:
+        sensor = IEMSensor()
+        sensor._log_file_path = os.path.join(path, "iem_messages")
+        sensor._timestamp_file_path = os.path.join(path, "checkpoint")
+        sensor._watch_log = lambda: None
+        iems = generate_log(sensor._log_file_path, args.size_mb)
+        print(f"{args.size_mb} MB log, {iems} IEMs")
+
+        for name, replay in (("legacy", replay_legacy), ("tail", replay_tail)):
+            open(sensor._timestamp_file_path, "w").close()
+            counter = Counter()
+            sensor._process_iem = counter.process_iem
+            start = time.perf_counter()
+            replay(sensor, counter)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>8}: {elapsed:8.2f} secs, "
+                  f"{counter.count / elapsed:12.0f} IEMs per sec")
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
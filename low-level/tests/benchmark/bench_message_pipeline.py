@@ -0,0 +1,143 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of the messages sent, from their creation to
+                    their serialization by the EgressProcessor. Measures
+                    messages/sec per message type with the former pipeline,
+                    reading and checking the schema per message and
+                    serializing the message three times, and with the
+                    schema registry, validating every message or a sample.
+
+  Usage: python3 bench_message_pipeline.py [--msgs 2000] [--sample-rate 0.1]
+ ****************************************************************************
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from jsonschema import Draft3Validator, validate
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from json_msgs.schema_registry import SchemaRegistry
+from json_msgs.messages.actuators.ack_response import AckResponseMsg
+from json_msgs.messages.sensors.raid_data import RAIDdataMsg
+from json_msgs.messages.sensors.realstor_psu_data import RealStorPSUDataMsg
+from json_msgs.messages.sensors.thread_monitor_msg import ThreadMonitorMsg
+
+SCHEMAS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..", "json_msgs", "schemas")
+
+INFO = {
+    "resource_type": "enclosure:hw:psu",
+    "resource_id": "psu_0.0",
+    "event_time": "1612345678"
+}
+PSU_INFO = {
+    "description": "FRU ID: 11", "health": "OK", "health-reason": "",
+    "health-recommendation": "", "location": "Enclosure 0 - Left",
+    "serial-number": "DHSIFTJ-18253C638B", "status": "Up",
+    "dc12v": "0", "dc5v": "0", "dc33v": "0", "dc12i": "0", "dc5i": "0",
+    "dctemp": "0", "durable-id": "psu_0.0", "vendor": "N/A"
+}
+RAID_INFO = {
+    "device": "/dev/md0",
+    "drives": [{"status": "U", "identity": {"path": "/dev/sda1",
+                                            "serialNumber": "ZAD0JN7L"}},
+               {"status": "_", "identity": {"path": "/dev/sdb1",
+                                            "serialNumber": "None"}}]
+}
+MONITOR_INFO = {
+    "module_name": "RAIDsensor", "alert_type": "fault",
+    "severity": "critical", "description": "RAIDsensor is stopped",
+    "impact": "RAID alerts are not reported",
+    "recommendation": "Restart SSPL", "specific_info": {"error": "timeout"}
+}
+
+MESSAGES = {
+    "RealStorPSUDataMsg": lambda: RealStorPSUDataMsg("srvnode-1", "fault",
+        "1612345678abcd", "critical", dict(INFO), dict(PSU_INFO)),
+    "RAIDdataMsg": lambda: RAIDdataMsg("srvnode-1", "fault", "1612345678abcd",
+        "critical", dict(INFO, resource_type="node:os:raid_data"),
+        dict(RAID_INFO)),
+    "ThreadMonitorMsg": lambda: ThreadMonitorMsg(MONITOR_INFO),
+    "AckResponseMsg": lambda: AckResponseMsg("SMART_TEST", "Passed",
+                                             "16ab-3c4d")
+}
+
+
+def former_pipeline(create):
+    """Schema read and checked per message, validated with jsonschema
+       validate, serialized by getJson, parsed by _check_debug and
+       serialized again by the EgressProcessor"""
+    msg = create()
+    schema_type = "actuators/SSPL-LL_Actuator_Response.json" \
+        if isinstance(msg, AckResponseMsg) else \
+        "sensors/SSPL-LL_Sensor_Response.json"
+    with open(os.path.join(SCHEMAS, schema_type)) as f:
+        schema = json.loads(' '.join(f.read().split()))
+    Draft3Validator.check_schema(schema)
+    response_type = "actuator_response_type" \
+        if isinstance(msg, AckResponseMsg) else "sensor_response_type"
+    msg.prepare_message(msg._json, response_type)
+    msg._json = msg.normalize_kv(msg._json)
+    validate(msg._json, schema)
+    return json.dumps(json.loads(json.dumps(msg._json)))
+
+
+def registry_pipeline(create):
+    """Validated with the shared validator, passed as a dict and serialized
+       once by the EgressProcessor"""
+    return json.dumps(create().getMsg())
+
+
+def measure(name, pipeline, create, msgs):
+    start = time.perf_counter()
+    for _ in range(msgs):
+        pipeline(create)
+    return msgs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--msgs", type=int, default=2000)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    registry = SchemaRegistry(SCHEMAS)
+    SchemaRegistry._instance = registry
+
+    print(f"{'message':>20} {'former':>10} {'registry':>10} "
+          f"{'sampled':>10}  msgs/sec")
+    for name, create in MESSAGES.items():
+        former = measure(name, former_pipeline, create, args.msgs)
+        registry.set_sample_rate(1)
+        full = measure(name, registry_pipeline, create, args.msgs)
+        registry.set_sample_rate(args.sample_rate)
+        sampled = measure(name, registry_pipeline, create, args.msgs)
+        print(f"{name:>20} {former:10.0f} {full:10.0f} {sampled:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of BaseMsg.prepare_message and normalize_kv.
+                    Measures messages/sec with the former implementation,
+                    looking the node ids up in the global config per
+                    message and copying the whole message to normalize it,
+                    and with the cached cluster identity and the
+                    normalization copying only the changed containers.
+
+  Usage: python3 bench_prepare_message.py [--msgs 20000]
+ ****************************************************************************
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from cortx.utils.kv_store import KvPayload
+
+from framework.base.sspl_constants import (DEFAULT_DC, DEFAULT_RACK,
+        DEFAULT_SN, DEFAULT_CLUSTER)
+from framework.utils.conf_utils import (GLOBAL_CONF, SITE_ID_KEY,
+        RACK_ID_KEY, NODE_ID_KEY, CLUSTER_ID_KEY, Conf)
+from json_msgs.messages.sensors.thread_monitor_msg import ThreadMonitorMsg
+
+RESPONSE_TYPE = "sensor_response_type"
+
+PSU_ALERT = {
+    "alert_type": "fault",
+    "severity": "critical",
+    "alert_id": "1612345678abcd",
+    "host_id": "srvnode-1",
+    "info": {
+        "resource_type": "enclosure:hw:psu",
+        "resource_id": "psu_0.0",
+        "event_time": "1612345678"
+    },
+    "specific_info": {
+        "description": "FRU ID: 11", "health": "OK", "health-reason": "",
+        "health-recommendation": "", "location": "Enclosure 0 - Left",
+        "serial-number": "DHSIFTJ-18253C638B", "status": "Up",
+        "dc12v": "0", "dc5v": "0", "dc33v": "0", "dc12i": "0", "dc5i": "0",
+        "dctemp": "0", "durable-id": "psu_0.0", "vendor": "N/A"
+    }
+}
+RAID_ALERT = {
+    "alert_type": "fault",
+    "severity": "critical",
+    "alert_id": "1612345678abcd",
+    "host_id": "srvnode-1",
+    "info": {
+        "resource_type": "node:os:raid_data",
+        "resource_id": "/dev/md0",
+        "event_time": "1612345678"
+    },
+    "specific_info": {
+        "device": "/dev/md0",
+        "drives": [{"status": "U", "identity": {"path": "/dev/sda1",
+                                                "serialNumber": "ZAD0JN7L"}},
+                   {"status": "_", "identity": {"path": "/dev/sdb1",
+                                                "serialNumber": "None"}}]
+    }
+}
+
+MESSAGES = {"psu": PSU_ALERT, "raid": RAID_ALERT}
+
+
+def former_prepare_message(jsonMsg, message_type):
+    if jsonMsg.get("message").get(message_type).get("info") is None:
+        return
+    payload = KvPayload(jsonMsg)
+    info = jsonMsg["message"][message_type]["info"]
+    if payload.get(f"message>{message_type}>info>site_id") is None:
+        info["site_id"] = Conf.get(GLOBAL_CONF, SITE_ID_KEY, DEFAULT_DC)
+    if payload.get(f"message>{message_type}>info>node_id") is None:
+        info["node_id"] = Conf.get(GLOBAL_CONF, NODE_ID_KEY, DEFAULT_SN)
+    if payload.get(f"message>{message_type}>info>rack_id") is None:
+        info["rack_id"] = Conf.get(GLOBAL_CONF, RACK_ID_KEY, DEFAULT_RACK)
+    if payload.get(f"message>{message_type}>info>cluster_id") is None:
+        info["cluster_id"] = Conf.get(GLOBAL_CONF, CLUSTER_ID_KEY,
+                                      DEFAULT_CLUSTER)
+    if payload.get(f"message>{message_type}>info>fru") is None:
+        info["fru"] = "false"
+
+
+def former_normalize_kv(item):
+    if isinstance(item, dict):
+        return {key.replace("-", "_"): former_normalize_kv(value)
+                for key, value in item.items()}
+    elif isinstance(item, list):
+        return [former_normalize_kv(_) for _ in item]
+    elif item == "N/A":
+        return "NA"
+    else:
+        return item
+
+
+def former(msg, json_msg):
+    former_prepare_message(json_msg, RESPONSE_TYPE)
+    return former_normalize_kv(json_msg)
+
+
+def current(msg, json_msg):
+    msg.prepare_message(json_msg, RESPONSE_TYPE)
+    return msg.normalize_kv(json_msg)
+
+
+def measure(pipeline, msg, alert, msgs):
+    # Messages are built before timing, prepare_message fills their info
+    json_msgs = [{"message": {RESPONSE_TYPE: copy.deepcopy(alert)}}
+                 for _ in range(msgs)]
+    start = time.perf_counter()
+    for json_msg in json_msgs:
+        pipeline(msg, json_msg)
+    return msgs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--msgs", type=int, default=20000)
+    args = parser.parse_args()
+
+    msg = ThreadMonitorMsg({})
+    print(f"{'message':>10} {'former':>10} {'current':>10}  msgs/sec")
+    for name, alert in MESSAGES.items():
+        print(f"{name:>10} {measure(former, msg, alert, args.msgs):10.0f} "
+              f"{measure(current, msg, alert, args.msgs):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
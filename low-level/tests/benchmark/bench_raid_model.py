@@ -0,0 +1,118 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of a RAID scan on a fixture of md arrays.
+                    Compares the former scan, one 'mdadm --examine | grep'
+                    shell per member, emulated with 'cat | grep' on fixture
+                    files as mdadm needs real devices, with a refresh of
+                    the MdRaid model reading mdstat and sysfs.
+
+  Usage: python3 bench_raid_model.py [--arrays 8] [--members 12] [--scans 5]
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from framework.utils.md_raid import MdRaid
+
+
+def write(path, value):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as attr:
+        attr.write(f"{value}\n")
+
+
+def create_fixture(path, arrays, members):
+    """Writes mdstat, the sysfs md attributes and a mdadm --examine output
+       per member.
+    """
+    mdstat = ["Personalities : [raid6]"]
+    for array in range(arrays):
+        name = f"md{array}"
+        drives = [f"sd{array}x{member}" for member in range(members)]
+        mdstat.append(f"{name} : active raid6 " + " ".join(
+            f"{drive}[{member}]" for member, drive in enumerate(drives)))
+        mdstat.append(f"      1046528 blocks super 1.2 level 6, 512k chunk, "
+                      f"[{members}/{members}] [{'U' * members}]")
+        md_dir = os.path.join(path, "sys", "block", name, "md")
+        for attr, value in (("array_state", "clean"), ("level", "raid6"),
+                            ("raid_disks", members), ("degraded", 0),
+                            ("sync_action", "idle"), ("mismatch_cnt", 0)):
+            write(os.path.join(md_dir, attr), value)
+        for member, drive in enumerate(drives):
+            write(os.path.join(md_dir, f"dev-{drive}", "slot"), member)
+            write(os.path.join(md_dir, f"dev-{drive}", "state"), "in_sync")
+            write(os.path.join(md_dir, f"dev-{drive}", "block", "dev"),
+                  f"{8 + array}:{member}")
+            write(os.path.join(path, "examine", drive),
+                  f"   Device Role : Active device {member}")
+        mdstat.append("")
+    mdstat.append("unused devices: <none>")
+    write(os.path.join(path, "mdstat"), "\n".join(mdstat))
+
+
+def scan_legacy(path, md_raid):
+    with open(os.path.join(path, "mdstat")) as mdstat:
+        content = mdstat.read()
+    for array in md_raid._parse_mdstat(content):
+        for drive, _, _ in array[3]:
+            subprocess.Popen(f"cat {path}/examine/{drive} | grep 'Device Role'",
+                             shell=True, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE).communicate()
+
+
+def scan_model(path, md_raid):
+    md_raid.refresh()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--arrays", type=int, default=8)
+    parser.add_argument("--members", type=int, default=12)
+    parser.add_argument("--scans", type=int, default=5)
+    args = parser.parse_args()
+
+    path = tempfile.mkdtemp()
+    try:
+        create_fixture(path, args.arrays, args.members)
+        md_raid = MdRaid(os.path.join(path, "mdstat"),
+                         os.path.join(path, "sys"), lambda member: "None")
+        print(f"{args.arrays} arrays x {args.members} members")
+        for name, scan in (("legacy", scan_legacy), ("model", scan_model)):
+            start = time.perf_counter()
+            for _ in range(args.scans):
+                scan(path, md_raid)
+            elapsed = (time.perf_counter() - start) / args.scans
+            print(f"{name:>8}: {elapsed * 1000:10.2f} ms per scan")
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
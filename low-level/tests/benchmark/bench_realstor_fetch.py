@@ -0,0 +1,157 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of the RealStor CLI API fetches against a
+                    local fake controller. Compares one connection per
+                    request issued serially, as done by the sensors before,
+                    with the pooled session and fetch_many of
+                    RealStorEnclosure. The fake controller adds a delay per
+                    new connection, standing for the TCP/TLS setup, and per
+                    request.
+
+  Usage: python3 bench_realstor_fetch.py [--rounds 20] [--connect-delay 0.02]
+                                         [--request-delay 0.01]
+ ****************************************************************************
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from framework.platforms.realstor.realstor_enclosure import RealStorEnclosure
+
+
+FRUS = ["drives", "fan-modules", "power-supplies", "controllers",
+        "enclosures", "disk-groups", "volumes", "sensors"]
+
+SESSION_KEY = "bench-session-key"
+
+# Show API to the key of its response
+RESPONSE_KEYS = {"/api" + uri: fru
+                 for fru, uri in RealStorEnclosure.FRU_URI_MAP.items()}
+RESPONSE_KEYS["/api" + RealStorEnclosure.URI_CLIAPI_SHOWFRUS] = "enclosure-fru"
+
+
+class FakeControllerHandler(BaseHTTPRequestHandler):
+    """Answers login and show requests the way the controller does"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid delayed ACK stalls on
+    # the kept alive connections
+    disable_nagle_algorithm = True
+    connect_delay = 0
+    request_delay = 0
+    connections = 0
+    _lock = threading.Lock()
+
+    def setup(self):
+        with self._lock:
+            FakeControllerHandler.connections += 1
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def do_GET(self):
+        time.sleep(self.request_delay)
+        status = [{"response-type": "Success", "return-code": 0,
+                   "response": "Command completed successfully."}]
+        if self.path.startswith("/api/login/"):
+            status[0].update({"return-code": 1, "response": SESSION_KEY})
+            body = {"status": status}
+        else:
+            name = RESPONSE_KEYS.get(self.path, "unknown")
+            body = {name: [{"durable-id": f"{name}_{index}", "health": "OK"}
+                           for index in range(24)],
+                    "status": status}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeController(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def run_serial(enclosure, rounds):
+    """One new connection per request, one request at a time"""
+    headers = dict(enclosure.common_reqheaders)
+    for _ in range(rounds):
+        for fru in FRUS:
+            url = enclosure.build_url(RealStorEnclosure.FRU_URI_MAP[fru])
+            requests.get(url, headers=headers,
+                         timeout=enclosure.WEBSERVICE_TIMEOUT).json()
+
+
+def run_pooled(enclosure, rounds):
+    for _ in range(rounds):
+        result = enclosure.fetch_many(FRUS)
+        assert all(result.values())
+
+
+def measure(name, func, enclosure, rounds):
+    connections = FakeControllerHandler.connections
+    start = time.time()
+    func(enclosure, rounds)
+    elapsed = time.time() - start
+    print(f"{name:>7}: {rounds * len(FRUS)} requests in {elapsed:6.2f} s, "
+          f"{elapsed / rounds * 1000:7.1f} ms per poll, "
+          f"{FakeControllerHandler.connections - connections} connections")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--connect-delay", type=float, default=0.02)
+    parser.add_argument("--request-delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    FakeControllerHandler.connect_delay = args.connect_delay
+    FakeControllerHandler.request_delay = args.request_delay
+    server = FakeController(("127.0.0.1", 0), FakeControllerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    enclosure = RealStorEnclosure()
+    enclosure.mc1 = enclosure.mc2 = enclosure.active_ip = "127.0.0.1"
+    enclosure.mc1_wsport = enclosure.mc2_wsport = enclosure.active_wsport = \
+        str(server.server_address[1])
+    enclosure.login()
+
+    measure("serial", run_serial, enclosure, args.rounds)
+    measure("pooled", run_pooled, enclosure, args.rounds)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of idle module scheduling. Runs a set of
+                    idle fake modules, polling sensors and queue consumers
+                    re-armed every second, on per module sched.scheduler
+                    loops and on the shared SchedulerCore, and reports the
+                    wakeups/sec and RSS of the process. In pooled mode the
+                    sensors run on the core workers without a thread.
+
+  Usage: python3 bench_scheduler_core.py [--seconds 30] [--modules 30]
+ ****************************************************************************
+"""
+
+import argparse
+import glob
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from sched import scheduler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from framework.base.scheduler_core import CoreScheduler, SchedulerCore
+
+
+SENSOR_INTERVAL = 30
+
+
+class FakeModule(object):
+    """Queue consumer re-armed the way the message handlers do"""
+
+    def __init__(self, name, sched, msgQ):
+        self._name = name
+        self._scheduler = sched
+        self._msgQ = msgQ
+
+    def run(self):
+        while not self._msgQ.empty():
+            self._msgQ.get_nowait()
+        if hasattr(self._scheduler, "enter_on_queue"):
+            self._scheduler.enter_on_queue(self._name, self._msgQ, 1, self.run)
+        else:
+            self._scheduler.enter(1, 1, self.run, ())
+
+
+class FakeSensor(object):
+    """Sensor polling its resource every SENSOR_INTERVAL secs"""
+
+    def __init__(self, sched):
+        self._scheduler = sched
+
+    def run(self):
+        self._scheduler.enter(SENSOR_INTERVAL, 1, self.run, ())
+
+
+def wakeups():
+    """Voluntary context switches of all the threads of the process"""
+    total = 0
+    for status in glob.glob("/proc/self/task/*/status"):
+        try:
+            with open(status) as fh:
+                for line in fh:
+                    if line.startswith("voluntary_ctxt_switches"):
+                        total += int(line.split()[1])
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def rss_kb():
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith("VmRSS"):
+                return int(line.split()[1])
+    return 0
+
+
+def run_modules(mode, modules, seconds):
+    for index in range(modules):
+        pooled = mode == "pooled" and not index % 2
+        if mode == "sched":
+            sched = scheduler(time.time, time.sleep)
+        else:
+            sched = CoreScheduler(f"module-{index}", pooled=pooled)
+        if index % 2:
+            module = FakeModule(f"module-{index}", sched, queue.Queue())
+        else:
+            module = FakeSensor(sched)
+        sched.enter(0, 1, module.run, ())
+        if pooled:
+            sched.start(print)
+        else:
+            threading.Thread(target=sched.run, daemon=True).start()
+
+    # Let the modules settle before measuring
+    time.sleep(2)
+    start = wakeups()
+    time.sleep(seconds)
+    rate = (wakeups() - start) / seconds
+    print(f"{mode:>6}: {modules} modules, {threading.active_count()} threads, "
+          f"{rate:8.1f} wakeups/sec, RSS {rss_kb()} kB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=30)
+    parser.add_argument("--modules", type=int, default=30)
+    parser.add_argument("--mode", choices=["sched", "core", "pooled"])
+    args = parser.parse_args()
+
+    if args.mode:
+        run_modules(args.mode, args.modules, args.seconds)
+        return
+
+    # One process per mode so RSS is not shared between the runs
+    for mode in ["sched", "core", "pooled"]:
+        subprocess.run([sys.executable, os.path.abspath(__file__),
+                        "--mode", mode, "--seconds", str(args.seconds),
+                        "--modules", str(args.modules)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of the DiskMonitor SMART health sweep.
+                    Compares the serial one fork per drive per second loop
+                    with SmartHealthPoller using a fake smartctl.
+
+  Usage: python3 bench_smart_poller.py [--seconds 60] [--interval 300]
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import stat
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from framework.utils.smart_poller import SmartHealthPoller
+from framework.utils.utility import run_command
+
+
+FAKE_SMARTCTL = """#!/bin/sh
+sleep 0.01
+echo '{"smart_status": {"passed": true}}'
+"""
+
+DRIVE_COUNTS = [12, 84, 500]
+
+
+class CountingRunner(object):
+    """Runs the fake smartctl and counts the forks"""
+
+    def __init__(self):
+        self.forks = 0
+
+    def __call__(self, command):
+        self.forks += 1
+        return run_command(command)
+
+
+def make_fake_smartctl(directory):
+    path = os.path.join(directory, "smartctl")
+    with open(path, "w") as fh:
+        fh.write(FAKE_SMARTCTL)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def get_commands(smartctl, drives):
+    return {f"/org/freedesktop/UDisks2/drives/drive_{i}":
+            f"{smartctl} -H /dev/sd{i} --json" for i in range(drives)}
+
+
+def bench_serial(smartctl, drives, seconds):
+    """Old behaviour, every drive is checked on every 1 second tick"""
+    runner = CountingRunner()
+    commands = get_commands(smartctl, drives)
+    start = time.time()
+    for command in commands.values():
+        runner(command)
+    sweep = time.time() - start
+    # Every tick forks once per drive
+    return sweep, float(drives), runner.forks
+
+
+def bench_poller(smartctl, drives, seconds, interval, workers):
+    """SmartHealthPoller driven by a virtual 1 second tick"""
+    runner = CountingRunner()
+    poller = SmartHealthPoller(interval=interval, workers=workers,
+                               max_checks=drives, runner=runner)
+    commands = get_commands(smartctl, drives)
+    now = time.time()
+
+    start = time.time()
+    poller.poll(commands, now)
+    sweep = time.time() - start
+    first_sweep_forks = runner.forks
+
+    # Steady state, no udisks2 changes, only the jittered interval applies
+    for tick in range(1, seconds + 1):
+        poller.poll(commands, now + tick)
+    poller.shutdown()
+    steady_forks = runner.forks - first_sweep_forks
+    return sweep, steady_forks / float(seconds), runner.forks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=int, default=3600,
+                        help="virtual seconds of steady state polling")
+    parser.add_argument("--interval", type=int,
+                        default=SmartHealthPoller.DEFAULT_INTERVAL)
+    parser.add_argument("--workers", type=int,
+                        default=SmartHealthPoller.DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        smartctl = make_fake_smartctl(directory)
+        print(f"{'drives':>6} {'mode':>8} {'sweep (s)':>10} {'forks/sec':>10}")
+        for drives in DRIVE_COUNTS:
+            sweep, rate, _ = bench_serial(smartctl, drives, args.seconds)
+            print(f"{drives:>6} {'serial':>8} {sweep:>10.3f} {rate:>10.2f}")
+            sweep, rate, _ = bench_poller(smartctl, drives, args.seconds,
+                                          args.interval, args.workers)
+            print(f"{drives:>6} {'poller':>8} {sweep:>10.3f} {rate:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
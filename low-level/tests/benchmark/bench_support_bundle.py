@@ -0,0 +1,160 @@
+#!/usr/bin/python3.6
+
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+"""
+ ****************************************************************************
+  Description:       Benchmark of the support bundle enclosure log download
+                    and compression. Downloads a generated store.zip from a
+                    local http server, loaded in memory then written as
+                    before or streamed to disk, and reports the time and
+                    the peak of memory allocated. Then compresses a
+                    generated log tree with the former tarfile gzip level 9,
+                    with level 6 and with pigz when installed.
+
+  Usage: python3 bench_support_bundle.py [--size-mb 200] [--logs-mb 100]
+                                         [--threads 4]
+ ****************************************************************************
+"""
+
+import argparse
+import http.server
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", ".."))
+
+from framework.platforms.realstor.realstor_enclosure import RealStorEnclosure
+from framework.utils.tar_utils import open_tar_gz
+from framework.utils.webservices import WebServices
+
+
+class StoreZipHandler(http.server.SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        self.send_header("content-disposition",
+                         RealStorEnclosure.ENCL_LOGS_ATTACHMENT)
+        super().end_headers()
+
+
+def serve(path):
+    handler = lambda *args: StoreZipHandler(*args, directory=path)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def former_download(url, file_name):
+    response = WebServices().ws_request(WebServices.HTTP_GET, url, {}, None, 60)
+    with open(file_name, 'wb') as enclosure_resp:
+        enclosure_resp.write(response.content)
+
+
+def streamed_download(url, file_name):
+    ws = WebServices()
+    enclosure = RealStorEnclosure.__new__(RealStorEnclosure)
+    enclosure.ws = ws
+    enclosure.ws_request = lambda url, method, headers=None, stream=False: \
+        ws.ws_request(method, url, headers or {}, None, 60, stream=stream)
+    response = enclosure.ws_request(url, WebServices.HTTP_GET, stream=True)
+    assert enclosure._save_enclosure_logs(url, response, file_name,
+                                          logging.getLogger(__name__))
+
+
+def measure(name, download, url, file_name):
+    tracemalloc.start()
+    start = time.perf_counter()
+    download(url, file_name)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    os.remove(file_name)
+    print(f"{name:>10}: {elapsed:8.2f} secs, {peak / 2 ** 20:8.1f} MB peak")
+
+
+def compress(name, threads, level, logs_dir, tar_location):
+    start = time.perf_counter()
+    with open_tar_gz(tar_location, logging.getLogger(__name__), threads,
+                     level) as tar:
+        tar.add(logs_dir, arcname="sspl/logs/")
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(tar_location)
+    os.remove(tar_location)
+    print(f"{name:>10}: {elapsed:8.2f} secs, {size / 2 ** 20:8.1f} MB")
+
+
+def create_logs(path, size):
+    """Writes log files, compressible like the SSPL logs"""
+    line = b"Mar 22 10:12:04 srvnode-1 sspl-ll[12345]: INFO NodeHWsensor, " \
+           b"sensor HDD 12 Status reading %08d, status ok\n"
+    os.makedirs(path)
+    written = index = 0
+    while written < size:
+        with open(os.path.join(path, f"sspl.log.{index}"), "wb") as log:
+            lines = b"".join(line % n for n in range(written, written + 100000))
+            log.write(lines)
+            written += len(lines)
+        index += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--logs-mb", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    path = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(path, "store.zip"), "wb") as store_zip:
+            for _ in range(args.size_mb):
+                store_zip.write(os.urandom(2 ** 20))
+        server = serve(path)
+        url = f"http://127.0.0.1:{server.server_port}/store.zip"
+        file_name = os.path.join(path, "enclosure_logs.zip")
+        print(f"store.zip download, {args.size_mb} MB")
+        measure("former", former_download, url, file_name)
+        measure("streamed", streamed_download, url, file_name)
+        server.shutdown()
+
+        logs_dir = os.path.join(path, "logs")
+        create_logs(logs_dir, args.logs_mb * 2 ** 20)
+        print(f"tar.gz of {args.logs_mb} MB of logs")
+        tar_location = os.path.join(path, "bundle.tar.gz")
+        for name, threads, level in (("gzip -9", 1, 9), ("gzip -6", 1, 6),
+                                     (f"pigz -p{args.threads}",
+                                      args.threads, 6)):
+            if threads > 1 and not shutil.which("pigz"):
+                print(f"{name:>10}: pigz not installed")
+                continue
+            compress(name, threads, level, logs_dir, tar_location)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
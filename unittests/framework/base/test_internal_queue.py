@@ -0,0 +1,59 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import queue
+import threading
+import time
+import unittest
+
+from framework.base.internal_msgQ import InternalQueue, MsgPriority
+
+
+class TestInternalQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.q = InternalQueue()
+
+    def test_fault_lane_is_read_first(self):
+        self.q.put("node_data-1", priority=MsgPriority.LOW)
+        self.q.put("node_data-2", priority=MsgPriority.LOW)
+        self.q.put("fault")
+        self.assertEqual(self.q.get_nowait(), "fault")
+        self.assertListEqual(self.q.queue, ["node_data-1", "node_data-2"])
+        self.assertListEqual(self.q.get_many(10, 0), ["node_data-1", "node_data-2"])
+
+    def test_get_many_blocks_until_message(self):
+        self.assertListEqual(self.q.get_many(5, timeout=0.01), [])
+        threading.Timer(0.05, self.q.put, ("alert",)).start()
+        start = time.time()
+        self.assertListEqual(self.q.get_many(5, timeout=5), ["alert"])
+        self.assertLess(time.time() - start, 1)
+        self.assertRaises(queue.Empty, self.q.get, timeout=0.01)
+
+    def test_stats(self):
+        for index in range(4):
+            self.q.put(index)
+        self.q.get_many(3)
+        stats = self.q.get_stats()
+        self.assertEqual(stats["depth"], 1)
+        self.assertListEqual(stats["depth_per_lane"], [1, 0])
+        self.assertGreater(stats["enqueue_rate"], 0)
+        self.assertGreaterEqual(stats["max_age"], stats["avg_age"])
+        # Rates are reset by each call
+        self.assertEqual(self.q.get_stats()["enqueue_rate"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
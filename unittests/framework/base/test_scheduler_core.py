@@ -0,0 +1,122 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import queue
+import threading
+import time
+import unittest
+
+from framework.base.scheduler_core import CoreScheduler, SchedulerCore
+
+
+class TestCoreScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.core = SchedulerCore(workers=1)
+        self.scheduler = CoreScheduler("test", core=self.core)
+
+    def test_events_run_in_time_order_on_caller_thread(self):
+        calls = []
+        self.scheduler.enter(0.05, 1, calls.append, ("second",))
+        self.scheduler.enter(0.01, 1, calls.append, ("first",))
+        self.scheduler.enter(0.02, 1,
+                             lambda: calls.append(threading.current_thread()))
+        self.scheduler.run()
+        self.assertListEqual(calls, ["first", threading.current_thread(),
+                                     "second"])
+        self.assertTrue(self.scheduler.empty())
+
+    def test_cancelled_event_does_not_run(self):
+        calls = []
+        event = self.scheduler.enter(0.01, 1, calls.append, ("cancelled",))
+        self.scheduler.cancel(event)
+        self.scheduler.run()
+        self.assertListEqual(calls, [])
+
+    def test_exception_reaches_run(self):
+        def fail():
+            raise RuntimeError("module failure")
+        self.scheduler.enter(0, 1, fail)
+        self.assertRaises(RuntimeError, self.scheduler.run)
+
+    def test_queue_readiness(self):
+        msgQ = queue.Queue()
+        calls = []
+        self.scheduler.enter_on_queue("test", msgQ, 1, calls.append, ("ready",))
+        self.assertFalse(self.scheduler.empty())
+
+        msgQ.put("message")
+        self.core.notify_queue("test")
+        self.scheduler.run()
+        self.assertListEqual(calls, ["ready"])
+
+        # Pending messages make the event ready right away
+        self.scheduler.enter_on_queue("test", msgQ, 1, calls.append, ("again",))
+        self.scheduler.run()
+        self.assertListEqual(calls, ["ready", "again"])
+
+
+class TestPooledCoreScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.core = SchedulerCore(workers=2)
+        self.scheduler = CoreScheduler("test", core=self.core, pooled=True)
+        self.errors = queue.Queue()
+        self.calls = queue.Queue()
+
+    def test_events_run_on_workers_after_start(self):
+        self.scheduler.enter(0, 1, self.calls.put, ("first",))
+        self.scheduler.enter(0.01, 1,
+            lambda: self.calls.put(threading.current_thread()))
+        self.assertRaises(queue.Empty, self.calls.get, timeout=0.1)
+
+        self.scheduler.start(self.errors.put)
+        self.assertEqual(self.calls.get(timeout=1), "first")
+        self.assertIn("SchedulerCore", self.calls.get(timeout=1).name)
+        self.assertTrue(self.scheduler.empty())
+
+    def test_events_run_one_at_a_time(self):
+        running = []
+        overlaps = []
+
+        def poll():
+            running.append(1)
+            overlaps.append(len(running) > 1)
+            time.sleep(0.02)
+            running.pop()
+            self.calls.put("done")
+
+        for _ in range(4):
+            self.scheduler.enter(0, 1, poll)
+        self.scheduler.start(self.errors.put)
+        for _ in range(4):
+            self.calls.get(timeout=1)
+        self.assertListEqual(overlaps, [False] * 4)
+
+    def test_exception_stops_until_next_start(self):
+        def fail():
+            raise RuntimeError("module failure")
+        self.scheduler.enter(0, 1, fail)
+        self.scheduler.start(self.errors.put)
+        self.assertIsInstance(self.errors.get(timeout=1), RuntimeError)
+
+        self.scheduler.enter(0, 1, self.calls.put, ("after restart",))
+        self.assertRaises(queue.Empty, self.calls.get, timeout=0.1)
+        self.scheduler.start(self.errors.put)
+        self.assertEqual(self.calls.get(timeout=1), "after restart")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from cortx.utils.message_bus import MessageProducer
+
+from framework.base.internal_msgQ import InternalQueue
+from framework.messaging.egress_processor import EgressProcessor
+
+
+def alert(name):
+    return {"message": {"sensor_response_type": {"info": {"name": name}}}}
+
+
+def ack(name):
+    return {"message": {"actuator_response_type": {"ack": {"name": name}}}}
+
+
+SHUTDOWN = {"message": {"actuator_response_type": {"thread_controller": {
+    "thread_response": "SSPL-LL is shutting down"}}}}
+
+
+class TestEgressProcessor(unittest.TestCase):
+
+    def setUp(self):
+        egress = EgressProcessor.__new__(EgressProcessor)
+        egress._signature_user = "sspl-ll"
+        egress._signature_token = "FAKETOKEN1234"
+        egress._signature_expires = "3600"
+        egress._log_debug = lambda msg: None
+        egress._check_debug = lambda msg: (False, msg)
+        egress._producer = MagicMock(spec=MessageProducer)
+        egress.store_queue = MagicMock()
+        egress.store_queue.is_empty.return_value = True
+        egress._request_shutdown = False
+        egress._sent_msgs = 0
+        egress._sent_batches = 0
+        egress._stats_start = time.time()
+        self.egress = egress
+
+    def sent(self):
+        return [[json.loads(msg) for msg in call[0][0]]
+                for call in self.egress._producer.send.call_args_list]
+
+    def test_queued_message_not_signed(self):
+        msg = alert("cpu")
+        self.egress._transmit_batch([(msg, None)])
+        self.assertEqual(msg, alert("cpu"))
+        self.assertIn("signature", self.sent()[0][0])
+
+    def test_batch_assembly(self):
+        self.egress._transmit_batch([(alert("cpu"), None), (ack("led"), None),
+                                     (alert("fan"), None)])
+        # Responses and alerts are sent in one call each
+        self.assertEqual(
+            [[msg["message"] for msg in batch] for batch in self.sent()],
+            [[ack("led")["message"]],
+             [alert("cpu")["message"], alert("fan")["message"]]])
+        self.assertEqual(self.egress.get_throughput()["avg_batch_size"], 3)
+
+    def test_failed_alerts_queued(self):
+        self.egress._producer.send.side_effect = Exception("bus down")
+        self.egress._transmit_batch([(alert("cpu"), None), (ack("led"), None),
+                                     (alert("fan"), None)])
+        # Only the alerts are kept to be sent again, the whole batch
+        queued = [json.loads(call[0][0])["message"]
+                  for call in self.egress.store_queue.put.call_args_list]
+        self.assertEqual(queued, [alert("cpu")["message"],
+                                  alert("fan")["message"]])
+
+    def test_alerts_queued_behind_accumulated(self):
+        self.egress.store_queue.is_empty.return_value = False
+        self.egress._transmit_batch([(alert("cpu"), None)])
+        self.egress._producer.send.assert_not_called()
+        self.assertEqual(self.egress.store_queue.put.call_count, 1)
+
+    def test_shutdown_drains_queue(self):
+        q = InternalQueue()
+        for msg in (alert("cpu"), SHUTDOWN, alert("fan"), alert("psu")):
+            q.put((msg, None))
+        self.egress._msgQlist = {EgressProcessor.name(): q}
+        self.egress._running = True
+        self.egress._batch_size = 2
+        self.egress._batch_timeout = 0
+        self.egress.shutdown = MagicMock()
+        self.egress.run()
+        # Messages queued behind the shutdown message are sent
+        names = [msg["message"]["sensor_response_type"]["info"]["name"]
+                 for batch in self.sent() for msg in batch
+                 if "sensor_response_type" in msg["message"]]
+        self.assertEqual(names, ["cpu", "fan", "psu"])
+        self.assertTrue(q.empty())
+        self.egress.shutdown.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
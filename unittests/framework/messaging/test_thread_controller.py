@@ -0,0 +1,105 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import queue
+import threading
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from framework.base.module_thread import SensorThread
+from framework.base.scheduler_core import SchedulerCore
+from framework.messaging.thread_controller import execute_thread
+
+
+class PolledSensor(SensorThread):
+    """Sensor polling on the core workers, its first runs fail"""
+
+    RUN_ON_CORE_WORKERS = True
+
+    def __init__(self, failures):
+        super(PolledSensor, self).__init__(self.name(), 1)
+        self.failures = failures
+        self.runs = queue.Queue()
+        self._write_internal_msgQ = MagicMock()
+
+    @staticmethod
+    def name():
+        return "PolledSensor"
+
+    @staticmethod
+    def impact():
+        return "Polled resource is not monitored."
+
+    def initialize(self, conf_reader, msgQlist, product):
+        self._scheduler.enter(0, self._priority, self.run, ())
+
+    def run(self):
+        self.runs.put(threading.current_thread())
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("poll failed")
+
+
+class TestExecuteOnCoreWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self.core = SchedulerCore(workers=2)
+        self.monitor_msg = MagicMock()
+        for target, value in (
+                ("framework.base.module_thread.Conf.get",
+                 Mock(side_effect=lambda index, key, default=None: default)),
+                ("framework.base.scheduler_core.SchedulerCore.get_instance",
+                 Mock(return_value=self.core)),
+                ("framework.messaging.thread_controller._get_recovery_config",
+                 Mock(return_value=(2, 0))),
+                ("framework.messaging.thread_controller.store", MagicMock()),
+                ("framework.messaging.thread_controller.ThreadMonitorMsg",
+                 self.monitor_msg)):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def alerts(self):
+        return [call[0][0] for call in self.monitor_msg.call_args_list]
+
+    def runs(self, module, count):
+        threads = [module.runs.get(timeout=2) for _ in range(count)]
+        self.assertRaises(queue.Empty, module.runs.get, timeout=0.2)
+        return threads
+
+    def test_recovered_without_thread(self):
+        module = PolledSensor(failures=2)
+        execute_thread(module, {}, None, "LR2")
+        # Each failure schedules the next start on the core
+        threads = self.runs(module, 3)
+        self.assertTrue(all(thread.name.startswith("SchedulerCore")
+                            for thread in threads))
+        self.assertTrue(module.is_running())
+        self.assertListEqual(self.alerts(), [])
+
+    def test_unrecoverable(self):
+        module = PolledSensor(failures=5)
+        execute_thread(module, {}, None, "LR2")
+        self.runs(module, 3)
+        self.assertFalse(module.is_running())
+        # One fault alert once the recovery attempts are exhausted
+        alerts = self.alerts()
+        self.assertEqual(len(alerts), 1)
+        self.assertEqual(alerts[0]["alert_type"], "fault")
+        self.assertEqual(module._write_internal_msgQ.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,19 +13,24 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
-import json
 import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import patch, mock_open
 
 from framework.platforms.server.raid import RAID, RAIDs
+from framework.utils.md_raid import MdArray, MdMember, MdRaid
 
-with open(f'{os.path.dirname(__file__)}/mdadm.txt', 'rb') as f:
-    mdadm = f.read()
+MDSTAT = """Personalities : [raid1]
+md0 : active raid1 sdb2[1] sda2[0]
+      1046528 blocks super 1.2 [2/2] [UU]
+      bitmap: 0/1 pages [0KB], 65536KB chunk
 
-simpleprocess_return = [(mdadm, b'', 0),
-                        (json.dumps({"serial_number": "ZBS1VV3D"}), b'', 0),
-                        (json.dumps({"serial_number": "ZC236QHZ"}), b'', 0)]
+unused devices: <none>
+"""
+
+SERIAL_NUMBERS = {"sda2": "ZBS1VV3D", "sdb2": "ZC236QHZ"}
 
 
 class TestRAIDs(unittest.TestCase):
@@ -47,9 +52,25 @@ class TestRAIDs(unittest.TestCase):
 class TestRAID(unittest.TestCase):
 
     def setUp(self):
+        self.path = tempfile.mkdtemp()
+        mdstat = os.path.join(self.path, "mdstat")
+        with open(mdstat, "w") as f:
+            f.write(MDSTAT)
+        self._write("mismatch_cnt", "0")
+        self._write("degraded", "0")
+        self._write("array_state", "clean")
+        for slot, member in enumerate(("sda2", "sdb2")):
+            self._write(f"dev-{member}/slot", slot)
+            self._write(f"dev-{member}/state", "in_sync")
         self.raid = RAID("/dev/md0")
+        self.raid._md_raid = MdRaid(mdstat, self.path, SERIAL_NUMBERS.get)
+
+    def _write(self, attr, value):
+        path = os.path.join(self.path, "block", "md0", "md", attr)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(f"{value}\n")
 
-    @patch('cortx.utils.process.SimpleProcess.run', Mock(side_effect=simpleprocess_return))
     def test_get_devices(self):
         devices = self.raid.get_devices()
         self.assertListEqual([{"state": "active sync   /dev/sda2", "identity": {
@@ -61,16 +82,52 @@ class TestRAID(unittest.TestCase):
               "serialNumber": "ZC236QHZ"
             }}], devices)
 
-    @patch('cortx.utils.conf_store.Conf.get', Mock())
+    def test_get_health(self):
+        self.assertEqual(self.raid.get_health()[0], "OK")
+        self._write("dev-sdb2/state", "faulty")
+        self._write("degraded", "1")
+        self.raid._md_raid.refresh()
+        self.assertEqual(self.raid.get_health()[0], "Degraded")
+
+    def _set_array(self, level, status, layout=None):
+        members = tuple(MdMember(f"sd{chr(ord('a') + slot)}", slot,
+                                 "in_sync" if flag == "U" else "faulty", None)
+                        for slot, flag in enumerate(status))
+        array = MdArray("md0", "active", "clean", level, len(status),
+                        status.count("U"), status.count("_"), status, "idle",
+                        0, layout, members)
+        self.raid._get_array = lambda: array
+
+    def test_get_health_per_level(self):
+        for level, status, health in (
+                ("raid5", "UU_U", "Degraded"),
+                ("raid5", "U__U", "Fault"),
+                ("raid6", "U__UU", "Degraded"),
+                ("raid6", "U___U", "Fault"),
+                ("raid1", "U__", "Degraded"),
+                ("raid0", "U_", "Fault"),
+                # Mirrors of 2 near copies are slots 0-1 and 2-3
+                ("raid10", "U__U", "Degraded"),
+                ("raid10", "__UU", "Fault"),
+                # Copies of a chunk on any 2 consecutive slots
+                ("raid10", "UU__U", "Fault"),
+                ("raid10", "U_U_U", "Degraded")):
+            self._set_array(level, status)
+            self.assertEqual(self.raid.get_health()[0], health,
+                             f"{level} [{status}]")
+        # 3 near copies survive 2 failures of a mirror
+        self._set_array("raid10", "U__UUU", layout=0x103)
+        self.assertEqual(self.raid.get_health()[0], "Degraded")
+        self._set_array("raid10", "___UUU", layout=0x103)
+        self.assertEqual(self.raid.get_health()[0], "Fault")
+
     def test_get_data_integrity_status(self):
-        mdadm = '0\n'
-        with patch('framework.platforms.server.raid.open', mock_open(read_data=mdadm)):
-            status = self.raid.get_data_integrity_status()
-            self.assertEqual(status["raid_integrity_error"], False)
-            self.assertEqual(status["raid_integrity_mismatch_count"], "0")
+        status = self.raid.get_data_integrity_status()
+        self.assertEqual(status["raid_integrity_error"], False)
+        self.assertEqual(status["raid_integrity_mismatch_count"], "0")
 
     def tearDown(self):
-        pass
+        shutil.rmtree(self.path, ignore_errors=True)
 
 
 if __name__ == "__main__":
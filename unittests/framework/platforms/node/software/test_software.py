@@ -0,0 +1,81 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from framework.platforms.server.software import SoftwareInventory
+
+rpm_qa = (b"/usr/bin/kafka-server-start.sh\tkafka-2.13_2.7.0-el7.x86_64\t2.13_2.7.0\tApache License, Version 2.0\n"
+          b"/etc/systemd/system/kafka.service\tkafka-2.13_2.7.0-el7.x86_64\t2.13_2.7.0\tApache License, Version 2.0\n"
+          b"/usr/lib/systemd/system/sshd.service\topenssh-server-7.4p1-21.el7.x86_64\t7.4p1\tBSD\n")
+
+
+class TestSoftwareInventory(unittest.TestCase):
+
+    def setUp(self):
+        self.inventory = SoftwareInventory()
+
+    @patch("framework.platforms.server.software.os.stat")
+    @patch("framework.platforms.server.software.SimpleProcess")
+    def test_rpm_index_built_once_per_rpmdb_change(self, simple_process, stat):
+        simple_process.return_value.run.return_value = (rpm_qa, b"", 0)
+        stat.return_value = Mock(st_mtime=1)
+        self.assertEqual(self.inventory.get_rpm_property(
+            "/etc/systemd/system/kafka.service", "LICENSE"),
+            "Apache License, Version 2.0")
+        self.assertEqual(self.inventory.get_rpm_property(
+            "/usr/lib/systemd/system/sshd.service", "VERSION"), "7.4p1")
+        self.assertEqual(self.inventory.get_rpm_property(
+            "/etc/systemd/system/local.service", "VERSION"), "NA")
+        self.assertEqual(simple_process.call_count, 1)
+
+        stat.return_value = Mock(st_mtime=2)
+        self.inventory.get_rpm_property("/etc/systemd/system/kafka.service",
+                                        "VERSION")
+        self.assertEqual(simple_process.call_count, 2)
+
+    @patch("framework.platforms.server.software.Interface")
+    @patch("framework.platforms.server.software.DbusServiceHandler")
+    def test_unit_states_from_single_list_units(self, handler, interface):
+        manager = MagicMock()
+        manager.ListUnits.return_value = [
+            ("sshd.service", "OpenSSH", "loaded", "active", "running", "",
+             "/org/freedesktop/systemd1/unit/sshd_2eservice", 0, "", "/")]
+        manager.LoadUnit.return_value = "/org/freedesktop/systemd1/unit/kafka_2eservice"
+        handler._get_systemd_interface.return_value = (MagicMock(), manager)
+        interface.return_value.GetAll.side_effect = lambda iface: {
+            "Id": "unit", "Description": "desc", "UnitFileState": "enabled"}
+        interface.return_value.Get.return_value = [["/usr/sbin/sshd"]]
+
+        unit = self.inventory.get_unit("sshd.service")
+        self.assertEqual((unit["active_state"], unit["sub_state"]),
+                         ("active", "running"))
+        self.assertEqual(unit["command_line_path"], "/usr/sbin/sshd")
+        # Units not loaded are inactive
+        unit = self.inventory.get_unit("kafka.service")
+        self.assertEqual(unit["active_state"], "inactive")
+
+        self.inventory.get_unit("sshd.service")
+        self.assertEqual(manager.ListUnits.call_count, 1)
+        self.assertEqual(interface.return_value.GetAll.call_count, 2)
+        self.inventory.invalidate_units()
+        self.inventory.get_unit("sshd.service")
+        self.assertEqual(manager.ListUnits.call_count, 2)
+        self.assertEqual(interface.return_value.GetAll.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from requests.exceptions import ChunkedEncodingError
+
+from framework.platforms.realstor.realstor_enclosure import RealStorEnclosure
+from framework.utils.webservices import WebServices
+
+LOGS = bytes(range(256)) * 40
+
+
+class FakeResponse(object):
+    """Streams body in chunks, failing after fail_after bytes"""
+
+    def __init__(self, status_code, body, headers, fail_after=None):
+        self.status_code = status_code
+        self.headers = headers
+        self._body = body
+        self._fail_after = fail_after
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for offset in range(0, len(self._body), 1000):
+            if self._fail_after is not None and offset >= self._fail_after:
+                raise ChunkedEncodingError("Connection broken")
+            yield self._body[offset:offset + 1000]
+
+    def close(self):
+        self.closed = True
+
+
+def full_response(fail_after=None):
+    return FakeResponse(200, LOGS, {
+        "content-disposition": RealStorEnclosure.ENCL_LOGS_ATTACHMENT,
+        "Content-Length": str(len(LOGS))}, fail_after)
+
+
+def partial_response(offset):
+    return FakeResponse(206, LOGS[offset:], {
+        "Content-Range": f"bytes {offset}-{len(LOGS) - 1}/{len(LOGS)}"})
+
+
+class TestEnclosureLogsDownload(unittest.TestCase):
+
+    def setUp(self):
+        self.enclosure = RealStorEnclosure.__new__(RealStorEnclosure)
+        self.enclosure.ws = WebServices
+        self.enclosure.ws_request = self.ws_request
+        self.resumes = []
+        self.tmp_dir = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.tmp_dir, "enclosure_logs.zip")
+        self.logger = logging.getLogger(__name__)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def ws_request(self, url, method, headers=None, stream=False):
+        self.assertTrue(stream)
+        self.resumes.append(headers["Range"])
+        return self.responses.pop(0)
+
+    def save(self, response):
+        return self.enclosure._save_enclosure_logs(
+            "/downloadDebugData", response, self.file_name, self.logger)
+
+    def test_download_resumed(self):
+        self.responses = [partial_response(3000)]
+        response = full_response(fail_after=3000)
+        self.assertTrue(self.save(response))
+        self.assertTrue(response.closed)
+        self.assertEqual(self.resumes, ["bytes=3000-"])
+        with open(self.file_name, "rb") as f:
+            self.assertEqual(f.read(), LOGS)
+        self.assertFalse(os.path.exists(self.file_name + ".part"))
+
+    def test_range_ignored(self):
+        # Controller sends the whole file again
+        self.responses = [full_response()]
+        self.assertTrue(self.save(full_response(fail_after=5000)))
+        with open(self.file_name, "rb") as f:
+            self.assertEqual(f.read(), LOGS)
+
+    def test_download_failed(self):
+        self.responses = [full_response(fail_after=1000)
+                          for _ in range(10)]
+        self.assertFalse(self.save(full_response(fail_after=1000)))
+        self.assertEqual(len(self.resumes), 5)
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
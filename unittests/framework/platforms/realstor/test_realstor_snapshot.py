@@ -0,0 +1,117 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import threading
+import time
+import unittest
+
+from framework.platforms.realstor.realstor_snapshot import \
+    RealStorSnapshotService
+
+
+class FakeResponse(object):
+
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeEnclosure(object):
+    """Answers the show APIs, counting the requests per uri"""
+
+    LDR_R1_ENCL = "LDR_R1_ENCL"
+
+    class ws(object):
+        HTTP_GET = "GET"
+        HTTP_OK = 200
+        LOOPBACK = "127.0.0.1"
+
+    def __init__(self):
+        self.active_ip = "10.0.0.2"
+        self.requests = []
+        self.failing = set()
+        self._lock = threading.Lock()
+
+    def build_url(self, uri):
+        return uri
+
+    def get_api_status(self, status):
+        return status[0]["return-code"] if status else -1
+
+    def ws_request(self, url, method):
+        with self._lock:
+            self.requests.append(url)
+        if url in self.failing:
+            return FakeResponse(500, "")
+        key = next(key for uri, key in
+                   RealStorSnapshotService.FRU_ENDPOINTS.values() if uri == url)
+        return FakeResponse(200, json.dumps({
+            "status": [{"return-code": 0}],
+            key: [{"url": url, "count": len(self.requests)}]}))
+
+
+class TestRealStorSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.encl = FakeEnclosure()
+        self.service = RealStorSnapshotService(self.encl, cycle=30)
+
+    def test_one_fetch_per_cycle_shared(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            self.service.get_fru("power-supplies"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.encl.requests),
+                         len(RealStorSnapshotService.FRU_ENDPOINTS))
+        self.assertEqual(len(set(json.dumps(r) for r in results)), 1)
+
+        fans = self.service.get_fru("fan-modules")
+        self.assertEqual(fans[0]["url"], "/show/fan-modules")
+        self.assertEqual(len(self.encl.requests),
+                         len(RealStorSnapshotService.FRU_ENDPOINTS))
+        self.assertEqual(self.service.snapshot.version, 1)
+
+    def test_max_age_refreshes_requested_fru(self):
+        self.service.get_snapshot(["system"])
+        self.encl.requests = []
+        time.sleep(0.05)
+        snapshot = self.service.get_snapshot(["disk-groups"], max_age=0.01)
+        self.assertEqual(self.encl.requests, ["/show/disk-groups"])
+        self.assertEqual(snapshot.version, 2)
+
+        previous = snapshot
+        snapshot = self.service.get_snapshot(["disk-groups"], max_age=0)
+        self.assertTrue(snapshot.changed(previous, "disk-groups"))
+        self.assertFalse(snapshot.changed(previous, "system"))
+
+    def test_failed_fru_recorded(self):
+        self.encl.failing.add("/show/controllers")
+        snapshot = self.service.get_snapshot(["controllers"])
+        self.assertIsNone(snapshot.get("controllers"))
+        self.assertIn("controllers", snapshot.errors)
+        self.assertIsNotNone(snapshot.get("system"))
+
+        self.encl.failing.clear()
+        snapshot = self.service.get_snapshot(["controllers"], max_age=0)
+        self.assertIsNotNone(snapshot.get("controllers"))
+        self.assertNotIn("controllers", snapshot.errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import unittest
+
+from framework.base.scheduler_core import SchedulerCore
+from framework.utils.actuator_dispatcher import (ActuatorDispatcher,
+    ActuatorTimeout, LatencyHistogram)
+
+
+class Results(object):
+    """Callback recording the results of the requests"""
+
+    def __init__(self):
+        self.results = []
+        self.done = threading.Semaphore(0)
+
+    def callback(self, name):
+        def _callback(result, error):
+            self.results.append((name, result, error))
+            self.done.release()
+        return _callback
+
+    def wait(self, count):
+        for _ in range(count):
+            assert self.done.acquire(timeout=5)
+
+
+class TestActuatorDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = ActuatorDispatcher(default_workers=2, timeout=0,
+                                             core=SchedulerCore())
+        self.results = Results()
+
+    def tearDown(self):
+        self.dispatcher.shutdown()
+
+    def test_pools_are_independent(self):
+        release = threading.Event()
+        self.dispatcher.submit("smart", "SMART", release.wait,
+                               self.results.callback("slow"))
+        self.dispatcher.submit("hpi", "LED", lambda: "on",
+                               self.results.callback("fast"))
+        self.results.wait(1)
+        self.assertEqual(self.results.results, [("fast", "on", None)])
+        release.set()
+        self.results.wait(1)
+
+    def test_device_requests_are_serialized(self):
+        running = []
+        overlaps = []
+
+        def work():
+            overlaps.append(bool(running))
+            running.append(1)
+            threading.Event().wait(0.02)
+            running.pop()
+
+        for name in ("hpi", "hdparm", "hpi"):
+            self.dispatcher.submit(name, "DISK", work,
+                                   self.results.callback(name),
+                                   device="/dev/sda")
+        self.results.wait(3)
+        self.assertEqual(overlaps, [False, False, False])
+        self.assertEqual(self.dispatcher.get_stats()["busy_devices"], 0)
+
+    def test_coalescing(self):
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait()
+            return "fans"
+
+        key = ("NDHW", "NDHW:node:fru:fan")
+        self.assertTrue(self.dispatcher.submit("node_hw", "NDHW", work,
+                                               self.results.callback(1), key))
+        self.assertFalse(self.dispatcher.submit("node_hw", "NDHW", work,
+                                                self.results.callback(2), key))
+        release.set()
+        self.results.wait(2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(self.results.results),
+                         [(1, "fans", None), (2, "fans", None)])
+        self.assertEqual(self.dispatcher.get_stats()["coalesced"], 1)
+
+    def test_timeout(self):
+        release = threading.Event()
+        finished = threading.Event()
+        expired = []
+
+        def work():
+            release.wait()
+            expired.append(self.dispatcher.is_expired())
+            finished.set()
+            return "late"
+
+        self.dispatcher.submit("raid", "RAID", work,
+                               self.results.callback("raid"), timeout=0.05)
+        self.results.wait(1)
+        name, result, error = self.results.results[0]
+        self.assertIsNone(result)
+        self.assertIsInstance(error, ActuatorTimeout)
+        release.set()
+        self.assertTrue(finished.wait(5))
+        # The late result is not passed to the callback
+        self.assertEqual(expired, [True])
+        self.assertEqual(len(self.results.results), 1)
+        stats = self.dispatcher.get_stats()
+        self.assertEqual(stats["timed_out"], 1)
+        self.assertEqual(stats["latency"]["RAID"]["count"], 1)
+
+    def test_queued_request_timed_out(self):
+        dispatcher = ActuatorDispatcher(workers={"power": 1}, timeout=0,
+                                        core=SchedulerCore())
+        self.addCleanup(dispatcher.shutdown)
+        release = threading.Event()
+        calls = []
+
+        def stop():
+            release.wait()
+            calls.append("STOP")
+
+        dispatcher.submit("power", "STOP", stop, self.results.callback("stop"))
+        dispatcher.submit("power", "RESET", lambda: calls.append("RESET"),
+                          self.results.callback("reset"), timeout=0.05)
+        self.results.wait(1)
+        self.assertIsInstance(self.results.results[0][2], ActuatorTimeout)
+        release.set()
+        self.results.wait(1)
+        dispatcher.submit("power", "STATUS", lambda: None,
+                          self.results.callback("status"))
+        self.results.wait(1)
+        # The reset timed out while queued behind the stop is never run
+        self.assertEqual(calls, ["STOP"])
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets(self):
+        histogram = LatencyHistogram((0.1, 1))
+        for latency in (0.05, 0.1, 0.5, 2):
+            histogram.observe(latency)
+        stats = histogram.get_stats()
+        self.assertEqual(stats["buckets"], {"le_0.1": 2, "le_1": 1, "inf": 1})
+        self.assertEqual(stats["count"], 4)
+        self.assertEqual(stats["max"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from collections import OrderedDict
+
+from framework.utils.cluster_identity import ClusterIdentity
+from json_msgs.messages.sensors.thread_monitor_msg import ThreadMonitorMsg
+
+FIELDS = (("site_id", "site_key", "DC"), ("node_id", "node_key", "SN"),
+          ("rack_id", "rack_key", "RC"), ("cluster_id", "cluster_key", "CC"))
+
+
+class TestClusterIdentity(unittest.TestCase):
+
+    def setUp(self):
+        self.conf = {"site_key": "1", "node_key": "srvnode-1"}
+        self.reads = 0
+        self.identity = ClusterIdentity(self._conf_get, FIELDS)
+
+    def _conf_get(self, key, default):
+        self.reads += 1
+        return self.conf.get(key, default)
+
+    def test_fill_reads_config_once(self):
+        info = {"resource_type": "node:os:raid", "rack_id": "7"}
+        self.identity.fill(info)
+        self.identity.fill({})
+        self.assertEqual(info, {"resource_type": "node:os:raid",
+            "site_id": "1", "node_id": "srvnode-1", "rack_id": "7",
+            "cluster_id": "CC", "fru": "false"})
+        self.assertEqual(self.reads, len(FIELDS))
+
+    def test_refresh(self):
+        self.identity.get_ids()
+        self.conf["node_key"] = "srvnode-2"
+        self.assertEqual(self.identity.get_ids()["node_id"], "srvnode-1")
+        self.identity.refresh()
+        info = {}
+        self.identity.fill(info)
+        self.assertEqual(info["node_id"], "srvnode-2")
+
+
+class TestNormalizeKv(unittest.TestCase):
+
+    def setUp(self):
+        self.msg = ThreadMonitorMsg({})
+
+    @staticmethod
+    def _normalize(item):
+        """Former recursive implementation"""
+        if isinstance(item, dict):
+            return {key.replace("-", "_"): TestNormalizeKv._normalize(value)
+                    for key, value in item.items()}
+        elif isinstance(item, list):
+            return [TestNormalizeKv._normalize(_) for _ in item]
+        return "NA" if item == "N/A" else item
+
+    def test_normalize(self):
+        item = {"health-reason": "N/A", "status": "OK",
+                "clean": {"a": [1, {"b": 2}], "c": None},
+                "drives": [{"serial-number": "Z1"}, "N/A", [], {}],
+                "nested": [[{"x-y": {"z": "N/A"}}]],
+                "ordered": OrderedDict([("fw-version", "N/A")])}
+        self.assertEqual(self.msg.normalize_kv(item), self._normalize(item))
+        normalized = self.msg.normalize_kv(item)
+        self.assertIs(normalized["clean"], item["clean"])
+        self.assertEqual(self.msg.normalize_kv("N/A"), "NA")
+        self.assertIs(self.msg.normalize_kv(normalized), normalized)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import base64
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, unquote, urlparse
+
+from framework.utils.consulstore import ConsulStore
+
+
+class FakeConsul(object):
+    """KV and txn endpoints of consul kept in a dict"""
+
+    def __init__(self):
+        self.kv = {}
+        self.index = 1
+        self.requests = []
+        self.changed = threading.Condition()
+
+    def set(self, key, value):
+        with self.changed:
+            self.kv[key] = value
+            self.index += 1
+            self.changed.notify_all()
+
+    def entry(self, key):
+        value = self.kv[key]
+        return {"Key": key, "Value": base64.b64encode(value).decode()
+                if value else None}
+
+
+class FakeConsulHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, code, body=b""):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("X-Consul-Index", str(self.server.consul.index))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _parse(self):
+        url = urlparse(self.path)
+        self.server.consul.requests.append((self.command, url.path))
+        return unquote(url.path[len("/v1/kv/"):]), parse_qs(url.query,
+                                                            keep_blank_values=True)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_GET(self):
+        consul = self.server.consul
+        key, query = self._parse()
+        if "index" in query:
+            with consul.changed:
+                consul.changed.wait_for(
+                    lambda: consul.index > int(query["index"][0]), timeout=2)
+        keys = sorted(k for k in consul.kv if k == key or
+                      (("recurse" in query or "keys" in query) and
+                       k.startswith(key)))
+        if not keys:
+            return self._reply(404)
+        if "raw" in query:
+            return self._reply(200, consul.kv[key])
+        if "keys" in query:
+            return self._reply(200, keys)
+        return self._reply(200, [consul.entry(k) for k in keys])
+
+    def do_PUT(self):
+        consul = self.server.consul
+        key, _ = self._parse()
+        body = self._body()
+        if self.path.startswith("/v1/kv/"):
+            consul.set(key, body)
+            return self._reply(200, True)
+        results, errors = [], []
+        for index, op in enumerate(json.loads(body)):
+            kv = op["KV"]
+            if kv["Verb"] == "get" and kv["Key"] not in consul.kv:
+                errors.append({"OpIndex": index, "What": "key doesn't exist"})
+        if errors:
+            return self._reply(409, {"Results": None, "Errors": errors})
+        for op in json.loads(body):
+            kv = op["KV"]
+            if kv["Verb"] == "set":
+                consul.set(kv["Key"], base64.b64decode(kv["Value"]))
+            elif kv["Verb"] == "delete":
+                consul.kv.pop(kv["Key"], None)
+            else:
+                results.append({"KV": consul.entry(kv["Key"])})
+        return self._reply(200, {"Results": results, "Errors": None})
+
+    def do_DELETE(self):
+        key, _ = self._parse()
+        self.server.consul.kv.pop(key, None)
+        return self._reply(200, True)
+
+
+class FakeConsulServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestConsulStore(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeConsulServer(("127.0.0.1", 0), FakeConsulHandler)
+        self.server.consul = self.consul = FakeConsul()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.store = ConsulStore("127.0.0.1", self.server.server_port)
+        self.store.TXN_MAX_OPS = 4
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_single_key_operations(self):
+        self.store.put({"health": "OK"}, "/sspl/disk_1")
+        self.store.put("raw message", "sspl/messages/0", pickled=False)
+        self.assertEqual(self.store.get("sspl/disk_1"), {"health": "OK"})
+        self.assertEqual(self.store.get("sspl/messages/0"), b"raw message")
+        self.assertEqual(self.store.exists("sspl/disk_1"), (True, "Success"))
+        self.assertEqual(self.store.exists("sspl/disk_2"), (False, "Success"))
+        self.assertEqual(sorted(self.store.get_keys_with_prefix("sspl/")),
+                         ["0", "disk_1"])
+        self.store.delete("sspl/disk_1")
+        self.assertIsNone(self.store.get("sspl/disk_1"))
+
+    def test_batched_operations(self):
+        items = {f"sspl/disk_{slot}": {"slot": slot} for slot in range(10)}
+        self.assertTrue(self.store.put_many(items))
+        txns = [path for _, path in self.consul.requests if path == "/v1/txn"]
+        self.assertEqual(len(txns), 3)
+
+        values = self.store.get_many(["sspl/disk_1", "sspl/disk_9",
+                                      "sspl/missing"])
+        self.assertEqual(values, {"sspl/disk_1": {"slot": 1},
+                                  "sspl/disk_9": {"slot": 9},
+                                  "sspl/missing": None})
+
+        self.assertTrue(self.store.delete_many(list(items)[:5]))
+        self.assertEqual(len(self.store.get_keys_with_prefix("sspl/")), 5)
+
+    def test_unreachable_consul(self):
+        server = HTTPServer(("127.0.0.1", 0), FakeConsulHandler)
+        server.server_close()
+        store = ConsulStore("127.0.0.1", server.server_port)
+        store.BACKOFF_BASE = 0.0001
+        self.assertEqual(store.exists("sspl/disk_1"), (False, "Failure"))
+        self.assertIsNone(store.get_many(["sspl/disk_1"]))
+
+    def test_watch(self):
+        self.store.put(1, "sspl/head")
+        index, value = self.store.watch("sspl/head")
+        self.assertEqual(value, 1)
+
+        threading.Timer(0.1, self.store.put, (2, "sspl/head")).start()
+        start = time.time()
+        index, value = self.store.watch("sspl/head", index, wait=5)
+        self.assertEqual(value, 2)
+        self.assertLess(time.time() - start, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
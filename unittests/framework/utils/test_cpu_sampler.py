@@ -0,0 +1,123 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from framework.utils.cpu_sampler import CpuSampler
+
+
+class TestCpuSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.stat_path = os.path.join(self.path, "stat")
+        # busy and idle jiffies of cpu0 and cpu1
+        self.jiffies = [[0, 0], [0, 0]]
+        self.sampler = CpuSampler(tick=1, max_window=60, cpus=2,
+                                  stat_path=self.stat_path)
+
+    def _tick(self, busy0, idle0, busy1=None, idle1=None):
+        cores = [(0, busy0, idle0)]
+        if busy1 is not None:
+            cores.append((1, busy1, idle1))
+        for core, busy, idle in cores:
+            self.jiffies[core][0] += busy
+            self.jiffies[core][1] += idle
+        lines = []
+        total_busy = sum(busy for busy, _ in self.jiffies)
+        total_idle = sum(idle for _, idle in self.jiffies)
+        lines.append(f"cpu  {total_busy} 0 0 {total_idle} 0 0 0 0 0 0\n")
+        for core, _, _ in cores:
+            busy, idle = self.jiffies[core]
+            lines.append(f"cpu{core} {busy} 0 0 {idle} 0 0 0 0 0 0\n")
+        lines.append("intr 0\n")
+        with open(self.stat_path, "w") as stat:
+            stat.writelines(lines)
+        self.sampler.sample()
+
+    def test_current_usage(self):
+        self._tick(0, 0, 0, 0)
+        self._tick(50, 50, 100, 0)
+        self.assertEqual(self.sampler.get_usage(), 75.0)
+        self.assertListEqual(self.sampler.get_usage(percpu=True), [50.0, 100.0])
+
+    def test_windows(self):
+        self._tick(0, 0, 0, 0)
+        for _ in range(30):
+            self._tick(100, 0, 100, 0)
+        for _ in range(60):
+            self._tick(0, 100, 0, 100)
+        usage = self.sampler.get_window_usage()
+        self.assertEqual(usage["current"], 0.0)
+        self.assertEqual(usage["1min"], 0.0)
+        # Longer windows are bounded by the samples held, 61 ticks back
+        self.assertEqual(usage["15min"], 1.6)
+
+        self._tick(100, 0, 100, 0)
+        self.assertAlmostEqual(self.sampler.get_usage(60), 1.7)
+
+    def test_partial_window_and_offline_core(self):
+        self._tick(0, 0, 0, 0)
+        self._tick(100, 100, 100, 100)
+        # cpu1 goes offline and is missing from /proc/stat
+        self._tick(100, 100)
+        self.assertListEqual(self.sampler.get_usage(percpu=True), [50.0, 0.0])
+        self.assertListEqual(self.sampler.get_usage(300, percpu=True),
+                             [50.0, 50.0])
+
+    def _write_stat(self, cores):
+        """cores: core id to (busy, idle) cumulative jiffies"""
+        lines = [f"cpu  {sum(busy for busy, _ in cores.values())} 0 0 "
+                 f"{sum(idle for _, idle in cores.values())} 0 0 0 0 0 0\n"]
+        for core, (busy, idle) in sorted(cores.items()):
+            lines.append(f"cpu{core} {busy} 0 0 {idle} 0 0 0 0 0 0\n")
+        with open(self.stat_path, "w") as stat:
+            stat.writelines(lines)
+
+    def test_sized_from_highest_core_id(self):
+        # cpu1 is offline, ids are sparse
+        self._write_stat({0: (0, 0), 2: (0, 0), 3: (0, 0)})
+        sampler = CpuSampler(tick=1, max_window=60, stat_path=self.stat_path)
+        self.assertEqual(sampler.cpus, 4)
+        sampler.sample()
+        self._write_stat({0: (10, 90), 2: (20, 80), 3: (100, 0)})
+        sampler.sample()
+        self.assertListEqual(sampler.get_usage(percpu=True),
+                             [10.0, 0.0, 20.0, 100.0])
+
+    def test_core_with_higher_id_added(self):
+        self._tick(0, 0, 0, 0)
+        self._tick(50, 50, 50, 50)
+        # cpu3 comes online with jiffies counted before the sampler saw it
+        self._write_stat({0: (100, 100), 1: (100, 100), 3: (500, 500)})
+        self.sampler.sample()
+        self.assertEqual(self.sampler.cpus, 4)
+        self.assertListEqual(self.sampler.get_usage(60, percpu=True),
+                             [50.0, 50.0, 0.0, 0.0])
+        self._write_stat({0: (100, 200), 1: (100, 200), 3: (600, 500)})
+        self.sampler.sample()
+        self.assertListEqual(self.sampler.get_usage(percpu=True),
+                             [0.0, 0.0, 0.0, 100.0])
+        self.assertEqual(self.sampler.get_usage(60, percpu=True)[3], 100.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.utils.filestore import FileStore
+from framework.utils.store_factory import _get_file_store
+
+
+class TestFileStore(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.key = os.path.join(self.path, "cache", "SSPL_MESSAGE_HEAD_INDEX")
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_cached_reads(self):
+        store = FileStore(cached=True)
+        store.put({"head": 1}, self.key)
+        for _ in range(3):
+            self.assertEqual(store.get(self.key), {"head": 1})
+        self.assertEqual(store.get_cache_stats(),
+                         {"hits": 3, "misses": 0, "entries": 1})
+
+        # Returned values are copies of the cached content
+        store.get(self.key)["head"] = 2
+        self.assertEqual(store.get(self.key), {"head": 1})
+
+    def test_immutable_values_not_deserialized_again(self):
+        store = FileStore(cached=True)
+        store.put(7, self.key)
+        store.put(None, f"{self.key}_none")
+        FileStore().put("fault", f"{self.key}_state")
+        store.get(f"{self.key}_state")
+        with patch("framework.utils.filestore.pickle.loads") as loads:
+            self.assertEqual(store.get(self.key), 7)
+            self.assertIsNone(store.get(f"{self.key}_none"))
+            self.assertEqual(store.get(f"{self.key}_state"), "fault")
+            loads.assert_not_called()
+        self.assertEqual(store.get_cache_stats()["hits"], 3)
+
+    def test_external_change_invalidates(self):
+        store = FileStore(cached=True)
+        store.put(1, self.key)
+        FileStore().put(2, self.key)
+        self.assertEqual(store.get(self.key), 2)
+        self.assertEqual(store.get_cache_stats()["misses"], 1)
+        self.assertEqual(store.get(self.key), 2)
+        self.assertEqual(store.get_cache_stats()["hits"], 1)
+
+        store.delete(self.key)
+        self.assertIsNone(store.get(self.key))
+        self.assertEqual(store.get_cache_stats()["entries"], 0)
+
+    def test_atomic_write_of_raw_values(self):
+        store = FileStore(cached=True)
+        store.put("message", self.key, pickled=False)
+        self.assertEqual(store.get(self.key), b"message")
+        self.assertEqual(os.listdir(os.path.dirname(self.key)),
+                         ["SSPL_MESSAGE_HEAD_INDEX"])
+
+    def test_cache_bounds(self):
+        store = FileStore(cached=True, cache_size=2, cache_max_value=64)
+        # Large contents, e.g. messages, are not cached
+        store.put("m" * 65, self.key, pickled=False)
+        self.assertEqual(store.get(self.key), b"m" * 65)
+        self.assertEqual(store.get_cache_stats()["entries"], 0)
+        for index in range(3):
+            store.put(index, f"{self.key}_{index}")
+        self.assertEqual(store.get_cache_stats()["entries"], 2)
+        # Least recently used entry was dropped
+        store.get(f"{self.key}_1")
+        store.get(f"{self.key}_0")
+        self.assertEqual(store.get_cache_stats(),
+                         {"hits": 1, "misses": 2, "entries": 2})
+
+    def test_group_fsync(self):
+        store = FileStore(fsync_batch=3)
+        with patch("os.fsync") as fsync:
+            store.put(1, self.key + "_1")
+            store.put(2, self.key + "_2")
+            self.assertEqual(fsync.call_count, 0)
+            store.put(3, self.key + "_3")
+            # The three files and their directory
+            self.assertEqual(fsync.call_count, 4)
+
+
+class TestFileStoreConfig(unittest.TestCase):
+
+    def get_file_store(self, conf):
+        with patch("framework.utils.store_factory.Conf.get",
+                   Mock(side_effect=lambda index, key, default=None:
+                        conf.get(key.split(">")[-1], default))):
+            return _get_file_store()
+
+    def test_defaults(self):
+        store = self.get_file_store({})
+        self.assertTrue(store._cached)
+        self.assertEqual(store._fsync_batch, 0)
+
+    def test_datastore_settings(self):
+        store = self.get_file_store({"file_store_cached": "false",
+                                     "file_store_fsync_batch": "8"})
+        self.assertFalse(store._cached)
+        self.assertEqual(store._fsync_batch, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
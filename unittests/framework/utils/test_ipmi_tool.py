@@ -18,7 +18,7 @@
 import os
 import unittest
 import shutil
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from framework.utils.ipmi_client import IpmiFactory, Conf, store
 from framework.base.sspl_constants import DATA_PATH
@@ -61,6 +61,70 @@ class TestIpmiTool(unittest.TestCase):
         self.assertEqual(retcode, 1, msg=err_str)
         self.assertTrue(self.tool.VM_ERROR in err, msg=err_str)
 
+    def test_parse_sdr_list(self):
+        sdr_out = ("Sys Fan 2B       | 33h | ok  | 29.4 | 5332 RPM\n"
+                   "PS1 Status       | C8h | ok  | 10.1 | Presence detected\n"
+                   "\n")
+        sensors = self.tool.parse_sdr_list(sdr_out)
+        self.assertDictEqual(sensors, {
+            "Sys Fan 2B": ("33", "ok", "29.4", "5332 RPM"),
+            "PS1 Status": ("c8", "ok", "10.1", "Presence detected")})
+
+    def test_split_sdr_get(self):
+        props_out = ("Sensor ID              : PS1 Status (0xc8)\n"
+                     " Entity ID             : 10.1 (Power Supply)\n"
+                     " States Asserted       : Power Supply\n"
+                     "                         [Presence detected]\n"
+                     "\n"
+                     "Sensor ID              : Fan 1\n"
+                     " Entity ID             : 29.1 (Fan Device)\n")
+        records = self.tool.split_sdr_get(props_out)
+        self.assertDictEqual(records, {
+            "PS1 Status": "Sensor ID              : PS1 Status (0xc8)\n"
+                          " Entity ID             : 10.1 (Power Supply)\n"
+                          " States Asserted       : Power Supply\n"
+                          "                         [Presence detected]\n",
+            "Fan 1": "Sensor ID              : Fan 1\n"
+                     " Entity ID             : 29.1 (Fan Device)\n"})
+
+    def test_parse_sensor_get(self):
+        props_out = ("Locating sensor record...\n"
+                     "Sensor ID              : HDD 0 Status (0xf0)\n"
+                     " Entity ID             : 4.1\n"
+                     " Sensor Type (Discrete): Drive Slot / Bay\n"
+                     " States Asserted       : Drive Slot / Bay\n"
+                     "                         [Drive Present]\n"
+                     "\n"
+                     "Sensor ID              : PS2 Status (0x51)\n"
+                     " Entity ID             : 10.2\n"
+                     " Sensor Type (Discrete): Power Supply\n"
+                     "\n")
+        sensors = self.tool.parse_sensor_get(props_out)
+        self.assertDictEqual(sensors, {
+            "HDD 0 Status": (
+                {"Sensor ID": "HDD 0 Status (0xf0)", "Entity ID": "4.1"},
+                {"Sensor Type (Discrete)": "Drive Slot / Bay",
+                 "States Asserted": "Drive Slot / Bay\n"
+                                    "                         [Drive Present]"}),
+            "PS2 Status": (
+                {"Sensor ID": "PS2 Status (0x51)", "Entity ID": "10.2"},
+                {"Sensor Type (Discrete)": "Power Supply"})})
+
+    def test_get_sensors_props_reads_missing_sensors_alone(self):
+        props_out = ("Locating sensor record...\n"
+                     "Sensor ID              : Fan 1 (0x41)\n"
+                     " Entity ID             : 29.1\n"
+                     " Sensor Reading        : 5300 (+/- 0) RPM\n")
+        with patch.object(self.tool, "_run_ipmitool_subcommand",
+                          return_value=(props_out, "not found", 1)) as run, \
+                patch.object(self.tool, "get_sensor_props",
+                             return_value=(False, {"ERROR": "not found"})):
+            props = self.tool.get_sensors_props(["Fan 1", "Fan 2"])
+        run.assert_called_once_with("sensor get 'Fan 1' 'Fan 2'")
+        self.assertEqual(props["Fan 1"][1],
+                         {"Sensor Reading": "5300 (+/- 0) RPM"})
+        self.assertEqual(props["Fan 2"], (False, {"ERROR": "not found"}))
+
     # TODO: Needs to be implemented
     # def test_ipmi_over_lan(self):
     #     pass
@@ -0,0 +1,112 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from framework.utils.md_raid import MdRaid
+
+MDSTAT = """Personalities : [raid1]
+md0 : active raid1 sdb1[1] sda1[0]
+      1046528 blocks super 1.2 [2/2] [UU]
+      bitmap: 0/1 pages [0KB], 65536KB chunk
+
+md1 : active raid1 sdd[2](F) sdc[0]
+      2096128 blocks super 1.2 [2/1] [U_]
+
+unused devices: <none>
+"""
+
+
+class TestMdRaid(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.mdstat = os.path.join(self.path, "mdstat")
+        self.serial_lookups = []
+        with open(self.mdstat, "w") as mdstat:
+            mdstat.write(MDSTAT)
+        self._write("md0", "mismatch_cnt", "0")
+        self._write("md0", "sync_action", "idle")
+        self._write("md0", "degraded", "0")
+        self._member("md0", "sda1", "0", "in_sync", "8:1")
+        self._member("md0", "sdb1", "1", "in_sync", "8:17")
+        self._member("md1", "sdc", "0", "in_sync", "8:32")
+        self._member("md1", "sdd", "none", "faulty", "8:48")
+        self.md_raid = MdRaid(self.mdstat, self.path, self._serial_lookup)
+
+    def _serial_lookup(self, member):
+        self.serial_lookups.append(member)
+        return f"SN-{member}"
+
+    def _write(self, array, attr, value):
+        path = os.path.join(self.path, "block", array, "md", attr)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as attr_file:
+            attr_file.write(f"{value}\n")
+
+    def _member(self, array, name, slot, state, dev):
+        self._write(array, f"dev-{name}/slot", slot)
+        self._write(array, f"dev-{name}/state", state)
+        self._write(array, f"dev-{name}/block/dev", dev)
+
+    def test_snapshot(self):
+        snapshot, events = self.md_raid.refresh()
+        self.assertEqual(len(events), 2)
+        md0 = snapshot["md0"]
+        self.assertEqual((md0.level, md0.raid_disks, md0.status),
+                         ("raid1", 2, "UU"))
+        self.assertEqual((md0.mismatch_cnt, md0.sync_action), (0, "idle"))
+        self.assertEqual([(member.name, member.slot) for member in md0.members],
+                         [("sda1", 0), ("sdb1", 1)])
+        md1 = snapshot["md1"]
+        self.assertEqual(md1.status, "U_")
+        self.assertEqual(md1.members[-1].slot, None)
+        self.assertEqual(md1.members[-1].state, "faulty")
+
+    def test_diff(self):
+        self.md_raid.refresh()
+        self._write("md0", "dev-sdb1/state", "faulty")
+        self._write("md0", "mismatch_cnt", "128")
+        _, events = self.md_raid.refresh()
+        self.assertEqual(sorted(event.kind for event in events),
+                         [MdRaid.ARRAY_CHANGED, MdRaid.MEMBER_CHANGED])
+        member = [event for event in events if event.member][0]
+        self.assertEqual((member.array, member.member, member.new.state),
+                         ("md0", "sdb1", "faulty"))
+        _, events = self.md_raid.refresh()
+        self.assertEqual(events, [])
+
+    def test_identity_cached_until_member_changes(self):
+        self.md_raid.refresh()
+        identity = self.md_raid.get_identity("sda1")
+        self.assertEqual(identity, {"path": "/dev/sda1",
+                                    "serialNumber": "SN-sda1"})
+        self.md_raid.get_identity("sda1")
+        self.assertEqual(self.serial_lookups, ["sda1"])
+        # Drive replaced by another one
+        self._write("md0", "dev-sda1/block/dev", "8:64")
+        self.md_raid.refresh()
+        self.md_raid.get_identity("sda1")
+        self.assertEqual(self.serial_lookups, ["sda1", "sda1"])
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from framework.utils.net_status import IfStatus, NetworkStatus
+
+
+class TestNetworkStatus(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.commands = []
+        self.ping_returncode = 0
+        self._interface("eth9", "up", "1")
+        self._interface("eth10", "down", "0")
+        self._interface("bond9", "lowerlayerdown", None)
+        self.nw_status = NetworkStatus(self.path, runner=self._run)
+
+    def _interface(self, name, operstate, carrier):
+        net_dir = os.path.join(self.path, "class", "net", name)
+        os.makedirs(net_dir)
+        with open(os.path.join(net_dir, "operstate"), "w") as f:
+            f.write(f"{operstate}\n")
+        if carrier is not None:
+            with open(os.path.join(net_dir, "carrier"), "w") as f:
+                f.write(f"{carrier}\n")
+
+    def _run(self, command):
+        self.commands.append(command.split()[0])
+        if command.startswith("ping"):
+            return "", "", self.ping_returncode
+        return "IP Address Source : Static Address\n" \
+               "IP Address : 10.0.0.9\nSubnet Mask : 255.255.255.0", "", 0
+
+    def test_interfaces(self):
+        interfaces = self.nw_status.get_interfaces()
+        self.assertEqual(interfaces["eth9"], IfStatus("UP", "", "CONNECTED"))
+        self.assertEqual(interfaces["eth10"],
+                         IfStatus("DOWN", "", "DISCONNECTED"))
+        self.assertEqual(interfaces["bond9"],
+                         IfStatus("LOWERLAYERDOWN", "", "UNKNOWN"))
+        self.assertEqual(self.commands, [])
+
+    def test_bmc_lan_cached_until_unreachable(self):
+        self.nw_status.probe_bmc()
+        self.nw_status.probe_bmc()
+        self.assertEqual(self.nw_status.get_bmc_status(), ("10.0.0.9", True))
+        self.assertEqual(self.commands, ["sudo", "ping", "ping"])
+        self.ping_returncode = 1
+        self.nw_status.probe_bmc()
+        self.assertEqual(self.nw_status.get_bmc_status(), ("10.0.0.9", False))
+        self.nw_status.probe_bmc()
+        self.assertEqual(self.commands.count("sudo"), 2)
+
+    def test_parse_link_events(self):
+        name = b"eth9\0"
+        attr = struct.pack("=HH", 4 + len(name), NetworkStatus.IFLA_IFNAME) + \
+            name + b"\0" * 3
+        body = struct.pack("=BxHiII", 0, 1, 2, 0, 0) + attr
+        msg = struct.pack("=IHHII", 16 + len(body), NetworkStatus.RTM_NEWLINK,
+                          0, 0, 0) + body
+        self.assertEqual(self.nw_status._parse_link_events(msg * 2),
+                         ["eth9", "eth9"])
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import time
+import unittest
+
+from framework.utils.resource_collector import ResourceCollector
+
+
+class TestResourceCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.collector = ResourceCollector(workers=4)
+        self.calls = []
+
+    def _method(self, name, delay=0, fail=False):
+        def collect():
+            self.calls.append(name)
+            time.sleep(delay)
+            if fail:
+                raise RuntimeError(name)
+            return f"{name}-{len(self.calls)}"
+        return collect
+
+    def test_collectors_run_concurrently_and_are_cached(self):
+        self.collector.register("cpu", self._method("cpu", 0.2), ttl=60)
+        self.collector.register("disk", self._method("disk", 0.2), ttl=60)
+        start = time.time()
+        results = self.collector.collect()
+        self.assertLess(time.time() - start, 0.35)
+        self.assertEqual(results["cpu"].status, ResourceCollector.STATUS_FRESH)
+
+        results = self.collector.collect(["cpu"])
+        self.assertEqual(results["cpu"].status, ResourceCollector.STATUS_CACHED)
+        self.assertEqual(len(self.calls), 2)
+
+        self.collector.invalidate("cpu")
+        self.assertEqual(self.collector.collect(["cpu"])["cpu"].status,
+                         ResourceCollector.STATUS_FRESH)
+
+    def test_timeout_serves_stale_value(self):
+        self.collector.register("raid", self._method("raid", 0.3), ttl=0,
+                                timeout=0.05)
+        result = self.collector.collect()["raid"]
+        self.assertEqual(result.status, ResourceCollector.STATUS_UNAVAILABLE)
+        self.assertIsNone(result.value)
+
+        # The run completes in the background and is not started again
+        time.sleep(0.4)
+        self.assertEqual(self.calls, ["raid"])
+        result = self.collector.collect()["raid"]
+        self.assertEqual(result.status, ResourceCollector.STATUS_STALE)
+        self.assertEqual(result.value, "raid-1")
+
+    def test_failure_serves_last_value(self):
+        fail = threading.Event()
+
+        def collect():
+            if fail.is_set():
+                raise RuntimeError("ipmitool failed")
+            return "sensors"
+        self.collector.register("fan", collect, ttl=0)
+        self.assertEqual(self.collector.get("fan"), "sensors")
+        fail.set()
+        result = self.collector.collect()["fan"]
+        self.assertEqual(result.status, ResourceCollector.STATUS_STALE)
+        self.assertEqual(result.value, "sensors")
+
+    def test_fingerprint_change_invalidates(self):
+        version = [1]
+        self.collector.register("services", self._method("services"), ttl=60,
+                                fingerprint=lambda: version[0])
+        self.collector.collect()
+        self.collector.collect()
+        version[0] = 2
+        self.collector.collect()
+        self.assertEqual(self.calls, ["services", "services"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from framework.utils.segment_log import SegmentLog
+
+
+class TestSegmentLog(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.log = SegmentLog(self.path, segment_size=256, fsync_batch=4)
+
+    def _segments(self):
+        return [name for name in os.listdir(self.path)
+                if name.startswith(SegmentLog.SEGMENT_PREFIX)]
+
+    def test_fifo_across_segments(self):
+        for index in range(50):
+            self.log.append(f"message-{index}")
+        self.assertEqual(len(self.log), 50)
+        self.assertGreater(len(self._segments()), 1)
+
+        self.assertEqual(self.log.peek(2), (0, [b"message-0", b"message-1"]))
+        self.log.ack(10)
+        self.assertEqual(self.log.peek(1), (10, [b"message-10"]))
+        self.assertEqual(len(self.log), 40)
+
+    def test_ack_only_removes_peeked_records(self):
+        for index in range(20):
+            self.log.append(f"message-{index}")
+        first, records = self.log.peek(5)
+        # Another consumer drops the head meanwhile
+        head, _ = self.log.peek(0)
+        self.log.ack(head + 1)
+        self.log.ack(first + len(records))
+        self.assertEqual(self.log.peek(1), (5, [b"message-5"]))
+        self.assertEqual(len(self.log), 15)
+        # Acking records already removed is a no-op
+        self.assertEqual(self.log.ack(first + 2), 0)
+
+    def test_size_is_bytes_on_disk(self):
+        self.log.append("abcd")
+        self.assertEqual(self.log.size(), SegmentLog.HEADER.size + 4)
+        self.log.ack(1)
+        self.assertEqual(self.log.size(), 0)
+
+    def test_checkpoint_survives_restart(self):
+        for index in range(20):
+            self.log.append(f"message-{index}")
+        self.log.ack(7)
+        log = SegmentLog(self.path, segment_size=256)
+        self.assertEqual(len(log), 13)
+        self.assertEqual(log.peek(1), (7, [b"message-7"]))
+
+    def test_partial_record_is_dropped(self):
+        self.log.append("complete")
+        self.log.sync()
+        tail = sorted(self._segments())[-1]
+        with open(os.path.join(self.path, tail), "ab") as fh:
+            fh.write(b"\x00\x00\x00\x20trunc")
+        log = SegmentLog(self.path, segment_size=256)
+        self.assertEqual(len(log), 1)
+        log.append("next")
+        self.assertEqual(log.peek(5), (0, [b"complete", b"next"]))
+
+    def test_drained_segments_are_removed(self):
+        for index in range(50):
+            self.log.append(f"message-{index}")
+        self.log.ack(50)
+        self.assertEqual(len(self.log), 0)
+        self.assertEqual(len(self._segments()), 1)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import Mock
+
+from framework.utils.smart_poller import SmartHealthPoller
+
+
+PASSED = ("SMART overall-health self-assessment test result: PASSED", "", 0)
+
+
+def commands(*drives):
+    return {drive: f"sudo smartctl -H {drive}" for drive in drives}
+
+
+class TestSmartHealthPoller(unittest.TestCase):
+
+    def setUp(self):
+        # Mocked smartctl, fails for /dev/sdc
+        self.smartctl = Mock(side_effect=self._smartctl)
+        self.poller = SmartHealthPoller(interval=300, workers=2, jitter=0,
+                                        max_checks=32, runner=self.smartctl)
+        self.addCleanup(self.poller.shutdown)
+
+    def _smartctl(self, command):
+        if command.endswith("/dev/sdc"):
+            raise OSError("smartctl not found")
+        return PASSED
+
+    def checked(self, drives, now):
+        self.smartctl.reset_mock()
+        results = self.poller.poll(commands(*drives), now)
+        self.assertEqual(sorted(call[0][0] for call in
+                                self.smartctl.call_args_list),
+                         sorted(commands(*results).values()))
+        return sorted(results)
+
+    def test_poll_interval(self):
+        drives = ["/dev/sda", "/dev/sdb"]
+        self.assertEqual(self.checked(drives, 1000), drives)
+        # Results are kept until the interval has elapsed
+        self.assertEqual(self.checked(drives, 1299), [])
+        self.assertEqual(self.checked(drives, 1300), drives)
+
+    def test_new_and_invalidated_drives_checked(self):
+        self.checked(["/dev/sda", "/dev/sdb"], 1000)
+        self.poller.invalidate("/dev/sdb")
+        self.assertEqual(self.checked(["/dev/sda", "/dev/sdb", "/dev/sdd"],
+                                      1010), ["/dev/sdb", "/dev/sdd"])
+
+    def test_removed_drive_checked_when_back(self):
+        self.checked(["/dev/sda", "/dev/sdb"], 1000)
+        self.assertEqual(self.checked(["/dev/sda"], 1010), [])
+        self.assertEqual(self.checked(["/dev/sda", "/dev/sdb"], 1020),
+                         ["/dev/sdb"])
+
+    def test_max_checks_oldest_first(self):
+        poller = SmartHealthPoller(interval=300, jitter=0, max_checks=2,
+                                   runner=self.smartctl)
+        self.addCleanup(poller.shutdown)
+        drives = commands("/dev/sda", "/dev/sdb", "/dev/sdd")
+        self.assertEqual(sorted(poller.poll(drives, 1000)),
+                         ["/dev/sda", "/dev/sdb"])
+        self.assertEqual(sorted(poller.poll(drives, 1010)), ["/dev/sdd"])
+        # The drive checked last is due last
+        self.assertEqual(sorted(poller.poll(drives, 1300)),
+                         ["/dev/sda", "/dev/sdb"])
+
+    def test_failed_check(self):
+        results = self.poller.poll(commands("/dev/sda", "/dev/sdc"), 1000)
+        self.assertEqual(results["/dev/sda"], PASSED)
+        self.assertEqual(results["/dev/sdc"], ("", "smartctl not found", -1))
+        # A failed check is not retried before the interval
+        self.assertEqual(self.checked(["/dev/sda", "/dev/sdc"], 1010), [])
+        self.assertEqual(self.checked(["/dev/sda", "/dev/sdc"], 1300),
+                         ["/dev/sda", "/dev/sdc"])
+
+    def test_jitter_bounds(self):
+        poller = SmartHealthPoller(interval=100, jitter=0.1,
+                                   runner=self.smartctl)
+        self.addCleanup(poller.shutdown)
+        drives = commands(*[f"/dev/sd{letter}" for letter in "abdefgh"])
+        poller.poll(drives, 1000)
+        self.assertEqual(poller.poll(drives, 1089), {})
+        self.assertEqual(len(poller.poll(drives, 1110)), len(drives))
+
+
+if __name__ == "__main__":
+    unittest.main()
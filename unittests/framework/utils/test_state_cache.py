@@ -0,0 +1,89 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import unittest
+from unittest.mock import Mock
+
+from framework.utils.state_cache import WriteBehindCache
+
+
+class DictStore(object):
+    """Minimal in memory store keeping track of the writes."""
+
+    def __init__(self):
+        self.data = {}
+        self.put = Mock(side_effect=self._put)
+        self.delete = Mock(side_effect=self._delete)
+
+    def _put(self, value, key, pickled=True):
+        self.data[key] = value
+
+    def _delete(self, key):
+        self.data.pop(key, None)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def get_keys_with_prefix(self, prefix):
+        return [os.path.basename(key) for key in self.data
+                if key.startswith(prefix)]
+
+
+class TestWriteBehindCache(unittest.TestCase):
+
+    PREFIX = "/var/cortx/sspl/data/server/disks"
+    DRIVE = "/org/freedesktop/UDisks2/drives/drive_1"
+
+    def setUp(self):
+        self.store = DictStore()
+        self.cache = WriteBehindCache(self.store, self.PREFIX, flush_window=60)
+
+    def test_flush_writes_only_dirty_records(self):
+        self.cache[self.DRIVE] = {"faulty": False}
+        self.cache["/org/freedesktop/UDisks2/drives/drive_2"] = {"faulty": False}
+        self.cache.flush(force=True)
+        self.assertEqual(self.store.put.call_count, 2)
+
+        self.cache[self.DRIVE]["faulty"] = True
+        self.cache.mark_dirty(self.DRIVE)
+        self.cache.flush(force=True)
+        self.assertEqual(self.store.put.call_count, 3)
+
+        # Nothing changed, nothing written
+        self.cache.flush(force=True)
+        self.assertEqual(self.store.put.call_count, 3)
+
+    def test_flush_is_deferred_within_window(self):
+        self.cache[self.DRIVE] = {"faulty": False}
+        self.cache.flush()
+        self.store.put.assert_not_called()
+        self.assertTrue(self.cache.is_dirty())
+
+    def test_delete_and_reload(self):
+        self.cache[self.DRIVE] = {"faulty": True}
+        self.cache["drive_2"] = {"faulty": False}
+        self.cache.flush(force=True)
+        del self.cache["drive_2"]
+        self.cache.flush(force=True)
+        self.store.delete.assert_called_once()
+
+        cache = WriteBehindCache(self.store, self.PREFIX).load()
+        self.assertDictEqual(dict(cache), {self.DRIVE: {"faulty": True}})
+        self.assertFalse(cache.is_dirty())
+
+
+if __name__ == "__main__":
+    unittest.main()
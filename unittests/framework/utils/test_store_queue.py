@@ -0,0 +1,90 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import Mock, patch
+
+from framework.utils.store_queue import StoreQueue
+
+
+class FakeStore(object):
+    """Store in a dict, reads fail while unavailable is set"""
+
+    def __init__(self):
+        self.data = {}
+        self.unavailable = False
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def get_many(self, keys):
+        if self.unavailable:
+            return None
+        return {key: self.data.get(key) for key in keys}
+
+    def put(self, value, key, pickled=True):
+        self.data[key] = value
+
+    def put_many(self, values):
+        self.data.update(values)
+
+    def delete_many(self, keys):
+        for key in keys:
+            self.data.pop(key, None)
+        return True
+
+
+class TestStoreQueueCounters(unittest.TestCase):
+
+    def setUp(self):
+        self.store = FakeStore()
+        for name, value in (
+                ("store", self.store),
+                ("Conf.get", Mock(side_effect=lambda index, key, default:
+                                  default))):
+            patcher = patch(f"framework.utils.store_queue.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.queue = StoreQueue()
+        for msg in ("a", "b", "c"):
+            self.queue.put(msg)
+
+    def counters(self):
+        return {key: self.store.data[key] for key in (
+            self.queue.SSPL_MEMORY_USAGE, self.queue.SSPL_MESSAGE_HEAD_INDEX,
+            self.queue.SSPL_MESSAGE_TAIL_INDEX)}
+
+    def test_read_failure_writes_nothing(self):
+        counters = self.counters()
+        self.store.unavailable = True
+        StoreQueue()
+        self.queue.put("d")
+        self.queue.delete()
+        self.queue.ack(3)
+        self.assertTrue(self.queue.is_empty())
+        self.assertEqual(self.queue.get_batch(10), (0, []))
+        self.assertEqual(self.counters(), counters)
+        self.store.unavailable = False
+        self.assertEqual(self.queue.get_batch(10), (0, ["a", "b", "c"]))
+
+    def test_ack(self):
+        first, items = self.queue.get_batch(2)
+        self.queue.ack(first + len(items))
+        self.assertEqual(self.queue.get_batch(10), (2, ["c"]))
+        self.assertEqual(self.counters()[self.queue.SSPL_MEMORY_USAGE], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from framework.utils.tar_utils import open_tar_gz
+
+
+class TestOpenTarGz(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.tmp_dir, "sspl.log")
+        with open(self.log_file, "w") as log:
+            log.write("sspl-ll started\n" * 1000)
+        self.tar_location = os.path.join(self.tmp_dir, "sspl.tar.gz")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @patch("framework.utils.tar_utils.shutil.which", return_value=None)
+    def test_without_pigz(self, which):
+        logger = MagicMock()
+        with open_tar_gz(self.tar_location, logger, threads=4) as tar:
+            tar.add(self.log_file, arcname="sspl/logs/sspl.log")
+        logger.warn.assert_called_once()
+        with tarfile.open(self.tar_location, "r:gz") as tar:
+            self.assertEqual(
+                tar.extractfile("sspl/logs/sspl.log").read(),
+                b"sspl-ll started\n" * 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
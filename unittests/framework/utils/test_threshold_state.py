@@ -0,0 +1,108 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+
+from framework.utils.threshold_state import (
+    FAULT, FAULT_RESOLVED, AlertState, ThresholdTracker, parse_threshold)
+
+
+class DictStore(object):
+    """Store keeping the values in a dict"""
+
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.puts = 0
+
+    def exists(self, key):
+        return key in self.data, None
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def put(self, value, key):
+        self.puts += 1
+        self.data[key] = value
+
+
+class TestThresholdTracker(unittest.TestCase):
+
+    def test_fault_after_wait_and_resolved_after_iterations(self):
+        tracker = ThresholdTracker('cpu')
+        self.assertIsNone(tracker.update(50, 80, 100, wait=30))
+        self.assertIsNone(tracker.update(90, 80, 110, wait=30))
+        self.assertIsNone(tracker.update(90, 80, 120, wait=30))
+        self.assertEqual(tracker.update(90, 80, 130, wait=30), FAULT)
+        self.assertIsNone(tracker.update(95, 80, 140, wait=30))
+
+        self.assertIsNone(tracker.update(50, 80, 150, iteration_limit=2))
+        self.assertIsNone(tracker.update(50, 80, 160, iteration_limit=2))
+        self.assertEqual(tracker.update(50, 80, 170, iteration_limit=2),
+                         FAULT_RESOLVED)
+        self.assertFalse(tracker.high_usage)
+
+    def test_record_round_trip(self):
+        tracker = ThresholdTracker('memory', True, 120, 3)
+        record = tracker.to_record()
+        self.assertEqual(record['high_memory_usage'], 'True')
+        restored = ThresholdTracker.from_record('memory', record)
+        self.assertEqual((restored.high_usage, restored.usage_time,
+                          restored.fault_resolved_iterations), (True, 120, 3))
+
+    def test_parse_threshold(self):
+        self.assertEqual(parse_threshold("80", 90), 80)
+        self.assertEqual(parse_threshold("80.5", 90), 80.5)
+        self.assertEqual(parse_threshold("high", 90), 90)
+
+
+class TestAlertState(unittest.TestCase):
+
+    def test_flush_only_when_dirty(self):
+        store = DictStore()
+        state = AlertState(store, "STATE", ['cpu', 'disk']).load()
+        self.assertTrue(state.flush())
+        self.assertFalse(state.flush())
+        state.trackers['disk'].update(95, 90, 1)
+        self.assertFalse(state.flush())
+        state.mark_dirty()
+        self.assertTrue(state.flush())
+        self.assertEqual(store.puts, 2)
+        self.assertEqual(store.data["STATE"]['disk']['high_disk_usage'], 'True')
+
+    def test_migrates_legacy_records(self):
+        store = DictStore({
+            "CPU_USAGE_DATA": {'high_cpu_usage': 'True',
+                               'cpu_usage_time_map': '100',
+                               'cpu_fault_resolved_iterations': '1'},
+            "NW_SENSOR_DATA": {'prev_nw_if_status': {'eth0': 'UP'},
+                               'prev_cable_status': {'eth0': 'CONNECTED'}}
+        })
+        state = AlertState(store, "STATE", ['cpu', 'memory'],
+                           {'cpu': "CPU_USAGE_DATA",
+                            'memory': "MEMORY_USAGE_DATA",
+                            'nw': "NW_SENSOR_DATA"}).load()
+        self.assertTrue(state.trackers['cpu'].high_usage)
+        self.assertFalse(state.trackers['memory'].high_usage)
+        self.assertEqual(state.prev_nw_if_status, {'eth0': 'UP'})
+        self.assertTrue(state.flush())
+
+        reloaded = AlertState(store, "STATE", ['cpu', 'memory']).load()
+        self.assertEqual(reloaded.trackers['cpu'].usage_time, 100)
+        self.assertEqual(reloaded.prev_cable_status, {'eth0': 'CONNECTED'})
+        self.assertFalse(reloaded.flush())
+
+
+if __name__ == "__main__":
+    unittest.main()
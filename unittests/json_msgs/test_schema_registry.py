@@ -0,0 +1,88 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import os
+import unittest
+
+from jsonschema import ValidationError
+
+from json_msgs.schema_registry import SchemaRegistry
+from json_msgs.messages.sensors.thread_monitor_msg import ThreadMonitorMsg
+
+SCHEMAS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..", "low-level", "json_msgs", "schemas")
+
+
+class TestSchemaRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = SchemaRegistry(SCHEMAS)
+        SchemaRegistry._instance = self.registry
+        self.info = {
+            "module_name": "RAIDsensor",
+            "alert_type": "fault",
+            "severity": "critical",
+            "description": "RAIDsensor is stopped",
+            "impact": "RAID alerts are not reported",
+            "recommendation": "Restart SSPL",
+            "specific_info": {"error": "timeout"}
+        }
+
+    def tearDown(self):
+        SchemaRegistry._instance = None
+
+    def test_validator_loaded_once(self):
+        validator = self.registry.get_validator(SchemaRegistry.SENSOR_RESPONSE)
+        self.assertIs(validator,
+            self.registry.get_validator(SchemaRegistry.SENSOR_RESPONSE))
+
+    def test_sampled_validation(self):
+        invalid = {"message": {}}
+        with self.assertRaises(ValidationError):
+            self.registry.validate(SchemaRegistry.SENSOR_RESPONSE, invalid,
+                                   sampled=True)
+
+        self.registry.set_sample_rate(0.25)
+        validated = []
+        for _ in range(8):
+            try:
+                self.registry.validate(SchemaRegistry.SENSOR_REQUEST,
+                                       invalid, sampled=True)
+                validated.append(False)
+            except ValidationError:
+                validated.append(True)
+        self.assertEqual(validated, [True, False, False, False] * 2)
+        # Unsampled validation is never skipped
+        with self.assertRaises(ValidationError):
+            self.registry.validate(SchemaRegistry.SENSOR_RESPONSE, invalid)
+
+        self.registry.set_sample_rate(0)
+        self.assertFalse(self.registry.validate(
+            SchemaRegistry.SENSOR_RESPONSE, invalid, sampled=True))
+
+    def test_message_passed_as_dict(self):
+        msg = ThreadMonitorMsg(self.info).getMsg()
+        self.assertIsInstance(msg, dict)
+        info = msg["message"]["sensor_response_type"]["info"]
+        self.assertEqual(info["resource_id"], "RAIDsensor")
+        self.assertIn("site_id", info)
+        self.assertEqual(json.loads(ThreadMonitorMsg(self.info).getJson())
+                         ["message"]["sensor_response_type"]["alert_type"],
+                         "fault")
+
+
+if __name__ == "__main__":
+    unittest.main()
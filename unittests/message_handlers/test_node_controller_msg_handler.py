@@ -0,0 +1,68 @@
+import unittest
+
+from message_handlers.service_msg_handler import ServiceMsgHandler
+
+
+class TestServiceMsgHandler(unittest.TestCase):
+    service_info = {
+            'service_name': 'kafka',
+            'status': 'failed'
+        }
+
+    def setUp(self) -> None:
+        self.service_msg_handler = ServiceMsgHandler()
+        self.service_msg_handler.cluster_id = 1
+        self.service_msg_handler.site_id = 1
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from framework.base.internal_msgQ import InternalMsgQ
+from framework.messaging.egress_processor import EgressProcessor
+from message_handlers.node_controller_msg_handler import \
+    NodeControllerMsgHandler
+from message_handlers.service_msg_handler import ServiceMsgHandler
+
+
+ASSEMBLE = {"actuator_request_type": {"node_controller": {
+    "node_request": "RAID: assemble"}}}
+
+
+class TestExpiredRequest(unittest.TestCase):
+
+    def setUp(self):
+        handler = NodeControllerMsgHandler.__new__(NodeControllerMsgHandler)
+        handler._log_debug = lambda msg: None
+        handler._dispatcher = MagicMock()
+        handler.setup = "hw"
+        self.handler = handler
+        self.raid_actuator = MagicMock()
+        self.raid_actuator.perform_request.return_value = "assembled"
+        self.write = MagicMock()
+        for patcher in (
+                patch.object(InternalMsgQ, "_write_internal_msgQ", self.write),
+                patch("message_handlers.node_controller_msg_handler."
+                      "AckResponseMsg")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def written_to(self):
+        return [call[0][0] for call in self.write.call_args_list]
+
+    def test_response_sent(self):
+        self.handler._dispatcher.is_expired.return_value = False
+        self.handler._execute_raid_request("RAID: assemble",
+            self.raid_actuator, ASSEMBLE, "uuid-1")
+        self.assertEqual(self.written_to(),
+                         [EgressProcessor.name(), ServiceMsgHandler.name()])
+
+    def test_expired_response_dropped(self):
+        self.handler._dispatcher.is_expired.return_value = True
+        self.handler._execute_raid_request("RAID: assemble",
+            self.raid_actuator, ASSEMBLE, "uuid-1")
+        # The RAID was assembled, openhpid is still restarted
+        self.assertEqual(self.written_to(), [ServiceMsgHandler.name()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from message_handlers.node_data_msg_handler import NodeDataMsgHandler
+
+
+class TestNodeDataMsgHandlerSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = NodeDataMsgHandler.__new__(NodeDataMsgHandler)
+        self.handler._suspended = False
+        self.handler._node_sensor = MagicMock()
+        self.handler._alert_state = MagicMock()
+        self.handler._scheduler = MagicMock()
+        self.handler._priority = 1
+        self.handler._read_my_msgQ_noWait = MagicMock(return_value=(None, None))
+        for generate in ("_generate_host_update", "_generate_cpu_data",
+                         "_generate_if_data", "_generate_disk_space_alert"):
+            setattr(self.handler, generate, MagicMock())
+
+    @patch("message_handlers.node_data_msg_handler.time.sleep")
+    def test_periodic_data_with_empty_queue(self, sleep):
+        self.handler._transmit_interval = 10
+        # Nothing is ever written to the queue
+        for _ in range(3):
+            self.handler.run()
+            delay, _, action, _ = self.handler._scheduler.enter.call_args[0]
+            self.assertEqual(action, self.handler.run)
+        self.assertEqual(self.handler._generate_cpu_data.call_count, 3)
+        self.assertEqual(self.handler._generate_disk_space_alert.call_count, 3)
+        self.handler._scheduler.enter_on_queue.assert_not_called()
+        # The interval is waited for by run, not by the scheduler
+        self.assertEqual(sleep.call_count, 30)
+        self.assertEqual(delay, 1)
+
+    def test_requests_only_without_interval(self):
+        self.handler._transmit_interval = 0
+        self.handler._read_my_msgQ = MagicMock(return_value=(None, None))
+        self.handler._is_my_msgQ_empty = MagicMock(return_value=True)
+        self.handler._msgQlist = {NodeDataMsgHandler.name(): MagicMock()}
+        self.handler.run()
+        self.handler._scheduler.enter_on_queue.assert_called_once()
+        self.handler._scheduler.enter.assert_not_called()
+        self.handler._generate_cpu_data.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from sensors.impl.generic.iem_sensor import IEMSensor
+
+
+class TestIEMSensor(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.path, "iem_messages")
+        self.sent = []
+        self.sensor = self._create_sensor()
+
+    def _create_sensor(self):
+        sensor = IEMSensor()
+        sensor._log_file_path = self.log_path
+        sensor._timestamp_file_path = os.path.join(self.path, "checkpoint")
+        sensor._checkpoint_batch = 2
+        sensor._process_iem = self.sent.append
+        sensor._watch_log = lambda: None
+        return sensor
+
+    def _write(self, *lines, mode="a"):
+        with open(self.log_path, mode) as log:
+            log.writelines(lines)
+
+    def _iem(self, second):
+        return f"2021-03-01T10:00:{second:02d}.000000+00:00 node IEC:" \
+               f"IS0010010010:event {second}\n"
+
+    def _read(self, sensor=None):
+        sensor = sensor or self.sensor
+        if sensor._iem_logs is None or sensor._reopen:
+            sensor._open_log()
+        sensor._read_iem()
+
+    def test_reads_complete_lines_once(self):
+        self._write(self._iem(1), self._iem(2))
+        self._read()
+        # Partial line is left for the next read
+        self._write(self._iem(3)[:20])
+        self._read()
+        self.assertEqual(len(self.sent), 2)
+        self._write(self._iem(3)[20:])
+        self._read()
+        self.assertEqual([iem.split()[-1] for iem in self.sent],
+                         ["1", "2", "3"])
+
+    def test_resumes_from_checkpoint(self):
+        self._write(self._iem(1), self._iem(2), self._iem(3))
+        self._read()
+        with open(self.sensor._timestamp_file_path) as checkpoint:
+            self.assertEqual(json.load(checkpoint)["offset"],
+                             os.path.getsize(self.log_path))
+        self._write(self._iem(4))
+        sensor = self._create_sensor()
+        self._read(sensor)
+        self.assertEqual(len(self.sent), 4)
+
+    def test_truncated_log(self):
+        self._write(self._iem(1), self._iem(2))
+        self._read()
+        # logrotate copytruncate
+        self._write(self._iem(3), mode="w")
+        self._read()
+        self.assertEqual(self.sent[-1].split()[-1], "3")
+        self.assertEqual(len(self.sent), 3)
+
+    def test_rotated_log_skips_processed_iems(self):
+        self._write(self._iem(1), self._iem(2))
+        self._read()
+        os.rename(self.log_path, f"{self.log_path}.1")
+        # Rotated log holding processed and new IEMs
+        self._write(self._iem(2), self._iem(3))
+        sensor = self._create_sensor()
+        self._read(sensor)
+        self.assertEqual([iem.split()[-1] for iem in self.sent],
+                         ["1", "2", "3"])
+
+    def test_rotation_reads_old_log_till_end(self):
+        self._write(self._iem(1), self._iem(2))
+        self._read()
+        # Written just before the move
+        self._write(self._iem(3))
+        os.rename(self.log_path, f"{self.log_path}.1")
+        self._write(self._iem(4))
+        # IN_MOVED_TO/IN_CREATE event for the new log
+        self.sensor._reopen = True
+        self._read()
+        self.assertEqual([iem.split()[-1] for iem in self.sent],
+                         ["1", "2", "3", "4"])
+
+    def test_legacy_timestamp_checkpoint(self):
+        self._write(self._iem(1), self._iem(2))
+        with open(self.sensor._timestamp_file_path, "w") as checkpoint:
+            checkpoint.write(self._iem(1).split()[0])
+        self._read()
+        self.assertEqual(len(self.sent), 1)
+
+    def tearDown(self):
+        if self.sensor._iem_logs:
+            self.sensor._iem_logs.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import MagicMock
+
+from framework.utils.ipmi_client import IPMITool
+from sensors.impl.generic.node_hw import NodeHWsensor
+
+
+SDR = {
+    "PS1 Status": "Sensor ID              : PS1 Status (0xc8)\n"
+                  " Entity ID             : 10.1 (Power Supply)\n"
+                  " States Asserted       : Power Supply\n"
+                  "                         [Presence detected]\n",
+    "Fan 1": "Sensor ID              : Fan 1 (0x41)\n"
+             " Entity ID             : 29.1 (Fan Device)\n"
+             " Sensor Reading        : 5300 (+/- 0) RPM\n",
+}
+
+
+class TestNodeHWSdrProps(unittest.TestCase):
+
+    def setUp(self):
+        self.commands = []
+        sensor = NodeHWsensor.__new__(NodeHWsensor)
+        sensor.ipmi_client = MagicMock()
+        sensor.ipmi_client.split_sdr_get = IPMITool.split_sdr_get
+        sensor._check_ipmitool_result = MagicMock()
+        sensor._run_ipmitool_subcommand = self._run_ipmitool_subcommand
+        self.sensor = sensor
+        # Left out of the output of the multi sensor 'sdr get'
+        self.missing = set()
+
+    def _run_ipmitool_subcommand(self, subcommand, grep_args=None,
+                                 out_file=None):
+        self.commands.append(subcommand)
+        sensor_ids = subcommand[len("sdr get '"):-1].split("' '")
+        if len(sensor_ids) > 1:
+            sensor_ids = [sensor_id for sensor_id in sensor_ids
+                          if sensor_id not in self.missing]
+        out = "\n".join(SDR[sensor_id] for sensor_id in sensor_ids
+                        if sensor_id in SDR)
+        return out, "", 0 if out else 1
+
+    def test_single_sdr_get(self):
+        props = self.sensor._get_sensors_sdr_props(["PS1 Status", "Fan 1"])
+        self.assertEqual(self.commands, ["sdr get 'PS1 Status' 'Fan 1'"])
+        dynamic, static = props["PS1 Status"]
+        self.assertEqual(static["Entity ID"], "10.1 (Power Supply)")
+        self.assertIn("Presence detected", dynamic["States Asserted"])
+        dynamic, _ = props["Fan 1"]
+        self.assertEqual(dynamic["Sensor Reading"], "5300 (+/- 0) RPM")
+
+    def test_missing_sensor_read_alone(self):
+        self.missing = {"Fan 1"}
+        props = self.sensor._get_sensors_sdr_props(
+            ["PS1 Status", "Fan 1", "Fan 2"])
+        self.assertEqual(self.commands, ["sdr get 'PS1 Status' 'Fan 1' 'Fan 2'",
+                                         "sdr get 'Fan 1'", "sdr get 'Fan 2'"])
+        self.assertEqual(sorted(props), ["Fan 1", "PS1 Status"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Copyright (c) 2021 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from sensors.impl.generic.node_hw import NodeHWsensor
+
+
+def fan_entry(index):
+    return f"{index:x} | 04/16/2019 | 05:29:09 | Fan #0x30 | " \
+           f"Lower Non-critical going low | Asserted"
+
+
+def other_entry(index):
+    return f"{index:x} | 04/16/2019 | 05:29:09 | System Event #0x01 | " \
+           f"Timestamp Clock Sync | Asserted"
+
+
+class TestNodeHWSelFetch(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.sel = []
+        self.commands = []
+        self.events = []
+        sensor = NodeHWsensor.__new__(NodeHWsensor)
+        sensor.fru_types = {NodeHWsensor.TYPE_FAN: self._fan_event}
+        sensor.channel_err = False
+        sensor.ipmi_client = MagicMock()
+        sensor._run_ipmitool_subcommand = self._run_ipmitool_subcommand
+        sensor._sel_fetch_window = 32
+        sensor._sel_seen_index = None
+        sensor.index_file_name = os.path.join(self.path, "index")
+        sensor.list_file_name = os.path.join(self.path, "list")
+        sensor.list_file_collect_name = os.path.join(self.path, "collect")
+        sensor.list_file = sensor._get_file(sensor.list_file_name)
+        self.sensor = sensor
+
+    def tearDown(self):
+        self.sensor.list_file.close()
+        shutil.rmtree(self.path)
+
+    def _fan_event(self, index, *args):
+        self.events.append(index)
+
+    def _run_ipmitool_subcommand(self, subcommand, grep_args=None,
+                                 out_file=None):
+        self.commands.append(subcommand)
+        entries = self.sel
+        if subcommand.startswith("sel list last "):
+            entries = self.sel[-int(subcommand.split()[-1]):]
+        return "".join(f"{entry}\n" for entry in entries), "", 0
+
+    def _poll(self, last_index):
+        self.sensor._write_index_file(last_index)
+        self.commands.clear()
+        self.sensor._update_list_file()
+        self.sensor._notify_NodeDataMsgHandler()
+        return self.sensor._read_index_file()
+
+    def test_new_fru_events(self):
+        self.sel = [fan_entry(i) for i in range(1, 11)]
+        self.assertEqual(self._poll(8), 10)
+        self.assertEqual(self.events, ["9", "a"])
+        self.assertEqual(self.commands, ["sel list last 32"])
+
+    def test_other_events_advance_index(self):
+        self.sel = [fan_entry(1)] + [other_entry(i) for i in range(2, 101)]
+        # Window is doubled until the last processed index is found
+        self.assertEqual(self._poll(1), 100)
+        self.assertEqual(self.commands, ["sel list last 32",
+                                         "sel list last 64",
+                                         "sel list last 128"])
+        self.assertEqual(self.events, [])
+        # Next poll starts from the newest entry, not the last FRU one
+        self.sel.append(fan_entry(101))
+        self.assertEqual(self._poll(100), 101)
+        self.assertEqual(self.commands, ["sel list last 32"])
+        self.assertEqual(self.events, ["65"])
+
+    def test_cleared_sel(self):
+        self.sel = [fan_entry(1), fan_entry(2), other_entry(3)]
+        self.assertEqual(self._poll(0x40), 3)
+        self.assertEqual(self.commands, ["sel list last 32", "sel list"])
+        self.assertEqual(self.events, ["1", "2"])
+
+    def test_rotated_sel(self):
+        self.sel = [fan_entry(i) for i in range(3000, 3000 + 4096)]
+        self.assertEqual(self._poll(2000), 3000 + 4095)
+        self.assertEqual(self.commands[-1], "sel list")
+        self.assertEqual(len(self.events), 4096)
+
+    def test_full_list_after_other_event(self):
+        self.sensor._sel_fetch_window = 0
+        self.sel = [fan_entry(1), other_entry(2), fan_entry(3)]
+        self.assertEqual(self._poll(2), 3)
+        self.assertEqual(self.commands, ["sel list"])
+        self.assertEqual(self.events, ["3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -266,5 +266,22 @@ class TestServerHealth(unittest.TestCase):
         assert specifics['trafficOut'] == 11451635037
 
 
+class TestServerHealthCollector(unittest.TestCase):
+
+    @patch("solution.lr2.server.health.Platform")
+    def test_collector_per_instance(self, _platform):
+        instances = []
+        for name in ("first", "second"):
+            health = ServerHealth.__new__(ServerHealth)
+            health.server_resources = {
+                "hw": {"cpu": Mock(return_value=name)}, "sw": {}}
+            health.collector = health._create_collector()
+            instances.append(health)
+        # Each instance collects with its own methods
+        self.assertEqual(
+            [health.collector.collect(["cpu"])["cpu"].value
+             for health in instances], ["first", "second"])
+
+
 if __name__ == "__main__":
     unittest.main()